@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""Example of a pipelined collect -> analyze -> report run with Summit SEO.
+
+Pages are fetched on the event loop, analyzed in worker processes and
+summarized on a thread, each stage with its own worker pool, so the next
+page is downloaded while the current one is being analyzed.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict
+
+from summit_seo.collector import CollectorFactory
+from summit_seo.parallel import Pipeline, PipelineStage, WorkerType, run_analyzer, warm_up_worker
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger("pipeline_example")
+
+ANALYZERS = ['security']
+
+
+async def collect(url: str) -> Dict[str, Any]:
+    """Fetch a page on the event loop."""
+    collector = CollectorFactory.create('webpage', {})
+    result = await collector.collect(url)
+    return {'url': url, 'html': result.content}
+
+
+def analyze(page: Dict[str, Any]) -> Dict[str, Any]:
+    """Run the analyzers on a page inside a worker process."""
+    scores = {
+        name: run_analyzer(name, page['html']).score
+        for name in ANALYZERS
+    }
+    return {'url': page['url'], 'scores': scores}
+
+
+def report(analysis: Dict[str, Any]) -> str:
+    """Format the results of a page."""
+    return json.dumps(analysis)
+
+
+async def main():
+    """Run a few URLs through the pipeline and print stage statistics."""
+    urls = [
+        "https://www.example.com",
+        "https://www.python.org",
+        "https://www.mozilla.org",
+    ]
+
+    pipeline = Pipeline([
+        PipelineStage("collect", collect, workers=4),
+        PipelineStage(
+            "analyze", analyze, workers=2, worker_type=WorkerType.PROCESS,
+            worker_initializer=warm_up_worker, worker_initargs=(ANALYZERS,)
+        ),
+        PipelineStage("report", report, workers=1, worker_type=WorkerType.THREAD),
+    ])
+
+    async with pipeline:
+        for url, result in zip(urls, await pipeline.run(urls)):
+            if isinstance(result, Exception):
+                logger.info(f"URL: {url} - Error: {result}")
+            else:
+                logger.info(result)
+
+        for name, stats in pipeline.get_statistics().items():
+            logger.info(
+                f"{name}: {stats['processed']} processed, {stats['failed']} failed, "
+                f"{stats['throughput']:.2f}/s, avg {stats['avg_time']:.3f}s, "
+                f"utilization {stats['utilization']:.0%}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
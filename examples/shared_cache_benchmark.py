@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Shared Cache Benchmark for Summit SEO
+
+This example starts the local-socket cache server in a separate process and
+runs several worker processes against it, the way multiple API workers
+would share one warm cache. It reports single-key and pipelined batch
+throughput for each worker.
+
+Point SERVER_URL at a Redis server to benchmark against Redis instead.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import tempfile
+import time
+
+from summit_seo.cache import CacheConfig, NetworkCache
+from summit_seo.cache.resp_server import main as run_server
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger("shared_cache_benchmark")
+
+SOCKET_PATH = os.path.join(tempfile.gettempdir(), "summit_seo_cache_benchmark.sock")
+SERVER_URL = os.environ.get("SERVER_URL", f"unix://{SOCKET_PATH}")
+WORKERS = 4
+KEYS = 2000
+BATCH_SIZE = 100
+PAGE = "<html><body>" + "<p>Benchmark content</p>" * 200 + "</body></html>"
+
+
+async def run_worker(worker_id: int) -> None:
+    """Measure cache throughput from one worker."""
+    cache = NetworkCache(CacheConfig(server_url=SERVER_URL, namespace="benchmark"))
+    keys = [f"page:{i}" for i in range(KEYS)]
+
+    start = time.perf_counter()
+    for key in keys:
+        await cache.set(key, PAGE)
+    single_set = KEYS / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for key in keys:
+        await cache.get(key)
+    single_get = KEYS / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for i in range(0, KEYS, BATCH_SIZE):
+        await cache.get_many(keys[i:i + BATCH_SIZE])
+    batch_get = KEYS / (time.perf_counter() - start)
+
+    logger.info(
+        f"Worker {worker_id}: set {single_set:,.0f}/s, get {single_get:,.0f}/s, "
+        f"get_many {batch_get:,.0f}/s, hit ratio {cache.get_stats()['hit_ratio']:.2f}"
+    )
+    await cache.close()
+
+
+def worker_main(worker_id: int) -> None:
+    """Entry point of a worker process."""
+    asyncio.run(run_worker(worker_id))
+
+
+def main() -> None:
+    """Start the server and the workers."""
+    server = None
+    if SERVER_URL.startswith("unix://"):
+        server = multiprocessing.Process(target=run_server, args=(["--unix", SOCKET_PATH],), daemon=True)
+        server.start()
+        while not os.path.exists(SOCKET_PATH):
+            time.sleep(0.05)
+
+    workers = [multiprocessing.Process(target=worker_main, args=(i,)) for i in range(WORKERS)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    if server is not None:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
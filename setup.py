@@ -22,5 +22,10 @@ setup(
             "types-beautifulsoup4>=4.12.0",
         ],
     },
+    entry_points={
+        "console_scripts": [
+            "summit-seo=summit_seo.cli.main:cli",
+        ],
+    },
     python_requires=">=3.12",
 ) 
\ No newline at end of file
@@ -5,7 +5,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 import hashlib
 import json
-from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar, Union
+from ..cache.blob_store import cached_content_hash
 from ..collector.base import CollectionResult
 from .recommendation import Recommendation, RecommendationManager
 
@@ -22,6 +23,7 @@ class AnalysisMetadata:
     version: str = '1.0.0'
     additional_info: Optional[Dict[str, Any]] = None
     cached: bool = False
+    stale: bool = False
     cache_key: Optional[str] = None
 
 @dataclass
@@ -50,6 +52,7 @@ class AnalysisResult(Generic[OutputType]):
                 'version': self.metadata.version,
                 'additional_info': self.metadata.additional_info,
                 'cached': self.metadata.cached,
+                'stale': self.metadata.stale,
                 'cache_key': self.metadata.cache_key
             },
             'score': self.score,
@@ -112,6 +115,18 @@ class BaseAnalyzer(ABC, Generic[InputType, OutputType]):
     It provides a common structure for analyzing different aspects of SEO
     and generating standardized results.
     """
+    
+    # Bump when analysis logic changes so cached results are not reused
+    cache_version: str = '1'
+    
+    # Input attributes besides the body that affect results (e.g. ('url',));
+    # cached results are otherwise shared by all inputs with the same body
+    cache_key_fields: Tuple[str, ...] = ()
+    
+    # Config keys that only control caching and never affect results
+    CACHE_CONFIG_KEYS = frozenset({
+        'enable_caching', 'cache_ttl', 'cache_type', 'cache_namespace', 'cache_stale_ttl'
+    })
 
     def __init__(self, config: Optional[Dict[str, Any]] = None) -> None:
         """Initialize the analyzer.
@@ -127,6 +142,8 @@ class BaseAnalyzer(ABC, Generic[InputType, OutputType]):
         self.cache_ttl = self.config.get('cache_ttl', 3600)  # 1 hour default
         self.cache_type = self.config.get('cache_type', 'memory')
         self.cache_namespace = self.config.get('cache_namespace', 'analyzer')
+        self.cache_stale_ttl = self.config.get('cache_stale_ttl', 0)
+        self._config_fingerprint = self._compute_config_fingerprint()
         
         # Recommendation manager
         self.recommendation_manager = RecommendationManager()
@@ -135,7 +152,9 @@ class BaseAnalyzer(ABC, Generic[InputType, OutputType]):
         """Analyze the input data and return results.
         
         This implementation checks the cache first, and only performs analysis
-        if the result is not found in cache or if caching is disabled.
+        if the result is not found in cache or if caching is disabled. Expired
+        results still within the stale window are returned immediately and
+        reanalyzed in the background.
         
         Args:
             data: Input data to analyze
@@ -149,12 +168,14 @@ class BaseAnalyzer(ABC, Generic[InputType, OutputType]):
         # Validate input
         self.validate_input(data)
         
+        cache_key: Optional[str] = None
+        
         # Check cache if enabled
         if self.enable_caching:
             try:
                 from ..cache import cache_manager
                 
-                # Generate cache key based on analyzer type and input data
+                # Generate the cache key once; it is reused when storing the result
                 cache_key = self.generate_cache_key(data)
                 
                 # Try to get result from cache
@@ -173,6 +194,20 @@ class BaseAnalyzer(ABC, Generic[InputType, OutputType]):
                     cached_result.metadata.cache_key = cache_key
                     
                     return cached_result
+                
+                if cache_result.hit and cache_result.metadata.get('stale'):
+                    # Serve the stale result and reanalyze in the background
+                    cache_manager.schedule_refresh(
+                        cache_key,
+                        lambda: self._analyze_and_cache(data, cache_key)
+                    )
+                    
+                    stale_result = cache_result.value
+                    stale_result.metadata.cached = True
+                    stale_result.metadata.stale = True
+                    stale_result.metadata.cache_key = cache_key
+                    
+                    return stale_result
                     
             except ImportError:
                 # Cache module not available, continue with analysis
@@ -182,6 +217,25 @@ class BaseAnalyzer(ABC, Generic[InputType, OutputType]):
                 import logging
                 logging.warning(f"Cache error in {self.__class__.__name__}: {str(e)}")
         
+        return await self._analyze_and_cache(data, cache_key)
+
+    async def _analyze_and_cache(
+        self,
+        data: InputType,
+        cache_key: Optional[str] = None
+    ) -> AnalysisResult[OutputType]:
+        """Run the analysis and store the result in the cache.
+        
+        Args:
+            data: Input data to analyze
+            cache_key: Precomputed cache key (generated if not provided)
+            
+        Returns:
+            AnalysisResult containing the fresh analysis output
+            
+        Raises:
+            AnalyzerError: If analysis fails
+        """
         # Perform analysis
         result = await self._analyze(data)
         
@@ -190,7 +244,8 @@ class BaseAnalyzer(ABC, Generic[InputType, OutputType]):
             try:
                 from ..cache import cache_manager
                 
-                cache_key = self.generate_cache_key(data)
+                if cache_key is None:
+                    cache_key = self.generate_cache_key(data)
                 
                 # Store result in cache
                 await cache_manager.set(
@@ -198,7 +253,8 @@ class BaseAnalyzer(ABC, Generic[InputType, OutputType]):
                     result,
                     ttl=self.cache_ttl,
                     cache_type=self.cache_type,
-                    name=self.get_cache_name()
+                    name=self.get_cache_name(),
+                    stale_ttl=self.cache_stale_ttl
                 )
                 
                 # Update metadata
@@ -329,19 +385,30 @@ class BaseAnalyzer(ABC, Generic[InputType, OutputType]):
     def generate_cache_key(self, data: InputType) -> str:
         """Generate a cache key based on analyzer type and input data.
         
+        HTML strings and collection results are keyed by the content address
+        of their body, so identical bodies are analyzed once per analyzer
+        version regardless of the URL they were fetched from.
+        
         Args:
             data: Input data
             
         Returns:
             Cache key string
         """
-        # Use analyzer class name as prefix
-        prefix = self.__class__.__name__
+        # Use analyzer class name and version as prefix
+        prefix = f"{self.__class__.__name__}@{self.cache_version}"
         
         # Hash the input data
         if isinstance(data, str):
-            # For string data, hash directly
-            data_hash = hashlib.md5(data.encode('utf-8')).hexdigest()
+            # For string data, use the content address of the body; the same
+            # string passed to several analyzers is hashed once
+            data_hash = cached_content_hash(data)
+        elif isinstance(data, CollectionResult):
+            data_hash = data.get_content_hash()
+            if self.cache_key_fields:
+                fields = {name: getattr(data, name) for name in self.cache_key_fields}
+                fields_json = json.dumps(fields, sort_keys=True, default=str)
+                data_hash = f"{data_hash}:{hashlib.md5(fields_json.encode('utf-8')).hexdigest()[:8]}"
         elif hasattr(data, 'to_dict'):
             # If data has to_dict method, use it
             data_dict = data.to_dict()
@@ -350,19 +417,28 @@ class BaseAnalyzer(ABC, Generic[InputType, OutputType]):
             # For other types, use string representation
             data_hash = hashlib.md5(str(data).encode('utf-8')).hexdigest()
         
-        # Add config hash if it would affect analysis results
-        config_hash = ""
-        if self.config:
-            # Only include config keys that affect analysis results
-            analysis_config = {k: v for k, v in self.config.items() 
-                            if k not in ('enable_caching', 'cache_ttl', 'cache_type', 'cache_namespace')}
-            
-            if analysis_config:
-                config_hash = hashlib.md5(json.dumps(analysis_config, sort_keys=True).encode('utf-8')).hexdigest()[:8]
-                return f"{prefix}:{data_hash}:{config_hash}"
+        if self._config_fingerprint:
+            return f"{prefix}:{data_hash}:{self._config_fingerprint}"
         
         return f"{prefix}:{data_hash}"
     
+    def _compute_config_fingerprint(self) -> str:
+        """Compute a short hash of the config keys that affect analysis results.
+        
+        Computed once at construction so cache keys do not re-serialize the
+        config on every analysis.
+        
+        Returns:
+            Config hash, or an empty string if no such keys are set
+        """
+        analysis_config = {k: v for k, v in self.config.items()
+                           if k not in self.CACHE_CONFIG_KEYS}
+        if not analysis_config:
+            return ""
+        
+        config_json = json.dumps(analysis_config, sort_keys=True, default=str)
+        return hashlib.md5(config_json.encode('utf-8')).hexdigest()[:8]
+    
     def get_cache_name(self) -> Optional[str]:
         """Get the cache name based on TTL.
         
@@ -1,7 +1,10 @@
 """Security analyzer implementation."""
 
-from typing import Dict, Any, Optional, List, Set, Tuple
+from typing import Dict, Any, Optional, List, Set, Tuple, Pattern
 from bs4 import BeautifulSoup
+from bisect import bisect_right
+from functools import lru_cache
+from html.parser import HTMLParser
 import re
 import urllib.parse
 from dataclasses import dataclass
@@ -22,6 +25,105 @@ class SecurityIssue:
     severity: str  # 'high', 'medium', 'low'
     remediation: str
 
+class _SourceSpans(HTMLParser):
+    """Offsets of script, style, comment and text regions in raw HTML.
+    
+    The document is tokenized once; each region is stored as a
+    (start, end, location) span in document order, where location is
+    'script', 'style', 'comment' or the name of the element containing
+    the text ('[document]' for top-level text, as in BeautifulSoup).
+    """
+    
+    VOID_ELEMENTS = {
+        'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+        'link', 'meta', 'param', 'source', 'track', 'wbr',
+    }
+    
+    def __init__(self, html_content: str) -> None:
+        super().__init__(convert_charrefs=False)
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+        self.locations: List[str] = []
+        self._open_tags: List[str] = []
+        self._line_starts = [0] + [m.end() for m in re.finditer('\n', html_content)]
+        self.feed(html_content)
+        self.close()
+    
+    def locate(self, offset: int) -> Optional[str]:
+        """Get the location of the region containing an offset, if any."""
+        index = bisect_right(self.starts, offset) - 1
+        if index >= 0 and offset < self.ends[index]:
+            return self.locations[index]
+        return None
+    
+    def _offset(self) -> int:
+        line, column = self.getpos()
+        return self._line_starts[line - 1] + column
+    
+    def _add(self, start: int, end: int, location: str) -> None:
+        # Adjacent text chunks of the same element form one region
+        if self.ends and self.ends[-1] == start and self.locations[-1] == location:
+            self.ends[-1] = end
+        else:
+            self.starts.append(start)
+            self.ends.append(end)
+            self.locations.append(location)
+    
+    def handle_starttag(self, tag, attrs):
+        if tag not in self.VOID_ELEMENTS:
+            self._open_tags.append(tag)
+    
+    def handle_startendtag(self, tag, attrs):
+        pass
+    
+    def handle_endtag(self, tag):
+        if tag in self._open_tags:
+            while self._open_tags.pop() != tag:
+                pass
+    
+    def handle_data(self, data):
+        parent = self._open_tags[-1] if self._open_tags else '[document]'
+        start = self._offset()
+        self._add(start, start + len(data), parent)
+    
+    def handle_entityref(self, name):
+        self.handle_data(f'&{name};')
+    
+    def handle_charref(self, name):
+        self.handle_data(f'&#{name};')
+    
+    def handle_comment(self, data):
+        start = self._offset()
+        self._add(start, start + len(data) + len('<!---->'), 'comment')
+
+@lru_cache(maxsize=32)
+def _compile_sensitive_scanner(patterns: Tuple[Tuple[str, str], ...]) -> Tuple[Optional[Pattern], List[Tuple[str, Pattern]]]:
+    """Combine sensitive data patterns into one regex.
+    
+    Each pattern becomes a named alternative, so one pass over the
+    document finds matches of every type and ``match.lastgroup`` tells
+    which type matched. Where matches of several types start at the
+    same offset, the earlier pattern wins. Patterns with their own
+    capturing groups (whose backreferences would be renumbered) are
+    returned separately to be scanned on their own.
+    
+    Args:
+        patterns: (data type, regex) pairs
+        
+    Returns:
+        Tuple of the combined regex (None if no pattern could be
+        combined) and the (data type, regex) pairs to scan separately
+    """
+    combined = []
+    separate = []
+    for index, (data_type, pattern) in enumerate(patterns):
+        compiled = re.compile(pattern)
+        if compiled.groups:
+            separate.append((data_type, compiled))
+        else:
+            combined.append(f'(?P<_{index}>{pattern})')
+    return (re.compile('|'.join(combined)) if combined else None), separate
+
 class SecurityAnalyzer(BaseAnalyzer[str, Dict[str, Any]]):
     """Analyzer for website security issues.
     
@@ -798,60 +900,47 @@ class SecurityAnalyzer(BaseAnalyzer[str, Dict[str, Any]]):
             'password': [],
         }
         
-        # Check for sensitive data in HTML content
-        for data_type, pattern in self.SENSITIVE_PATTERNS.items():
-            matches = re.finditer(pattern, html_content)
-            for match in matches:
-                matched_text = match.group(0)
+        # Locate script, comment and text regions once, then scan for
+        # every pattern in one pass and look up where each match is
+        spans = _SourceSpans(html_content)
+        for data_type, match in self._find_sensitive_matches(html_content):
+            matched_text = match.group(0)
+            location = spans.locate(match.start())
+            
+            # For API keys and passwords, only report those in script tags or comments
+            if data_type in ['api_key', 'password']:
+                if location not in ('script', 'comment'):
+                    continue
+                sensitive_data_found.setdefault(data_type, []).append({
+                    'value': self._redact_sensitive_data(matched_text, data_type),
+                    'location': location
+                })
                 
-                # For API keys and passwords, check if they are in script tags or comments
-                if data_type in ['api_key', 'password']:
-                    # Check if it's within script tags, not in attribute values
-                    script_tags = soup.find_all('script')
-                    for script in script_tags:
-                        if script.string and matched_text in script.string:
-                            sensitive_data_found[data_type].append({
-                                'value': self._redact_sensitive_data(matched_text, data_type),
-                                'location': 'script'
-                            })
-                            
-                            # Add a specific issue for API keys found in scripts
-                            if data_type == 'api_key':
-                                issues.append(f"Found API key exposed in script tag")
-                                security_issues.append(SecurityIssue(
-                                    name="API Key Exposure",
-                                    description="API key is exposed in client-side JavaScript code, making it vulnerable to theft.",
-                                    severity=self.SEVERITY_HIGH,
-                                    remediation="Move API keys to server-side code and use appropriate authentication mechanisms."
-                                ))
-                    
-                    # Check if it's within comments
-                    comments = soup.find_all(string=lambda text: isinstance(text, str) and '<!--' in text)
-                    for comment in comments:
-                        if matched_text in comment:
-                            sensitive_data_found[data_type].append({
-                                'value': self._redact_sensitive_data(matched_text, data_type),
-                                'location': 'comment'
-                            })
-                            
-                            # Add a specific issue for passwords found in comments
-                            if data_type == 'password':
-                                issues.append(f"Found password exposed in HTML comment")
-                                security_issues.append(SecurityIssue(
-                                    name="Password Exposure in Comments",
-                                    description="Password is exposed in HTML comments, creating a security risk.",
-                                    severity=self.SEVERITY_HIGH,
-                                    remediation="Remove all passwords from HTML comments and source code."
-                                ))
-                else:
-                    # For other types, check if they are in visible content, not in attributes
-                    visible_text_elements = soup.find_all(text=True)
-                    for text in visible_text_elements:
-                        if matched_text in text and text.parent.name not in ['script', 'style']:
-                            sensitive_data_found[data_type].append({
-                                'value': self._redact_sensitive_data(matched_text, data_type),
-                                'location': text.parent.name
-                            })
+                # Add a specific issue for API keys found in scripts
+                if data_type == 'api_key' and location == 'script':
+                    issues.append(f"Found API key exposed in script tag")
+                    security_issues.append(SecurityIssue(
+                        name="API Key Exposure",
+                        description="API key is exposed in client-side JavaScript code, making it vulnerable to theft.",
+                        severity=self.SEVERITY_HIGH,
+                        remediation="Move API keys to server-side code and use appropriate authentication mechanisms."
+                    ))
+                
+                # Add a specific issue for passwords found in comments
+                if data_type == 'password' and location == 'comment':
+                    issues.append(f"Found password exposed in HTML comment")
+                    security_issues.append(SecurityIssue(
+                        name="Password Exposure in Comments",
+                        description="Password is exposed in HTML comments, creating a security risk.",
+                        severity=self.SEVERITY_HIGH,
+                        remediation="Remove all passwords from HTML comments and source code."
+                    ))
+            elif location is not None and location not in ('script', 'style', 'comment'):
+                # For other types, only report those in visible content, not in attributes
+                sensitive_data_found.setdefault(data_type, []).append({
+                    'value': self._redact_sensitive_data(matched_text, data_type),
+                    'location': location
+                })
         
         # Check for specific input types that handle sensitive data
         password_inputs = soup.find_all('input', {'type': 'password'})
@@ -947,6 +1036,29 @@ class SecurityAnalyzer(BaseAnalyzer[str, Dict[str, Any]]):
             'sensitive_forms': len(sensitive_forms) if 'sensitive_forms' in locals() else 0
         }
     
+    def _find_sensitive_matches(self, html_content: str) -> List[Tuple[str, re.Match]]:
+        """Find matches of all sensitive data patterns.
+        
+        Args:
+            html_content: Raw HTML content
+            
+        Returns:
+            List of (data type, match) pairs in document order
+        """
+        data_types = list(self.SENSITIVE_PATTERNS)
+        combined, separate = _compile_sensitive_scanner(tuple(self.SENSITIVE_PATTERNS.items()))
+        
+        found = []
+        if combined is not None:
+            for match in combined.finditer(html_content):
+                found.append((data_types[int(match.lastgroup[1:])], match))
+        for data_type, pattern in separate:
+            found.extend((data_type, match) for match in pattern.finditer(html_content))
+        
+        if separate:
+            found.sort(key=lambda item: item[1].start())
+        return found
+    
     def _redact_sensitive_data(self, data: str, data_type: str) -> str:
         """Redact sensitive data for inclusion in reports.
         
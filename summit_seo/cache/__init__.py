@@ -9,6 +9,15 @@ from .base import BaseCache, CacheKey, CacheConfig, CacheError, CacheResult
 from .factory import CacheFactory
 from .memory_cache import MemoryCache
 from .file_cache import FileCache
+from .network_cache import NetworkCache, NetworkCacheError
+from .resp_server import RespServer
+from .log_cache import LogCache, LogCacheError
+from .log_store import LogStore, LogStoreError
+from .refresh import RefreshScheduler
+from .blob_store import BlobStore, blob_store, cached_content_hash, content_hash, normalize_body
+from .codec import CacheCodec, CodecError, CompressedText, get_codec, get_available_compressors
+from .manager import CacheManager, cache_manager
+from .warmer import CacheWarmer, CacheWarmerError, load_run_urls, save_run_urls
 
 __all__ = [
     'BaseCache', 
@@ -18,5 +27,29 @@ __all__ = [
     'CacheResult',
     'CacheFactory',
     'MemoryCache',
-    'FileCache'
+    'FileCache',
+    'NetworkCache',
+    'NetworkCacheError',
+    'RespServer',
+    'LogCache',
+    'LogCacheError',
+    'LogStore',
+    'LogStoreError',
+    'RefreshScheduler',
+    'BlobStore',
+    'blob_store',
+    'cached_content_hash',
+    'content_hash',
+    'normalize_body',
+    'CacheCodec',
+    'CodecError',
+    'CompressedText',
+    'get_codec',
+    'get_available_compressors',
+    'CacheManager',
+    'cache_manager',
+    'CacheWarmer',
+    'CacheWarmerError',
+    'load_run_urls',
+    'save_run_urls'
 ] 
\ No newline at end of file
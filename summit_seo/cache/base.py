@@ -21,6 +21,10 @@ class CacheConfig:
     namespace: str = "default"  # Namespace for the cache
     enable_stats: bool = True  # Whether to track cache statistics
     persistent: bool = False  # Whether the cache should persist between runs
+    stale_ttl: int = 0  # Seconds past expiry during which stale entries are still served
+    codec: Optional[str] = None  # Value codec, e.g. 'pickle' or 'pickle+zlib' (None stores live objects)
+    cache_dir: Optional[str] = None  # Directory for file-based caches (default: system temp dir)
+    server_url: Optional[str] = None  # Shared cache server, e.g. 'redis://host:6379/0' or 'unix:///path.sock'
 
 @dataclass
 class CacheResult(Generic[V]):
@@ -77,6 +81,7 @@ class BaseCache(ABC, Generic[K, V]):
         
         # Cache statistics
         self._hits = 0
+        self._stale_hits = 0
         self._misses = 0
         self._sets = 0
         self._evictions = 0
@@ -94,6 +99,9 @@ class BaseCache(ABC, Generic[K, V]):
         
         if self.config.max_size < 1:
             raise CacheConfigError("Max size must be at least 1")
+        
+        if self.config.stale_ttl < 0:
+            raise CacheConfigError("Stale TTL cannot be negative")
 
     @abstractmethod
     async def get(self, key: K) -> CacheResult[V]:
@@ -111,13 +119,16 @@ class BaseCache(ABC, Generic[K, V]):
         pass
 
     @abstractmethod
-    async def set(self, key: K, value: V, ttl: Optional[int] = None) -> None:
+    async def set(self, key: K, value: V, ttl: Optional[int] = None,
+                  stale_ttl: Optional[int] = None) -> None:
         """Set a value in the cache.
         
         Args:
             key: The cache key to set
             value: The value to cache
             ttl: Optional time to live in seconds (overrides config.ttl if provided)
+            stale_ttl: Optional window in seconds after expiry during which the
+                entry is still returned as stale (overrides config.stale_ttl)
             
         Raises:
             CacheKeyError: If the key is invalid
@@ -216,6 +227,35 @@ class BaseCache(ABC, Generic[K, V]):
         
         return result
 
+    async def get_many(self, keys: List[K]) -> Dict[K, CacheResult[V]]:
+        """Get several values from the cache.
+        
+        Backends that support batched reads override this to fetch all keys
+        in one round trip.
+        
+        Args:
+            keys: Cache keys to retrieve
+            
+        Returns:
+            Dictionary mapping each key to its CacheResult
+        """
+        return {key: await self.get(key) for key in keys}
+
+    async def set_many(self, items: Dict[K, V], ttl: Optional[int] = None,
+                       stale_ttl: Optional[int] = None) -> None:
+        """Set several values in the cache.
+        
+        Backends that support batched writes override this to store all
+        values in one round trip.
+        
+        Args:
+            items: Dictionary mapping cache keys to values
+            ttl: Optional time to live in seconds (overrides config.ttl if provided)
+            stale_ttl: Optional stale window in seconds (overrides config.stale_ttl)
+        """
+        for key, value in items.items():
+            await self.set(key, value, ttl, stale_ttl=stale_ttl)
+
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics.
         
@@ -233,6 +273,7 @@ class BaseCache(ABC, Generic[K, V]):
         
         return {
             'hits': self._hits,
+            'stale_hits': self._stale_hits,
             'misses': self._misses,
             'sets': self._sets,
             'evictions': self._evictions,
@@ -244,12 +285,13 @@ class BaseCache(ABC, Generic[K, V]):
 
     def _update_stats(self, hit: bool = False, miss: bool = False, 
                       set_op: bool = False, eviction: bool = False, 
-                      error: bool = False) -> None:
+                      error: bool = False, stale: bool = False) -> None:
         """Update cache statistics.
         
         Args:
             hit: Whether a cache hit occurred
             miss: Whether a cache miss occurred
+            stale: Whether a stale entry was served
             set_op: Whether a cache set operation occurred
             eviction: Whether a cache eviction occurred
             error: Whether a cache error occurred
@@ -259,6 +301,8 @@ class BaseCache(ABC, Generic[K, V]):
             
         if hit:
             self._hits += 1
+        if stale:
+            self._stale_hits += 1
         if miss:
             self._misses += 1
         if set_op:
@@ -0,0 +1,183 @@
+"""Content-addressed storage for page bodies.
+
+Many URLs return byte-identical bodies (soft-404s, parameter variants,
+pagination stubs). The blob store keys bodies by a hash of their normalized
+text so identical bodies share one string in memory and analyzers can key
+their caches on the body instead of the URL.
+"""
+
+import hashlib
+import sys
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from .base import CacheConfigError
+
+
+def normalize_body(content: str) -> str:
+    """Normalize a body before hashing.
+
+    Line endings are unified and surrounding whitespace is removed, so bodies
+    that differ only in transport formatting hash the same.
+
+    Args:
+        content: Raw body text
+
+    Returns:
+        Normalized body text
+    """
+    return content.replace('\r\n', '\n').replace('\r', '\n').strip()
+
+
+def content_hash(content: str) -> str:
+    """Compute the content address of a body.
+
+    Args:
+        content: Raw body text
+
+    Returns:
+        Hex digest of the normalized body
+    """
+    normalized = normalize_body(content)
+    return hashlib.blake2b(normalized.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=16)
+def cached_content_hash(content: str) -> str:
+    """Compute the content address of a body, reusing recent results.
+
+    Strings cannot carry a memoized hash, so recent results are kept in a
+    small LRU. Passing the same string object to several callers hashes
+    the body once; lookups compare by identity before equality.
+
+    Args:
+        content: Raw body text
+
+    Returns:
+        Hex digest of the normalized body
+    """
+    return content_hash(content)
+
+
+class BlobStore:
+    """In-memory content-addressed store for page bodies.
+
+    Bodies are kept in LRU order and evicted once their total memory use
+    (``sys.getsizeof`` of each string, so non-ASCII text counts at 2 or 4
+    bytes per character) exceeds ``max_bytes``. Evicting a body never invalidates results that still
+    reference it; it only stops future bodies from being shared with it.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        """Initialize the blob store.
+
+        Args:
+            max_bytes: Maximum memory used by stored bodies in bytes
+
+        Raises:
+            CacheConfigError: If max_bytes is less than 1
+        """
+        if max_bytes < 1:
+            raise CacheConfigError("Blob store size must be at least 1")
+
+        self.max_bytes = max_bytes
+        self._blobs: 'OrderedDict[str, str]' = OrderedDict()
+        self._size = 0
+
+        # Store statistics
+        self._puts = 0
+        self._dedup_hits = 0
+        self._bytes_saved = 0
+        self._evictions = 0
+
+    def put(self, content: str) -> Tuple[str, str]:
+        """Add a body to the store.
+
+        Args:
+            content: Body text
+
+        Returns:
+            Tuple of (content hash, body). The body is the stored instance when
+            an identical one is already present, so callers share one string.
+        """
+        digest = content_hash(content)
+        self._puts += 1
+
+        existing = self._blobs.get(digest)
+        if existing is not None:
+            self._blobs.move_to_end(digest)
+            self._dedup_hits += 1
+
+            if existing == content:
+                self._bytes_saved += sys.getsizeof(content)
+                return digest, existing
+
+            # Same normalized body, different formatting: keep the caller's text
+            return digest, content
+
+        self._blobs[digest] = content
+        self._size += sys.getsizeof(content)
+        self._evict()
+        return digest, content
+
+    def get(self, digest: str) -> Optional[str]:
+        """Get a body by its content hash.
+
+        Args:
+            digest: Content hash returned by put()
+
+        Returns:
+            The body, or None if it is not stored
+        """
+        content = self._blobs.get(digest)
+        if content is not None:
+            self._blobs.move_to_end(digest)
+        return content
+
+    def __contains__(self, digest: str) -> bool:
+        """Check whether a body with the given hash is stored."""
+        return digest in self._blobs
+
+    def __len__(self) -> int:
+        """Get the number of stored bodies."""
+        return len(self._blobs)
+
+    def _evict(self) -> None:
+        """Evict least recently used bodies until the store fits in max_bytes."""
+        while self._size > self.max_bytes and len(self._blobs) > 1:
+            _, content = self._blobs.popitem(last=False)
+            self._size -= sys.getsizeof(content)
+            self._evictions += 1
+
+    def clear(self) -> int:
+        """Remove all bodies.
+
+        Returns:
+            Number of removed bodies
+        """
+        count = len(self._blobs)
+        self._blobs.clear()
+        self._size = 0
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get blob store statistics.
+
+        Returns:
+            Dictionary containing store statistics
+        """
+        return {
+            'blobs': len(self._blobs),
+            'size': self._size,
+            'max_bytes': self.max_bytes,
+            'puts': self._puts,
+            'dedup_hits': self._dedup_hits,
+            'dedup_ratio': self._dedup_hits / self._puts if self._puts else 0.0,
+            'bytes_saved': self._bytes_saved,
+            'evictions': self._evictions
+        }
+
+
+# Shared instance used by collectors with dedup_content enabled
+blob_store = BlobStore()
@@ -0,0 +1,331 @@
+"""Value codecs for compact cache storage.
+
+A codec turns cached values into bytes and back. It combines a serializer
+(pickle protocol 5) with a compressor from the standard library (zlib, lzma,
+bz2) or an optional faster one (zstd, lz4) when the package is installed.
+
+Large text bodies such as page HTML can be wrapped in ``CompressedText``,
+which keeps them compressed until they are read. When pickled, its
+compressed bytes travel as an out-of-band buffer, so the codec stores them
+as-is instead of compressing them a second time.
+"""
+
+import bz2
+import lzma
+import pickle
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from .base import CacheConfigError, CacheError
+
+
+class CodecError(CacheError):
+    """Exception raised when a value cannot be encoded or decoded."""
+    pass
+
+
+@dataclass(frozen=True)
+class Compressor:
+    """A named compression algorithm."""
+    name: str
+    id: int  # Stable identifier written into encoded frames
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+_compressors: Dict[str, Compressor] = {}
+_compressors_by_id: Dict[int, Compressor] = {}
+
+
+def register_compressor(compressor: Compressor) -> None:
+    """Register a compressor so codecs can refer to it by name.
+
+    Args:
+        compressor: Compressor to register
+
+    Raises:
+        ValueError: If the name or id is already registered
+    """
+    if compressor.name in _compressors:
+        raise ValueError(f"Compressor '{compressor.name}' is already registered")
+    if compressor.id in _compressors_by_id:
+        raise ValueError(f"Compressor id {compressor.id} is already registered")
+
+    _compressors[compressor.name] = compressor
+    _compressors_by_id[compressor.id] = compressor
+
+
+def get_compressor(name: str) -> Compressor:
+    """Get a registered compressor by name.
+
+    Args:
+        name: Compressor name (e.g. 'zlib', 'lzma', 'zstd')
+
+    Returns:
+        The compressor
+
+    Raises:
+        CacheConfigError: If the compressor is unknown or not installed
+    """
+    if name not in _compressors:
+        available = ', '.join(sorted(_compressors))
+        raise CacheConfigError(
+            f"Unknown or unavailable compressor '{name}' (available: {available})"
+        )
+    return _compressors[name]
+
+
+def get_available_compressors() -> List[str]:
+    """Get the names of all usable compressors.
+
+    Returns:
+        List of compressor names
+    """
+    return sorted(_compressors)
+
+
+def default_compressor() -> Compressor:
+    """Get the fastest available general-purpose compressor.
+
+    Returns:
+        zstd or lz4 if installed, otherwise zlib
+    """
+    for name in ('zstd', 'lz4', 'zlib'):
+        if name in _compressors:
+            return _compressors[name]
+    return _compressors['zlib']
+
+
+register_compressor(Compressor('none', 0, bytes, bytes))
+register_compressor(Compressor('zlib', 1, lambda data: zlib.compress(data, 6), zlib.decompress))
+register_compressor(Compressor('lzma', 2, lzma.compress, lzma.decompress))
+register_compressor(Compressor('bz2', 3, bz2.compress, bz2.decompress))
+
+try:
+    import zstandard
+
+    _zstd_compressor = zstandard.ZstdCompressor(level=3)
+    _zstd_decompressor = zstandard.ZstdDecompressor()
+    register_compressor(Compressor(
+        'zstd', 4, _zstd_compressor.compress, _zstd_decompressor.decompress
+    ))
+except ImportError:
+    pass
+
+try:
+    import lz4.frame
+
+    register_compressor(Compressor('lz4', 5, lz4.frame.compress, lz4.frame.decompress))
+except ImportError:
+    pass
+
+
+class CompressedText:
+    """A text body held in compressed form until it is read.
+
+    The text is decompressed on every call to ``text()``; callers that read
+    it repeatedly should keep the returned string.
+    """
+
+    __slots__ = ('_blob', '_compressor_id', '_length')
+
+    def __init__(self, blob: bytes, compressor_id: int, length: int):
+        """Initialize compressed text.
+
+        Args:
+            blob: Compressed UTF-8 bytes
+            compressor_id: Id of the compressor that produced the blob
+            length: Length of the original text in characters
+        """
+        self._blob = blob
+        self._compressor_id = compressor_id
+        self._length = length
+
+    @classmethod
+    def compress(cls, text: str, compressor: Optional[Compressor] = None) -> 'CompressedText':
+        """Compress a string.
+
+        Args:
+            text: Text to compress
+            compressor: Compressor to use (defaults to the fastest available)
+
+        Returns:
+            CompressedText holding the compressed bytes
+        """
+        compressor = compressor or default_compressor()
+        blob = compressor.compress(text.encode('utf-8'))
+        return cls(blob, compressor.id, len(text))
+
+    def text(self) -> str:
+        """Decompress and return the text.
+
+        Returns:
+            The original string
+
+        Raises:
+            CodecError: If the blob cannot be decompressed
+        """
+        compressor = _compressors_by_id.get(self._compressor_id)
+        if compressor is None:
+            raise CodecError(f"Compressor id {self._compressor_id} is not available")
+
+        try:
+            return compressor.decompress(self._blob).decode('utf-8')
+        except Exception as e:
+            raise CodecError(f"Failed to decompress text: {str(e)}")
+
+    @property
+    def compressed_size(self) -> int:
+        """Get the size of the compressed bytes."""
+        return len(self._blob)
+
+    def __len__(self) -> int:
+        """Get the length of the original text in characters."""
+        return self._length
+
+    def __reduce_ex__(self, protocol):
+        """Pickle the compressed bytes out-of-band where the protocol allows it."""
+        blob = pickle.PickleBuffer(self._blob) if protocol >= 5 else self._blob
+        return (_restore_compressed_text, (blob, self._compressor_id, self._length))
+
+    def __repr__(self) -> str:
+        """Get string representation of the compressed text."""
+        return f"CompressedText(length={self._length}, compressed_size={len(self._blob)})"
+
+
+def _restore_compressed_text(blob: Any, compressor_id: int, length: int) -> CompressedText:
+    """Rebuild CompressedText from pickled state."""
+    return CompressedText(bytes(blob), compressor_id, length)
+
+
+class CacheCodec:
+    """Serializer plus compressor used to store cache values as bytes.
+
+    Values are pickled with protocol 5. The main pickle stream is compressed
+    when it is at least ``min_size`` bytes; out-of-band buffers (such as the
+    bytes inside ``CompressedText``) are stored uncompressed.
+    """
+
+    _MAGIC = b'SSC1'
+    _HEADER = struct.Struct('!4sBBI')  # magic, compressor id, compressed flag, frame count
+    _LENGTH = struct.Struct('!Q')
+
+    def __init__(self, compressor: Union[str, Compressor] = 'none', min_size: int = 1024):
+        """Initialize the codec.
+
+        Args:
+            compressor: Compressor name or instance
+            min_size: Minimum stream size in bytes before compression is applied
+        """
+        self.compressor = get_compressor(compressor) if isinstance(compressor, str) else compressor
+        self.min_size = min_size
+
+    @property
+    def name(self) -> str:
+        """Get the codec spec string (e.g. 'pickle+zlib')."""
+        if self.compressor.name == 'none':
+            return 'pickle'
+        return f"pickle+{self.compressor.name}"
+
+    def encode(self, value: Any) -> bytes:
+        """Encode a value to bytes.
+
+        Args:
+            value: Value to encode
+
+        Returns:
+            Encoded bytes
+
+        Raises:
+            CodecError: If the value cannot be serialized
+        """
+        buffers: List[pickle.PickleBuffer] = []
+        try:
+            stream = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+        except Exception as e:
+            raise CodecError(f"Failed to serialize value: {str(e)}")
+
+        compressed = self.compressor.id != 0 and len(stream) >= self.min_size
+        if compressed:
+            stream = self.compressor.compress(stream)
+
+        frames = [stream] + [buf.raw() for buf in buffers]
+        parts = [self._HEADER.pack(self._MAGIC, self.compressor.id, int(compressed), len(frames))]
+        for frame in frames:
+            parts.append(self._LENGTH.pack(len(frame)))
+            parts.append(frame)
+        return b''.join(parts)
+
+    def decode(self, data: bytes) -> Any:
+        """Decode bytes produced by ``encode``.
+
+        Args:
+            data: Encoded bytes
+
+        Returns:
+            The decoded value
+
+        Raises:
+            CodecError: If the data is corrupt or uses an unavailable compressor
+        """
+        view = memoryview(data)
+        try:
+            magic, compressor_id, compressed, frame_count = self._HEADER.unpack_from(view, 0)
+        except struct.error as e:
+            raise CodecError(f"Invalid codec header: {str(e)}")
+
+        if magic != self._MAGIC:
+            raise CodecError("Invalid codec header")
+
+        try:
+            offset = self._HEADER.size
+            frames = []
+            for _ in range(frame_count):
+                (length,) = self._LENGTH.unpack_from(view, offset)
+                offset += self._LENGTH.size
+                if offset + length > len(view):
+                    raise CodecError("Truncated frame")
+                frames.append(view[offset:offset + length])
+                offset += length
+            if not frames:
+                raise CodecError("No frames")
+
+            stream = frames[0]
+            if compressed:
+                compressor = _compressors_by_id.get(compressor_id)
+                if compressor is None:
+                    raise CodecError(f"Compressor id {compressor_id} is not available")
+                stream = compressor.decompress(stream)
+        except CodecError:
+            raise
+        except Exception as e:
+            raise CodecError(f"Corrupt encoded value: {str(e)}")
+
+        try:
+            return pickle.loads(stream, buffers=frames[1:])
+        except Exception as e:
+            raise CodecError(f"Failed to deserialize value: {str(e)}")
+
+
+def get_codec(spec: Optional[str]) -> Optional[CacheCodec]:
+    """Build a codec from a spec string.
+
+    Args:
+        spec: 'pickle' or 'pickle+<compressor>' (e.g. 'pickle+zlib'), or None
+
+    Returns:
+        The codec, or None if spec is None
+
+    Raises:
+        CacheConfigError: If the spec is invalid
+    """
+    if spec is None:
+        return None
+
+    serializer, _, compressor = spec.partition('+')
+    if serializer != 'pickle':
+        raise CacheConfigError(f"Unsupported cache serializer '{serializer}'")
+
+    return CacheCodec(compressor or 'none')
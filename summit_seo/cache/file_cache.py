@@ -7,13 +7,18 @@ import pickle
 import hashlib
 import tempfile
 import fnmatch
-import time
+import logging
 import shutil
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, TypeVar, Union, Set
 
 from .base import BaseCache, CacheConfig, CacheError, CacheKeyError, CacheResult, CacheValueError, CacheKey
+from .codec import CodecError, get_codec
+from .file_index import FileCacheIndex
+
+# Setup logging
+logger = logging.getLogger(__name__)
 
 # Type variables for key and value
 K = TypeVar('K')
@@ -28,34 +33,41 @@ class FileCache(BaseCache[CacheKey, Any]):
     """File-based cache implementation.
     
     This cache stores items in files on disk for persistence between
-    application runs.
+    application runs. Values are encoded with the configured codec
+    (plain pickle by default), so compressed codecs shrink files on disk.
+    
+    Each namespace keeps a persistent LRU and expiry index, so eviction,
+    expiry sweeps and key queries do not scan the cache directory.
     """
     
     def __init__(self, config: Optional[CacheConfig] = None):
         """Initialize the file cache.
         
         Args:
-            config: Optional cache configuration. In addition to standard CacheConfig,
-                   supports 'cache_dir' parameter.
+            config: Optional cache configuration. Files are stored under
+                   config.cache_dir, or a temp directory if it is not set.
         """
         super().__init__(config)
         
         # Get cache directory from config or use temp directory
-        self._cache_dir = self.config.metadata.get('cache_dir') if hasattr(self.config, 'metadata') else None
+        self._cache_dir = self.config.cache_dir
         if not self._cache_dir:
             self._cache_dir = os.path.join(tempfile.gettempdir(), 'summit_seo_cache')
             
         # Create cache directory if it doesn't exist
         os.makedirs(self._cache_dir, exist_ok=True)
         
-        # Create namespace directory
-        self._ensure_namespace(self.config.namespace)
-        
         # Lock for thread safety
         self._lock = asyncio.Lock()
         
-        # Internal key registry to avoid file system lookups
-        self._registry: Dict[str, Set[str]] = {}
+        # Codec for value storage
+        self._codec = get_codec(self.config.codec or 'pickle')
+        
+        # Per-namespace LRU and expiry indexes to avoid file system scans
+        self._indexes: Dict[str, FileCacheIndex] = {}
+        
+        # Create namespace directory
+        self._ensure_namespace(self.config.namespace)
     
     def _ensure_namespace(self, namespace: str) -> None:
         """Ensure namespace directory exists.
@@ -66,18 +78,84 @@ class FileCache(BaseCache[CacheKey, Any]):
         ns_dir = os.path.join(self._cache_dir, namespace)
         os.makedirs(ns_dir, exist_ok=True)
         
-        # Initialize registry for this namespace
-        if namespace not in self._registry:
-            self._registry[namespace] = set()
+        # Rebuild the index for this namespace from its journal and files
+        if namespace not in self._indexes:
+            index = FileCacheIndex(ns_dir)
             
-            # Load existing keys from directory
             try:
-                for filename in os.listdir(ns_dir):
-                    if filename.endswith('.cache'):
-                        key = self._filename_to_key(filename)
-                        self._registry[namespace].add(key)
+                index.load(lambda key_hash: self._read_index_info(ns_dir, key_hash))
             except (OSError, IOError) as e:
                 raise FileCacheError(f"Error accessing cache directory: {str(e)}")
+            
+            self._indexes[namespace] = index
+    
+    def _get_index(self, namespace: Optional[str] = None) -> FileCacheIndex:
+        """Get the index for a namespace, loading it if needed.
+        
+        Args:
+            namespace: Optional namespace (defaults to config namespace)
+            
+        Returns:
+            Index for the namespace
+        """
+        ns = namespace or self.config.namespace
+        if ns not in self._indexes:
+            self._ensure_namespace(ns)
+        return self._indexes[ns]
+    
+    def _read_index_info(self, ns_dir: str, key_hash: str) -> Optional[Tuple[Any, Optional[float]]]:
+        """Read the index information of a cache file missing from the index.
+        
+        Corrupt files are removed.
+        
+        Args:
+            ns_dir: Namespace directory
+            key_hash: Hash of the cache file
+            
+        Returns:
+            Tuple of (key, remove_at), or None if the file is unreadable
+        """
+        file_path = os.path.join(ns_dir, f"{key_hash}.cache")
+        
+        try:
+            with open(file_path, 'rb') as f:
+                entry = pickle.load(f)
+            return entry.get('key', key_hash), self._remove_at(entry)
+        except (OSError, IOError):
+            return None
+        except Exception as e:
+            logger.warning(f"Removing corrupt cache file {file_path}: {str(e)}")
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
+            return None
+    
+    @staticmethod
+    def _remove_at(entry: Dict[str, Any]) -> Optional[float]:
+        """Get the time after which an entry can no longer be served.
+        
+        Args:
+            entry: Cache entry
+            
+        Returns:
+            Timestamp at the end of the stale window, or None if it never expires
+        """
+        if entry['ttl'] <= 0:
+            return None
+        return entry['timestamp'] + entry['ttl'] + entry.get('stale_ttl', 0)
+    
+    def _remove_file(self, ns: str, key_hash: str) -> None:
+        """Remove a cache file, ignoring files that are already gone.
+        
+        Args:
+            ns: Namespace of the file
+            key_hash: Hash of the cache file
+        """
+        try:
+            os.remove(os.path.join(self._cache_dir, ns, f"{key_hash}.cache"))
+        except FileNotFoundError:
+            pass
     
     def _get_file_path(self, key: CacheKey, namespace: Optional[str] = None) -> str:
         """Get the file path for a cache key.
@@ -163,12 +241,31 @@ class FileCache(BaseCache[CacheKey, Any]):
                 # Check if entry has expired
                 now = datetime.now().timestamp()
                 expiration_time = entry['timestamp'] + entry['ttl']
+                stale_ttl = entry.get('stale_ttl', 0)
+                
+                if entry['ttl'] > 0 and now > expiration_time and now <= expiration_time + stale_ttl:
+                    # Serve the stale value and let the caller revalidate
+                    self._update_stats(stale=True)
+                    
+                    return CacheResult(
+                        value=self._decode_value(entry),
+                        hit=True,
+                        timestamp=datetime.fromtimestamp(entry['timestamp']),
+                        ttl=entry['ttl'],
+                        expired=True,
+                        metadata={
+                            'stale': True,
+                            'stale_ttl': stale_ttl,
+                            'access_count': entry['access_count'],
+                            'last_accessed': datetime.fromtimestamp(entry['last_accessed'])
+                        }
+                    )
                 
                 if entry['ttl'] > 0 and now > expiration_time:
                     # Remove expired entry
                     os.remove(file_path)
                     key_hash = self._key_to_filename(key)
-                    self._registry[self.config.namespace].discard(key_hash[:-6])
+                    self._get_index().discard(key_hash[:-6])
                     self._update_stats(miss=True)
                     
                     return CacheResult(
@@ -187,9 +284,10 @@ class FileCache(BaseCache[CacheKey, Any]):
                 with open(file_path, 'wb') as f:
                     pickle.dump(entry, f)
                 
+                self._get_index().touch(self._key_to_filename(key)[:-6])
                 self._update_stats(hit=True)
                 return CacheResult(
-                    value=entry['value'],
+                    value=self._decode_value(entry),
                     hit=True,
                     timestamp=datetime.fromtimestamp(entry['timestamp']),
                     ttl=entry['ttl'],
@@ -200,17 +298,19 @@ class FileCache(BaseCache[CacheKey, Any]):
                     }
                 )
                 
-        except (OSError, IOError, pickle.PickleError) as e:
+        except (OSError, IOError, pickle.PickleError, CodecError) as e:
             self._update_stats(error=True)
             raise FileCacheError(f"Error reading cache file: {str(e)}")
     
-    async def set(self, key: CacheKey, value: Any, ttl: Optional[int] = None) -> None:
+    async def set(self, key: CacheKey, value: Any, ttl: Optional[int] = None,
+                  stale_ttl: Optional[int] = None) -> None:
         """Set a value in the cache.
         
         Args:
             key: The cache key to set
             value: The value to cache
             ttl: Optional time to live in seconds (overrides config.ttl if provided)
+            stale_ttl: Optional stale window in seconds (overrides config.stale_ttl)
             
         Raises:
             CacheKeyError: If the key is invalid
@@ -226,18 +326,30 @@ class FileCache(BaseCache[CacheKey, Any]):
             raise CacheValueError("Cache value cannot be None")
         
         ttl_value = ttl if ttl is not None else self.config.ttl
+        stale_ttl_value = stale_ttl if stale_ttl is not None else self.config.stale_ttl
         file_path = self._get_file_path(key)
         
+        try:
+            encoded_value = self._codec.encode(value)
+        except CodecError as e:
+            self._update_stats(error=True)
+            raise CacheValueError(f"Cannot encode cache value: {str(e)}")
+        
+        key_hash = self._key_to_filename(key)[:-6]
+        
         # Check if we need to evict items to maintain max_size
         async with self._lock:
-            if len(self._registry[self.config.namespace]) >= self.config.max_size:
+            index = self._get_index()
+            if key_hash not in index and len(index) >= self.config.max_size:
                 await self._evict_items()
             
             # Create cache entry
             entry = {
                 'key': key,
-                'value': value,
+                'value': encoded_value,
+                'codec': self._codec.name,
                 'ttl': ttl_value,
+                'stale_ttl': stale_ttl_value,
                 'timestamp': datetime.now().timestamp(),
                 'last_accessed': datetime.now().timestamp(),
                 'access_count': 0
@@ -248,47 +360,51 @@ class FileCache(BaseCache[CacheKey, Any]):
                 with open(file_path, 'wb') as f:
                     pickle.dump(entry, f)
                 
-                # Add to registry
-                key_hash = self._key_to_filename(key)
-                self._registry[self.config.namespace].add(key_hash[:-6])
+                # Add to index as the most recently used entry
+                index.add(key_hash, key, self._remove_at(entry))
                 self._update_stats(set_op=True)
                 
             except (OSError, IOError, pickle.PickleError) as e:
                 self._update_stats(error=True)
                 raise FileCacheError(f"Error writing cache file: {str(e)}")
     
+    def _decode_value(self, entry: Dict[str, Any]) -> Any:
+        """Decode the value stored in a cache entry.
+        
+        Args:
+            entry: Cache entry loaded from disk
+            
+        Returns:
+            The decoded value
+        """
+        codec_name = entry.get('codec')
+        if codec_name is None:
+            # Entry written before codecs were introduced
+            return entry['value']
+        
+        codec = self._codec if codec_name == self._codec.name else get_codec(codec_name)
+        return codec.decode(entry['value'])
+    
     async def _evict_items(self) -> int:
-        """Evict items to maintain max cache size.
+        """Evict least recently used items to maintain max cache size.
         
         Returns:
             Number of evicted items
         """
         ns = self.config.namespace
-        ns_dir = os.path.join(self._cache_dir, ns)
+        index = self._get_index(ns)
         evicted = 0
         
         try:
-            # Get all cache files with their last modified time
-            files = []
-            for filename in os.listdir(ns_dir):
-                if filename.endswith('.cache'):
-                    file_path = os.path.join(ns_dir, filename)
-                    mtime = os.path.getmtime(file_path)
-                    files.append((file_path, mtime, filename))
-            
-            # Sort by last modified time (oldest first)
-            files.sort(key=lambda x: x[1])
-            
-            # Remove oldest files to get below max_size
-            to_remove = max(1, len(files) - self.config.max_size + 1)
-            for i in range(to_remove):
-                if i < len(files):
-                    file_path, _, filename = files[i]
-                    os.remove(file_path)
-                    key_hash = self._filename_to_key(filename)
-                    self._registry[ns].discard(key_hash)
-                    evicted += 1
-                    self._update_stats(eviction=True)
+            # Remove least recently used entries to get below max_size
+            while len(index) >= self.config.max_size:
+                key_hash = index.pop_lru()
+                if key_hash is None:
+                    break
+                
+                self._remove_file(ns, key_hash)
+                evicted += 1
+                self._update_stats(eviction=True)
             
             return evicted
             
@@ -318,7 +434,7 @@ class FileCache(BaseCache[CacheKey, Any]):
                 try:
                     os.remove(file_path)
                     key_hash = self._key_to_filename(key)
-                    self._registry[self.config.namespace].discard(key_hash[:-6])
+                    self._get_index().discard(key_hash[:-6])
                     return True
                 except (OSError, IOError) as e:
                     raise FileCacheError(f"Error removing cache file: {str(e)}")
@@ -352,8 +468,8 @@ class FileCache(BaseCache[CacheKey, Any]):
                         os.remove(file_path)
                         count += 1
                 
-                # Clear registry for this namespace
-                self._registry[ns] = set()
+                # Clear index for this namespace
+                self._get_index(ns).clear()
                 
                 return count
                 
@@ -381,6 +497,11 @@ class FileCache(BaseCache[CacheKey, Any]):
                             if filename.endswith('.cache'):
                                 count += 1
                 
+                # Close index journals before removing their files
+                for index in self._indexes.values():
+                    index.close()
+                self._indexes.clear()
+                
                 # Remove all files
                 shutil.rmtree(self._cache_dir)
                 
@@ -388,10 +509,6 @@ class FileCache(BaseCache[CacheKey, Any]):
                 os.makedirs(self._cache_dir, exist_ok=True)
                 self._ensure_namespace(self.config.namespace)
                 
-                # Clear registry
-                self._registry.clear()
-                self._registry[self.config.namespace] = set()
-                
                 return count
                 
             except (OSError, IOError) as e:
@@ -400,6 +517,8 @@ class FileCache(BaseCache[CacheKey, Any]):
     async def get_keys(self, pattern: Optional[str] = None) -> List[CacheKey]:
         """Get all cache keys matching a pattern in the current namespace.
         
+        Keys are answered from the index without reading the cache directory.
+        
         Args:
             pattern: Optional pattern to match keys against
             
@@ -409,26 +528,19 @@ class FileCache(BaseCache[CacheKey, Any]):
         Raises:
             FileCacheError: If there's an error reading the cache directory
         """
-        ns = self.config.namespace
-        ns_dir = os.path.join(self._cache_dir, ns)
-        
-        if not os.path.exists(ns_dir):
-            return []
+        async with self._lock:
+            keys = self._get_index().keys()
         
-        try:
-            keys = []
-            for filename in os.listdir(ns_dir):
-                if filename.endswith('.cache'):
-                    # For file cache, we can only return the hash as the key
-                    key = self._filename_to_key(filename)
-                    
-                    if pattern is None or (isinstance(pattern, str) and fnmatch.fnmatch(key, pattern)):
-                        keys.append(key)
-            
+        if pattern is None:
             return keys
-            
-        except (OSError, IOError) as e:
-            raise FileCacheError(f"Error reading cache directory: {str(e)}")
+        
+        if isinstance(pattern, str):
+            return [
+                key for key in keys
+                if isinstance(key, str) and fnmatch.fnmatch(key, pattern)
+            ]
+        
+        return keys
     
     async def get_size(self) -> int:
         """Get the current size of the default namespace cache.
@@ -441,8 +553,8 @@ class FileCache(BaseCache[CacheKey, Any]):
         """
         ns = self.config.namespace
         
-        if ns in self._registry:
-            return len(self._registry[ns])
+        if ns in self._indexes:
+            return len(self._indexes[ns])
         
         return 0
     
@@ -475,10 +587,14 @@ class FileCache(BaseCache[CacheKey, Any]):
             expiration_time = entry['timestamp'] + entry['ttl']
             
             if entry['ttl'] > 0 and now > expiration_time:
+                # Keep entries that can still be served stale
+                if now <= expiration_time + entry.get('stale_ttl', 0):
+                    return False
+                
                 # Remove expired entry
                 os.remove(file_path)
                 key_hash = self._key_to_filename(key)
-                self._registry[self.config.namespace].discard(key_hash[:-6])
+                self._get_index().discard(key_hash[:-6])
                 return False
             
             return True
@@ -489,6 +605,12 @@ class FileCache(BaseCache[CacheKey, Any]):
     async def cleanup_expired(self) -> int:
         """Remove all expired entries from the cache.
         
+        Expired entries are taken from the expiry index of each namespace
+        this cache has loaded, so only files that are actually past their
+        stale window are touched. Namespaces of other caches sharing the
+        cache directory are left to their owners, which keep their own
+        index and journal for them.
+        
         Returns:
             Number of removed entries
             
@@ -500,39 +622,21 @@ class FileCache(BaseCache[CacheKey, Any]):
         
         async with self._lock:
             try:
-                # Check each namespace
-                for ns in os.listdir(self._cache_dir):
-                    ns_dir = os.path.join(self._cache_dir, ns)
-                    
-                    if os.path.isdir(ns_dir):
-                        # Check each file in namespace
-                        for filename in os.listdir(ns_dir):
-                            if filename.endswith('.cache'):
-                                file_path = os.path.join(ns_dir, filename)
-                                
-                                # Check if entry has expired
-                                try:
-                                    with open(file_path, 'rb') as f:
-                                        entry = pickle.load(f)
-                                    
-                                    expiration_time = entry['timestamp'] + entry['ttl']
-                                    
-                                    if entry['ttl'] > 0 and now > expiration_time:
-                                        # Remove expired entry
-                                        os.remove(file_path)
-                                        
-                                        # Update registry
-                                        if ns in self._registry:
-                                            key_hash = self._filename_to_key(filename)
-                                            self._registry[ns].discard(key_hash)
-                                        
-                                        count += 1
-                                except (pickle.PickleError, EOFError):
-                                    # If file is corrupt, remove it
-                                    os.remove(file_path)
-                                    count += 1
+                # Check each namespace this cache has an index for
+                for ns, index in list(self._indexes.items()):
+                    for key_hash in index.pop_expired(now):
+                        self._remove_file(ns, key_hash)
+                        count += 1
                 
                 return count
                 
             except (OSError, IOError) as e:
-                raise FileCacheError(f"Error cleaning up expired entries: {str(e)}") 
\ No newline at end of file
+                raise FileCacheError(f"Error cleaning up expired entries: {str(e)}")
+    
+    def get_index_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get statistics of the loaded namespace indexes.
+        
+        Returns:
+            Dictionary mapping namespace to index statistics
+        """
+        return {ns: index.get_stats() for ns, index in self._indexes.items()}
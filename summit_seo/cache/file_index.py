@@ -0,0 +1,274 @@
+"""Persistent LRU and expiry index for the file cache.
+
+The index tracks every entry in a file cache namespace so eviction, expiry
+sweeps and key queries never have to list or stat the cache directory.
+Entries are kept in an OrderedDict in least-recently-used order, and
+expiration times are kept in a min-heap with lazy deletion.
+
+Changes are appended to a journal file in the namespace directory. On
+startup the journal is replayed and reconciled with the files actually on
+disk, and the journal is periodically compacted into a snapshot so it
+stays proportional to the number of entries.
+"""
+
+import heapq
+import json
+import logging
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class IndexEntry:
+    """Index record for a single cache file."""
+    key: Any  # Original cache key
+    remove_at: Optional[float] = None  # When the entry is past its stale window (None: never)
+
+
+class FileCacheIndex:
+    """LRU and expiry index for one file cache namespace."""
+
+    JOURNAL_NAME = '_index.journal'
+
+    # Compact once the journal has this many times more records than entries
+    COMPACT_RATIO = 4
+    MIN_COMPACT_RECORDS = 1024
+
+    def __init__(self, ns_dir: str):
+        """Initialize the index.
+
+        Args:
+            ns_dir: Namespace directory holding the cache files
+        """
+        self.ns_dir = ns_dir
+        self.journal_path = os.path.join(ns_dir, self.JOURNAL_NAME)
+        self._entries: 'OrderedDict[str, IndexEntry]' = OrderedDict()
+        self._expiry: List[Tuple[float, str]] = []
+        self._journal = None
+        self._records = 0
+
+    def __len__(self) -> int:
+        """Get the number of indexed entries."""
+        return len(self._entries)
+
+    def __contains__(self, key_hash: str) -> bool:
+        """Check whether a key hash is indexed."""
+        return key_hash in self._entries
+
+    def load(self, read_entry: Callable[[str], Optional[Tuple[Any, Optional[float]]]]) -> None:
+        """Rebuild the index from the journal and the files on disk.
+
+        Files not present in the journal (for example written by an older
+        version) are read once with ``read_entry``; journal records whose
+        file no longer exists are dropped. The journal is then compacted.
+
+        Args:
+            read_entry: Function taking a key hash and returning
+                (key, remove_at) for its file, or None if it is unreadable
+        """
+        self._entries.clear()
+        self._expiry = []
+
+        if os.path.exists(self.journal_path):
+            self._replay()
+
+        on_disk = {
+            filename[:-6] for filename in os.listdir(self.ns_dir)
+            if filename.endswith('.cache')
+        }
+
+        for key_hash in list(self._entries):
+            if key_hash not in on_disk:
+                del self._entries[key_hash]
+
+        for key_hash in on_disk - set(self._entries):
+            info = read_entry(key_hash)
+            if info is not None:
+                self._entries[key_hash] = IndexEntry(key=info[0], remove_at=info[1])
+
+        for key_hash, entry in self._entries.items():
+            if entry.remove_at is not None:
+                self._expiry.append((entry.remove_at, key_hash))
+        heapq.heapify(self._expiry)
+
+        self.compact()
+
+    def _replay(self) -> None:
+        """Apply the journal records to the in-memory index."""
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Torn write at the end of the journal
+                    logger.warning(f"Skipping corrupt cache index record in {self.journal_path}")
+                    continue
+
+                op, key_hash = record[0], record[1]
+                if op == 's':
+                    self._entries.pop(key_hash, None)
+                    self._entries[key_hash] = IndexEntry(key=_decode_key(record[2]), remove_at=record[3])
+                elif op == 't':
+                    if key_hash in self._entries:
+                        self._entries.move_to_end(key_hash)
+                elif op == 'd':
+                    self._entries.pop(key_hash, None)
+
+    def _append(self, record: List[Any]) -> None:
+        """Append a record to the journal.
+
+        Args:
+            record: Journal record
+        """
+        if self._journal is None:
+            self._journal = open(self.journal_path, 'a', encoding='utf-8')
+
+        self._journal.write(json.dumps(record, default=str) + '\n')
+        self._journal.flush()
+        self._records += 1
+
+        if self._records >= max(self.MIN_COMPACT_RECORDS, self.COMPACT_RATIO * len(self._entries)):
+            self.compact()
+
+    def add(self, key_hash: str, key: Any, remove_at: Optional[float]) -> None:
+        """Add or replace an entry as the most recently used.
+
+        Args:
+            key_hash: Hash used as the cache file name
+            key: Original cache key
+            remove_at: Timestamp after which the entry can be removed (None: never)
+        """
+        self._entries.pop(key_hash, None)
+        self._entries[key_hash] = IndexEntry(key=key, remove_at=remove_at)
+
+        if remove_at is not None:
+            heapq.heappush(self._expiry, (remove_at, key_hash))
+
+        self._append(['s', key_hash, _encode_key(key), remove_at])
+
+    def touch(self, key_hash: str) -> None:
+        """Mark an entry as most recently used.
+
+        Args:
+            key_hash: Hash of the accessed entry
+        """
+        if key_hash in self._entries:
+            self._entries.move_to_end(key_hash)
+            self._append(['t', key_hash])
+
+    def discard(self, key_hash: str) -> bool:
+        """Remove an entry from the index.
+
+        Args:
+            key_hash: Hash of the entry to remove
+
+        Returns:
+            True if the entry was indexed, False otherwise
+        """
+        if self._entries.pop(key_hash, None) is None:
+            return False
+
+        self._append(['d', key_hash])
+        return True
+
+    def pop_lru(self) -> Optional[str]:
+        """Remove and return the least recently used entry.
+
+        Returns:
+            Key hash of the removed entry, or None if the index is empty
+        """
+        if not self._entries:
+            return None
+
+        key_hash, _ = self._entries.popitem(last=False)
+        self._append(['d', key_hash])
+        return key_hash
+
+    def pop_expired(self, now: float) -> Iterator[str]:
+        """Remove and yield entries whose stale window has passed.
+
+        Heap records made obsolete by a later set or removal are skipped.
+
+        Args:
+            now: Current timestamp
+
+        Yields:
+            Key hashes of expired entries
+        """
+        while self._expiry and self._expiry[0][0] < now:
+            remove_at, key_hash = heapq.heappop(self._expiry)
+            entry = self._entries.get(key_hash)
+            if entry is not None and entry.remove_at == remove_at:
+                del self._entries[key_hash]
+                self._append(['d', key_hash])
+                yield key_hash
+
+    def keys(self) -> List[Any]:
+        """Get the original keys of all entries in LRU order.
+
+        Returns:
+            List of cache keys
+        """
+        return [entry.key for entry in self._entries.values()]
+
+    def compact(self) -> None:
+        """Rewrite the journal as a snapshot of the current entries."""
+        self.close()
+
+        tmp_path = self.journal_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for key_hash, entry in self._entries.items():
+                f.write(json.dumps(['s', key_hash, _encode_key(entry.key), entry.remove_at], default=str) + '\n')
+        os.replace(tmp_path, self.journal_path)
+
+        self._records = len(self._entries)
+
+        # Drop heap records that no longer match an entry
+        self._expiry = [
+            (remove_at, key_hash) for remove_at, key_hash in self._expiry
+            if key_hash in self._entries and self._entries[key_hash].remove_at == remove_at
+        ]
+        heapq.heapify(self._expiry)
+
+    def clear(self) -> None:
+        """Remove all entries and truncate the journal."""
+        self._entries.clear()
+        self._expiry = []
+        self.compact()
+
+    def close(self) -> None:
+        """Close the journal file."""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics.
+
+        Returns:
+            Dictionary containing index statistics
+        """
+        return {
+            'entries': len(self._entries),
+            'expiry_heap': len(self._expiry),
+            'journal_records': self._records
+        }
+
+
+def _encode_key(key: Any) -> Any:
+    """Convert a cache key into a JSON-compatible value."""
+    if isinstance(key, tuple):
+        return {'tuple': [str(item) for item in key]}
+    return key if isinstance(key, str) else str(key)
+
+
+def _decode_key(value: Any) -> Any:
+    """Restore a cache key written by _encode_key."""
+    if isinstance(value, dict):
+        return tuple(value['tuple'])
+    return value
@@ -0,0 +1,349 @@
+"""Segmented log cache implementation."""
+
+import asyncio
+import fnmatch
+import os
+import shutil
+import struct
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .base import BaseCache, CacheConfig, CacheError, CacheKey, CacheKeyError, CacheResult, CacheValueError
+from .codec import CodecError, get_codec
+from .log_store import LogStore, LogStoreError
+
+
+class LogCacheError(CacheError):
+    """Exception raised for log cache-specific errors."""
+    pass
+
+
+class LogCache(BaseCache[CacheKey, Any]):
+    """Cache backed by append-only, memory-mapped segment files.
+
+    Suited to millions of small entries (robots.txt, headers, small analyzer
+    results) where one file per entry would exhaust inodes. Each namespace
+    is a LogStore directory under config.cache_dir. Reads are a single slice
+    of a memory-mapped segment; overwritten, deleted and expired entries are
+    reclaimed by compaction, which runs in a background thread once sealed
+    segments are mostly dead.
+
+    max_size is enforced approximately: when it is exceeded, the oldest
+    segment and all entries stored in it are dropped. Tuple keys are stored
+    joined with ':' and returned as strings by get_keys().
+    """
+
+    # Header stored before each encoded value: timestamp, ttl, stale_ttl
+    _HEADER = struct.Struct('!dII')
+
+    def __init__(self, config: Optional[CacheConfig] = None,
+                 segment_size: int = LogStore.DEFAULT_SEGMENT_SIZE):
+        """Initialize the log cache.
+
+        Args:
+            config: Optional cache configuration. Files are stored under
+                   config.cache_dir, or a temp directory if it is not set.
+            segment_size: Size of each segment file in bytes
+        """
+        super().__init__(config)
+
+        self._cache_dir = self.config.cache_dir or os.path.join(tempfile.gettempdir(), 'summit_seo_log_cache')
+        self._segment_size = segment_size
+        self._stores: Dict[str, LogStore] = {}
+        self._compaction: Optional[asyncio.Task] = None
+
+        # Codec for value storage
+        self._codec = get_codec(self.config.codec or 'pickle')
+
+        self._get_store()
+
+    def _get_store(self, namespace: Optional[str] = None) -> LogStore:
+        """Get the store for a namespace, opening it if needed.
+
+        Args:
+            namespace: Optional namespace (defaults to config namespace)
+
+        Returns:
+            Store for the namespace
+
+        Raises:
+            LogCacheError: If the store cannot be opened
+        """
+        ns = namespace or self.config.namespace
+        if ns not in self._stores:
+            try:
+                self._stores[ns] = LogStore(os.path.join(self._cache_dir, ns), self._segment_size)
+            except (OSError, LogStoreError) as e:
+                raise LogCacheError(f"Error opening log store: {str(e)}")
+        return self._stores[ns]
+
+    @staticmethod
+    def _encode_key(key: CacheKey) -> bytes:
+        """Convert a cache key to key bytes."""
+        key_str = ':'.join(str(item) for item in key) if isinstance(key, tuple) else str(key)
+        return key_str.encode('utf-8')
+
+    async def get(self, key: CacheKey) -> CacheResult[Any]:
+        """Get a value from the cache.
+
+        Args:
+            key: The cache key to retrieve
+
+        Returns:
+            CacheResult containing the value and hit status
+
+        Raises:
+            CacheKeyError: If the key is invalid
+            LogCacheError: If the stored entry cannot be read
+        """
+        if key is None:
+            self._update_stats(miss=True)
+            raise CacheKeyError("Cache key cannot be None")
+
+        try:
+            found = self._get_store().get(self._encode_key(key))
+            if found is None:
+                self._update_stats(miss=True)
+                return CacheResult(value=None, hit=False, timestamp=datetime.now(), ttl=self.config.ttl)
+
+            data = found[0]
+            timestamp, ttl, stale_ttl = self._HEADER.unpack_from(data, 0)
+            value = self._codec.decode(data[self._HEADER.size:])
+        except (LogStoreError, CodecError, struct.error) as e:
+            self._update_stats(error=True)
+            raise LogCacheError(f"Error reading cache entry: {str(e)}")
+
+        expiration_time = timestamp + ttl
+        if ttl > 0 and time.time() > expiration_time:
+            # The record outlives its TTL only for the stale window
+            self._update_stats(stale=True)
+            return CacheResult(
+                value=value,
+                hit=True,
+                timestamp=datetime.fromtimestamp(timestamp),
+                ttl=ttl,
+                expired=True,
+                metadata={'stale': True, 'stale_ttl': stale_ttl}
+            )
+
+        self._update_stats(hit=True)
+        return CacheResult(
+            value=value,
+            hit=True,
+            timestamp=datetime.fromtimestamp(timestamp),
+            ttl=ttl,
+            expired=False
+        )
+
+    async def set(self, key: CacheKey, value: Any, ttl: Optional[int] = None,
+                  stale_ttl: Optional[int] = None) -> None:
+        """Set a value in the cache.
+
+        Args:
+            key: The cache key to set
+            value: The value to cache
+            ttl: Optional time to live in seconds (overrides config.ttl if provided)
+            stale_ttl: Optional stale window in seconds (overrides config.stale_ttl)
+
+        Raises:
+            CacheKeyError: If the key is invalid
+            CacheValueError: If the value is None, cannot be encoded or is too large
+        """
+        if key is None:
+            self._update_stats(error=True)
+            raise CacheKeyError("Cache key cannot be None")
+
+        if value is None:
+            self._update_stats(error=True)
+            raise CacheValueError("Cache value cannot be None")
+
+        ttl_value = ttl if ttl is not None else self.config.ttl
+        stale_ttl_value = stale_ttl if stale_ttl is not None else self.config.stale_ttl
+        now = time.time()
+
+        try:
+            data = self._HEADER.pack(now, ttl_value, stale_ttl_value) + self._codec.encode(value)
+        except CodecError as e:
+            self._update_stats(error=True)
+            raise CacheValueError(f"Cannot encode cache value: {str(e)}")
+
+        expires_at = now + ttl_value + stale_ttl_value if ttl_value > 0 else 0.0
+        store = self._get_store()
+
+        try:
+            store.put(self._encode_key(key), data, expires_at)
+        except LogStoreError as e:
+            self._update_stats(error=True)
+            raise CacheValueError(f"Cannot store cache value: {str(e)}")
+
+        self._update_stats(set_op=True)
+
+        while len(store) > self.config.max_size:
+            evicted = store.evict_oldest()
+            if not evicted:
+                break
+            for _ in range(evicted):
+                self._update_stats(eviction=True)
+
+        self._schedule_compaction(store)
+
+    def _schedule_compaction(self, store: LogStore) -> None:
+        """Start background compaction if a sealed segment is mostly dead.
+
+        Args:
+            store: Store to check
+        """
+        if self._compaction is not None and not self._compaction.done():
+            return
+
+        if store.compaction_candidates():
+            self._compaction = asyncio.get_running_loop().create_task(self.compact(store))
+
+    async def compact(self, store: Optional[LogStore] = None) -> int:
+        """Compact a store in a worker thread.
+
+        Args:
+            store: Store to compact (defaults to the current namespace)
+
+        Returns:
+            Number of bytes reclaimed
+        """
+        store = store or self._get_store()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, store.compact)
+
+    async def invalidate(self, key: CacheKey) -> bool:
+        """Invalidate a cache entry.
+
+        Args:
+            key: The cache key to invalidate
+
+        Returns:
+            True if the key was invalidated, False if it didn't exist
+
+        Raises:
+            CacheKeyError: If the key is invalid
+        """
+        if key is None:
+            raise CacheKeyError("Cache key cannot be None")
+
+        return self._get_store().delete(self._encode_key(key))
+
+    async def invalidate_namespace(self, namespace: Optional[str] = None) -> int:
+        """Invalidate all cache entries in a namespace.
+
+        Args:
+            namespace: The namespace to invalidate (defaults to config.namespace)
+
+        Returns:
+            Number of invalidated cache entries
+        """
+        store = self._get_store(namespace)
+        count = len(store)
+        store.clear()
+        return count
+
+    async def clear(self) -> int:
+        """Clear all cache entries in all namespaces.
+
+        Returns:
+            Number of cleared cache entries
+
+        Raises:
+            LogCacheError: If the cache directory cannot be removed
+        """
+        if self._compaction is not None:
+            await self._compaction
+
+        count = 0
+        try:
+            for ns in os.listdir(self._cache_dir):
+                count += len(self._get_store(ns))
+
+            for store in self._stores.values():
+                store.close()
+            self._stores.clear()
+
+            shutil.rmtree(self._cache_dir)
+        except OSError as e:
+            raise LogCacheError(f"Error clearing cache: {str(e)}")
+
+        self._get_store()
+        return count
+
+    async def get_keys(self, pattern: Optional[str] = None) -> List[CacheKey]:
+        """Get all cache keys matching a pattern in the current namespace.
+
+        Args:
+            pattern: Optional pattern to match keys against
+
+        Returns:
+            List of matching cache keys
+        """
+        keys = [key.decode('utf-8') for key in self._get_store().keys()]
+
+        if isinstance(pattern, str):
+            return [key for key in keys if fnmatch.fnmatch(key, pattern)]
+
+        return keys
+
+    async def get_size(self) -> int:
+        """Get the current size of the default namespace cache.
+
+        Returns:
+            Number of items in the cache
+        """
+        return len(self._get_store())
+
+    async def has_key(self, key: CacheKey) -> bool:
+        """Check if a key exists in the cache.
+
+        Args:
+            key: The cache key to check
+
+        Returns:
+            True if the key exists and has not expired, False otherwise
+        """
+        if key is None:
+            return False
+
+        found = self._get_store().get(self._encode_key(key))
+        if found is None:
+            return False
+
+        timestamp, ttl, _ = self._HEADER.unpack_from(found[0], 0)
+        return ttl == 0 or time.time() <= timestamp + ttl
+
+    async def cleanup_expired(self) -> int:
+        """Remove all expired entries and compact mostly-dead segments.
+
+        Returns:
+            Number of removed entries
+        """
+        count = 0
+        for store in list(self._stores.values()):
+            count += store.expire()
+            await self.compact(store)
+        return count
+
+    async def close(self) -> None:
+        """Wait for compaction and close all stores."""
+        if self._compaction is not None:
+            await self._compaction
+            self._compaction = None
+
+        for store in self._stores.values():
+            store.close()
+        self._stores.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics, including per-namespace store statistics.
+
+        Returns:
+            Dictionary containing cache statistics
+        """
+        stats = super().get_stats()
+        stats['stores'] = {ns: store.get_stats() for ns, store in self._stores.items()}
+        return stats
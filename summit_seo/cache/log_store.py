@@ -0,0 +1,887 @@
+"""Append-only segmented log store with a memory-mapped hash index.
+
+Records are appended to fixed-size segment files that are memory-mapped, so
+reads are a single slice of a mapping with no per-read ``open``. A hash
+index, itself a memory-mapped file using open addressing, maps each key to
+the segment, offset and length of its latest record. Because the index
+lives on disk, memory use stays flat even with tens of millions of keys,
+and the store reopens without rescanning its segments.
+
+Updates and deletions append new records (deletions append tombstones);
+``compact`` copies the live records out of mostly-dead segments and
+deletes them.
+
+Segment file layout::
+
+    header: magic (4s), version (H), end offset (Q), live bytes (Q),
+            padding to 32 bytes
+    record: crc32 (I), key length (H), value length (I), expires at (d),
+            flags (B), key bytes, value bytes
+
+A record with a key length of 0 marks the end of the written data. The
+index file header records the last applied log position; on open, records
+after that position are replayed, and a missing or corrupt index is rebuilt
+from the segments.
+"""
+
+import hashlib
+import logging
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from .base import CacheConfigError, CacheError
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+
+class LogStoreError(CacheError):
+    """Exception raised for log store errors."""
+    pass
+
+
+_SEGMENT_MAGIC = b'SSLG'
+_SEGMENT_HEADER = struct.Struct('!4sHQ')
+_SEGMENT_LIVE = struct.Struct('!Q')
+_SEGMENT_LIVE_OFFSET = _SEGMENT_HEADER.size
+SEGMENT_HEADER_SIZE = 32
+
+_RECORD = struct.Struct('!IHIdB')
+_RECORD_BODY = struct.Struct('!HIdB')  # record header without the crc
+_TOMBSTONE = 1
+
+_INDEX_MAGIC = b'SSIX'
+_INDEX_HEADER = struct.Struct('!4sHQQQIQ')  # magic, version, capacity, count, deleted, segment, offset
+INDEX_HEADER_SIZE = 64
+_SLOT = struct.Struct('!QIII')  # key hash, segment, offset, length
+
+_EMPTY = 0
+_DELETED = 1
+
+_SEGMENT_NAME = re.compile(r'^seg-(\d{8})\.log$')
+
+# Type alias for a record location: (segment, offset, length)
+Location = Tuple[int, int, int]
+
+
+def _key_hash(key: bytes) -> int:
+    """Hash a key to a 64-bit index value that is never EMPTY or DELETED."""
+    value = int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'big')
+    return value if value > _DELETED else value + 2
+
+
+class _HashIndex:
+    """Open-addressing hash table stored in a memory-mapped file.
+
+    Slots hold only a 64-bit key hash and the record location. Hash matches
+    are confirmed with a callback that compares the key stored in the log,
+    so colliding keys are resolved correctly.
+    """
+
+    MIN_CAPACITY = 1 << 14
+    MAX_LOAD = 0.7
+
+    def __init__(self, path: str):
+        """Open the index file, creating an empty index if needed.
+
+        Args:
+            path: Index file path
+        """
+        self.path = path
+        self._file = None
+        self._mm: Optional[mmap.mmap] = None
+        self.loaded = self._open_existing()
+        if not self.loaded:
+            self._create(path, self.MIN_CAPACITY)
+            self._map(path)
+
+    def _open_existing(self) -> bool:
+        """Map an existing, valid index file.
+
+        Returns:
+            True if a valid index was loaded
+        """
+        if not os.path.exists(self.path):
+            return False
+
+        try:
+            self._map(self.path)
+            magic, version, capacity, _, _, _, _ = _INDEX_HEADER.unpack_from(self._mm, 0)
+            expected = INDEX_HEADER_SIZE + capacity * _SLOT.size
+            if magic == _INDEX_MAGIC and version == 1 and len(self._mm) == expected:
+                return True
+        except (OSError, ValueError, struct.error):
+            pass
+
+        logger.warning(f"Rebuilding invalid log store index {self.path}")
+        self.close()
+        return False
+
+    @staticmethod
+    def _create(path: str, capacity: int) -> None:
+        """Create an empty index file.
+
+        Args:
+            path: Index file path
+            capacity: Number of slots
+        """
+        with open(path, 'wb') as f:
+            f.truncate(INDEX_HEADER_SIZE + capacity * _SLOT.size)
+            f.seek(0)
+            f.write(_INDEX_HEADER.pack(_INDEX_MAGIC, 1, capacity, 0, 0, 0, 0))
+
+    def _map(self, path: str) -> None:
+        """Memory-map the index file.
+
+        Args:
+            path: Index file path
+        """
+        self._file = open(path, 'r+b')
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        _, _, self.capacity, self.count, self.deleted, _, _ = _INDEX_HEADER.unpack_from(self._mm, 0)
+
+    def _write_header(self, segment: Optional[int] = None, offset: Optional[int] = None) -> None:
+        """Write the header, keeping the stored position unless one is given."""
+        if segment is None:
+            segment, offset = self.position
+        _INDEX_HEADER.pack_into(self._mm, 0, _INDEX_MAGIC, 1, self.capacity,
+                                self.count, self.deleted, segment, offset)
+
+    @property
+    def position(self) -> Tuple[int, int]:
+        """Get the last log position applied to the index."""
+        values = _INDEX_HEADER.unpack_from(self._mm, 0)
+        return values[5], values[6]
+
+    def set_position(self, segment: int, offset: int) -> None:
+        """Record the last log position applied to the index.
+
+        Args:
+            segment: Segment id
+            offset: Offset just past the last applied record
+        """
+        self._write_header(segment, offset)
+
+    def _slot(self, i: int) -> Tuple[int, int, int, int]:
+        """Read slot i."""
+        return _SLOT.unpack_from(self._mm, INDEX_HEADER_SIZE + i * _SLOT.size)
+
+    def _set_slot(self, i: int, key_hash: int, segment: int, offset: int, length: int) -> None:
+        """Write slot i."""
+        _SLOT.pack_into(self._mm, INDEX_HEADER_SIZE + i * _SLOT.size, key_hash, segment, offset, length)
+
+    def _find(self, key_hash: int, matches: Callable[[int, int], bool]) -> int:
+        """Find the slot holding a key.
+
+        Args:
+            key_hash: Hash of the key
+            matches: Callback confirming that (segment, offset) holds the key
+
+        Returns:
+            Slot number, or -1 if the key is not indexed
+        """
+        mask = self.capacity - 1
+        i = key_hash & mask
+        while True:
+            slot_hash, segment, offset, _ = self._slot(i)
+            if slot_hash == _EMPTY:
+                return -1
+            if slot_hash == key_hash and matches(segment, offset):
+                return i
+            i = (i + 1) & mask
+
+    def get(self, key_hash: int, matches: Callable[[int, int], bool]) -> Optional[Location]:
+        """Look up the location of a key.
+
+        Args:
+            key_hash: Hash of the key
+            matches: Callback confirming that (segment, offset) holds the key
+
+        Returns:
+            (segment, offset, length), or None if the key is not indexed
+        """
+        i = self._find(key_hash, matches)
+        if i < 0:
+            return None
+        _, segment, offset, length = self._slot(i)
+        return segment, offset, length
+
+    def put(self, key_hash: int, location: Location,
+            matches: Callable[[int, int], bool]) -> Optional[Location]:
+        """Insert or update the location of a key.
+
+        Args:
+            key_hash: Hash of the key
+            location: New (segment, offset, length)
+            matches: Callback confirming that (segment, offset) holds the key
+
+        Returns:
+            The previous location, or None if the key was new
+        """
+        mask = self.capacity - 1
+        i = key_hash & mask
+        free = -1
+        while True:
+            slot_hash, segment, offset, length = self._slot(i)
+            if slot_hash == _EMPTY:
+                break
+            if slot_hash == _DELETED:
+                if free < 0:
+                    free = i
+            elif slot_hash == key_hash and matches(segment, offset):
+                self._set_slot(i, key_hash, *location)
+                return segment, offset, length
+            i = (i + 1) & mask
+
+        if free >= 0:
+            i = free
+            self.deleted -= 1
+        self._set_slot(i, key_hash, *location)
+        self.count += 1
+        self._write_header()
+
+        if (self.count + self.deleted) > self.capacity * self.MAX_LOAD:
+            self._resize(self.capacity * 2 if self.count > self.capacity * self.MAX_LOAD / 2 else self.capacity)
+        return None
+
+    def remove(self, key_hash: int, matches: Callable[[int, int], bool]) -> Optional[Location]:
+        """Remove a key.
+
+        Args:
+            key_hash: Hash of the key
+            matches: Callback confirming that (segment, offset) holds the key
+
+        Returns:
+            The removed location, or None if the key was not indexed
+        """
+        i = self._find(key_hash, matches)
+        if i < 0:
+            return None
+
+        _, segment, offset, length = self._slot(i)
+        self._set_slot(i, _DELETED, 0, 0, 0)
+        self.count -= 1
+        self.deleted += 1
+        self._write_header()
+        return segment, offset, length
+
+    def remove_location(self, key_hash: int, location: Location) -> bool:
+        """Remove a key known to be stored at a location.
+
+        Args:
+            key_hash: Hash of the key
+            location: Exact (segment, offset, length) of its record
+
+        Returns:
+            True if the key was removed
+        """
+        segment, offset, _ = location
+        return self.remove(key_hash, lambda s, o: s == segment and o == offset) is not None
+
+    def items(self) -> Iterator[Tuple[int, Location]]:
+        """Iterate over all indexed entries.
+
+        Yields:
+            (key hash, (segment, offset, length)) tuples
+        """
+        for i in range(self.capacity):
+            slot_hash, segment, offset, length = self._slot(i)
+            if slot_hash > _DELETED:
+                yield slot_hash, (segment, offset, length)
+
+    def _resize(self, capacity: int) -> None:
+        """Rehash all entries into a new index file.
+
+        Args:
+            capacity: New number of slots
+        """
+        entries = list(self.items())
+        position = self.position
+
+        tmp_path = self.path + '.tmp'
+        self._create(tmp_path, capacity)
+        self.close()
+        os.replace(tmp_path, self.path)
+        self._map(self.path)
+
+        mask = capacity - 1
+        for key_hash, location in entries:
+            i = key_hash & mask
+            while self._slot(i)[0] != _EMPTY:
+                i = (i + 1) & mask
+            self._set_slot(i, key_hash, *location)
+
+        self.count = len(entries)
+        self.deleted = 0
+        self._write_header(*position)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        position = self.position
+        self.close()
+        self._create(self.path, self.MIN_CAPACITY)
+        self._map(self.path)
+        self._write_header(*position)
+
+    def flush(self) -> None:
+        """Flush the index to disk."""
+        if self._mm is not None:
+            self._mm.flush()
+
+    def close(self) -> None:
+        """Unmap and close the index file."""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class _Segment:
+    """A memory-mapped segment file."""
+
+    def __init__(self, segment_id: int, path: str, size: int, create: bool = False):
+        """Open or create a segment.
+
+        Args:
+            segment_id: Segment id
+            path: Segment file path
+            size: Segment size in bytes (used when creating)
+            create: Whether to create a new, empty segment
+        """
+        self.id = segment_id
+        self.path = path
+
+        if create:
+            with open(path, 'wb') as f:
+                f.truncate(size)
+                f.write(_SEGMENT_HEADER.pack(_SEGMENT_MAGIC, 1, SEGMENT_HEADER_SIZE))
+
+        self._file = open(path, 'r+b')
+        self.mm = mmap.mmap(self._file.fileno(), 0)
+        self.size = len(self.mm)
+
+        magic, _, self.end = _SEGMENT_HEADER.unpack_from(self.mm, 0)
+        if magic != _SEGMENT_MAGIC:
+            self.close()
+            raise LogStoreError(f"Invalid log segment {path}")
+
+    @property
+    def live(self) -> int:
+        """Get the bytes of records still referenced by the index."""
+        return _SEGMENT_LIVE.unpack_from(self.mm, _SEGMENT_LIVE_OFFSET)[0]
+
+    @live.setter
+    def live(self, value: int) -> None:
+        """Persist the bytes of records still referenced by the index."""
+        _SEGMENT_LIVE.pack_into(self.mm, _SEGMENT_LIVE_OFFSET, max(0, value))
+
+    def records(self, start: int = SEGMENT_HEADER_SIZE) -> Iterator[Tuple[int, Tuple[int, int, int, float, int]]]:
+        """Iterate over the record headers of the segment.
+
+        Args:
+            start: Offset of the first record
+
+        Yields:
+            (offset, (crc, key length, value length, expires at, flags)) tuples
+        """
+        offset = start
+        while offset + _RECORD.size <= self.size:
+            header = _RECORD.unpack_from(self.mm, offset)
+            if header[1] == 0:
+                return
+            yield offset, header
+            offset += _RECORD.size + header[1] + header[2]
+
+    def seal(self, end: int) -> None:
+        """Record the end of the written data and flush the segment.
+
+        Args:
+            end: Offset just past the last record
+        """
+        self.end = end
+        _SEGMENT_HEADER.pack_into(self.mm, 0, _SEGMENT_MAGIC, 1, end)
+        self.mm.flush()
+
+    def close(self) -> None:
+        """Unmap and close the segment file."""
+        self.mm.close()
+        self._file.close()
+
+
+class LogStore:
+    """Append-only key-value store built from memory-mapped segments.
+
+    The store is thread-safe; compaction may run in a background thread
+    while other threads read and write.
+    """
+
+    DEFAULT_SEGMENT_SIZE = 64 * 1024 * 1024
+
+    def __init__(self, directory: str, segment_size: int = DEFAULT_SEGMENT_SIZE,
+                 compact_threshold: float = 0.5):
+        """Open or create a store.
+
+        Args:
+            directory: Directory holding the segment and index files
+            segment_size: Size of each segment file in bytes
+            compact_threshold: Live-data ratio below which a sealed segment is compacted
+
+        Raises:
+            CacheConfigError: If the segment size or threshold is invalid
+        """
+        if segment_size < 4096 or segment_size >= 1 << 32:
+            raise CacheConfigError("Segment size must be between 4 KiB and 4 GiB")
+        if not 0 < compact_threshold <= 1:
+            raise CacheConfigError("Compaction threshold must be between 0 and 1")
+
+        self.directory = directory
+        self.segment_size = segment_size
+        self.compact_threshold = compact_threshold
+        self._lock = threading.RLock()
+        self._segments: Dict[int, _Segment] = {}
+        self._compacting: Set[int] = set()
+        self._active: Optional[_Segment] = None
+        self._write_offset = SEGMENT_HEADER_SIZE
+
+        # Store statistics
+        self._compactions = 0
+        self._reclaimed_bytes = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._open()
+
+    def _segment_path(self, segment_id: int) -> str:
+        """Get the file path of a segment."""
+        return os.path.join(self.directory, f"seg-{segment_id:08d}.log")
+
+    def _open(self) -> None:
+        """Map segments and load or rebuild the index."""
+        segment_ids = sorted(
+            int(match.group(1)) for match in map(_SEGMENT_NAME.match, os.listdir(self.directory))
+            if match
+        )
+        for segment_id in segment_ids:
+            self._segments[segment_id] = _Segment(segment_id, self._segment_path(segment_id), self.segment_size)
+
+        self._index = _HashIndex(os.path.join(self.directory, 'index.bin'))
+
+        if not self._segments:
+            self._active = self._new_segment(1)
+            self._index.set_position(1, SEGMENT_HEADER_SIZE)
+            return
+
+        if self._index.loaded:
+            start_segment, start_offset = self._index.position
+        else:
+            start_segment, start_offset = segment_ids[0], SEGMENT_HEADER_SIZE
+            for segment in self._segments.values():
+                segment.live = 0
+
+        # Replay records written after the last indexed position
+        for segment_id in segment_ids:
+            if segment_id < start_segment:
+                continue
+            offset = start_offset if segment_id == start_segment else SEGMENT_HEADER_SIZE
+            self._segments[segment_id].end = self._replay(self._segments[segment_id], offset)
+
+        self._active = self._segments[segment_ids[-1]]
+        self._write_offset = self._active.end
+        self._index.set_position(self._active.id, self._write_offset)
+
+    def _new_segment(self, segment_id: int) -> _Segment:
+        """Create a new active segment.
+
+        Args:
+            segment_id: Id of the new segment
+
+        Returns:
+            The new segment
+        """
+        segment = _Segment(segment_id, self._segment_path(segment_id), self.segment_size, create=True)
+        self._segments[segment_id] = segment
+        self._write_offset = SEGMENT_HEADER_SIZE
+        return segment
+
+    def _replay(self, segment: _Segment, offset: int) -> int:
+        """Apply the records of a segment to the index.
+
+        Replaying a record that was already applied leaves the index and the
+        live-byte counters unchanged, so replay may safely overlap.
+
+        Args:
+            segment: Segment to replay
+            offset: Offset to start at
+
+        Returns:
+            Offset just past the last valid record
+        """
+        end = offset
+        for offset, (crc, key_len, value_len, _, flags) in segment.records(offset):
+            length = _RECORD.size + key_len + value_len
+            if offset + length > segment.size or zlib.crc32(segment.mm[offset + 4:offset + length]) != crc:
+                # Torn write: everything from here on is discarded
+                logger.warning(f"Truncating corrupt record in {segment.path} at offset {offset}")
+                segment.mm[offset:offset + _RECORD.size] = bytes(_RECORD.size)
+                return offset
+
+            key = segment.mm[offset + _RECORD.size:offset + _RECORD.size + key_len]
+            if flags & _TOMBSTONE:
+                self._release(self._index.remove(_key_hash(key), self._matcher(key)))
+            else:
+                self._release(self._index.put(_key_hash(key), (segment.id, offset, length), self._matcher(key)))
+                segment.live += length
+
+            end = offset + length
+
+        return end
+
+    def _key_at(self, segment_id: int, offset: int) -> Optional[bytes]:
+        """Read the key of the record at a location."""
+        segment = self._segments.get(segment_id)
+        if segment is None:
+            return None
+        key_len = struct.unpack_from('!H', segment.mm, offset + 4)[0]
+        start = offset + _RECORD.size
+        return segment.mm[start:start + key_len]
+
+    def _matcher(self, key: bytes) -> Callable[[int, int], bool]:
+        """Build the index callback confirming that a location holds key."""
+        return lambda segment_id, offset: self._key_at(segment_id, offset) == key
+
+    def _append(self, record: bytes) -> Tuple[int, int]:
+        """Append an encoded record to the active segment.
+
+        Args:
+            record: Encoded record
+
+        Returns:
+            (segment id, offset) of the record
+        """
+        if self._write_offset + len(record) + _RECORD.size > self._active.size:
+            self._active.seal(self._write_offset)
+            self._active = self._new_segment(self._active.id + 1)
+
+        offset = self._write_offset
+        self._active.mm[offset:offset + len(record)] = record
+        self._write_offset += len(record)
+        self._active.end = self._write_offset
+        return self._active.id, offset
+
+    @staticmethod
+    def _encode_record(key: bytes, value: bytes, expires_at: float, flags: int = 0) -> bytes:
+        """Encode a record with its checksum."""
+        body = _RECORD_BODY.pack(len(key), len(value), expires_at, flags) + key + value
+        return struct.pack('!I', zlib.crc32(body)) + body
+
+    def _check_key(self, key: bytes) -> None:
+        """Validate a key."""
+        if not key or len(key) > 0xFFFF:
+            raise LogStoreError("Keys must be between 1 and 65535 bytes")
+
+    def _release(self, location: Optional[Location]) -> None:
+        """Mark a record as dead for compaction accounting."""
+        if location is not None and location[0] in self._segments:
+            self._segments[location[0]].live -= location[2]
+
+    def put(self, key: bytes, value: bytes, expires_at: float = 0.0) -> None:
+        """Store a value.
+
+        Args:
+            key: Key bytes
+            value: Value bytes
+            expires_at: Unix time after which the record is dead (0: never)
+
+        Raises:
+            LogStoreError: If the key or value does not fit in a segment
+        """
+        self._check_key(key)
+        record = self._encode_record(key, value, expires_at)
+        if len(record) + _RECORD.size > self.segment_size - SEGMENT_HEADER_SIZE:
+            raise LogStoreError(f"Record of {len(record)} bytes does not fit in a segment")
+
+        with self._lock:
+            segment_id, offset = self._append(record)
+            previous = self._index.put(_key_hash(key), (segment_id, offset, len(record)), self._matcher(key))
+            self._release(previous)
+            self._segments[segment_id].live += len(record)
+            self._index.set_position(segment_id, self._write_offset)
+
+    def get(self, key: bytes) -> Optional[Tuple[bytes, float]]:
+        """Read a value.
+
+        Args:
+            key: Key bytes
+
+        Returns:
+            (value, expires_at), or None if the key is missing or expired
+
+        Raises:
+            LogStoreError: If the record fails its checksum
+        """
+        with self._lock:
+            location = self._index.get(_key_hash(key), self._matcher(key))
+            if location is None:
+                return None
+
+            segment_id, offset, length = location
+            data = self._segments[segment_id].mm[offset:offset + length]
+
+        crc, key_len, value_len, expires_at, _ = _RECORD.unpack_from(data, 0)
+        if zlib.crc32(memoryview(data)[4:]) != crc:
+            raise LogStoreError(f"Corrupt record for key {key!r}")
+
+        if expires_at and time.time() > expires_at:
+            return None
+        return data[_RECORD.size + key_len:], expires_at
+
+    def delete(self, key: bytes) -> bool:
+        """Delete a key by appending a tombstone.
+
+        Args:
+            key: Key bytes
+
+        Returns:
+            True if the key existed
+        """
+        self._check_key(key)
+        with self._lock:
+            location = self._index.remove(_key_hash(key), self._matcher(key))
+            if location is None:
+                return False
+
+            self._release(location)
+            segment_id, _ = self._append(self._encode_record(key, b'', 0.0, _TOMBSTONE))
+            self._index.set_position(segment_id, self._write_offset)
+            return True
+
+    def keys(self) -> List[bytes]:
+        """Get all live keys.
+
+        Returns:
+            List of key bytes (expired keys not yet compacted are included)
+        """
+        with self._lock:
+            return [self._key_at(segment_id, offset) for _, (segment_id, offset, _) in self._index.items()]
+
+    def __len__(self) -> int:
+        """Get the number of indexed keys."""
+        return self._index.count
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """Delete all expired keys.
+
+        Args:
+            now: Current Unix time (defaults to time.time())
+
+        Returns:
+            Number of deleted keys
+        """
+        now = now or time.time()
+        expired = []
+
+        with self._lock:
+            for key_hash, location in self._index.items():
+                segment_id, offset, _ = location
+                expires_at = _RECORD.unpack_from(self._segments[segment_id].mm, offset)[3]
+                if expires_at and now > expires_at:
+                    expired.append((key_hash, location))
+
+            # Expired records need no tombstone: they never come back to life
+            for key_hash, location in expired:
+                if self._index.remove_location(key_hash, location):
+                    self._release(location)
+
+        return len(expired)
+
+    def compaction_candidates(self) -> List[int]:
+        """Get the sealed segments whose live-data ratio is below the threshold.
+
+        Returns:
+            Segment ids, oldest first
+        """
+        with self._lock:
+            return [
+                segment.id for segment in sorted(self._segments.values(), key=lambda s: s.id)
+                if segment is not self._active
+                and segment.live < (segment.end - SEGMENT_HEADER_SIZE) * self.compact_threshold
+            ]
+
+    def compact(self) -> int:
+        """Rewrite live records of mostly-dead segments and delete the segments.
+
+        The lock is taken per record, so readers and writers are not blocked
+        for the whole compaction.
+
+        Returns:
+            Number of bytes reclaimed
+        """
+        reclaimed = 0
+        for segment_id in self.compaction_candidates():
+            reclaimed += self._compact_segment(segment_id)
+
+        if reclaimed:
+            with self._lock:
+                self._compactions += 1
+                self._reclaimed_bytes += reclaimed
+        return reclaimed
+
+    def _compact_segment(self, segment_id: int) -> int:
+        """Move the live records of one segment and delete it.
+
+        Args:
+            segment_id: Segment to compact
+
+        Returns:
+            Number of bytes reclaimed
+        """
+        with self._lock:
+            segment = self._segments.get(segment_id)
+            if segment is None:
+                return 0
+            # evict_oldest leaves the segment alone while it is compacted
+            self._compacting.add(segment_id)
+
+        now = time.time()
+        records = segment.records()
+        try:
+            while True:
+                with self._lock:
+                    # clear() or close() may have dropped the segment meanwhile
+                    if self._segments.get(segment_id) is not segment:
+                        return 0
+
+                    record = next(records, None)
+                    if record is None or record[0] >= segment.end:
+                        break
+                    offset, (_, key_len, value_len, expires_at, flags) = record
+
+                    length = _RECORD.size + key_len + value_len
+                    key = segment.mm[offset + _RECORD.size:offset + _RECORD.size + key_len]
+
+                    if flags & _TOMBSTONE:
+                        # Keep tombstones while older segments may hold the deleted key
+                        if min(self._segments) < segment_id:
+                            new_segment, _ = self._append(segment.mm[offset:offset + length])
+                            self._index.set_position(new_segment, self._write_offset)
+                        continue
+
+                    key_hash = _key_hash(key)
+                    location = (segment_id, offset, length)
+                    if self._index.get(key_hash, self._matcher(key)) != location:
+                        continue
+
+                    if expires_at and now > expires_at:
+                        self._index.remove_location(key_hash, location)
+                        continue
+
+                    new_segment, new_offset = self._append(segment.mm[offset:offset + length])
+                    self._index.put(key_hash, (new_segment, new_offset, length), self._matcher(key))
+                    self._segments[new_segment].live += length
+                    self._index.set_position(new_segment, self._write_offset)
+
+            with self._lock:
+                if self._segments.get(segment_id) is not segment:
+                    return 0
+                reclaimed = segment.end - SEGMENT_HEADER_SIZE
+                self._active.seal(self._write_offset)
+                self._index.flush()
+                del self._segments[segment_id]
+                segment.close()
+                os.remove(segment.path)
+        finally:
+            with self._lock:
+                self._compacting.discard(segment_id)
+
+        logger.debug(f"Compacted log segment {segment_id}, reclaimed {reclaimed} bytes")
+        return reclaimed
+
+    def evict_oldest(self) -> int:
+        """Drop the oldest sealed segment and every key stored in it.
+
+        Segments being compacted are skipped; their live records are
+        already moving to the active segment.
+
+        Returns:
+            Number of evicted keys
+        """
+        with self._lock:
+            sealed = [
+                segment_id for segment_id in self._segments
+                if segment_id != self._active.id and segment_id not in self._compacting
+            ]
+            if not sealed:
+                return 0
+
+            segment = self._segments[min(sealed)]
+            evicted = 0
+            for offset, (_, key_len, value_len, _, flags) in segment.records():
+                if offset >= segment.end or flags & _TOMBSTONE:
+                    continue
+                key = segment.mm[offset + _RECORD.size:offset + _RECORD.size + key_len]
+                location = (segment.id, offset, _RECORD.size + key_len + value_len)
+                if self._index.remove_location(_key_hash(key), location):
+                    evicted += 1
+
+            self._index.flush()
+            del self._segments[segment.id]
+            segment.close()
+            os.remove(segment.path)
+            return evicted
+
+    def clear(self) -> None:
+        """Remove all keys and segments."""
+        with self._lock:
+            for segment in self._segments.values():
+                segment.close()
+                os.remove(segment.path)
+            self._segments.clear()
+            self._index.clear()
+            next_id = self._active.id + 1
+            self._active = self._new_segment(next_id)
+            self._index.set_position(next_id, SEGMENT_HEADER_SIZE)
+
+    def flush(self) -> None:
+        """Flush the active segment and the index to disk."""
+        with self._lock:
+            self._active.seal(self._write_offset)
+            self._index.flush()
+
+    def close(self) -> None:
+        """Flush and close all files."""
+        with self._lock:
+            if self._active is None:
+                return
+            self.flush()
+            for segment in self._segments.values():
+                segment.close()
+            self._segments.clear()
+            self._index.close()
+            self._active = None
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get store statistics.
+
+        Returns:
+            Dictionary containing store statistics
+        """
+        with self._lock:
+            used = sum(segment.end - SEGMENT_HEADER_SIZE for segment in self._segments.values())
+            live = sum(segment.live for segment in self._segments.values())
+            return {
+                'keys': self._index.count,
+                'segments': len(self._segments),
+                'used_bytes': used,
+                'live_bytes': live,
+                'live_ratio': live / used if used else 1.0,
+                'index_capacity': self._index.capacity,
+                'compactions': self._compactions,
+                'reclaimed_bytes': self._reclaimed_bytes
+            }
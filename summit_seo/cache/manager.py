@@ -8,6 +8,10 @@ from .base import BaseCache, CacheConfig, CacheError, CacheResult, CacheKey
 from .factory import CacheFactory
 from .memory_cache import MemoryCache
 from .file_cache import FileCache
+from .network_cache import NetworkCache
+from .log_cache import LogCache
+from .refresh import RefreshScheduler
+from .blob_store import blob_store
 
 # Type variables
 K = TypeVar('K')
@@ -26,19 +30,32 @@ class CacheManager:
     def __init__(self):
         """Initialize the cache manager."""
         self._initialized = False
+        self._refresher = RefreshScheduler()
     
     def initialize(self, config: Optional[Dict[str, Any]] = None) -> None:
         """Initialize the cache system.
         
         Args:
-            config: Optional configuration dictionary for caches
+            config: Optional configuration dictionary for caches. Besides the
+                per-type 'memory' and 'file' sections, supports a 'network'
+                section (with 'server_url') for a cache shared between workers,
+                a 'log' section enabling the segmented log cache for many small
+                entries, and 'max_concurrent_refreshes' for stale-while-revalidate
+                refreshes.
         """
         if self._initialized:
             return
         
         # Register cache types
-        CacheFactory.register('memory', MemoryCache)
-        CacheFactory.register('file', FileCache)
+        registered = CacheFactory.get_registered_caches()
+        if 'memory' not in registered:
+            CacheFactory.register('memory', MemoryCache)
+        if 'file' not in registered:
+            CacheFactory.register('file', FileCache)
+        if 'network' not in registered:
+            CacheFactory.register('network', NetworkCache)
+        if 'log' not in registered:
+            CacheFactory.register('log', LogCache)
         
         # Create default configurations
         memory_config = CacheConfig(
@@ -55,7 +72,27 @@ class CacheManager:
             namespace="default",
             enable_stats=True,
             invalidate_on_error=False,
-            persistent=True
+            persistent=True,
+            codec='pickle+zlib'
+        )
+        
+        network_config = CacheConfig(
+            ttl=86400,              # 24 hours
+            namespace="default",
+            enable_stats=True,
+            invalidate_on_error=False,
+            persistent=True,
+            codec='pickle+zlib'
+        )
+        
+        log_config = CacheConfig(
+            ttl=86400,              # 24 hours
+            max_size=10000000,      # Max 10,000,000 items
+            namespace="default",
+            enable_stats=True,
+            invalidate_on_error=False,
+            persistent=True,
+            codec='pickle'
         )
         
         # Apply custom configurations if provided
@@ -65,18 +102,44 @@ class CacheManager:
             
             if 'file' in config:
                 self._update_config(file_config, config['file'])
+            
+            if 'network' in config:
+                self._update_config(network_config, config['network'])
+            
+            if 'log' in config:
+                self._update_config(log_config, config['log'])
+            
+            if 'max_concurrent_refreshes' in config:
+                self._refresher = RefreshScheduler(config['max_concurrent_refreshes'])
         
         # Create cache instances
         CacheFactory.create('memory', memory_config)
         CacheFactory.create('file', file_config)
         
         # Create specialized cache namespaces with custom TTL values
-        self._create_specialized_caches()
+        self._create_specialized_caches(memory_config, file_config)
+        
+        # The shared network cache is only available when a server is configured
+        if network_config.server_url:
+            self._create_tiered_caches('network', network_config)
+        
+        # The log cache is opt-in since it keeps its files open
+        if config and 'log' in config:
+            self._create_tiered_caches('log', log_config)
         
         self._initialized = True
         
         logger.info("Cache manager initialized")
     
+    def reset(self) -> None:
+        """Drop all cache instances so the next access re-initializes them.
+        
+        This is primarily useful for testing.
+        """
+        CacheFactory.clear_instances()
+        self._refresher = RefreshScheduler(self._refresher.max_concurrent)
+        self._initialized = False
+    
     def _update_config(self, base_config: CacheConfig, updates: Dict[str, Any]) -> None:
         """Update a base config with custom values.
         
@@ -88,8 +151,15 @@ class CacheManager:
             if hasattr(base_config, key):
                 setattr(base_config, key, value)
     
-    def _create_specialized_caches(self) -> None:
-        """Create specialized cache namespaces with custom TTL values."""
+    def _create_specialized_caches(self, memory_config: CacheConfig,
+                                   file_config: CacheConfig) -> None:
+        """Create specialized cache namespaces with custom TTL values.
+        
+        Args:
+            memory_config: Default memory cache configuration to inherit the codec from
+            file_config: Default file cache configuration to inherit the codec
+                and cache directory from
+        """
         # Short-lived caches
         short_config = CacheConfig(
             ttl=300,                # 5 minutes
@@ -124,6 +194,13 @@ class CacheManager:
         medium_file_config = CacheConfig(**vars(medium_config))
         long_file_config = CacheConfig(**vars(long_config))
         
+        # Specialized caches store values the same way as the defaults
+        for mem_config in (short_mem_config, medium_mem_config, long_mem_config):
+            mem_config.codec = memory_config.codec
+        for f_config in (short_file_config, medium_file_config, long_file_config):
+            f_config.codec = file_config.codec
+            f_config.cache_dir = file_config.cache_dir
+        
         # Add names to configs for instance identification
         short_mem_config.name = "memory_short"
         medium_mem_config.name = "memory_medium"
@@ -140,25 +217,53 @@ class CacheManager:
         CacheFactory.create('file', medium_file_config)
         CacheFactory.create('file', long_file_config)
     
+    def _create_tiered_caches(self, cache_type: str, base_config: CacheConfig) -> None:
+        """Create the default and specialized caches of an optional cache type.
+        
+        Specialized caches use the same namespaces and TTLs as the memory and
+        file ones, sharing the base configuration otherwise.
+        
+        Args:
+            cache_type: Registered cache type ('network' or 'log')
+            base_config: Default configuration for the cache type
+        """
+        CacheFactory.create(cache_type, base_config)
+        
+        for name, namespace, ttl in (('short', 'short_term', 300),
+                                     ('medium', 'medium_term', 3600),
+                                     ('long', 'long_term', 86400)):
+            config = CacheConfig(**vars(base_config))
+            config.namespace = namespace
+            config.ttl = ttl
+            config.name = f"{cache_type}_{name}"
+            CacheFactory.create(cache_type, config)
+    
     def get_cache(self, cache_type: str, name: Optional[str] = None) -> BaseCache:
         """Get a cache instance.
         
         Args:
-            cache_type: Type of cache ('memory' or 'file')
+            cache_type: Type of cache ('memory', 'file', 'network' or 'log')
             name: Optional instance name ('short', 'medium', 'long', or None for default)
             
         Returns:
             Cache instance
             
         Raises:
-            ValueError: If cache type or name is invalid
+            ValueError: If cache type or name is invalid, or an optional
+                cache type is requested without being configured
         """
         if not self._initialized:
             self.initialize()
         
-        if cache_type not in ('memory', 'file'):
+        if cache_type not in ('memory', 'file', 'network', 'log'):
             raise ValueError(f"Invalid cache type: {cache_type}")
         
+        if cache_type == 'network' and CacheFactory.get_instance('network') is None:
+            raise ValueError("Network cache is not configured (set network.server_url)")
+        
+        if cache_type == 'log' and CacheFactory.get_instance('log') is None:
+            raise ValueError("Log cache is not configured (add a 'log' section)")
+        
         if name is None:
             return CacheFactory.get_instance(cache_type)
         
@@ -179,7 +284,7 @@ class CacheManager:
         
         Args:
             key: Cache key
-            cache_type: Type of cache ('memory' or 'file')
+            cache_type: Type of cache ('memory', 'file', 'network' or 'log')
             name: Optional instance name
             
         Returns:
@@ -189,18 +294,46 @@ class CacheManager:
         return await cache.get(key)
     
     async def set(self, key: CacheKey, value: Any, ttl: Optional[int] = None,
-                 cache_type: str = 'memory', name: Optional[str] = None) -> None:
+                 cache_type: str = 'memory', name: Optional[str] = None,
+                 stale_ttl: Optional[int] = None) -> None:
         """Set a value in the cache.
         
         Args:
             key: Cache key
             value: Value to cache
             ttl: Optional time to live
-            cache_type: Type of cache ('memory' or 'file')
+            cache_type: Type of cache ('memory', 'file', 'network' or 'log')
             name: Optional instance name
+            stale_ttl: Optional window after expiry during which the value is served stale
         """
         cache = self.get_cache(cache_type, name)
-        await cache.set(key, value, ttl)
+        await cache.set(key, value, ttl, stale_ttl=stale_ttl)
+    
+    def schedule_refresh(self, key: CacheKey, refresh_func: Callable[[], Awaitable[Any]]) -> bool:
+        """Schedule a background refresh of a stale cache entry.
+        
+        Refreshes are deduplicated per key and bounded by the
+        'max_concurrent_refreshes' setting.
+        
+        Args:
+            key: Cache key being refreshed
+            refresh_func: Async function that recomputes and stores the value
+            
+        Returns:
+            True if a refresh was scheduled, False if one is already in flight
+        """
+        return self._refresher.schedule(key, refresh_func)
+    
+    async def wait_for_refreshes(self, timeout: Optional[float] = None) -> bool:
+        """Wait for all scheduled background refreshes to finish.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True if all refreshes finished, False if timeout occurred
+        """
+        return await self._refresher.wait(timeout)
     
     async def invalidate(self, key: CacheKey, cache_type: Optional[str] = None,
                         name: Optional[str] = None) -> None:
@@ -219,7 +352,7 @@ class CacheManager:
             # Invalidate in all cache types
             if name is not None:
                 # Invalidate in specific instance of all cache types
-                for type_name in ('memory', 'file'):
+                for type_name in ('memory', 'file', 'network', 'log'):
                     try:
                         cache = self.get_cache(type_name, name)
                         await cache.invalidate(key)
@@ -249,6 +382,9 @@ class CacheManager:
         for name, instance in CacheFactory._instances.items():
             stats[name] = instance.get_stats()
         
+        stats['refresh'] = self._refresher.get_stats()
+        stats['blob_store'] = blob_store.get_stats()
+        
         return stats
     
     async def cleanup(self) -> Dict[str, int]:
@@ -275,7 +411,7 @@ class CacheManager:
             key: Cache key
             compute_func: Async function to compute the value if not in cache
             ttl: Optional time to live
-            cache_type: Type of cache ('memory' or 'file')
+            cache_type: Type of cache ('memory', 'file', 'network' or 'log')
             name: Optional instance name
             
         Returns:
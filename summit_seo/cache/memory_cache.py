@@ -8,6 +8,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple, TypeVar, Union
 
 from .base import BaseCache, CacheConfig, CacheError, CacheKeyError, CacheResult, CacheValueError, CacheKey
+from .codec import get_codec
 
 # Type variables for key and value
 K = TypeVar('K')
@@ -16,7 +17,8 @@ V = TypeVar('V')
 class CacheEntry:
     """Cache entry with metadata."""
     
-    def __init__(self, key: Any, value: Any, ttl: int, timestamp: datetime):
+    def __init__(self, key: Any, value: Any, ttl: int, timestamp: datetime,
+                 stale_ttl: int = 0):
         """Initialize a cache entry.
         
         Args:
@@ -24,10 +26,12 @@ class CacheEntry:
             value: Cached value
             ttl: Time to live in seconds
             timestamp: Entry creation timestamp
+            stale_ttl: Seconds past expiry during which the entry may be served stale
         """
         self.key = key
         self.value = value
         self.ttl = ttl
+        self.stale_ttl = stale_ttl
         self.timestamp = timestamp
         self.last_accessed = timestamp
         self.access_count = 0
@@ -44,6 +48,18 @@ class CacheEntry:
         expiration_time = self.timestamp.timestamp() + self.ttl
         return datetime.now().timestamp() > expiration_time
     
+    def is_stale(self) -> bool:
+        """Check if the entry has expired but is still within its stale window.
+        
+        Returns:
+            True if the entry can be served stale, False otherwise
+        """
+        if self.stale_ttl <= 0 or not self.is_expired():
+            return False
+        
+        stale_until = self.timestamp.timestamp() + self.ttl + self.stale_ttl
+        return datetime.now().timestamp() <= stale_until
+    
     def access(self) -> None:
         """Update entry access metadata."""
         self.last_accessed = datetime.now()
@@ -54,7 +70,9 @@ class MemoryCache(BaseCache[CacheKey, Any]):
     """In-memory cache implementation.
     
     This cache stores items in memory using an OrderedDict for efficient
-    access and LRU (Least Recently Used) eviction policy.
+    access and LRU (Least Recently Used) eviction policy. If a codec is
+    configured, values are kept as encoded (optionally compressed) bytes and
+    decoded on each read.
     """
     
     def __init__(self, config: Optional[CacheConfig] = None):
@@ -69,6 +87,9 @@ class MemoryCache(BaseCache[CacheKey, Any]):
         self._cache: Dict[str, Dict[CacheKey, CacheEntry]] = {}
         self._lock = asyncio.Lock()  # Lock for thread safety
         
+        # Optional codec for compact value storage
+        self._codec = get_codec(self.config.codec)
+        
         # Initialize namespace
         self._ensure_namespace(self.config.namespace)
     
@@ -128,6 +149,25 @@ class MemoryCache(BaseCache[CacheKey, Any]):
             
             # Check if entry has expired
             if entry.is_expired():
+                if entry.is_stale():
+                    # Serve the stale value and let the caller revalidate
+                    entry.access()
+                    self._cache[ns].move_to_end(cache_key)
+                    self._update_stats(stale=True)
+                    return CacheResult(
+                        value=self._decode(entry.value),
+                        hit=True,
+                        timestamp=entry.timestamp,
+                        ttl=entry.ttl,
+                        expired=True,
+                        metadata={
+                            'stale': True,
+                            'stale_ttl': entry.stale_ttl,
+                            'access_count': entry.access_count,
+                            'last_accessed': entry.last_accessed
+                        }
+                    )
+                
                 # Remove expired entry
                 del self._cache[ns][cache_key]
                 self._update_stats(miss=True)
@@ -147,7 +187,7 @@ class MemoryCache(BaseCache[CacheKey, Any]):
             
             self._update_stats(hit=True)
             return CacheResult(
-                value=entry.value,
+                value=self._decode(entry.value),
                 hit=True,
                 timestamp=entry.timestamp,
                 ttl=entry.ttl,
@@ -158,13 +198,15 @@ class MemoryCache(BaseCache[CacheKey, Any]):
                 }
             )
     
-    async def set(self, key: CacheKey, value: Any, ttl: Optional[int] = None) -> None:
+    async def set(self, key: CacheKey, value: Any, ttl: Optional[int] = None,
+                  stale_ttl: Optional[int] = None) -> None:
         """Set a value in the cache.
         
         Args:
             key: The cache key to set
             value: The value to cache
             ttl: Optional time to live in seconds (overrides config.ttl if provided)
+            stale_ttl: Optional stale window in seconds (overrides config.stale_ttl)
             
         Raises:
             CacheKeyError: If the key is invalid
@@ -180,6 +222,8 @@ class MemoryCache(BaseCache[CacheKey, Any]):
         
         ns, cache_key = self._build_key(key)
         ttl_value = ttl if ttl is not None else self.config.ttl
+        stale_ttl_value = stale_ttl if stale_ttl is not None else self.config.stale_ttl
+        stored_value = self._encode(value)
         
         async with self._lock:
             # Check if we need to evict items
@@ -189,15 +233,42 @@ class MemoryCache(BaseCache[CacheKey, Any]):
             # Create new cache entry
             entry = CacheEntry(
                 key=cache_key,
-                value=value,
+                value=stored_value,
                 ttl=ttl_value,
-                timestamp=datetime.now()
+                timestamp=datetime.now(),
+                stale_ttl=stale_ttl_value
             )
             
             # Store entry
             self._cache[ns][cache_key] = entry
             self._update_stats(set_op=True)
     
+    def _encode(self, value: Any) -> Any:
+        """Encode a value for storage if a codec is configured.
+        
+        Args:
+            value: Value to store
+            
+        Returns:
+            Encoded bytes, or the value itself without a codec
+        """
+        if self._codec is None:
+            return value
+        return self._codec.encode(value)
+    
+    def _decode(self, stored: Any) -> Any:
+        """Decode a stored value if a codec is configured.
+        
+        Args:
+            stored: Stored value
+            
+        Returns:
+            The decoded value
+        """
+        if self._codec is None:
+            return stored
+        return self._codec.decode(stored)
+    
     def _evict_lru_item(self, namespace: str) -> bool:
         """Evict the least recently used item from the cache.
         
@@ -327,8 +398,9 @@ class MemoryCache(BaseCache[CacheKey, Any]):
                 
             entry = self._cache[ns][cache_key]
             if entry.is_expired():
-                # Remove expired entry
-                del self._cache[ns][cache_key]
+                # Keep entries that can still be served stale
+                if not entry.is_stale():
+                    del self._cache[ns][cache_key]
                 return False
                 
             return True
@@ -347,7 +419,7 @@ class MemoryCache(BaseCache[CacheKey, Any]):
                 to_remove = []
                 
                 for key, entry in self._cache[ns].items():
-                    if entry.is_expired():
+                    if entry.is_expired() and not entry.is_stale():
                         to_remove.append(key)
                 
                 for key in to_remove:
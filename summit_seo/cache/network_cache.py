@@ -0,0 +1,437 @@
+"""Shared network cache implementation."""
+
+import struct
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .base import BaseCache, CacheConfig, CacheConfigError, CacheError, CacheKey, CacheKeyError, CacheResult, CacheValueError
+from .codec import CodecError, get_codec
+from .resp import RespConnection, RespError
+
+
+class NetworkCacheError(CacheError):
+    """Exception raised for network cache-specific errors."""
+    pass
+
+
+def _escape_pattern(text: str) -> str:
+    """Escape glob characters so text matches literally in a SCAN pattern."""
+    return ''.join(f'[{c}]' if c in '*?[' else c for c in text)
+
+
+class NetworkCache(BaseCache[CacheKey, Any]):
+    """Cache stored on a shared server speaking the Redis protocol.
+
+    All workers pointed at the same server share one cache. Keys are stored
+    as ``<key_prefix><namespace>:<key>`` so namespaces can be scanned by
+    prefix, and expiry is enforced by the server (TTL plus the stale
+    window). Batched reads and writes are pipelined into a single round trip.
+    Tuple keys are stored joined with ':' and returned as strings by
+    get_keys().
+    """
+
+    KEY_PREFIX = 'summit_seo:'
+
+    # Header stored before each encoded value: timestamp, ttl, stale_ttl
+    _HEADER = struct.Struct('!dII')
+
+    # Number of keys requested per SCAN call and deleted per pipeline
+    SCAN_COUNT = 500
+
+    def __init__(self, config: Optional[CacheConfig] = None):
+        """Initialize the network cache.
+
+        Args:
+            config: Optional cache configuration. config.server_url selects the
+                   server (e.g. 'redis://localhost:6379/0' or 'unix:///tmp/cache.sock').
+
+        Raises:
+            CacheConfigError: If no server URL is configured
+        """
+        super().__init__(config)
+
+        if not self.config.server_url:
+            raise CacheConfigError("Network cache requires a server_url")
+
+        self._connection = RespConnection(self.config.server_url)
+
+        # Codec for value storage
+        self._codec = get_codec(self.config.codec or 'pickle')
+
+    def _server_key(self, key: CacheKey, namespace: Optional[str] = None) -> str:
+        """Get the server-side key for a cache key.
+
+        Args:
+            key: Cache key
+            namespace: Optional namespace (defaults to config namespace)
+
+        Returns:
+            Prefixed key string
+        """
+        ns = namespace or self.config.namespace
+        key_str = ':'.join(str(item) for item in key) if isinstance(key, tuple) else str(key)
+        return f"{self.KEY_PREFIX}{ns}:{key_str}"
+
+    def _namespace_prefix(self, namespace: Optional[str] = None) -> str:
+        """Get the key prefix of a namespace.
+
+        Args:
+            namespace: Optional namespace (defaults to config namespace)
+
+        Returns:
+            Prefix shared by all keys in the namespace
+        """
+        return f"{self.KEY_PREFIX}{namespace or self.config.namespace}:"
+
+    async def _pipeline(self, commands: List[Tuple[Any, ...]]) -> List[Any]:
+        """Run commands in one round trip, translating connection failures.
+
+        Args:
+            commands: Commands to send
+
+        Returns:
+            Replies in command order
+
+        Raises:
+            NetworkCacheError: If the server cannot be reached or returns an error
+        """
+        try:
+            replies = await self._connection.pipeline(commands)
+        except (ConnectionError, OSError, RespError) as e:
+            self._update_stats(error=True)
+            raise NetworkCacheError(f"Cache server error: {str(e)}")
+        except Exception as e:
+            self._update_stats(error=True)
+            raise NetworkCacheError(f"Cache server request failed: {str(e) or type(e).__name__}")
+
+        for reply in replies:
+            if isinstance(reply, RespError):
+                self._update_stats(error=True)
+                raise NetworkCacheError(f"Cache server error: {str(reply)}")
+
+        return replies
+
+    def _encode_entry(self, value: Any, ttl: int, stale_ttl: int) -> bytes:
+        """Encode a value with its timing header.
+
+        Args:
+            value: Value to encode
+            ttl: Time to live in seconds
+            stale_ttl: Stale window in seconds
+
+        Returns:
+            Encoded entry
+
+        Raises:
+            CacheValueError: If the value cannot be encoded
+        """
+        try:
+            payload = self._codec.encode(value)
+        except CodecError as e:
+            self._update_stats(error=True)
+            raise CacheValueError(f"Cannot encode cache value: {str(e)}")
+
+        return self._HEADER.pack(time.time(), ttl, stale_ttl) + payload
+
+    def _set_command(self, key: CacheKey, value: Any, ttl: Optional[int],
+                     stale_ttl: Optional[int]) -> Tuple[Any, ...]:
+        """Build the SET command for a cache entry.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Optional time to live in seconds
+            stale_ttl: Optional stale window in seconds
+
+        Returns:
+            SET command tuple
+
+        Raises:
+            CacheKeyError: If the key is invalid
+            CacheValueError: If the value is None or cannot be encoded
+        """
+        if key is None:
+            self._update_stats(error=True)
+            raise CacheKeyError("Cache key cannot be None")
+
+        if value is None:
+            self._update_stats(error=True)
+            raise CacheValueError("Cache value cannot be None")
+
+        ttl_value = ttl if ttl is not None else self.config.ttl
+        stale_ttl_value = stale_ttl if stale_ttl is not None else self.config.stale_ttl
+        data = self._encode_entry(value, ttl_value, stale_ttl_value)
+
+        command: Tuple[Any, ...] = ('SET', self._server_key(key), data)
+        if ttl_value > 0:
+            # The server keeps the entry until its stale window has passed
+            command += ('PX', (ttl_value + stale_ttl_value) * 1000)
+        return command
+
+    def _to_result(self, data: Optional[bytes]) -> CacheResult[Any]:
+        """Turn a stored entry into a cache result and update statistics.
+
+        Args:
+            data: Stored entry, or None if the key was not found
+
+        Returns:
+            CacheResult for the entry
+
+        Raises:
+            NetworkCacheError: If the entry cannot be decoded
+        """
+        if data is None:
+            self._update_stats(miss=True)
+            return CacheResult(value=None, hit=False, timestamp=datetime.now(), ttl=self.config.ttl)
+
+        try:
+            timestamp, ttl, stale_ttl = self._HEADER.unpack_from(data, 0)
+            value = self._codec.decode(data[self._HEADER.size:])
+        except (struct.error, CodecError) as e:
+            self._update_stats(error=True)
+            raise NetworkCacheError(f"Error decoding cache entry: {str(e)}")
+
+        now = time.time()
+        expiration_time = timestamp + ttl
+
+        if ttl > 0 and now > expiration_time:
+            if now <= expiration_time + stale_ttl:
+                # Serve the stale value and let the caller revalidate
+                self._update_stats(stale=True)
+                return CacheResult(
+                    value=value,
+                    hit=True,
+                    timestamp=datetime.fromtimestamp(timestamp),
+                    ttl=ttl,
+                    expired=True,
+                    metadata={'stale': True, 'stale_ttl': stale_ttl}
+                )
+
+            # Not yet removed by the server
+            self._update_stats(miss=True)
+            return CacheResult(
+                value=None,
+                hit=False,
+                timestamp=datetime.fromtimestamp(timestamp),
+                ttl=ttl,
+                expired=True
+            )
+
+        self._update_stats(hit=True)
+        return CacheResult(
+            value=value,
+            hit=True,
+            timestamp=datetime.fromtimestamp(timestamp),
+            ttl=ttl,
+            expired=False
+        )
+
+    async def get(self, key: CacheKey) -> CacheResult[Any]:
+        """Get a value from the cache.
+
+        Args:
+            key: The cache key to retrieve
+
+        Returns:
+            CacheResult containing the value and hit status
+
+        Raises:
+            CacheKeyError: If the key is invalid
+            NetworkCacheError: If the server request fails
+        """
+        if key is None:
+            self._update_stats(miss=True)
+            raise CacheKeyError("Cache key cannot be None")
+
+        (data,) = await self._pipeline([('GET', self._server_key(key))])
+        return self._to_result(data)
+
+    async def get_many(self, keys: List[CacheKey]) -> Dict[CacheKey, CacheResult[Any]]:
+        """Get several values in a single MGET round trip.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            Dictionary mapping each key to its CacheResult
+
+        Raises:
+            CacheKeyError: If any key is invalid
+            NetworkCacheError: If the server request fails
+        """
+        if not keys:
+            return {}
+
+        if any(key is None for key in keys):
+            raise CacheKeyError("Cache key cannot be None")
+
+        (values,) = await self._pipeline([('MGET', *(self._server_key(key) for key in keys))])
+        return {key: self._to_result(data) for key, data in zip(keys, values)}
+
+    async def set(self, key: CacheKey, value: Any, ttl: Optional[int] = None,
+                  stale_ttl: Optional[int] = None) -> None:
+        """Set a value in the cache.
+
+        Args:
+            key: The cache key to set
+            value: The value to cache
+            ttl: Optional time to live in seconds (overrides config.ttl if provided)
+            stale_ttl: Optional stale window in seconds (overrides config.stale_ttl)
+
+        Raises:
+            CacheKeyError: If the key is invalid
+            CacheValueError: If the value is None or cannot be encoded
+            NetworkCacheError: If the server request fails
+        """
+        await self._pipeline([self._set_command(key, value, ttl, stale_ttl)])
+        self._update_stats(set_op=True)
+
+    async def set_many(self, items: Dict[CacheKey, Any], ttl: Optional[int] = None,
+                       stale_ttl: Optional[int] = None) -> None:
+        """Set several values in one pipelined round trip.
+
+        Args:
+            items: Dictionary mapping cache keys to values
+            ttl: Optional time to live in seconds (overrides config.ttl if provided)
+            stale_ttl: Optional stale window in seconds (overrides config.stale_ttl)
+
+        Raises:
+            CacheKeyError: If any key is invalid
+            CacheValueError: If any value is None or cannot be encoded
+            NetworkCacheError: If the server request fails
+        """
+        commands = [self._set_command(key, value, ttl, stale_ttl) for key, value in items.items()]
+        await self._pipeline(commands)
+        for _ in commands:
+            self._update_stats(set_op=True)
+
+    async def _scan(self, pattern: str) -> List[bytes]:
+        """Collect all server keys matching a pattern.
+
+        Args:
+            pattern: SCAN MATCH pattern
+
+        Returns:
+            Matching server keys
+        """
+        keys: List[bytes] = []
+        cursor = b'0'
+
+        while True:
+            (reply,) = await self._pipeline([('SCAN', cursor, 'MATCH', pattern, 'COUNT', self.SCAN_COUNT)])
+            cursor, batch = reply
+            keys.extend(batch)
+            if cursor == b'0':
+                return keys
+
+    async def _delete_matching(self, pattern: str) -> int:
+        """Delete all server keys matching a pattern.
+
+        Args:
+            pattern: SCAN MATCH pattern
+
+        Returns:
+            Number of deleted keys
+        """
+        keys = await self._scan(pattern)
+        commands = [
+            ('DEL', *keys[i:i + self.SCAN_COUNT])
+            for i in range(0, len(keys), self.SCAN_COUNT)
+        ]
+        return sum(await self._pipeline(commands)) if commands else 0
+
+    async def invalidate(self, key: CacheKey) -> bool:
+        """Invalidate a cache entry.
+
+        Args:
+            key: The cache key to invalidate
+
+        Returns:
+            True if the key was invalidated, False if it didn't exist
+
+        Raises:
+            CacheKeyError: If the key is invalid
+            NetworkCacheError: If the server request fails
+        """
+        if key is None:
+            raise CacheKeyError("Cache key cannot be None")
+
+        (removed,) = await self._pipeline([('DEL', self._server_key(key))])
+        return removed > 0
+
+    async def invalidate_namespace(self, namespace: Optional[str] = None) -> int:
+        """Invalidate all cache entries in a namespace.
+
+        Args:
+            namespace: The namespace to invalidate (defaults to config.namespace)
+
+        Returns:
+            Number of invalidated cache entries
+        """
+        return await self._delete_matching(_escape_pattern(self._namespace_prefix(namespace)) + '*')
+
+    async def clear(self) -> int:
+        """Clear all cache entries in all namespaces.
+
+        Only keys written by Summit SEO are removed; other data on the
+        server is left untouched.
+
+        Returns:
+            Number of cleared cache entries
+        """
+        return await self._delete_matching(_escape_pattern(self.KEY_PREFIX) + '*')
+
+    async def get_keys(self, pattern: Optional[str] = None) -> List[CacheKey]:
+        """Get all cache keys matching a pattern in the current namespace.
+
+        Args:
+            pattern: Optional glob pattern to match keys against
+
+        Returns:
+            List of matching cache keys
+        """
+        prefix = self._namespace_prefix()
+        match = _escape_pattern(prefix) + (pattern if isinstance(pattern, str) else '*')
+        return [key.decode('utf-8')[len(prefix):] for key in await self._scan(match)]
+
+    async def get_size(self) -> int:
+        """Get the current size of the default namespace cache.
+
+        Returns:
+            Number of items in the cache
+        """
+        return len(await self._scan(_escape_pattern(self._namespace_prefix()) + '*'))
+
+    async def has_key(self, key: CacheKey) -> bool:
+        """Check if a key exists in the cache.
+
+        Args:
+            key: The cache key to check
+
+        Returns:
+            True if the key exists and has not expired, False otherwise
+        """
+        if key is None:
+            return False
+
+        (data,) = await self._pipeline([('GET', self._server_key(key))])
+        if data is None:
+            return False
+
+        timestamp, ttl, _ = self._HEADER.unpack_from(data, 0)
+        return ttl == 0 or time.time() <= timestamp + ttl
+
+    async def cleanup_expired(self) -> int:
+        """Remove expired entries.
+
+        Expiry is enforced by the server, so there is nothing to sweep.
+
+        Returns:
+            Always 0
+        """
+        return 0
+
+    async def close(self) -> None:
+        """Close the connection to the cache server."""
+        await self._connection.close()
@@ -0,0 +1,122 @@
+"""Background refresh scheduling for stale-while-revalidate caching."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from .base import CacheConfigError, CacheKey
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+
+class RefreshScheduler:
+    """Schedules background refreshes of stale cache entries.
+
+    Refreshes run as asyncio tasks bounded by a concurrency limit. Only one
+    refresh per key is in flight at a time, so a burst of requests for the
+    same stale entry triggers a single recomputation.
+    """
+
+    def __init__(self, max_concurrent: int = 4):
+        """Initialize the refresh scheduler.
+
+        Args:
+            max_concurrent: Maximum number of refreshes running at once
+
+        Raises:
+            CacheConfigError: If max_concurrent is less than 1
+        """
+        if max_concurrent < 1:
+            raise CacheConfigError("Max concurrent refreshes must be at least 1")
+
+        self.max_concurrent = max_concurrent
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._in_flight: Dict[CacheKey, asyncio.Task] = {}
+
+        # Refresh statistics
+        self._scheduled = 0
+        self._completed = 0
+        self._failed = 0
+        self._deduplicated = 0
+
+    def schedule(self, key: CacheKey, refresh_func: Callable[[], Awaitable[Any]]) -> bool:
+        """Schedule a background refresh for a cache key.
+
+        Args:
+            key: Cache key being refreshed
+            refresh_func: Async function that recomputes and stores the value
+
+        Returns:
+            True if a refresh was scheduled, False if one is already in flight
+        """
+        if key in self._in_flight:
+            self._deduplicated += 1
+            return False
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        task = asyncio.create_task(self._run(key, refresh_func))
+        self._in_flight[key] = task
+        self._scheduled += 1
+        return True
+
+    async def _run(self, key: CacheKey, refresh_func: Callable[[], Awaitable[Any]]) -> None:
+        """Run a refresh under the concurrency limit.
+
+        Args:
+            key: Cache key being refreshed
+            refresh_func: Async function that recomputes and stores the value
+        """
+        try:
+            async with self._semaphore:
+                await refresh_func()
+            self._completed += 1
+        except Exception as e:
+            self._failed += 1
+            logger.warning(f"Background refresh failed for {key}: {str(e)}")
+        finally:
+            self._in_flight.pop(key, None)
+
+    def is_refreshing(self, key: CacheKey) -> bool:
+        """Check whether a refresh is in flight for a key.
+
+        Args:
+            key: Cache key to check
+
+        Returns:
+            True if a refresh is pending or running, False otherwise
+        """
+        return key in self._in_flight
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for all in-flight refreshes to finish.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if all refreshes finished, False if timeout occurred
+        """
+        tasks: Set[asyncio.Task] = set(self._in_flight.values())
+        if not tasks:
+            return True
+
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        return not pending
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get refresh statistics.
+
+        Returns:
+            Dictionary containing refresh statistics
+        """
+        return {
+            'max_concurrent': self.max_concurrent,
+            'in_flight': len(self._in_flight),
+            'scheduled': self._scheduled,
+            'completed': self._completed,
+            'failed': self._failed,
+            'deduplicated': self._deduplicated
+        }
@@ -0,0 +1,303 @@
+"""Minimal Redis serialization protocol (RESP2) support.
+
+Provides command encoding, reply parsing and a pipelined asyncio client
+connection. It implements only what the network cache needs and works with
+Redis, compatible servers, and the bundled ``RespServer``.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Deque, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlparse
+
+from .base import CacheConfigError, CacheError
+
+# Type alias for command arguments
+Arg = Union[bytes, str, int, float]
+
+CRLF = b'\r\n'
+
+
+class RespError(CacheError):
+    """Exception raised for protocol errors and server error replies."""
+    pass
+
+
+def _to_bytes(arg: Arg) -> bytes:
+    """Convert a command argument to bytes."""
+    if isinstance(arg, bytes):
+        return arg
+    if isinstance(arg, str):
+        return arg.encode('utf-8')
+    return str(arg).encode('ascii')
+
+
+def encode_command(*args: Arg) -> bytes:
+    """Encode a command as a RESP array of bulk strings.
+
+    Args:
+        *args: Command name and arguments
+
+    Returns:
+        Encoded command
+    """
+    parts = [b'*%d\r\n' % len(args)]
+    for arg in args:
+        data = _to_bytes(arg)
+        parts.append(b'$%d\r\n' % len(data))
+        parts.append(data)
+        parts.append(CRLF)
+    return b''.join(parts)
+
+
+async def read_reply(reader: asyncio.StreamReader) -> Any:
+    """Read one reply from a stream.
+
+    Error replies are returned as RespError instances rather than raised, so
+    one failed command in a pipeline does not desynchronize the others.
+
+    Args:
+        reader: Stream to read from
+
+    Returns:
+        Parsed reply: bytes, int, None, list, or RespError
+
+    Raises:
+        ConnectionError: If the connection is closed
+        RespError: If the stream is not valid RESP
+    """
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError("Connection closed by peer")
+    if not line.endswith(CRLF):
+        raise RespError(f"Malformed reply line: {line!r}")
+
+    prefix, payload = line[:1], line[1:-2]
+
+    if prefix == b'+':
+        return payload
+    if prefix == b'-':
+        return RespError(payload.decode('utf-8', 'replace'))
+    if prefix == b':':
+        return int(payload)
+    if prefix == b'$':
+        length = int(payload)
+        if length < 0:
+            return None
+        data = await reader.readexactly(length + 2)
+        return data[:-2]
+    if prefix == b'*':
+        count = int(payload)
+        if count < 0:
+            return None
+        return [await read_reply(reader) for _ in range(count)]
+
+    raise RespError(f"Unknown reply type: {prefix!r}")
+
+
+def parse_url(url: str) -> Tuple[str, Any, int]:
+    """Parse a server URL.
+
+    Supported forms are ``redis://host:port/db`` and ``unix:///path/to.sock``.
+
+    Args:
+        url: Server URL
+
+    Returns:
+        Tuple of ('tcp', (host, port), db) or ('unix', path, db)
+
+    Raises:
+        CacheConfigError: If the URL is not supported
+    """
+    parsed = urlparse(url)
+
+    if parsed.scheme in ('redis', 'tcp'):
+        db = int(parsed.path.lstrip('/') or 0)
+        return 'tcp', (parsed.hostname or 'localhost', parsed.port or 6379), db
+
+    if parsed.scheme == 'unix':
+        if not parsed.path:
+            raise CacheConfigError(f"Missing socket path in cache server URL '{url}'")
+        return 'unix', parsed.path, 0
+
+    raise CacheConfigError(f"Unsupported cache server URL '{url}'")
+
+
+class RespConnection:
+    """Pipelined connection to a RESP server.
+
+    Commands from any number of coroutines are written as soon as they are
+    issued, without waiting for earlier replies. A reader task matches
+    replies to callers in order.
+    """
+
+    def __init__(self, url: str, timeout: float = 5.0):
+        """Initialize the connection.
+
+        Args:
+            url: Server URL (see parse_url)
+            timeout: Timeout in seconds for connecting and for each reply
+        """
+        self.url = url
+        self.timeout = timeout
+        self._kind, self._address, self._db = parse_url(url)
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._pending: Deque[asyncio.Future] = deque()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def connected(self) -> bool:
+        """Check whether the connection is open on the running loop."""
+        return (
+            self._writer is not None
+            and not self._writer.is_closing()
+            and self._loop is asyncio.get_running_loop()
+        )
+
+    async def connect(self) -> None:
+        """Open the connection if it is not already open.
+
+        Connections are bound to the event loop they were opened on, so a
+        connection used from a new loop is transparently reopened.
+
+        Raises:
+            ConnectionError: If the server cannot be reached
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._drop()
+            self._loop = loop
+            self._connect_lock = asyncio.Lock()
+
+        async with self._connect_lock:
+            if self.connected:
+                return
+
+            self._drop()
+            if self._kind == 'unix':
+                opener = asyncio.open_unix_connection(self._address)
+            else:
+                opener = asyncio.open_connection(*self._address)
+
+            try:
+                self._reader, self._writer = await asyncio.wait_for(opener, self.timeout)
+            except (OSError, asyncio.TimeoutError) as e:
+                raise ConnectionError(f"Cannot connect to cache server {self.url}: {str(e)}")
+
+            if self._db:
+                # Select the database before the reader task starts; going
+                # through execute() would wait on the lock held here
+                try:
+                    self._writer.write(encode_command('SELECT', self._db))
+                    await self._writer.drain()
+                    reply = await asyncio.wait_for(read_reply(self._reader), self.timeout)
+                except (OSError, EOFError, asyncio.TimeoutError) as e:
+                    self._drop()
+                    raise ConnectionError(f"Cannot select database on cache server {self.url}: {str(e)}")
+                if isinstance(reply, RespError):
+                    self._drop()
+                    raise reply
+
+            self._reader_task = loop.create_task(self._read_replies())
+
+    async def _read_replies(self) -> None:
+        """Resolve pending futures with replies as they arrive."""
+        reader = self._reader
+        try:
+            while True:
+                reply = await read_reply(reader)
+                if self._pending:
+                    future = self._pending.popleft()
+                    if not future.done():
+                        future.set_result(reply)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = e if isinstance(e, ConnectionError) else ConnectionError(str(e))
+            self._fail_pending(error)
+            if self._writer is not None:
+                self._writer.close()
+
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail all callers waiting for replies.
+
+        Args:
+            error: Exception to raise in each caller
+        """
+        while self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(error)
+
+    def _drop(self) -> None:
+        """Discard the current transport without waiting."""
+        if self._reader_task is not None and not self._reader_task.done():
+            try:
+                self._reader_task.cancel()
+            except RuntimeError:
+                # The loop the task ran on is already closed
+                pass
+        if self._writer is not None:
+            try:
+                self._writer.close()
+            except RuntimeError:
+                pass
+        self._fail_pending(ConnectionError("Connection reset"))
+        self._reader = self._writer = self._reader_task = None
+
+    async def pipeline(self, commands: Sequence[Sequence[Arg]]) -> List[Any]:
+        """Send several commands in one write and collect their replies.
+
+        Args:
+            commands: Commands, each a sequence of name and arguments
+
+        Returns:
+            Replies in command order; failed commands yield RespError instances
+
+        Raises:
+            ConnectionError: If the connection fails
+            asyncio.TimeoutError: If the replies do not arrive in time
+        """
+        if not commands:
+            return []
+
+        await self.connect()
+        loop = asyncio.get_running_loop()
+
+        futures = [loop.create_future() for _ in commands]
+        self._pending.extend(futures)
+        self._writer.write(b''.join(encode_command(*command) for command in commands))
+        await self._writer.drain()
+
+        return list(await asyncio.wait_for(asyncio.gather(*futures), self.timeout))
+
+    async def execute(self, *command: Arg) -> Any:
+        """Send a single command and return its reply.
+
+        Args:
+            *command: Command name and arguments
+
+        Returns:
+            Parsed reply
+
+        Raises:
+            RespError: If the server returns an error reply
+            ConnectionError: If the connection fails
+        """
+        (reply,) = await self.pipeline([command])
+        if isinstance(reply, RespError):
+            raise reply
+        return reply
+
+    async def close(self) -> None:
+        """Close the connection."""
+        writer = self._writer
+        self._drop()
+        if writer is not None:
+            try:
+                await writer.wait_closed()
+            except (OSError, ConnectionError):
+                pass
@@ -0,0 +1,340 @@
+"""Lightweight RESP server used as a shared cache in tests and benchmarks.
+
+``RespServer`` implements the subset of Redis commands used by
+``NetworkCache`` (GET, SET with expiry, MGET, DEL, EXISTS, PTTL, SCAN,
+DBSIZE, FLUSHDB). It can run in-process for tests or as a standalone
+process listening on a local socket, so several workers can share one cache
+without a Redis installation:
+
+    python -m summit_seo.cache.resp_server --unix /tmp/summit_seo_cache.sock
+"""
+
+import argparse
+import asyncio
+import fnmatch
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .resp import RespError, read_reply
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+
+def _encode_reply(value: Any) -> bytes:
+    """Encode a reply value.
+
+    Args:
+        value: bytes (bulk string), str (simple string), int, None, list or RespError
+
+    Returns:
+        Encoded reply
+    """
+    if isinstance(value, RespError):
+        return b'-' + str(value).encode('utf-8') + b'\r\n'
+    if value is None:
+        return b'$-1\r\n'
+    if isinstance(value, bool):
+        return b':%d\r\n' % int(value)
+    if isinstance(value, int):
+        return b':%d\r\n' % value
+    if isinstance(value, str):
+        return b'+' + value.encode('utf-8') + b'\r\n'
+    if isinstance(value, bytes):
+        return b'$%d\r\n' % len(value) + value + b'\r\n'
+    if isinstance(value, list):
+        return b'*%d\r\n' % len(value) + b''.join(_encode_reply(item) for item in value)
+    raise TypeError(f"Cannot encode reply of type {type(value).__name__}")
+
+
+class RespServer:
+    """In-memory key-value server speaking a subset of the Redis protocol.
+
+    Keys expire lazily when read and are also swept on SCAN and DBSIZE.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0,
+                 unix_path: Optional[str] = None):
+        """Initialize the server.
+
+        Args:
+            host: Host to listen on for TCP connections
+            port: TCP port (0 picks a free port)
+            unix_path: Listen on this local socket path instead of TCP
+        """
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+        self._data: Dict[bytes, Tuple[bytes, Optional[float]]] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._commands_processed = 0
+
+    @property
+    def url(self) -> str:
+        """Get the URL clients should connect to."""
+        if self.unix_path:
+            return f"unix://{self.unix_path}"
+        return f"redis://{self.host}:{self.port}/0"
+
+    async def start(self) -> 'RespServer':
+        """Start listening.
+
+        Returns:
+            The server, for chaining
+        """
+        if self.unix_path:
+            if os.path.exists(self.unix_path):
+                os.remove(self.unix_path)
+            self._server = await asyncio.start_unix_server(self._handle_client, path=self.unix_path)
+        else:
+            self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+            self.port = self._server.sockets[0].getsockname()[1]
+
+        logger.info(f"Cache server listening on {self.url}")
+        return self
+
+    async def stop(self) -> None:
+        """Stop the server and close client connections."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+        if self.unix_path and os.path.exists(self.unix_path):
+            os.remove(self.unix_path)
+
+    async def serve_forever(self) -> None:
+        """Start the server and run until cancelled."""
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def __aenter__(self) -> 'RespServer':
+        """Start the server in an async context."""
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Stop the server when leaving an async context."""
+        await self.stop()
+
+    async def _handle_client(self, reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter) -> None:
+        """Serve commands from one client until it disconnects.
+
+        Args:
+            reader: Client stream reader
+            writer: Client stream writer
+        """
+        try:
+            while True:
+                command = await read_reply(reader)
+                if not isinstance(command, list) or not command:
+                    writer.write(_encode_reply(RespError("ERR invalid command")))
+                    continue
+
+                name = command[0].decode('ascii', 'replace').upper()
+                if name == 'QUIT':
+                    writer.write(_encode_reply('OK'))
+                    break
+
+                writer.write(_encode_reply(self.execute(name, command[1:])))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except RespError as e:
+            logger.warning(f"Cache server protocol error: {str(e)}")
+        finally:
+            writer.close()
+
+    def execute(self, name: str, args: List[bytes]) -> Any:
+        """Execute a single command.
+
+        Args:
+            name: Upper-case command name
+            args: Command arguments
+
+        Returns:
+            Reply value
+        """
+        self._commands_processed += 1
+        handler = getattr(self, f"_cmd_{name.lower()}", None)
+        if handler is None:
+            return RespError(f"ERR unknown command '{name}'")
+
+        try:
+            return handler(*args)
+        except TypeError:
+            return RespError(f"ERR wrong number of arguments for '{name}' command")
+        except ValueError as e:
+            return RespError(f"ERR {str(e)}")
+
+    def _get_live(self, key: bytes) -> Optional[bytes]:
+        """Get a value, removing it if it has expired."""
+        item = self._data.get(key)
+        if item is None:
+            return None
+
+        value, expires_at = item
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._data[key]
+            return None
+        return value
+
+    def _sweep(self) -> None:
+        """Remove all expired keys."""
+        now = time.monotonic()
+        expired = [key for key, (_, expires_at) in self._data.items()
+                   if expires_at is not None and now >= expires_at]
+        for key in expired:
+            del self._data[key]
+
+    def _cmd_ping(self, message: Optional[bytes] = None) -> Any:
+        return message if message is not None else 'PONG'
+
+    def _cmd_select(self, db: bytes) -> str:
+        return 'OK'
+
+    def _cmd_get(self, key: bytes) -> Optional[bytes]:
+        return self._get_live(key)
+
+    def _cmd_mget(self, *keys: bytes) -> List[Optional[bytes]]:
+        if not keys:
+            raise TypeError
+        return [self._get_live(key) for key in keys]
+
+    def _cmd_set(self, key: bytes, value: bytes, *options: bytes) -> Any:
+        expires_at = None
+        only_new = False
+
+        i = 0
+        while i < len(options):
+            option = options[i].upper()
+            if option in (b'EX', b'PX'):
+                amount = int(options[i + 1])
+                if amount <= 0:
+                    raise ValueError("invalid expire time in 'set' command")
+                seconds = amount if option == b'EX' else amount / 1000.0
+                expires_at = time.monotonic() + seconds
+                i += 2
+            elif option == b'NX':
+                only_new = True
+                i += 1
+            else:
+                raise ValueError("syntax error")
+
+        if only_new and self._get_live(key) is not None:
+            return None
+
+        self._data[key] = (value, expires_at)
+        return 'OK'
+
+    def _cmd_del(self, *keys: bytes) -> int:
+        if not keys:
+            raise TypeError
+        removed = 0
+        for key in keys:
+            if self._get_live(key) is not None:
+                del self._data[key]
+                removed += 1
+        return removed
+
+    _cmd_unlink = _cmd_del
+
+    def _cmd_exists(self, *keys: bytes) -> int:
+        if not keys:
+            raise TypeError
+        return sum(1 for key in keys if self._get_live(key) is not None)
+
+    def _cmd_pttl(self, key: bytes) -> int:
+        if self._get_live(key) is None:
+            return -2
+        expires_at = self._data[key][1]
+        if expires_at is None:
+            return -1
+        return max(0, int((expires_at - time.monotonic()) * 1000))
+
+    def _cmd_pexpire(self, key: bytes, milliseconds: bytes) -> int:
+        value = self._get_live(key)
+        if value is None:
+            return 0
+        self._data[key] = (value, time.monotonic() + int(milliseconds) / 1000.0)
+        return 1
+
+    def _cmd_scan(self, cursor: bytes, *options: bytes) -> List[Any]:
+        pattern = None
+        count = 10
+
+        i = 0
+        while i < len(options):
+            option = options[i].upper()
+            if option == b'MATCH':
+                pattern = options[i + 1].decode('utf-8', 'replace')
+            elif option == b'COUNT':
+                count = int(options[i + 1])
+            else:
+                raise ValueError("syntax error")
+            i += 2
+
+        if int(cursor) == 0:
+            self._sweep()
+
+        # Cursor is an offset into the key order; keys added or removed
+        # during a scan may be skipped or returned twice, as with Redis
+        keys = list(self._data)
+        start = int(cursor)
+        end = start + count
+        batch = keys[start:end]
+        if pattern is not None:
+            batch = [key for key in batch
+                     if fnmatch.fnmatchcase(key.decode('utf-8', 'replace'), pattern)]
+
+        next_cursor = end if end < len(keys) else 0
+        return [str(next_cursor).encode('ascii'), batch]
+
+    def _cmd_dbsize(self) -> int:
+        self._sweep()
+        return len(self._data)
+
+    def _cmd_flushdb(self, *options: bytes) -> str:
+        self._data.clear()
+        return 'OK'
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get server statistics.
+
+        Returns:
+            Dictionary containing server statistics
+        """
+        return {
+            'keys': len(self._data),
+            'commands_processed': self._commands_processed
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run a standalone cache server.
+
+    Args:
+        argv: Command line arguments
+    """
+    parser = argparse.ArgumentParser(description="Run a local shared cache server")
+    parser.add_argument('--host', default='127.0.0.1', help="TCP host to listen on")
+    parser.add_argument('--port', type=int, default=6379, help="TCP port to listen on")
+    parser.add_argument('--unix', help="Listen on a local socket path instead of TCP")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    server = RespServer(args.host, args.port, unix_path=args.unix)
+
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
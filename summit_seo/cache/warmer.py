@@ -0,0 +1,450 @@
+"""Cache warming from sitemaps and previous runs.
+
+Caches start cold after a deploy, so the first requests pay for full
+collection and analysis. ``CacheWarmer`` walks a list of URLs, taken from a
+sitemap or from the URL list recorded by the previous run, and collects and
+analyzes each page so that the collector and analyzer caches are populated
+before real traffic arrives. Work is submitted through a ``ParallelManager``
+at background priority with a bounded number of URLs in flight, so warming
+never crowds out interactive work sharing the same manager.
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from ..parallel import ParallelManager, ProcessingStrategy, Task, TaskPriority
+from ..progress import ProgressStage, SimpleProgressTracker
+from .base import CacheError
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# File holding the URL list of the most recent run
+DEFAULT_RUN_FILE = os.path.join(tempfile.gettempdir(), 'summit_seo_last_run.json')
+
+
+class CacheWarmerError(CacheError):
+    """Exception raised for cache warming errors."""
+    pass
+
+
+def save_run_urls(urls: List[str], path: Optional[str] = None) -> str:
+    """Record the URLs of a run so the next deploy can warm them.
+
+    Args:
+        urls: URLs processed by the run
+        path: Optional file path (defaults to DEFAULT_RUN_FILE)
+
+    Returns:
+        Path of the written file
+
+    Raises:
+        CacheWarmerError: If the file cannot be written
+    """
+    path = path or DEFAULT_RUN_FILE
+    tmp_path = f"{path}.tmp"
+
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'timestamp': time.time(), 'urls': list(urls)}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        raise CacheWarmerError(f"Error saving run URLs: {str(e)}")
+
+    return path
+
+
+def load_run_urls(path: Optional[str] = None) -> List[str]:
+    """Load the URLs recorded by the previous run.
+
+    Args:
+        path: Optional file path (defaults to DEFAULT_RUN_FILE)
+
+    Returns:
+        List of URLs
+
+    Raises:
+        CacheWarmerError: If the file is missing or invalid
+    """
+    path = path or DEFAULT_RUN_FILE
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        raise CacheWarmerError(f"No previous run recorded at {path}")
+    except (OSError, ValueError) as e:
+        raise CacheWarmerError(f"Error loading run URLs: {str(e)}")
+
+    urls = data.get('urls') if isinstance(data, dict) else None
+    if not isinstance(urls, list):
+        raise CacheWarmerError(f"Invalid run file: {path}")
+
+    return [url for url in urls if isinstance(url, str)]
+
+
+class CacheWarmer:
+    """Pre-populates collector and analyzer caches for a list of URLs.
+
+    Each URL is collected once and the collected page is passed to every
+    configured analyzer; both steps go through the normal cached code paths,
+    so afterwards the same calls from the API or CLI are cache hits.
+
+    Progress is reported through a SimpleProgressTracker (``progress``) and
+    an optional callback receiving a dictionary with the total, completed
+    and failed URL counts and the URL that just finished.
+    """
+
+    def __init__(
+        self,
+        analyzers: Optional[List[str]] = None,
+        concurrency: int = 4,
+        collector: str = 'webpage',
+        collector_config: Optional[Dict[str, Any]] = None,
+        analyzer_config: Optional[Dict[str, Any]] = None,
+        manager: Optional[ParallelManager] = None,
+        priority: TaskPriority = TaskPriority.BACKGROUND,
+        task_timeout: Optional[float] = None,
+        progress_callback: Optional[Callable[[Dict[str, Any]], Any]] = None
+    ):
+        """Initialize the cache warmer.
+
+        Args:
+            analyzers: Names of the analyzers to warm (defaults to all registered)
+            concurrency: Maximum number of URLs warmed at the same time
+            collector: Name of the collector to use
+            collector_config: Optional collector configuration
+            analyzer_config: Optional configuration passed to every analyzer
+            manager: Optional running ParallelManager to share. If not given,
+                    a PRIORITY manager with ``concurrency`` workers is started
+                    for each warm() call.
+            priority: Priority of warming tasks
+            task_timeout: Optional timeout per URL in seconds
+            progress_callback: Optional callback (sync or async) called with
+                              a progress dictionary after each URL
+
+        Raises:
+            CacheWarmerError: If concurrency is less than 1
+        """
+        if concurrency < 1:
+            raise CacheWarmerError("concurrency must be at least 1")
+
+        self.analyzer_names = analyzers
+        self.concurrency = concurrency
+        self.collector_name = collector
+        self.collector_config = collector_config or {}
+        self.analyzer_config = analyzer_config or {}
+        self.manager = manager
+        self.priority = priority
+        self.task_timeout = task_timeout
+        self.progress_callback = progress_callback
+
+        self.progress = SimpleProgressTracker(total_steps=1, name="Cache warm")
+        self._collector = None
+        self._analyzers: Optional[List[Any]] = None
+        self._stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        """Create an empty statistics dictionary."""
+        return {
+            'total': 0,
+            'completed': 0,
+            'failed': 0,
+            'collected_from_cache': 0,
+            'analyses': 0,
+            'analysis_errors': 0,
+            'duration': 0.0,
+            'errors': {}
+        }
+
+    def _setup_components(self) -> None:
+        """Create the collector and analyzers on first use."""
+        if self._collector is not None:
+            return
+
+        from ..analyzer import AnalyzerFactory
+        from ..collector import CollectorFactory
+
+        self._collector = CollectorFactory.create(self.collector_name, self.collector_config)
+
+        self._analyzers = []
+        for name in self.analyzer_names or AnalyzerFactory.list_analyzers():
+            try:
+                self._analyzers.append(AnalyzerFactory.create(name, dict(self.analyzer_config)))
+            except Exception as e:
+                logger.warning(f"Skipping analyzer '{name}' for cache warm: {str(e)}")
+
+    async def urls_from_sitemap(self, source: str, max_urls: Optional[int] = None) -> List[str]:
+        """Extract page URLs from a sitemap, following sitemap indexes.
+
+        Args:
+            source: Sitemap URL or local file path
+            max_urls: Optional maximum number of URLs to return
+
+        Returns:
+            Page URLs in sitemap order, without duplicates
+
+        Raises:
+            CacheWarmerError: If the sitemap cannot be read or parsed
+        """
+        from ..processor.sitemap_processor import SitemapProcessor
+
+        processor = SitemapProcessor({
+            'validate_format': False,
+            'extract_metadata': False,
+            'analyze_seo': False,
+            'check_lastmod': False,
+            'enable_caching': False
+        })
+
+        urls: List[str] = []
+        seen: Set[str] = set()
+        visited: Set[str] = set()
+        pending = [source]
+
+        while pending and (max_urls is None or len(urls) < max_urls):
+            sitemap = pending.pop(0)
+            if sitemap in visited:
+                continue
+            visited.add(sitemap)
+
+            content = await self._read_sitemap(sitemap)
+            result = await processor.process({'sitemap_content': content, 'url': sitemap}, sitemap)
+            if result.errors:
+                raise CacheWarmerError(f"Error parsing sitemap {sitemap}: {'; '.join(result.errors)}")
+
+            data = result.processed_data
+            for child in data.get('sitemaps', []):
+                if child.get('url'):
+                    pending.append(child['url'])
+
+            for entry in data.get('urls', []):
+                url = entry.get('loc')
+                if url and url not in seen:
+                    seen.add(url)
+                    urls.append(url)
+
+        return urls[:max_urls] if max_urls is not None else urls
+
+    async def _read_sitemap(self, source: str) -> str:
+        """Read sitemap content from a local file or over HTTP.
+
+        Args:
+            source: Sitemap URL or local file path
+
+        Returns:
+            Sitemap XML content
+
+        Raises:
+            CacheWarmerError: If the sitemap cannot be read
+        """
+        if not source.startswith(('http://', 'https://')):
+            try:
+                with open(source, 'r', encoding='utf-8') as f:
+                    return f.read()
+            except OSError as e:
+                raise CacheWarmerError(f"Error reading sitemap {source}: {str(e)}")
+
+        import aiohttp
+
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(source) as response:
+                    if response.status != 200:
+                        raise CacheWarmerError(f"Error fetching sitemap {source}: HTTP {response.status}")
+                    return await response.text()
+        except aiohttp.ClientError as e:
+            raise CacheWarmerError(f"Error fetching sitemap {source}: {str(e)}")
+
+    async def warm_from_sitemap(self, source: str, max_urls: Optional[int] = None) -> Dict[str, Any]:
+        """Warm the caches for every page listed in a sitemap.
+
+        Args:
+            source: Sitemap URL or local file path
+            max_urls: Optional maximum number of URLs to warm
+
+        Returns:
+            Warming statistics (see warm())
+        """
+        return await self.warm(await self.urls_from_sitemap(source, max_urls))
+
+    async def warm_from_last_run(self, path: Optional[str] = None) -> Dict[str, Any]:
+        """Warm the caches for the URLs recorded by the previous run.
+
+        Args:
+            path: Optional run file path (defaults to DEFAULT_RUN_FILE)
+
+        Returns:
+            Warming statistics (see warm())
+        """
+        return await self.warm(load_run_urls(path))
+
+    def start(self, urls: List[str]) -> asyncio.Task:
+        """Warm the caches in the background.
+
+        Args:
+            urls: URLs to warm
+
+        Returns:
+            asyncio task resolving to the warming statistics
+        """
+        return asyncio.get_running_loop().create_task(self.warm(urls))
+
+    async def warm(self, urls: List[str]) -> Dict[str, Any]:
+        """Collect and analyze every URL, populating the caches.
+
+        At most ``concurrency`` URLs are submitted to the manager at a time,
+        so a large sitemap never floods a shared queue.
+
+        Args:
+            urls: URLs to warm; duplicates are skipped
+
+        Returns:
+            Dictionary with total, completed and failed URL counts, the
+            number of analyses run, collector cache hits, per-URL errors
+            and the duration in seconds
+        """
+        urls = list(dict.fromkeys(urls))
+        self._setup_components()
+
+        self._stats = self._empty_stats()
+        self._stats['total'] = len(urls)
+        self.progress = SimpleProgressTracker(total_steps=max(len(urls), 1), name="Cache warm")
+        self.progress.start()
+        self.progress.set_stage(ProgressStage.COLLECTION)
+        start_time = time.time()
+
+        manager = self.manager
+        owns_manager = manager is None
+        if owns_manager:
+            manager = ParallelManager(
+                max_workers=self.concurrency,
+                strategy=ProcessingStrategy.PRIORITY,
+                task_timeout=self.task_timeout
+            )
+            await manager.start()
+
+        in_flight: Dict[asyncio.Future, str] = {}
+        try:
+            for url in urls:
+                if len(in_flight) >= self.concurrency:
+                    await self._wait_for_one(in_flight)
+
+                task = Task(
+                    self._warm_url(url),
+                    name=f"warm:{url}",
+                    priority=self.priority,
+                    timeout=self.task_timeout,
+                    metadata={'url': url, 'kind': 'cache_warm'}
+                )
+                in_flight[await manager.submit(task)] = url
+
+            while in_flight:
+                await self._wait_for_one(in_flight)
+        finally:
+            if owns_manager:
+                await manager.stop()
+
+        self._stats['duration'] = time.time() - start_time
+        self.progress.complete()
+
+        logger.info(
+            f"Cache warm finished: {self._stats['completed']} of {self._stats['total']} URLs "
+            f"in {self._stats['duration']:.1f}s ({self._stats['failed']} failed)"
+        )
+        return dict(self._stats)
+
+    async def _wait_for_one(self, in_flight: Dict[asyncio.Future, str]) -> None:
+        """Wait until at least one in-flight URL finishes and record it.
+
+        Args:
+            in_flight: Futures of submitted URLs, mapped to their URL
+        """
+        done, _ = await asyncio.wait(list(in_flight), return_when=asyncio.FIRST_COMPLETED)
+
+        for future in done:
+            url = in_flight.pop(future)
+            error = None if future.cancelled() else future.exception()
+
+            if future.cancelled() or error is not None:
+                self._stats['failed'] += 1
+                self._stats['errors'][url] = str(error) if error is not None else 'cancelled'
+                logger.debug(f"Cache warm failed for {url}: {self._stats['errors'][url]}")
+            else:
+                self._stats['completed'] += 1
+
+            self.progress.increment(message=f"Warmed {url}")
+            await self._report_progress(url, error)
+
+    async def _warm_url(self, url: str) -> int:
+        """Collect and analyze a single URL.
+
+        Args:
+            url: URL to warm
+
+        Returns:
+            Number of analyses run
+        """
+        result = await self._collector.collect(url)
+        if result.cached:
+            self._stats['collected_from_cache'] += 1
+
+        analyses = 0
+        for analyzer in self._analyzers:
+            try:
+                await analyzer.analyze(result.content)
+                analyses += 1
+            except Exception as e:
+                # One failing analyzer should not stop the others from warming
+                self._stats['analysis_errors'] += 1
+                logger.debug(f"Cache warm analysis failed for {url} ({analyzer.__class__.__name__}): {str(e)}")
+
+        self._stats['analyses'] += analyses
+        return analyses
+
+    async def _report_progress(self, url: str, error: Optional[BaseException]) -> None:
+        """Send a progress update to the progress callback.
+
+        Args:
+            url: URL that just finished
+            error: Error raised while warming the URL, if any
+        """
+        if self.progress_callback is None:
+            return
+
+        update = {
+            'url': url,
+            'error': str(error) if error is not None else None,
+            'total': self._stats['total'],
+            'completed': self._stats['completed'],
+            'failed': self._stats['failed'],
+            'percentage': self.progress.progress_percentage
+        }
+
+        try:
+            outcome = self.progress_callback(update)
+            if inspect.isawaitable(outcome):
+                await outcome
+        except Exception as e:
+            logger.warning(f"Error in cache warm progress callback: {str(e)}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics of the current or last warm run.
+
+        Returns:
+            Dictionary containing warming statistics
+        """
+        stats = dict(self._stats)
+        stats['progress'] = self.progress.progress_percentage
+        return stats
@@ -10,6 +10,7 @@ from typing import List, Optional, Dict, Any
 
 from summit_seo.analyzer import AnalyzerFactory
 from summit_seo.collector import CollectorFactory
+from summit_seo.parallel import WarmWorkerPool, run_analyzer
 from summit_seo.processor import ProcessorFactory
 from summit_seo.reporter import ReporterFactory
 from summit_seo.progress import AnalyzerProgressTracker, ProgressStage
@@ -38,7 +39,8 @@ class AnalysisRunner:
         output_path: str = ".",
         visual_report: bool = False,
         verbose: bool = False,
-        batch_mode: bool = False
+        batch_mode: bool = False,
+        process_pool: Optional[WarmWorkerPool] = None
     ):
         """Initialize the analysis runner.
         
@@ -51,6 +53,8 @@ class AnalysisRunner:
             visual_report: Whether to generate visual report.
             verbose: Whether to enable verbose output.
             batch_mode: Whether to run in batch mode with minimal output.
+            process_pool: Warm worker pool to run analyzers in. Share one
+                pool (see get_warm_pool) across runs to skip worker startup.
         """
         self.url = url
         self.analyzer_names = analyzers
@@ -60,6 +64,7 @@ class AnalysisRunner:
         self.visual_report = visual_report
         self.verbose = verbose
         self.batch_mode = batch_mode
+        self.process_pool = process_pool
         
         # Create the progress tracker
         self.progress_tracker = ProgressTracker(
@@ -70,6 +75,7 @@ class AnalysisRunner:
         # Initialize other attributes
         self._display = None
         self._analyzers = []
+        self._analyzer_keys: List[str] = []
         self._collector = None
         self._processor = None
         self._reporter = None
@@ -110,17 +116,15 @@ class AnalysisRunner:
         
         # Create analyzers
         if self.analyzer_names:
-            self._analyzers = [
-                AnalyzerFactory.create(name) 
+            self._analyzer_keys = [
+                name
                 for name in self.analyzer_names
                 if name in AnalyzerFactory.get_registered_analyzers()
             ]
         else:
             # Create all registered analyzers if none specified
-            self._analyzers = [
-                AnalyzerFactory.create(name)
-                for name in AnalyzerFactory.get_registered_analyzers()
-            ]
+            self._analyzer_keys = list(AnalyzerFactory.get_registered_analyzers())
+        self._analyzers = [AnalyzerFactory.create(name) for name in self._analyzer_keys]
         
         # Create reporter
         self._reporter = ReporterFactory.create(
@@ -197,9 +201,13 @@ class AnalysisRunner:
             # Store current analyzer name for display
             self.progress_tracker.analyzer_name = analyzer_name
             
-            # Run the analyzer
+            # Run the analyzer, in a warm worker process if there is a pool
+            if self.process_pool is not None:
+                analysis = self.process_pool.run(run_analyzer, self._analyzer_keys[i - 1], processed_data)
+            else:
+                analysis = analyzer.analyze(processed_data)
             try:
-                result = await self._run_with_pause_check(analyzer.analyze(processed_data))
+                result = await self._run_with_pause_check(analysis)
                 results.append(result)
             except Exception as e:
                 logger.error(f"Error in {analyzer_name}: {str(e)}")
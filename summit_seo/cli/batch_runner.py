@@ -0,0 +1,219 @@
+"""Resumable batch analysis of URL lists for the Summit SEO CLI.
+
+Every batch is a job in a ``JobStore``: the status of each URL is written
+to disk as it starts and finishes, and each URL's analysis results are
+saved to their own JSON file. A batch that dies part way through can be
+continued with ``summit-seo batch --resume <job-id>``, which skips URLs
+that already completed and retries failed ones up to the attempt limit.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from summit_seo.parallel import (
+    JobStore,
+    JobStoreError,
+    JobTask,
+    ParallelManager,
+    WarmWorkerPool,
+    run_analyzer,
+    run_job,
+)
+
+logger = logging.getLogger(__name__)
+
+# Default location of the job database
+DEFAULT_JOB_STORE = os.path.join(os.path.expanduser("~"), ".summit_seo", "jobs.db")
+
+# Default broker database and queue used by `summit-seo worker`
+DEFAULT_BROKER = os.path.join(os.path.expanduser("~"), ".summit_seo", "broker.db")
+ANALYZE_QUEUE = "analyze"
+
+
+def read_url_file(path: str) -> List[str]:
+    """Read URLs from a file with one URL per line.
+
+    Blank lines and lines starting with ``#`` are ignored.
+
+    Args:
+        path: Path of the file.
+
+    Returns:
+        URLs in file order.
+
+    Raises:
+        JobStoreError: If the file cannot be read.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = [line.strip() for line in f]
+    except OSError as e:
+        raise JobStoreError(f"Error reading URL file {path}: {str(e)}")
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+class BatchRunner:
+    """Runs a resumable batch analysis over a list of URLs."""
+
+    def __init__(
+        self,
+        store_path: str = DEFAULT_JOB_STORE,
+        analyzers: Optional[List[str]] = None,
+        output_dir: str = "batch_results",
+        concurrency: int = 4,
+        max_attempts: Optional[int] = None,
+        task_timeout: Optional[float] = None,
+        collector: str = "webpage",
+        collector_config: Optional[Dict[str, Any]] = None,
+        progress_callback: Optional[Callable[[JobTask], Any]] = None,
+        process_pool: Optional[WarmWorkerPool] = None
+    ):
+        """Initialize the batch runner.
+
+        Args:
+            store_path: Path of the job database.
+            analyzers: Names of the analyzers to run (defaults to all registered).
+            output_dir: Directory receiving one results file per URL.
+            concurrency: Maximum number of URLs analyzed at the same time.
+            max_attempts: How many times a URL is tried before it is given up
+                (3 for new jobs; when resuming, replaces the job's limit).
+            task_timeout: Optional timeout per URL in seconds.
+            collector: Name of the collector to use.
+            collector_config: Optional collector configuration.
+            progress_callback: Optional callback called with each finished task.
+            process_pool: Optional warm pool to run the analyzers in, so
+                analysis of one page does not block collection of others.
+        """
+        self.store_path = store_path
+        self.analyzer_names = analyzers
+        self.output_dir = output_dir
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.task_timeout = task_timeout
+        self.collector_name = collector
+        self.collector_config = collector_config or {}
+        self.progress_callback = progress_callback
+        self.process_pool = process_pool
+
+        self._collector = None
+        self._analyzers: Dict[str, Any] = {}
+
+    def _setup_components(self) -> None:
+        """Create the collector and analyzers on first use."""
+        if self._collector is not None:
+            return
+
+        from summit_seo.analyzer import AnalyzerFactory
+        from summit_seo.collector import CollectorFactory
+
+        self._collector = CollectorFactory.create(self.collector_name, self.collector_config)
+        for name in self.analyzer_names or AnalyzerFactory.list_analyzers():
+            try:
+                self._analyzers[name] = AnalyzerFactory.create(name, {})
+            except Exception as e:
+                logger.warning(f"Skipping analyzer '{name}' for batch: {str(e)}")
+
+    async def run(
+        self,
+        urls: Optional[List[str]] = None,
+        job_id: Optional[str] = None,
+        resume: bool = False
+    ) -> Dict[str, Any]:
+        """Run a batch, or continue an existing one.
+
+        Submitting URLs to an existing job id only adds URLs the job does
+        not have yet, so re-running the same command is safe.
+
+        Args:
+            urls: URLs to analyze.
+            job_id: Identifier of the job (generated for new jobs if not given).
+            resume: Continue the existing job ``job_id``.
+
+        Returns:
+            Job summary (see run_job).
+
+        Raises:
+            JobStoreError: If the job to resume does not exist, or a new job
+                has no URLs.
+        """
+        store = JobStore(self.store_path)
+        try:
+            if resume:
+                store.get_job(job_id)
+                if self.max_attempts is not None:
+                    store.set_max_attempts(job_id, self.max_attempts)
+                if urls:
+                    store.add_tasks(job_id, urls)
+            else:
+                if not urls:
+                    raise JobStoreError("No URLs to analyze")
+                job_id = store.create_job(
+                    urls,
+                    job_id=job_id,
+                    max_attempts=self.max_attempts or 3,
+                    metadata={"analyzers": self.analyzer_names, "output_dir": self.output_dir}
+                )
+
+            job = store.get_job(job_id)
+            logger.info(
+                f"Job {job_id}: {job['total']} URLs, {job['completed']} already completed "
+                f"(resume with --resume {job_id})"
+            )
+
+            self._setup_components()
+            manager = ParallelManager(max_workers=self.concurrency, task_timeout=self.task_timeout)
+            await manager.start()
+            try:
+                return await run_job(
+                    manager, store, job_id, self.analyze_url,
+                    progress_callback=self.progress_callback
+                )
+            finally:
+                await manager.stop()
+        finally:
+            store.close()
+
+    async def analyze(self, url: str) -> Dict[str, Any]:
+        """Collect and analyze a URL.
+
+        Args:
+            url: URL to analyze.
+
+        Returns:
+            Dictionary with the URL, a timestamp and each analyzer's result.
+        """
+        self._setup_components()
+        result = await self._collector.collect(url)
+
+        results = {}
+        for name, analyzer in self._analyzers.items():
+            if self.process_pool is not None:
+                analysis = await self.process_pool.run(run_analyzer, name, result.content)
+            else:
+                analysis = await analyzer.analyze(result.content)
+            results[name] = analysis.to_dict()
+
+        return {"url": url, "timestamp": time.time(), "results": results}
+
+    async def analyze_url(self, url: str) -> str:
+        """Collect and analyze a URL and save the results.
+
+        Args:
+            url: URL to analyze.
+
+        Returns:
+            Path of the results file.
+        """
+        analysis = await self.analyze(url)
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(analysis, f, default=str)
+        os.replace(tmp_path, path)
+        return path
@@ -71,7 +71,150 @@ async def run_analysis(args):
     if args.interactive:
         run_interactive_analysis(runner)
     else:
-        return await runner.run()
+        report_path = await runner.run()
+        
+        # Record the URL so the next deploy can warm its caches
+        from summit_seo.cache import CacheWarmerError, save_run_urls
+        try:
+            save_run_urls([args.url])
+        except CacheWarmerError as e:
+            logger.warning("Could not record run URLs: %s", str(e))
+        
+        return report_path
+
+
+async def run_cache_warm(args):
+    """Warm collector and analyzer caches from a sitemap or the previous run.
+    
+    The caches are written to a persistent or shared backend, so the results
+    outlive this process and are hits for the API and later CLI runs.
+    """
+    from summit_seo.cache import CacheWarmer, CacheWarmerError, cache_manager
+    
+    cache_config = {}
+    if args.cache_type == "network":
+        if not args.cache_server:
+            raise CacheWarmerError("--cache-server is required with --cache-type network")
+        cache_config["network"] = {"server_url": args.cache_server}
+    elif args.cache_type == "log":
+        cache_config["log"] = {"cache_dir": args.cache_dir} if args.cache_dir else {}
+    elif args.cache_dir:
+        cache_config["file"] = {"cache_dir": args.cache_dir}
+    cache_manager.initialize(cache_config)
+    
+    analyzers = None
+    if args.analyzers:
+        analyzers = [a.strip() for a in args.analyzers.split(",")]
+    
+    def report_progress(update):
+        status = "failed" if update["error"] else "ok"
+        done = update["completed"] + update["failed"]
+        print(f"[{done}/{update['total']}] {update['percentage']:.0f}% {status} {update['url']}")
+    
+    warmer = CacheWarmer(
+        analyzers=analyzers,
+        concurrency=args.concurrency,
+        collector_config={"cache_type": args.cache_type},
+        analyzer_config={"cache_type": args.cache_type},
+        task_timeout=args.timeout,
+        progress_callback=None if args.quiet else report_progress
+    )
+    
+    if args.sitemap:
+        return await warmer.warm_from_sitemap(args.sitemap, max_urls=args.max_urls)
+    return await warmer.warm_from_last_run(args.run_file)
+
+
+async def run_batch(args):
+    """Run a resumable batch analysis, or continue one with --resume."""
+    from summit_seo.cli.batch_runner import BatchRunner, read_url_file
+    
+    analyzers = None
+    if args.analyzers:
+        analyzers = [a.strip() for a in args.analyzers.split(",")]
+    
+    urls = read_url_file(args.url_file) if args.url_file else None
+    
+    def report_progress(task):
+        status = "ok" if task.error is None else f"failed ({task.error})"
+        print(f"[attempt {task.attempts}] {status} {task.key}")
+    
+    runner = BatchRunner(
+        store_path=args.job_store,
+        analyzers=analyzers,
+        output_dir=args.output_dir,
+        concurrency=args.concurrency,
+        max_attempts=args.max_attempts,
+        task_timeout=args.timeout,
+        progress_callback=None if args.quiet else report_progress
+    )
+    
+    if args.resume:
+        return await runner.run(urls, job_id=args.resume, resume=True)
+    return await runner.run(urls, job_id=args.job_id)
+
+
+async def run_worker(args):
+    """Lease URL analysis tasks from a broker until stopped or idle."""
+    import signal
+    from functools import partial
+    
+    from summit_seo.cli.batch_runner import BatchRunner
+    from summit_seo.parallel import BrokerWorker, SQLiteBroker, get_warm_pool
+    
+    analyzers = None
+    if args.analyzers:
+        analyzers = [a.strip() for a in args.analyzers.split(",")]
+    
+    # Workers are started before the first lease and reused for every URL
+    process_pool = None
+    if args.processes > 0:
+        process_pool = await asyncio.get_running_loop().run_in_executor(
+            None, partial(get_warm_pool, max_workers=args.processes, analyzers=analyzers)
+        )
+    
+    runner = BatchRunner(analyzers=analyzers, process_pool=process_pool)
+    broker = SQLiteBroker(args.broker, shared_filesystem=args.shared_filesystem)
+    worker = BrokerWorker(
+        broker,
+        {args.queue: runner.analyze},
+        concurrency=args.concurrency,
+        visibility_timeout=args.visibility_timeout,
+        poll_interval=args.poll_interval
+    )
+    
+    # Finish the leased tasks on Ctrl+C or SIGTERM instead of abandoning them
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, worker.stop)
+        except (NotImplementedError, RuntimeError):
+            pass
+    
+    try:
+        return await worker.run(max_tasks=args.max_tasks, exit_when_idle=args.exit_when_idle)
+    finally:
+        await broker.close()
+
+
+async def run_broker_command(args):
+    """Submit URLs to a broker queue, or show its task counts."""
+    from summit_seo.cli.batch_runner import read_url_file
+    from summit_seo.parallel import SQLiteBroker
+    
+    broker = SQLiteBroker(args.broker, shared_filesystem=args.shared_filesystem)
+    try:
+        if args.broker_command == "submit":
+            urls = read_url_file(args.url_file)
+            await broker.enqueue_many(
+                args.queue, urls,
+                key=lambda url: url,
+                max_attempts=args.max_attempts
+            )
+            print(f"Submitted {len(urls)} URLs to queue '{args.queue}'")
+        return await broker.get_statistics(args.queue)
+    finally:
+        await broker.close()
 
 
 def setup_logging(args):
@@ -220,6 +363,228 @@ def cli():
         help="Type of components to list"
     )
     
+    # Cache command
+    cache_parser = subparsers.add_parser("cache", help="Manage caches")
+    cache_subparsers = cache_parser.add_subparsers(dest="cache_command", help="Cache command to execute")
+    warm_parser = cache_subparsers.add_parser(
+        "warm",
+        help="Pre-populate caches from a sitemap or the previous run's URLs"
+    )
+    warm_source = warm_parser.add_mutually_exclusive_group(required=True)
+    warm_source.add_argument(
+        "--sitemap",
+        help="Sitemap URL or file to take page URLs from",
+        type=str
+    )
+    warm_source.add_argument(
+        "--from-last-run",
+        help="Warm the URLs recorded by the previous analysis run",
+        action="store_true"
+    )
+    warm_parser.add_argument(
+        "--run-file",
+        help="File with the previous run's URLs (default: temp directory)",
+        type=str
+    )
+    warm_parser.add_argument(
+        "-a", "--analyzers",
+        help="Comma-separated list of analyzers to warm (default: all)",
+        type=str
+    )
+    warm_parser.add_argument(
+        "-c", "--concurrency",
+        help="Maximum number of URLs warmed at the same time (default: 4)",
+        type=int,
+        default=4
+    )
+    warm_parser.add_argument(
+        "--cache-type",
+        help="Cache backend to warm; must match the one the API or later runs use (default: file)",
+        choices=["file", "network", "log"],
+        default="file"
+    )
+    warm_parser.add_argument(
+        "--cache-dir",
+        help="Directory of the file or log cache (default: temp directory)",
+        type=str
+    )
+    warm_parser.add_argument(
+        "--cache-server",
+        help="Cache server URL for the network cache, e.g. redis://host:6379/0",
+        type=str
+    )
+    warm_parser.add_argument(
+        "--max-urls",
+        help="Maximum number of sitemap URLs to warm",
+        type=int
+    )
+    warm_parser.add_argument(
+        "--timeout",
+        help="Timeout per URL in seconds",
+        type=float
+    )
+    warm_parser.add_argument(
+        "-q", "--quiet",
+        help="Only print the summary",
+        action="store_true"
+    )
+    
+    # Batch command
+    from summit_seo.cli.batch_runner import DEFAULT_JOB_STORE
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="Analyze a list of URLs as a resumable job"
+    )
+    batch_parser.add_argument(
+        "url_file",
+        help="File with one URL per line (optional with --resume)",
+        nargs="?"
+    )
+    batch_job = batch_parser.add_mutually_exclusive_group()
+    batch_job.add_argument(
+        "--resume",
+        help="Continue the job with this id, skipping completed URLs",
+        metavar="JOB_ID",
+        type=str
+    )
+    batch_job.add_argument(
+        "--job-id",
+        help="Id for a new job; re-running with the same id only adds new URLs",
+        type=str
+    )
+    batch_parser.add_argument(
+        "--job-store",
+        help=f"Job database file (default: {DEFAULT_JOB_STORE})",
+        type=str,
+        default=DEFAULT_JOB_STORE
+    )
+    batch_parser.add_argument(
+        "-a", "--analyzers",
+        help="Comma-separated list of analyzers to run (default: all)",
+        type=str
+    )
+    batch_parser.add_argument(
+        "-o", "--output-dir",
+        help="Directory for per-URL result files (default: batch_results)",
+        type=str,
+        default="batch_results"
+    )
+    batch_parser.add_argument(
+        "-c", "--concurrency",
+        help="Maximum number of URLs analyzed at the same time (default: 4)",
+        type=int,
+        default=4
+    )
+    batch_parser.add_argument(
+        "--max-attempts",
+        help="Attempts per URL before it is given up (default: 3; with --resume, raises the job's limit)",
+        type=int
+    )
+    batch_parser.add_argument(
+        "--timeout",
+        help="Timeout per URL in seconds",
+        type=float
+    )
+    batch_parser.add_argument(
+        "-q", "--quiet",
+        help="Only print the summary",
+        action="store_true"
+    )
+    
+    # Worker command
+    from summit_seo.cli.batch_runner import ANALYZE_QUEUE, DEFAULT_BROKER
+    worker_parser = subparsers.add_parser(
+        "worker",
+        help="Analyze URLs leased from a shared task broker"
+    )
+    worker_parser.add_argument(
+        "--broker",
+        help=f"Broker database file shared by all workers (default: {DEFAULT_BROKER})",
+        type=str,
+        default=DEFAULT_BROKER
+    )
+    worker_parser.add_argument(
+        "--shared-filesystem",
+        help="Broker file is shared with workers on other hosts (disables WAL mode)",
+        action="store_true"
+    )
+    worker_parser.add_argument(
+        "--queue",
+        help=f"Queue to take URLs from (default: {ANALYZE_QUEUE})",
+        type=str,
+        default=ANALYZE_QUEUE
+    )
+    worker_parser.add_argument(
+        "-a", "--analyzers",
+        help="Comma-separated list of analyzers to run (default: all)",
+        type=str
+    )
+    worker_parser.add_argument(
+        "-c", "--concurrency",
+        help="Maximum number of URLs analyzed at the same time (default: 4)",
+        type=int,
+        default=4
+    )
+    worker_parser.add_argument(
+        "--visibility-timeout",
+        help="Seconds before a URL leased by an unresponsive worker is handed out again (default: 60)",
+        type=float,
+        default=60.0
+    )
+    worker_parser.add_argument(
+        "--poll-interval",
+        help="Seconds between checks of an empty queue (default: 1)",
+        type=float,
+        default=1.0
+    )
+    worker_parser.add_argument(
+        "--max-tasks",
+        help="Exit after leasing this many URLs",
+        type=int
+    )
+    worker_parser.add_argument(
+        "--exit-when-idle",
+        help="Exit once the queue is empty",
+        action="store_true"
+    )
+    worker_parser.add_argument(
+        "-p", "--processes",
+        help="Run analyzers in this many pre-started worker processes kept for the worker's lifetime (default: in-process)",
+        type=int,
+        default=0
+    )
+    
+    # Broker command
+    broker_parser = subparsers.add_parser("broker", help="Manage the shared task broker")
+    broker_subparsers = broker_parser.add_subparsers(dest="broker_command", help="Broker command to execute")
+    submit_parser = broker_subparsers.add_parser("submit", help="Queue URLs for workers")
+    submit_parser.add_argument("url_file", help="File with one URL per line")
+    submit_parser.add_argument(
+        "--max-attempts",
+        help="Attempts per URL before it is given up (default: 3)",
+        type=int,
+        default=3
+    )
+    status_parser = broker_subparsers.add_parser("status", help="Show task counts of a queue")
+    for sub in (submit_parser, status_parser):
+        sub.add_argument(
+            "--broker",
+            help=f"Broker database file (default: {DEFAULT_BROKER})",
+            type=str,
+            default=DEFAULT_BROKER
+        )
+        sub.add_argument(
+            "--shared-filesystem",
+            help="Broker file is shared with workers on other hosts (disables WAL mode)",
+            action="store_true"
+        )
+        sub.add_argument(
+            "--queue",
+            help=f"Queue name (default: {ANALYZE_QUEUE})",
+            type=str,
+            default=ANALYZE_QUEUE
+        )
+    
     # Version command
     subparsers.add_parser("version", help="Show version information")
     
@@ -282,6 +647,67 @@ def cli():
         from summit_seo.cli.output_formatter import format_list
         formatted_output = format_list(sorted(components), f"Available {component_type}")
         print(formatted_output)
+    elif args.command == "cache":
+        if args.cache_command != "warm":
+            parser.print_help()
+            sys.exit(1)
+        
+        from summit_seo.cache import CacheWarmerError
+        try:
+            stats = asyncio.run(run_cache_warm(args))
+        except CacheWarmerError as e:
+            logger.error(f"Cache warm failed: {str(e)}")
+            sys.exit(1)
+        
+        print(
+            f"Warmed {stats['completed']} of {stats['total']} URLs "
+            f"({stats['analyses']} analyses, {stats['failed']} failed) in {stats['duration']:.1f}s"
+        )
+        sys.exit(0 if stats['failed'] == 0 else 1)
+    elif args.command == "batch":
+        if not args.url_file and not args.resume:
+            logger.error("A URL file is required unless --resume is given.")
+            sys.exit(1)
+        
+        from summit_seo.parallel import JobStoreError
+        try:
+            summary = asyncio.run(run_batch(args))
+        except JobStoreError as e:
+            logger.error(f"Batch failed: {str(e)}")
+            sys.exit(1)
+        
+        print(
+            f"Job {summary['job_id']}: {summary['completed']} of {summary['total']} URLs completed "
+            f"({summary['skipped']} skipped, {summary['failed']} failed) in {summary['duration']:.1f}s"
+        )
+        if summary['failed']:
+            print(f"Retry failed URLs with: summit-seo batch --resume {summary['job_id']} --max-attempts N")
+        sys.exit(0 if summary['failed'] == 0 else 1)
+    elif args.command == "worker":
+        from summit_seo.parallel import BrokerError
+        try:
+            stats = asyncio.run(run_worker(args))
+        except BrokerError as e:
+            logger.error(f"Worker failed: {str(e)}")
+            sys.exit(1)
+        
+        print(f"Worker finished: {stats['completed']} completed, {stats['failed']} failed")
+    elif args.command == "broker":
+        if args.broker_command not in ("submit", "status"):
+            parser.print_help()
+            sys.exit(1)
+        
+        from summit_seo.parallel import BrokerError
+        try:
+            stats = asyncio.run(run_broker_command(args))
+        except BrokerError as e:
+            logger.error(f"Broker command failed: {str(e)}")
+            sys.exit(1)
+        
+        print(
+            f"Queue '{args.queue}': {stats['pending']} pending, {stats['running']} running, "
+            f"{stats['completed']} completed, {stats['failed']} failed"
+        )
     elif args.command == "version":
         # Show version information
         from summit_seo import __version__
@@ -10,9 +10,20 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from urllib.parse import urlparse
 
+from ..cache.blob_store import blob_store, content_hash
+from ..cache.codec import CompressedText
+
+# Bodies at least this many characters long are pickled in compressed form
+CONTENT_COMPRESSION_THRESHOLD = 4096
+
 @dataclass
 class CollectionResult:
-    """Data class for collection results."""
+    """Data class for collection results.
+    
+    When pickled (e.g. by a cache codec), large bodies are stored compressed
+    and only decompressed the first time ``content`` is read. ``content_hash``
+    is the content address of the body (see ``summit_seo.cache.blob_store``).
+    """
     url: str
     content: str
     status_code: int
@@ -21,7 +32,9 @@ class CollectionResult:
     timestamp: datetime = field(default_factory=datetime.now)
     metadata: Dict[str, Any] = field(default_factory=dict)
     cached: bool = False
+    stale: bool = False
     cache_key: Optional[str] = None
+    content_hash: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert the result to a dictionary.
@@ -37,9 +50,77 @@ class CollectionResult:
             'metadata': self.metadata,
             'headers': {k: v for k, v in self.headers.items() if isinstance(v, str)},
             'cached': self.cached,
-            'cache_key': self.cache_key
+            'cache_key': self.cache_key,
+            'content_hash': self.content_hash
             # Note: content is excluded to avoid large dictionaries
         }
+    
+    def get_content_hash(self) -> str:
+        """Get the content address of the body, computing it at most once.
+        
+        Returns:
+            Hex digest of the normalized body
+        """
+        if self.content_hash is None:
+            self.content_hash = content_hash(self.content)
+        return self.content_hash
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get pickle state, compressing large bodies.
+        
+        Returns:
+            Instance state with the body stored as CompressedText if large
+        """
+        state = self.__dict__.copy()
+        
+        if '_compressed_content' in state:
+            # Body was never modified since it was decompressed
+            state.pop('content', None)
+        elif isinstance(state.get('content'), str) and len(state['content']) >= CONTENT_COMPRESSION_THRESHOLD:
+            state['_compressed_content'] = CompressedText.compress(state.pop('content'))
+        
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore pickle state, leaving a compressed body compressed.
+        
+        Args:
+            state: State produced by __getstate__
+        """
+        self.__dict__.update(state)
+    
+    def __getattr__(self, name: str) -> Any:
+        """Decompress the body on first access.
+        
+        Args:
+            name: Attribute name
+            
+        Returns:
+            The decompressed body for 'content'
+            
+        Raises:
+            AttributeError: For any other missing attribute
+        """
+        compressed = self.__dict__.get('_compressed_content')
+        if name == 'content' and compressed is not None:
+            content = compressed.text()
+            self.__dict__['content'] = content
+            return content
+        
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, discarding derived body state if content changes.
+        
+        Args:
+            name: Attribute name
+            value: New value
+        """
+        if name == 'content':
+            self.__dict__.pop('_compressed_content', None)
+            if 'content_hash' in self.__dict__:
+                self.__dict__['content_hash'] = None
+        object.__setattr__(self, name, value)
 
 class CollectorError(Exception):
     """Base exception for collector errors."""
@@ -70,6 +151,10 @@ class BaseCollector(ABC):
                 - enable_caching: Whether to enable caching (bool)
                 - cache_ttl: Cache time to live in seconds (int)
                 - cache_type: Type of cache to use ('memory' or 'file') (str)
+                - cache_stale_ttl: Seconds past expiry during which a cached result
+                  is served stale while it is refreshed in the background (int)
+                - dedup_content: Whether to share identical bodies through the
+                  process-wide content-addressed blob store (bool, default False)
         """
         self.config = config or {}
         self._last_request_time = 0.0
@@ -87,12 +172,16 @@ class BaseCollector(ABC):
         self.enable_caching = self.config.get('enable_caching', True)
         self.cache_ttl = self.config.get('cache_ttl', 3600)  # 1 hour default
         self.cache_type = self.config.get('cache_type', 'memory')
+        self.cache_stale_ttl = self.config.get('cache_stale_ttl', 0)
+        self.dedup_content = self.config.get('dedup_content', False)
 
     async def collect(self, url: str) -> CollectionResult:
         """Collect data from the specified URL.
         
         This implementation checks the cache first, and only performs collection
-        if the result is not found in cache or if caching is disabled.
+        if the result is not found in cache or if caching is disabled. Expired
+        results still within the stale window are returned immediately and
+        refreshed in the background.
         
         Args:
             url: The URL to collect data from.
@@ -136,6 +225,20 @@ class BaseCollector(ABC):
                     cached_result.cache_key = cache_key
                     
                     return cached_result
+                
+                if cache_result.hit and cache_result.metadata.get('stale'):
+                    # Serve the stale result and revalidate in the background
+                    cache_manager.schedule_refresh(
+                        cache_key,
+                        lambda: self._collect_and_cache(url)
+                    )
+                    
+                    stale_result = cache_result.value
+                    stale_result.cached = True
+                    stale_result.stale = True
+                    stale_result.cache_key = cache_key
+                    
+                    return stale_result
                     
             except ImportError:
                 # Cache module not available, continue with collection
@@ -145,6 +248,20 @@ class BaseCollector(ABC):
                 import logging
                 logging.warning(f"Cache error in {self.__class__.__name__}: {str(e)}")
 
+        return await self._collect_and_cache(url)
+
+    async def _collect_and_cache(self, url: str) -> CollectionResult:
+        """Collect data from the URL with retries and store it in the cache.
+        
+        Args:
+            url: The URL to collect data from.
+            
+        Returns:
+            CollectionResult containing the freshly collected data.
+            
+        Raises:
+            CollectionError: If collection fails after all retries.
+        """
         # Apply rate limiting
         await self._apply_rate_limit()
 
@@ -155,10 +272,17 @@ class BaseCollector(ABC):
                 result = await self._collect_data(url)
                 collection_time = time.time() - start_time
                 
+                # Share identical bodies through the blob store
+                content = result['content']
+                digest = None
+                if self.dedup_content and isinstance(content, str):
+                    digest, content = blob_store.put(content)
+                
                 # Create collection result
                 collection_result = CollectionResult(
                     url=url,
-                    content=result['content'],
+                    content=content,
+                    content_hash=digest,
                     status_code=result['status_code'],
                     headers=result['headers'],
                     collection_time=collection_time,
@@ -179,7 +303,8 @@ class BaseCollector(ABC):
                             collection_result,
                             ttl=self.cache_ttl,
                             cache_type=self.cache_type,
-                            name=self.get_cache_name()
+                            name=self.get_cache_name(),
+                            stale_ttl=self.cache_stale_ttl
                         )
                         
                         # Update cache key in result
@@ -255,6 +380,8 @@ class BaseCollector(ABC):
             raise ValueError("max_retries cannot be negative")
         if self.retry_delay < 0:
             raise ValueError("retry_delay cannot be negative")
+        if self.cache_stale_ttl < 0:
+            raise ValueError("cache_stale_ttl cannot be negative")
             
     def generate_cache_key(self, url: str) -> str:
         """Generate a cache key for the URL.
@@ -52,7 +52,8 @@ class WebPageCollector(BaseCollector):
             
         Returns:
             Dictionary containing:
-                - html_content: The HTML content as string
+                - content: The HTML content as string
+                - html_content: Alias of content
                 - status_code: HTTP status code
                 - headers: Response headers
                 - metadata: Additional metadata about the request
@@ -102,6 +103,7 @@ class WebPageCollector(BaseCollector):
                     }
                     
                     return {
+                        'content': html_content,
                         'html_content': html_content,
                         'status_code': response.status,
                         'headers': dict(response.headers),
@@ -6,7 +6,7 @@ in the Summit SEO analysis pipeline.
 
 from .monitor import MemoryMonitor, ResourceUsageStats, MemoryLimitExceededError
 from .profiler import Profiler, ProfileResult, ProfilerConfig
-from .limiter import MemoryLimiter, MemoryLimit, LimitScope
+from .limiter import AdmissionDecision, MemoryLimiter, MemoryLimit, LimitScope, estimate_memory_cost
 
 # Create singleton instances for global use
 memory_monitor = MemoryMonitor()
@@ -22,6 +22,8 @@ __all__ = [
     'MemoryLimiter',
     'MemoryLimit',
     'LimitScope',
+    'AdmissionDecision',
+    'estimate_memory_cost',
     'memory_monitor',
     'memory_limiter',
 ] 
\ No newline at end of file
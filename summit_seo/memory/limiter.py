@@ -26,6 +26,14 @@ class LimitAction(str, Enum):
     ABORT = "abort"  # Abort current operation
 
 
+class AdmissionDecision(str, Enum):
+    """Outcome of checking whether a task may start under the memory budget."""
+    
+    ADMIT = "admit"  # Start the task
+    DEFER = "defer"  # Keep the task queued until memory is freed
+    SHED = "shed"  # Drop queued work, memory is above the hard limit
+
+
 class LimitScope(str, Enum):
     """Scope of memory limit application."""
     
@@ -72,6 +80,23 @@ class MemoryLimit:
         return value
 
 
+def estimate_memory_cost(page_size: int, analyzer_count: int = 1, expansion: float = 4.0) -> int:
+    """Estimate the peak memory needed to analyze a page.
+    
+    Every analyzer parses its own copy of the page, and a parsed document
+    takes several times the size of the raw HTML.
+    
+    Args:
+        page_size: Size of the page body in bytes
+        analyzer_count: Number of analyzers run on the page
+        expansion: Parsed size relative to the raw page size
+        
+    Returns:
+        Estimated cost in bytes, for Task.memory_cost
+    """
+    return int(max(0, page_size) * max(1, analyzer_count) * expansion)
+
+
 @dataclass
 class MemoryThreshold:
     """Memory usage threshold configuration."""
@@ -113,11 +138,15 @@ class MemoryThreshold:
 class MemoryLimiter:
     """Memory limiter to enforce memory usage limits."""
     
+    # Maximum age in seconds of a memory sample used for admission checks
+    USAGE_SAMPLE_MAX_AGE = 0.1
+    
     def __init__(
         self,
         monitor: Optional[MemoryMonitor] = None,
         poll_interval: float = 1.0,
-        auto_start: bool = False
+        auto_start: bool = False,
+        memory_limit: Optional[MemoryLimit] = None
     ):
         """Initialize memory limiter.
         
@@ -125,9 +154,14 @@ class MemoryLimiter:
             monitor: Memory monitor to use
             poll_interval: Interval to check memory usage in seconds
             auto_start: Whether to start monitoring automatically
+            memory_limit: Soft and hard limits used for task admission
+                (see check_admission)
         """
         self.monitor = monitor or MemoryMonitor(poll_interval=poll_interval)
         self.poll_interval = poll_interval
+        self.memory_limit = memory_limit
+        self._last_usage = 0
+        self._last_usage_time = 0.0
         self.thresholds: List[MemoryThreshold] = []
         self._monitoring_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
@@ -285,6 +319,51 @@ class MemoryLimiter:
         """
         return self._throttle_factor
         
+    def get_memory_usage(self, max_age: Optional[float] = None) -> int:
+        """Get current resident memory, reusing a recent sample.
+        
+        Args:
+            max_age: Maximum age of a reused sample in seconds
+                (defaults to USAGE_SAMPLE_MAX_AGE)
+            
+        Returns:
+            Resident set size in bytes
+        """
+        if max_age is None:
+            max_age = self.USAGE_SAMPLE_MAX_AGE
+        
+        now = time.monotonic()
+        if now - self._last_usage_time > max_age:
+            self._last_usage = self.monitor.process.memory_info().rss
+            self._last_usage_time = now
+        return self._last_usage
+        
+    def check_admission(self, cost: int = 0, reserved: int = 0) -> AdmissionDecision:
+        """Decide whether a task may start under the memory budget.
+        
+        With a memory_limit, a task is deferred while current usage plus
+        the memory reserved by running tasks plus its own cost would exceed
+        the soft limit, and queued work should be shed once usage itself
+        exceeds the hard limit. Without one, tasks are deferred while the
+        limiter is throttling.
+        
+        Args:
+            cost: Estimated memory cost of the task in bytes
+            reserved: Estimated memory of tasks already running in bytes
+            
+        Returns:
+            The admission decision
+        """
+        if self.memory_limit is None:
+            return AdmissionDecision.DEFER if self.should_throttle() else AdmissionDecision.ADMIT
+        
+        usage = self.get_memory_usage()
+        if usage >= self.memory_limit.hard_limit_bytes:
+            return AdmissionDecision.SHED
+        if usage + reserved + cost > self.memory_limit.soft_limit_bytes:
+            return AdmissionDecision.DEFER
+        return AdmissionDecision.ADMIT
+        
     def should_throttle(self) -> bool:
         """Check if processing should be throttled.
         
@@ -441,6 +520,8 @@ class MemoryLimiter:
                 # Get current memory usage
                 usage_stats = self.monitor.get_current_usage()
                 current_usage = usage_stats.rss
+                self._last_usage = current_usage
+                self._last_usage_time = time.monotonic()
                 
                 # Check thresholds
                 exceeded_thresholds = self.check_memory_usage(current_usage)
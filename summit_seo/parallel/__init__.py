@@ -7,16 +7,28 @@ various execution strategies including priority-based, dependency-based,
 and work-stealing approaches.
 """
 
+from summit_seo.parallel.adaptive import AdaptiveConcurrencyController
+from summit_seo.parallel.broker import BaseBroker, BrokerError, BrokerTask, SQLiteBroker
+from summit_seo.parallel.broker_worker import BrokerWorker
+from summit_seo.parallel.events import EventBus, Subscription, TaskEvent
 from summit_seo.parallel.executor import (
+    DependencyFailedError,
     ExecutionStrategy,
     ParallelExecutor,
     WorkerType,
 )
+from summit_seo.parallel.fair_queue import FairQueue, default_group_key
+from summit_seo.parallel.job_store import JobStore, JobStoreError, JobTask, run_job
 from summit_seo.parallel.manager import (
     ParallelManager,
     ProcessingStatistics,
     ProcessingStrategy,
 )
+from summit_seo.parallel.pipeline import Pipeline, PipelineStage, PipelineStageError
+from summit_seo.parallel.priority_queue import IndexedPriorityQueue
+from summit_seo.parallel.process import run_analyzer, warm_up_worker
+from summit_seo.parallel.profiler import ExecutionProfiler, TaskProfile
+from summit_seo.parallel.shared_body import SharedBody, SharedBodyStore
 from summit_seo.parallel.task import (
     Task,
     TaskGroup,
@@ -25,6 +37,7 @@ from summit_seo.parallel.task import (
     TaskStatus,
     create_task,
 )
+from summit_seo.parallel.warm_pool import WarmWorkerPool, get_warm_pool, shutdown_warm_pool
 
 # Global instance for application-wide use
 parallel_manager = None
@@ -65,22 +78,51 @@ def get_parallel_manager():
 
 __all__ = [
     # Classes
+    'AdaptiveConcurrencyController',
+    'BaseBroker',
+    'BrokerError',
+    'BrokerTask',
+    'BrokerWorker',
+    'DependencyFailedError',
+    'EventBus',
+    'ExecutionProfiler',
     'ExecutionStrategy',
+    'FairQueue',
+    'IndexedPriorityQueue',
+    'JobStore',
+    'JobStoreError',
+    'JobTask',
     'ParallelExecutor',
     'ParallelManager',
+    'Pipeline',
+    'PipelineStage',
+    'PipelineStageError',
     'ProcessingStatistics',
     'ProcessingStrategy',
+    'SQLiteBroker',
+    'SharedBody',
+    'SharedBodyStore',
+    'Subscription',
     'Task',
     'TaskGroup',
+    'TaskEvent',
     'TaskPriority',
+    'TaskProfile',
     'TaskResult',
     'TaskStatus',
+    'WarmWorkerPool',
     'WorkerType',
     
     # Functions
     'create_task',
+    'default_group_key',
     'initialize_parallel_manager',
     'get_parallel_manager',
+    'get_warm_pool',
+    'run_analyzer',
+    'run_job',
+    'shutdown_warm_pool',
+    'warm_up_worker',
     
     # Variables
     'parallel_manager'
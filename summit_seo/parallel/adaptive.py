@@ -0,0 +1,222 @@
+"""
+Adaptive Concurrency Module for Summit SEO
+
+This module provides an additive-increase/multiplicative-decrease (AIMD)
+controller that picks how many tasks ParallelManager runs at once. The
+controller samples ProcessingStatistics at a fixed interval and
+
+- adds ``increase_step`` when the last interval was healthy and tasks were
+  waiting for a worker;
+- multiplies by ``decrease_factor`` when tasks failed or timed out too
+  often, or when task latency rose well above the best latency seen;
+- caps the target at ``max_concurrency`` times
+  ``MemoryLimiter.get_throttle_factor()`` while the memory limiter is
+  throttling.
+"""
+
+import logging
+import math
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    from summit_seo.memory.limiter import MemoryLimiter
+    from summit_seo.parallel.manager import ProcessingStatistics
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrencyController:
+    """
+    AIMD controller for the number of concurrently running tasks.
+
+    Call ``update`` once per interval with the latest statistics; it returns
+    the new target concurrency. The controller is only a policy and does
+    not apply the target itself.
+    """
+
+    # Per-interval growth allowed for the best observed latency
+    BASELINE_DRIFT = 0.05
+
+    def __init__(
+        self,
+        min_concurrency: int = 1,
+        max_concurrency: int = 32,
+        initial_concurrency: Optional[int] = None,
+        increase_step: int = 1,
+        decrease_factor: float = 0.5,
+        error_rate_threshold: float = 0.1,
+        latency_tolerance: float = 2.0,
+        interval: float = 1.0,
+        memory_limiter: Optional["MemoryLimiter"] = None
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            min_concurrency: Lowest target concurrency.
+            max_concurrency: Highest target concurrency.
+            initial_concurrency: Starting target (defaults to a quarter of
+                max_concurrency, at least min_concurrency).
+            increase_step: Tasks added per healthy interval.
+            decrease_factor: Multiplier applied on congestion (0-1).
+            error_rate_threshold: Share of failed tasks in an interval that
+                counts as congestion.
+            latency_tolerance: How many times the best observed average task
+                latency an interval may reach before it counts as congestion.
+            interval: Seconds between updates, used by ParallelManager.
+            memory_limiter: Optional MemoryLimiter whose throttle factor
+                caps the target while memory is under pressure.
+
+        Raises:
+            ValueError: If the limits or factors are out of range.
+        """
+        if min_concurrency < 1 or max_concurrency < min_concurrency:
+            raise ValueError("Concurrency limits must satisfy 1 <= min_concurrency <= max_concurrency")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        if increase_step < 1:
+            raise ValueError("increase_step must be at least 1")
+        if latency_tolerance <= 1:
+            raise ValueError("latency_tolerance must be greater than 1")
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.error_rate_threshold = error_rate_threshold
+        self.latency_tolerance = latency_tolerance
+        self.interval = interval
+        self.memory_limiter = memory_limiter
+
+        if initial_concurrency is None:
+            initial_concurrency = max_concurrency // 4
+        self.target = self._clamp(initial_concurrency)
+
+        # Totals from the previous sample, used to compute per-interval rates
+        self._last_completed = 0
+        self._last_failed = 0
+        self._last_timed_out = 0
+        self._last_busy_time = 0.0
+        self._best_latency: Optional[float] = None
+
+        self._stats = {
+            "increases": 0,
+            "decreases": 0,
+            "last_reason": "initial",
+            "last_latency": 0.0,
+            "last_error_rate": 0.0,
+            "throttle_factor": 1.0,
+        }
+
+    def set_max_concurrency(self, max_concurrency: int) -> None:
+        """
+        Change the upper bound, e.g. to match the executor's max_workers.
+
+        Args:
+            max_concurrency: New upper bound.
+        """
+        self.max_concurrency = max(self.min_concurrency, max_concurrency)
+        self.target = self._clamp(self.target)
+
+    def update(self, stats: "ProcessingStatistics", queued: int = 0) -> int:
+        """
+        Compute the next target from the statistics of the last interval.
+
+        Args:
+            stats: Current (cumulative) processing statistics.
+            queued: Number of tasks waiting for a worker.
+
+        Returns:
+            The new target concurrency.
+        """
+        completed = stats.completed - self._last_completed
+        failed = stats.failed - self._last_failed
+        timed_out = stats.timed_out - self._last_timed_out
+
+        # avg_duration is cumulative; recover the interval's average latency
+        busy_time = stats.avg_duration * stats.completed
+        latency = (busy_time - self._last_busy_time) / completed if completed > 0 else None
+
+        self._last_completed = stats.completed
+        self._last_failed = stats.failed
+        self._last_timed_out = stats.timed_out
+        self._last_busy_time = busy_time
+
+        finished = completed + failed
+        error_rate = failed / finished if finished else 0.0
+        throttle = self.memory_limiter.get_throttle_factor() if self.memory_limiter else 1.0
+
+        self._stats["last_error_rate"] = error_rate
+        self._stats["throttle_factor"] = throttle
+        if latency is not None:
+            self._stats["last_latency"] = latency
+
+        # A throttle factor is a level, not a rate: it caps the target rather
+        # than shrinking it again every interval the pressure lasts
+        cap = self._clamp(math.floor(self.max_concurrency * throttle))
+
+        if self.target > cap:
+            self._limit(cap, "memory pressure")
+        elif timed_out > 0 or error_rate > self.error_rate_threshold:
+            self._decrease(self.decrease_factor, "errors" if timed_out == 0 else "timeouts")
+        elif (
+            latency is not None
+            and self._best_latency is not None
+            and latency > self._best_latency * self.latency_tolerance
+        ):
+            self._decrease(self.decrease_factor, "latency")
+        elif queued > 0 and finished > 0 and self.target < cap:
+            self._increase(cap)
+        else:
+            self._stats["last_reason"] = "steady"
+
+        # The baseline creeps up slowly so a lasting change in the workload
+        # is not treated as congestion forever
+        if latency is not None:
+            if self._best_latency is None:
+                self._best_latency = latency
+            else:
+                self._best_latency = min(latency, self._best_latency * (1 + self.BASELINE_DRIFT))
+
+        return self.target
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get statistics about the controller.
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            **self._stats,
+            "target_concurrency": self.target,
+            "min_concurrency": self.min_concurrency,
+            "max_concurrency": self.max_concurrency,
+            "best_latency": self._best_latency or 0.0,
+        }
+
+    def _increase(self, cap: int) -> None:
+        """Add increase_step to the target, up to cap."""
+        target = min(self._clamp(self.target + self.increase_step), cap)
+        if target != self.target:
+            self._stats["increases"] += 1
+        self.target = target
+        self._stats["last_reason"] = "increase"
+
+    def _decrease(self, factor: float, reason: str) -> None:
+        """Multiply the target by factor."""
+        self._limit(self._clamp(math.floor(self.target * factor)), reason)
+
+    def _limit(self, target: int, reason: str) -> None:
+        """Lower the target to a new value."""
+        if target != self.target:
+            self._stats["decreases"] += 1
+            logger.debug(f"Reducing concurrency from {self.target} to {target} ({reason})")
+        self.target = target
+        self._stats["last_reason"] = reason
+
+    def _clamp(self, value: int) -> int:
+        """Clamp a value to the concurrency limits."""
+        return max(self.min_concurrency, min(int(value), self.max_concurrency))
@@ -0,0 +1,560 @@
+"""
+Task Broker Module for Summit SEO
+
+This module lets several worker processes, on one host or on several,
+pull tasks from a shared queue. A broker hands out tasks under a lease: the
+worker that leased a task must renew it with heartbeats, and a task whose
+lease is not renewed within its visibility timeout becomes available to
+other workers again. Results and errors are reported back to the broker,
+where the submitter can read them.
+
+``BaseBroker`` defines the interface; ``SQLiteBroker`` implements it on a
+SQLite database file. By default it uses write-ahead logging, which needs
+every worker on one host. Pass ``shared_filesystem=True`` for hosts sharing
+a filesystem with working file locks; this keeps the rollback journal at
+the cost of slower commits. For many hosts, a network broker (Redis,
+Postgres) implementing the same interface is the better fit.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import time
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from summit_seo.parallel.task import TaskStatus
+
+logger = logging.getLogger(__name__)
+
+
+class BrokerError(Exception):
+    """Exception raised for task broker errors."""
+    pass
+
+
+@dataclass
+class BrokerTask:
+    """A task held by a broker."""
+    id: str
+    queue: str
+    payload: Any
+    status: TaskStatus
+    priority: int = 0
+    attempts: int = 0
+    max_attempts: int = 3
+    key: Optional[str] = None
+    lease_token: Optional[str] = None  # Set on tasks returned by lease()
+    lease_owner: Optional[str] = None
+    lease_expires: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+
+    @property
+    def done(self) -> bool:
+        """Check whether the task has finished for good."""
+        return self.status in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED)
+
+
+class BaseBroker(ABC):
+    """
+    Interface of a task broker.
+
+    Tasks are PENDING until a worker leases them, RUNNING while the lease
+    is held, and COMPLETED or FAILED once reported. A RUNNING task whose
+    lease expires is handed out again, or FAILED if it has used all its
+    attempts. Reports carrying a stale lease token are ignored, so a worker
+    that lost its lease cannot overwrite the outcome of the next one.
+    """
+
+    @abstractmethod
+    async def enqueue(
+        self,
+        queue: str,
+        payload: Any,
+        key: Optional[str] = None,
+        priority: int = 0,
+        max_attempts: int = 3
+    ) -> str:
+        """
+        Add a task to a queue.
+
+        Args:
+            queue: Queue name.
+            payload: JSON-serializable task input.
+            key: Optional unique key within the queue. Enqueueing a key
+                that is already queued or finished returns the existing task.
+            priority: Lower values are leased first.
+            max_attempts: How many leases the task gets before it fails.
+
+        Returns:
+            The task id.
+        """
+        pass
+
+    @abstractmethod
+    async def lease(
+        self,
+        queue: str,
+        worker_id: str,
+        visibility_timeout: float
+    ) -> Optional[BrokerTask]:
+        """
+        Lease the next available task of a queue.
+
+        Args:
+            queue: Queue name.
+            worker_id: Identifier of the leasing worker.
+            visibility_timeout: Seconds until the lease expires unless renewed.
+
+        Returns:
+            The leased task with its lease_token set, or None if no task
+            is available.
+        """
+        pass
+
+    @abstractmethod
+    async def heartbeat(self, task: BrokerTask, visibility_timeout: float) -> bool:
+        """
+        Renew the lease of a task.
+
+        Args:
+            task: Task returned by lease().
+            visibility_timeout: Seconds from now until the lease expires.
+
+        Returns:
+            True if the lease was renewed, False if it was lost.
+        """
+        pass
+
+    @abstractmethod
+    async def complete(self, task: BrokerTask, result: Any = None) -> bool:
+        """
+        Report that a leased task completed.
+
+        Args:
+            task: Task returned by lease().
+            result: JSON-serializable result.
+
+        Returns:
+            True if the result was recorded, False if the lease was lost.
+        """
+        pass
+
+    @abstractmethod
+    async def fail(self, task: BrokerTask, error: str, retry: bool = True) -> bool:
+        """
+        Report that a leased task failed.
+
+        The task is queued again if retry is set and it has attempts left.
+
+        Args:
+            task: Task returned by lease().
+            error: Description of the error.
+            retry: Whether the task may be retried.
+
+        Returns:
+            True if the failure was recorded, False if the lease was lost.
+        """
+        pass
+
+    @abstractmethod
+    async def get_task(self, task_id: str) -> Optional[BrokerTask]:
+        """
+        Get a task by id.
+
+        Args:
+            task_id: Task id.
+
+        Returns:
+            The task, or None if it does not exist.
+        """
+        pass
+
+    @abstractmethod
+    async def get_statistics(self, queue: Optional[str] = None) -> Dict[str, int]:
+        """
+        Get task counts per status.
+
+        Args:
+            queue: Only count tasks of this queue.
+
+        Returns:
+            Dictionary mapping lower-case status names to counts.
+        """
+        pass
+
+    async def close(self) -> None:
+        """Release the broker's resources."""
+        pass
+
+    async def enqueue_many(
+        self,
+        queue: str,
+        payloads: Iterable[Any],
+        key: Optional[Callable[[Any], str]] = None,
+        priority: int = 0,
+        max_attempts: int = 3
+    ) -> List[str]:
+        """
+        Add several tasks to a queue.
+
+        Args:
+            queue: Queue name.
+            payloads: Task inputs.
+            key: Optional function returning the key of a payload.
+            priority: Priority of the tasks.
+            max_attempts: Attempts per task.
+
+        Returns:
+            Task ids in payload order.
+        """
+        return [
+            await self.enqueue(
+                queue, payload,
+                key=key(payload) if key else None,
+                priority=priority,
+                max_attempts=max_attempts
+            )
+            for payload in payloads
+        ]
+
+    async def wait_for(
+        self,
+        task_id: str,
+        timeout: Optional[float] = None,
+        poll_interval: float = 0.5
+    ) -> BrokerTask:
+        """
+        Wait until a task has finished.
+
+        Args:
+            task_id: Task id.
+            timeout: Maximum time to wait in seconds.
+            poll_interval: Seconds between checks.
+
+        Returns:
+            The finished task.
+
+        Raises:
+            BrokerError: If the task does not exist.
+            asyncio.TimeoutError: If the timeout expires first.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            task = await self.get_task(task_id)
+            if task is None:
+                raise BrokerError(f"Unknown task: {task_id}")
+            if task.done:
+                return task
+            if deadline is not None and time.monotonic() >= deadline:
+                raise asyncio.TimeoutError(f"Task {task_id} did not finish in {timeout}s")
+            await asyncio.sleep(poll_interval)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS broker_tasks (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    queue TEXT NOT NULL,
+    task_key TEXT,
+    payload TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    lease_owner TEXT,
+    lease_token TEXT,
+    lease_expires REAL,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    UNIQUE (queue, task_key)
+);
+CREATE INDEX IF NOT EXISTS broker_tasks_ready ON broker_tasks (queue, status, priority, seq);
+"""
+
+_COLUMNS = (
+    "id, queue, task_key, payload, priority, status, attempts, max_attempts, "
+    "lease_owner, lease_token, lease_expires, result, error"
+)
+
+
+class SQLiteBroker(BaseBroker):
+    """
+    Task broker backed by a SQLite database file.
+
+    Every worker process opens the same file. Leases are taken inside an
+    immediate transaction, so two workers never lease the same task. Calls
+    run on a private thread so waiting for a lock held by another process
+    does not block the event loop.
+    """
+
+    def __init__(self, path: str, busy_timeout: float = 30.0, shared_filesystem: bool = False):
+        """
+        Open or create a broker database.
+
+        Args:
+            path: Path of the SQLite database file.
+            busy_timeout: Seconds to wait for a lock held by another process.
+            shared_filesystem: Whether workers on other hosts open the file
+                over a shared filesystem. WAL mode relies on shared memory
+                that only works on one host, so the rollback journal is
+                used instead. Every process opening the file must agree.
+
+        Raises:
+            BrokerError: If the database cannot be opened.
+        """
+        self.path = path
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="summit-seo-broker")
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            # Autocommit mode; transactions are opened explicitly
+            self._conn = sqlite3.connect(
+                path, timeout=busy_timeout, isolation_level=None, check_same_thread=False
+            )
+            journal_mode = "DELETE" if shared_filesystem else "WAL"
+            self._conn.execute(f"PRAGMA journal_mode = {journal_mode}")
+            self._conn.executescript(_SCHEMA)
+        except (OSError, sqlite3.Error) as e:
+            self._executor.shutdown(wait=False)
+            raise BrokerError(f"Error opening broker {path}: {str(e)}")
+
+    async def enqueue(
+        self,
+        queue: str,
+        payload: Any,
+        key: Optional[str] = None,
+        priority: int = 0,
+        max_attempts: int = 3
+    ) -> str:
+        """Add a task to a queue (see BaseBroker.enqueue)."""
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        return await self._call(self._enqueue, queue, payload, key, priority, max_attempts)
+
+    async def enqueue_many(
+        self,
+        queue: str,
+        payloads: Iterable[Any],
+        key: Optional[Callable[[Any], str]] = None,
+        priority: int = 0,
+        max_attempts: int = 3
+    ) -> List[str]:
+        """Add several tasks to a queue in one transaction (see BaseBroker.enqueue_many)."""
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        items = [(payload, key(payload) if key else None) for payload in payloads]
+        return await self._call(self._enqueue_many, queue, items, priority, max_attempts)
+
+    async def lease(
+        self,
+        queue: str,
+        worker_id: str,
+        visibility_timeout: float
+    ) -> Optional[BrokerTask]:
+        """Lease the next available task of a queue (see BaseBroker.lease)."""
+        return await self._call(self._lease, queue, worker_id, visibility_timeout)
+
+    async def heartbeat(self, task: BrokerTask, visibility_timeout: float) -> bool:
+        """Renew the lease of a task (see BaseBroker.heartbeat)."""
+        expires = time.time() + visibility_timeout
+        renewed = await self._call(
+            self._update_leased, task,
+            "lease_expires = ?", (expires,)
+        )
+        if renewed:
+            task.lease_expires = expires
+        return renewed
+
+    async def complete(self, task: BrokerTask, result: Any = None) -> bool:
+        """Report that a leased task completed (see BaseBroker.complete)."""
+        return await self._call(
+            self._update_leased, task,
+            "status = ?, result = ?, error = NULL, lease_token = NULL, lease_expires = NULL",
+            (TaskStatus.COMPLETED.name, json.dumps(result, default=str))
+        )
+
+    async def fail(self, task: BrokerTask, error: str, retry: bool = True) -> bool:
+        """Report that a leased task failed (see BaseBroker.fail)."""
+        retry = retry and task.attempts < task.max_attempts
+        status = TaskStatus.PENDING if retry else TaskStatus.FAILED
+        return await self._call(
+            self._update_leased, task,
+            "status = ?, error = ?, lease_token = NULL, lease_expires = NULL",
+            (status.name, error)
+        )
+
+    async def get_task(self, task_id: str) -> Optional[BrokerTask]:
+        """Get a task by id (see BaseBroker.get_task)."""
+        return await self._call(self._get_task, task_id)
+
+    async def get_statistics(self, queue: Optional[str] = None) -> Dict[str, int]:
+        """Get task counts per status (see BaseBroker.get_statistics)."""
+        return await self._call(self._get_statistics, queue)
+
+    async def close(self) -> None:
+        """Close the database."""
+        await self._call(self._conn.close)
+        self._executor.shutdown(wait=True)
+
+    async def _call(self, func: Callable, *args) -> Any:
+        """Run a database call on the broker thread."""
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        except sqlite3.Error as e:
+            raise BrokerError(f"Broker database error: {str(e)}")
+
+    def _enqueue(
+        self,
+        queue: str,
+        payload: Any,
+        key: Optional[str],
+        priority: int,
+        max_attempts: int
+    ) -> str:
+        """Insert a task, or return the existing task with the same key."""
+        return self._enqueue_many(queue, [(payload, key)], priority, max_attempts)[0]
+
+    def _enqueue_many(
+        self,
+        queue: str,
+        items: List[tuple],
+        priority: int,
+        max_attempts: int
+    ) -> List[str]:
+        """Insert (payload, key) items, reusing existing tasks with the same key."""
+        now = time.time()
+        task_ids = []
+        with self._transaction():
+            for payload, key in items:
+                if key is not None:
+                    row = self._conn.execute(
+                        "SELECT id FROM broker_tasks WHERE queue = ? AND task_key = ?", (queue, key)
+                    ).fetchone()
+                    if row is not None:
+                        task_ids.append(row[0])
+                        continue
+
+                task_id = uuid.uuid4().hex
+                self._conn.execute(
+                    "INSERT INTO broker_tasks (id, queue, task_key, payload, priority, status, "
+                    "max_attempts, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (task_id, queue, key, json.dumps(payload), priority,
+                     TaskStatus.PENDING.name, max_attempts, now, now)
+                )
+                task_ids.append(task_id)
+        return task_ids
+
+    def _lease(self, queue: str, worker_id: str, visibility_timeout: float) -> Optional[BrokerTask]:
+        """Lease the next available task inside an immediate transaction."""
+        now = time.time()
+        with self._transaction():
+            # Expired leases of tasks without attempts left fail for good
+            self._conn.execute(
+                "UPDATE broker_tasks SET status = ?, error = ?, lease_token = NULL, "
+                "lease_expires = NULL, updated_at = ? WHERE queue = ? AND status = ? "
+                "AND lease_expires < ? AND attempts >= max_attempts",
+                (TaskStatus.FAILED.name, "lease expired", now, queue, TaskStatus.RUNNING.name, now)
+            )
+
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM broker_tasks WHERE queue = ? AND "
+                "(status = ? OR (status = ? AND lease_expires < ?)) "
+                "ORDER BY priority, seq LIMIT 1",
+                (queue, TaskStatus.PENDING.name, TaskStatus.RUNNING.name, now)
+            ).fetchone()
+            if row is None:
+                return None
+
+            task = self._to_task(row)
+            task.status = TaskStatus.RUNNING
+            task.attempts += 1
+            task.lease_owner = worker_id
+            task.lease_token = uuid.uuid4().hex
+            task.lease_expires = now + visibility_timeout
+
+            self._conn.execute(
+                "UPDATE broker_tasks SET status = ?, attempts = ?, lease_owner = ?, "
+                "lease_token = ?, lease_expires = ?, updated_at = ? WHERE id = ?",
+                (task.status.name, task.attempts, worker_id, task.lease_token,
+                 task.lease_expires, now, task.id)
+            )
+        return task
+
+    def _update_leased(self, task: BrokerTask, assignments: str, params: tuple) -> bool:
+        """Update a task if the caller still holds its lease."""
+        with self._transaction():
+            updated = self._conn.execute(
+                f"UPDATE broker_tasks SET {assignments}, updated_at = ? "
+                "WHERE id = ? AND status = ? AND lease_token = ?",
+                params + (time.time(), task.id, TaskStatus.RUNNING.name, task.lease_token)
+            ).rowcount
+        return updated > 0
+
+    def _get_task(self, task_id: str) -> Optional[BrokerTask]:
+        """Read a task."""
+        row = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM broker_tasks WHERE id = ?", (task_id,)
+        ).fetchone()
+        return self._to_task(row) if row is not None else None
+
+    def _get_statistics(self, queue: Optional[str]) -> Dict[str, int]:
+        """Count tasks per status."""
+        query = "SELECT status, COUNT(*) FROM broker_tasks"
+        params: tuple = ()
+        if queue is not None:
+            query += " WHERE queue = ?"
+            params = (queue,)
+        counts = dict(self._conn.execute(query + " GROUP BY status", params).fetchall())
+
+        stats = {status.name.lower(): 0 for status in (
+            TaskStatus.PENDING, TaskStatus.RUNNING, TaskStatus.COMPLETED, TaskStatus.FAILED
+        )}
+        for status, count in counts.items():
+            stats[status.lower()] = count
+        stats["total"] = sum(counts.values())
+        return stats
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Run a block in an immediate transaction, taking the write lock up front."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        else:
+            self._conn.execute("COMMIT")
+
+    @staticmethod
+    def _to_task(row: tuple) -> BrokerTask:
+        """Convert a row selected with _COLUMNS to a BrokerTask."""
+        (task_id, queue, key, payload, priority, status, attempts, max_attempts,
+         lease_owner, lease_token, lease_expires, result, error) = row
+        return BrokerTask(
+            id=task_id,
+            queue=queue,
+            key=key,
+            payload=json.loads(payload),
+            status=TaskStatus[status],
+            priority=priority,
+            attempts=attempts,
+            max_attempts=max_attempts,
+            lease_owner=lease_owner,
+            lease_token=lease_token,
+            lease_expires=lease_expires,
+            result=json.loads(result) if result is not None else None,
+            error=error,
+        )
@@ -0,0 +1,207 @@
+"""
+Broker Worker Module for Summit SEO
+
+This module provides the worker side of a task broker. A ``BrokerWorker``
+leases tasks from one or more queues, runs them through a local
+ParallelManager, renews their leases while they run and reports results
+and errors back to the broker. Start one worker per process or host:
+
+    broker = SQLiteBroker("/shared/summit_seo_broker.db", shared_filesystem=True)
+    worker = BrokerWorker(broker, {"analyze": analyze_url}, concurrency=8)
+    await worker.run()
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+from summit_seo.parallel.broker import BaseBroker, BrokerTask
+from summit_seo.parallel.manager import ParallelManager
+from summit_seo.parallel.task import create_task
+
+logger = logging.getLogger(__name__)
+
+
+class BrokerWorker:
+    """
+    Leases tasks from a broker and runs them locally.
+
+    Each queue has a handler, a function (sync or async) called with a
+    task's payload whose return value is reported as the task's result.
+    A task whose handler raises is reported as failed and retried by the
+    broker while it has attempts left.
+    """
+
+    def __init__(
+        self,
+        broker: BaseBroker,
+        handlers: Dict[str, Callable[[Any], Any]],
+        concurrency: int = 4,
+        manager: Optional[ParallelManager] = None,
+        visibility_timeout: float = 60.0,
+        heartbeat_interval: Optional[float] = None,
+        poll_interval: float = 1.0,
+        worker_id: Optional[str] = None
+    ):
+        """
+        Initialize the worker.
+
+        Args:
+            broker: Broker to lease tasks from.
+            handlers: Mapping of queue names to handlers.
+            concurrency: Maximum number of leased tasks at a time.
+            manager: Optional running ParallelManager to run handlers on.
+                If not given, one with ``concurrency`` workers is started
+                by run().
+            visibility_timeout: Seconds a lease lasts without a heartbeat.
+            heartbeat_interval: Seconds between lease renewals (defaults to
+                a third of visibility_timeout).
+            poll_interval: Seconds to wait after finding every queue empty.
+            worker_id: Identifier recorded on leases (defaults to host:pid:random).
+
+        Raises:
+            ValueError: If no handlers are given or concurrency is less than 1.
+        """
+        if not handlers:
+            raise ValueError("A worker needs at least one queue handler")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        self.broker = broker
+        self.handlers = dict(handlers)
+        self.concurrency = concurrency
+        self.manager = manager
+        self.visibility_timeout = visibility_timeout
+        self.heartbeat_interval = heartbeat_interval or visibility_timeout / 3
+        self.poll_interval = poll_interval
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+        self._leased: Dict[asyncio.Task, BrokerTask] = {}
+        self._stopping: Optional[asyncio.Event] = None
+        self._stats = {
+            "leased": 0,
+            "completed": 0,
+            "failed": 0,
+            "leases_lost": 0,
+        }
+
+    def stop(self) -> None:
+        """Ask run() to return once the tasks it leased have finished."""
+        if self._stopping is not None:
+            self._stopping.set()
+
+    async def run(self, max_tasks: Optional[int] = None, exit_when_idle: bool = False) -> Dict[str, int]:
+        """
+        Lease and run tasks until stopped.
+
+        Args:
+            max_tasks: Return after leasing this many tasks.
+            exit_when_idle: Return once every queue is empty and no task is
+                running.
+
+        Returns:
+            Worker statistics.
+        """
+        self._stopping = asyncio.Event()
+        manager = self.manager
+        owns_manager = manager is None
+        if owns_manager:
+            manager = ParallelManager(max_workers=self.concurrency)
+            await manager.start()
+
+        heartbeat = asyncio.create_task(self._heartbeat_loop())
+        logger.info(f"Worker {self.worker_id} serving queues: {', '.join(self.handlers)}")
+        try:
+            while not self._stopping.is_set():
+                if max_tasks is not None and self._stats["leased"] >= max_tasks:
+                    break
+
+                if len(self._leased) >= self.concurrency:
+                    await asyncio.wait(list(self._leased), return_when=asyncio.FIRST_COMPLETED)
+                    continue
+
+                task = await self._lease_next()
+                if task is not None:
+                    runner = asyncio.create_task(self._run_task(manager, task))
+                    self._leased[runner] = task
+                    runner.add_done_callback(self._leased.pop)
+                    continue
+
+                if exit_when_idle and not self._leased:
+                    break
+                await self._wait_for_work()
+
+            if self._leased:
+                await asyncio.gather(*self._leased, return_exceptions=True)
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+            if owns_manager:
+                await manager.stop()
+
+        logger.info(
+            f"Worker {self.worker_id} finished: {self._stats['completed']} completed, "
+            f"{self._stats['failed']} failed"
+        )
+        return self.get_statistics()
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        Get statistics about the worker.
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {**self._stats, "running": len(self._leased)}
+
+    async def _lease_next(self) -> Optional[BrokerTask]:
+        """Lease a task from the first queue that has one."""
+        for queue in self.handlers:
+            task = await self.broker.lease(queue, self.worker_id, self.visibility_timeout)
+            if task is not None:
+                self._stats["leased"] += 1
+                return task
+        return None
+
+    async def _wait_for_work(self) -> None:
+        """Sleep for poll_interval, waking early if a task finishes or stop() is called."""
+        waiters = [asyncio.ensure_future(self._stopping.wait()), *self._leased]
+        try:
+            await asyncio.wait(waiters, timeout=self.poll_interval, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waiters[0].cancel()
+
+    async def _run_task(self, manager: ParallelManager, task: BrokerTask) -> None:
+        """Run a leased task and report its outcome."""
+        handler = self.handlers[task.queue]
+        start_time = time.perf_counter()
+        try:
+            result = await manager.submit_and_await(
+                create_task(handler, task.payload, name=f"broker:{task.queue}:{task.id}")
+            )
+        except Exception as e:
+            self._stats["failed"] += 1
+            reported = await self.broker.fail(task, str(e) or type(e).__name__)
+            logger.debug(f"Task {task.id} failed after {time.perf_counter() - start_time:.2f}s: {str(e)}")
+        else:
+            self._stats["completed"] += 1
+            reported = await self.broker.complete(task, result)
+
+        if not reported:
+            self._stats["leases_lost"] += 1
+            logger.warning(f"Lease of task {task.id} expired before its outcome was reported")
+
+    async def _heartbeat_loop(self) -> None:
+        """Renew the leases of running tasks."""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            for task in list(self._leased.values()):
+                try:
+                    if not await self.broker.heartbeat(task, self.visibility_timeout):
+                        logger.warning(f"Lost lease of task {task.id}")
+                except Exception as e:
+                    logger.warning(f"Error renewing lease of task {task.id}: {str(e)}")
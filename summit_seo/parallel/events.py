@@ -0,0 +1,239 @@
+"""
+Event Bus Module for Summit SEO
+
+This module provides a low-overhead bus for task lifecycle events.
+Publishing an event appends it to a bounded ring buffer and returns at
+once; a dispatcher task delivers buffered events to subscribers in
+batches, so subscriber callbacks never run on a task's critical path:
+
+    bus = EventBus()
+    bus.subscribe(record_failures, statuses={TaskStatus.FAILED})
+    await bus.start()
+    ...
+    await bus.stop()  # Delivers the remaining events
+
+A subscriber is a function (sync or async) called with a list of
+TaskEvent objects. Events are only recorded while the bus has
+subscribers, so an executor nobody listens to pays one length check
+per event.
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Set
+
+from summit_seo.parallel.task import TaskStatus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TaskEvent:
+    """A change of a task's status."""
+    task_id: str
+    status: TaskStatus
+    timestamp: float  # time.time() when the event was published
+    result: Any = None
+    error: Optional[BaseException] = None
+
+
+class Subscription:
+    """
+    Handle of a subscriber registered with an EventBus.
+
+    Call cancel() to stop receiving events.
+    """
+
+    def __init__(
+        self,
+        bus: "EventBus",
+        callback: Callable[[List[TaskEvent]], Any],
+        statuses: Optional[Set[TaskStatus]] = None
+    ):
+        self.bus = bus
+        self.callback = callback
+        self.statuses = statuses
+
+    def cancel(self) -> None:
+        """Unsubscribe from the bus."""
+        self.bus.unsubscribe(self)
+
+
+class EventBus:
+    """
+    Records task lifecycle events and fans them out to subscribers in batches.
+
+    Events wait in a ring buffer of ``capacity`` entries until the
+    dispatcher delivers them. If subscribers fall so far behind that the
+    buffer fills up, the oldest undelivered events are dropped (and
+    counted) rather than slowing down the tasks that publish them.
+    """
+
+    def __init__(self, capacity: int = 10000, batch_size: int = 500, flush_interval: float = 0.0):
+        """
+        Initialize the event bus.
+
+        Args:
+            capacity: Maximum number of undelivered events.
+            batch_size: Maximum number of events per subscriber call.
+            flush_interval: Seconds the dispatcher waits after being woken
+                before delivering, so that more events share a batch.
+
+        Raises:
+            ValueError: If capacity or batch_size is less than 1.
+        """
+        if capacity < 1 or batch_size < 1:
+            raise ValueError("capacity and batch_size must be at least 1")
+
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._buffer: Deque[TaskEvent] = deque(maxlen=capacity)
+        self._subscriptions: List[Subscription] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._stopping = False
+        self._stats = {
+            "published": 0,
+            "delivered": 0,
+            "batches": 0,
+            "dropped": 0,
+            "subscriber_errors": 0,
+        }
+
+    @property
+    def running(self) -> bool:
+        """Check if the dispatcher is running."""
+        return self._dispatcher is not None
+
+    def subscribe(
+        self,
+        callback: Callable[[List[TaskEvent]], Any],
+        statuses: Optional[Iterable[TaskStatus]] = None
+    ) -> Subscription:
+        """
+        Register a subscriber.
+
+        Args:
+            callback: Function (sync or async) called with each batch of
+                events. Exceptions it raises are logged and ignored.
+            statuses: Only deliver events with these statuses (default all).
+
+        Returns:
+            Subscription handle; cancel it to unsubscribe.
+        """
+        subscription = Subscription(self, callback, set(statuses) if statuses is not None else None)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Remove a subscriber.
+
+        Args:
+            subscription: Handle returned by subscribe().
+        """
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+
+    def publish(
+        self,
+        task_id: str,
+        status: TaskStatus,
+        result: Any = None,
+        error: Optional[BaseException] = None
+    ) -> None:
+        """
+        Record an event for delivery; never blocks.
+
+        Args:
+            task_id: The ID of the task.
+            status: The new status of the task.
+            result: The result of the task, if completed.
+            error: The error that occurred, if failed.
+        """
+        if not self._subscriptions:
+            return
+
+        if len(self._buffer) == self.capacity:
+            self._stats["dropped"] += 1
+        self._buffer.append(TaskEvent(task_id, status, time.time(), result, error))
+        self._stats["published"] += 1
+
+        if self._wakeup is not None and not self._wakeup.is_set():
+            self._wakeup.set()
+
+    async def start(self) -> None:
+        """Start delivering events; does nothing if already running."""
+        if self._dispatcher is not None:
+            return
+
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        if self._buffer:
+            self._wakeup.set()
+        self._dispatcher = asyncio.create_task(self._dispatch_loop())
+
+    async def stop(self) -> None:
+        """Deliver the buffered events and stop the dispatcher."""
+        if self._dispatcher is None:
+            return
+
+        self._stopping = True
+        self._wakeup.set()
+        dispatcher, self._dispatcher = self._dispatcher, None
+        await asyncio.gather(dispatcher, return_exceptions=True)
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        Get statistics about the event bus.
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            **self._stats,
+            "backlog": len(self._buffer),
+            "subscribers": len(self._subscriptions),
+        }
+
+    async def _dispatch_loop(self) -> None:
+        """Deliver buffered events whenever events are published."""
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            if self.flush_interval > 0 and not self._stopping:
+                await asyncio.sleep(self.flush_interval)
+
+            while self._buffer:
+                count = min(self.batch_size, len(self._buffer))
+                await self._deliver([self._buffer.popleft() for _ in range(count)])
+
+            if self._stopping:
+                return
+
+    async def _deliver(self, events: List[TaskEvent]) -> None:
+        """Call every subscriber with the events it is interested in."""
+        self._stats["batches"] += 1
+        self._stats["delivered"] += len(events)
+
+        for subscription in list(self._subscriptions):
+            if subscription.statuses is None:
+                selected = events
+            else:
+                selected = [event for event in events if event.status in subscription.statuses]
+            if not selected:
+                continue
+
+            try:
+                outcome = subscription.callback(selected)
+                if inspect.isawaitable(outcome):
+                    await outcome
+            except Exception as e:
+                self._stats["subscriber_errors"] += 1
+                logger.exception(f"Event subscriber {subscription.callback!r} failed: {e}")
@@ -7,14 +7,26 @@ execution strategies and worker management approaches.
 
 import asyncio
 import logging
+import multiprocessing
 import time
 from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from enum import Enum, auto
 from functools import partial
-from typing import Any, Callable, Coroutine, Dict, List, Optional, Set, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, Hashable, List, Optional, Set, Tuple, Union
 
+from summit_seo.parallel.events import EventBus, Subscription, TaskEvent
+from summit_seo.parallel.fair_queue import FairQueue, default_group_key
+from summit_seo.parallel.priority_queue import IndexedPriorityQueue
+from summit_seo.parallel.profiler import ExecutionProfiler
+from summit_seo.parallel.shared_body import Body, SharedBody, SharedBodyStore, call_with_shared_bodies
 from summit_seo.parallel.task import Task, TaskPriority, TaskStatus
 
+if TYPE_CHECKING:
+    from summit_seo.memory.limiter import MemoryLimiter
+    from summit_seo.parallel.warm_pool import WarmWorkerPool
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,21 +37,40 @@ class ExecutionStrategy(Enum):
     DEPENDENCY = auto()  # Dependency-based ordering
     WORK_STEALING = auto()  # Work-stealing strategy
     ADAPTIVE = auto()  # Adaptive strategy that changes based on system load
+    FAIR = auto()  # Deficit round robin across task groups (see FairQueue)
 
 
 class WorkerType(Enum):
-    """Types of workers for task execution."""
+    """Types of workers for task execution.
+    
+    THREAD and PROCESS workers run tasks that carry a callable (see
+    create_task) in a thread or process pool; coroutine-only tasks always
+    run on the event loop.
+    """
     ASYNCIO = auto()  # AsyncIO-based worker
     THREAD = auto()  # Thread-based worker
     PROCESS = auto()  # Process-based worker
 
 
+class DependencyFailedError(Exception):
+    """Exception set on tasks whose dependency failed or was cancelled."""
+    
+    def __init__(self, task_id: str, dependency_id: str):
+        self.task_id = task_id
+        self.dependency_id = dependency_id
+        super().__init__(f"Task {task_id} cannot run: dependency {dependency_id} failed or was cancelled")
+
+
 class ParallelExecutor:
     """
     Executes tasks in parallel with different execution strategies.
     
     This class is responsible for managing a pool of workers and executing
     tasks using the specified execution strategy.
+    
+    Dispatch is event-driven: each queued task wakes exactly one idle
+    worker, and task status changes are published to an EventBus. See
+    __init__ for process pools, memory admission and backpressure.
     """
     
     def __init__(
@@ -47,7 +78,21 @@ class ParallelExecutor:
         max_workers: int = 0,
         execution_strategy: ExecutionStrategy = ExecutionStrategy.FIFO,
         worker_type: WorkerType = WorkerType.ASYNCIO,
-        task_timeout: Optional[float] = None
+        task_timeout: Optional[float] = None,
+        worker_initializer: Optional[Callable] = None,
+        worker_initargs: Tuple = (),
+        mp_start_method: str = 'spawn',
+        shared_memory_threshold: Optional[int] = 64 * 1024,
+        memory_limiter: Optional["MemoryLimiter"] = None,
+        admission_poll_interval: float = 0.05,
+        group_key: Callable[[Task], Hashable] = default_group_key,
+        group_concurrency: Optional[int] = None,
+        group_limits: Optional[Dict[Hashable, int]] = None,
+        group_weights: Optional[Dict[Hashable, float]] = None,
+        max_pending: Optional[int] = None,
+        event_bus: Optional[EventBus] = None,
+        process_pool: Optional["WarmWorkerPool"] = None,
+        profiler: Optional[ExecutionProfiler] = None
     ):
         """
         Initialize the parallel executor.
@@ -55,18 +100,106 @@ class ParallelExecutor:
         Args:
             max_workers: Maximum number of workers to use. If 0, use CPU count.
             execution_strategy: Strategy to use for task execution ordering.
-            worker_type: Type of workers to use.
-            task_timeout: Default timeout for tasks in seconds.
+            worker_type: Type of workers to use. PROCESS workers share one
+                persistent process pool, created on start and reused for
+                every task.
+            task_timeout: Default timeout for tasks in seconds. A process
+                task that times out fails, but keeps its process busy until
+                the call returns.
+            worker_initializer: Function run once in each pool thread or
+                process when it starts, e.g. to import and warm up analyzers
+                (see summit_seo.parallel.process.warm_up_worker).
+            worker_initargs: Arguments for worker_initializer.
+            mp_start_method: multiprocessing start method for PROCESS workers.
+            shared_memory_threshold: Minimum length of a str or bytes
+                argument that PROCESS workers receive through shared memory
+                instead of pickling. None disables shared memory transfer.
+            memory_limiter: MemoryLimiter used to admit tasks against a
+                memory budget by their memory_cost (see
+                MemoryLimiter.check_admission). Workers pause above the soft
+                limit and the lowest-priority queued tasks are shed above the
+                hard limit; one task is always admitted when nothing runs.
+            admission_poll_interval: Seconds between memory checks while
+                admission is paused.
+            group_key: FAIR strategy: function returning the group of a
+                task (defaults to the 'group' or 'tenant' metadata, or the
+                host of the 'url' metadata).
+            group_concurrency: FAIR strategy: maximum running tasks per group.
+            group_limits: FAIR strategy: per-group overrides of
+                group_concurrency.
+            group_weights: FAIR strategy: per-group share of dispatches
+                relative to other groups (default 1).
+            max_pending: Maximum number of queued tasks waiting to start
+                before submit blocks. None means unbounded. Tasks waiting on
+                dependencies only count once they are queued, so a task
+                submitted before its dependencies never blocks them.
+            event_bus: Bus to publish task status changes to (a private
+                bus is created if not given).
+            process_pool: Persistent pool to run callable tasks in; implies
+                PROCESS workers. Its workers are started by the pool, so
+                worker_initializer and mp_start_method are ignored, and
+                stop() leaves the pool running. max_workers defaults to the
+                pool's size.
+            profiler: ExecutionProfiler recording when each task was
+                submitted, queued, started and finished, and on which worker.
+        
+        Raises:
+            ValueError: If max_pending is less than 1.
         """
-        import multiprocessing
+        if max_pending is not None and max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        
+        if process_pool is not None:
+            worker_type = WorkerType.PROCESS
+            if max_workers <= 0:
+                max_workers = process_pool.max_workers
         
         self.max_workers = max_workers if max_workers > 0 else multiprocessing.cpu_count()
         self.execution_strategy = execution_strategy
         self.worker_type = worker_type
         self.task_timeout = task_timeout
+        self.worker_initializer = worker_initializer
+        self.worker_initargs = tuple(worker_initargs)
+        self.mp_start_method = mp_start_method
+        self.shared_memory_threshold = shared_memory_threshold
+        self.memory_limiter = memory_limiter
+        self.admission_poll_interval = admission_poll_interval
+        self.max_pending = max_pending
+        self.event_bus = event_bus if event_bus is not None else EventBus()
+        self.process_pool = process_pool
+        self.profiler = profiler
+        
+        # Thread or process pool for callable tasks
+        self._pool: Optional[Executor] = None
+        
+        # Tasks running at once, at most max_workers (see set_concurrency_limit)
+        self._concurrency_limit = self.max_workers
+        self._slot_available = asyncio.Event()
+        
+        # Memory admission: estimated cost of running tasks
+        self._memory_reserved = 0
+        self._deferred_workers = 0
+        self._last_shed = 0.0
+        
+        # Page bodies passed to process workers through shared memory
+        self._shared_bodies: Optional[SharedBodyStore] = (
+            SharedBodyStore() if worker_type == WorkerType.PROCESS else None
+        )
         
         # Task queues and tracking
-        self._task_queue = asyncio.PriorityQueue()
+        self._fair = execution_strategy == ExecutionStrategy.FAIR
+        self._task_queue: Union[IndexedPriorityQueue[Task], FairQueue] = (
+            FairQueue(
+                group_key=group_key,
+                group_concurrency=group_concurrency,
+                group_limits=group_limits,
+                group_weights=group_weights
+            )
+            if self._fair else IndexedPriorityQueue()
+        )
+        self._ready = asyncio.Semaphore(0)  # One token per queued task
+        self._cancelled: Set[str] = set()
+        self._forgotten_tasks = 0  # Finished tasks dropped from _task_map by forget_task
         self._dependency_graph: Dict[str, Set[str]] = {}  # task_id -> set of dependency task_ids
         self._reverse_dependency_graph: Dict[str, Set[str]] = {}  # task_id -> set of dependent task_ids
         self._task_map: Dict[str, Task] = {}  # task_id -> Task
@@ -75,16 +208,18 @@ class ParallelExecutor:
         self._failed_tasks: Set[str] = set()
         self._running_tasks: Set[str] = set()
         
+        # Submission backpressure: tasks submitted but not yet started
+        self._pending_ids: Set[str] = set()
+        self._pending_space = asyncio.Event()
+        
         # Worker management
         self._workers: List[asyncio.Task] = []
         self._idle_workers: Set[int] = set()
-        self._worker_queues: List[asyncio.Queue] = []
+        self._worker_queues: List[deque] = []
         self._work_stealing_enabled = (execution_strategy == ExecutionStrategy.WORK_STEALING)
         
         # Control
         self._running = False
-        self._stop_event = asyncio.Event()
-        self._tasks_added_event = asyncio.Event()
         
         # Statistics
         self._stats = {
@@ -93,14 +228,24 @@ class ParallelExecutor:
             "tasks_failed": 0,
             "tasks_cancelled": 0,
             "tasks_timed_out": 0,
+            "pool_tasks": 0,
+            "pool_restarts": 0,
             "work_stealing_transfers": 0,
+            "tasks_deferred": 0,
+            "tasks_shed": 0,
+            "deferred_time": 0.0,
+            "submit_waits": 0,
+            "submit_wait_time": 0.0,
             "start_time": 0,
             "total_processing_time": 0,
+            "total_task_time": 0.0,
             "max_concurrent_tasks": 0,
         }
         
-        # Callback for task status changes
-        self._task_callback: Optional[Callable] = None
+        # Subscription of the callback passed to start, and whether start
+        # started the event bus (a shared bus may already be running)
+        self._callback_subscription: Optional[Subscription] = None
+        self._owns_event_bus = False
     
     @property
     def running(self) -> bool:
@@ -115,19 +260,35 @@ class ParallelExecutor:
             task_callback: Callback function for task status changes.
                 The callback signature should be:
                 callback(task_id, status, result=None, error=None)
+                It is subscribed to event_bus, so it runs after the status
+                change rather than on the task's critical path.
         """
         if self._running:
             logger.warning("Executor is already running")
             return
         
         self._running = True
-        self._stop_event.clear()
-        self._task_callback = task_callback
         self._stats["start_time"] = time.time()
         
+        if task_callback is not None:
+            self._callback_subscription = self.event_bus.subscribe(_callback_adapter(task_callback))
+        self._owns_event_bus = not self.event_bus.running
+        await self.event_bus.start()
+        
+        # Tasks queued while stopped are still owed a worker wake-up
+        self._ready = asyncio.Semaphore(self._queue_size())
+        self._slot_available = asyncio.Event()
+        self._pending_space = asyncio.Event()
+        
         # Set up worker queues for work stealing
-        if self._work_stealing_enabled:
-            self._worker_queues = [asyncio.Queue() for _ in range(self.max_workers)]
+        if self._work_stealing_enabled and not self._worker_queues:
+            self._worker_queues = [deque() for _ in range(self.max_workers)]
+        
+        if self.process_pool is not None:
+            # Starting the pool waits for its workers to warm up
+            self._pool = await asyncio.get_running_loop().run_in_executor(None, self.process_pool.start)
+        else:
+            self._pool = self._create_pool()
         
         # Start workers
         for i in range(self.max_workers):
@@ -145,13 +306,38 @@ class ParallelExecutor:
         
         logger.info("Stopping executor...")
         self._running = False
-        self._stop_event.set()
+        
+        # Wake every worker; each exits once it sees the executor stopped
+        for _ in range(len(self._workers)):
+            self._ready.release()
+        self._slot_available.set()
+        
+        # Producers blocked in submit see the executor stopped
+        self._pending_space.set()
         
         # Wait for all workers to complete
         if self._workers:
             await asyncio.gather(*self._workers, return_exceptions=True)
             self._workers.clear()
         
+        # Shut the pool down without blocking the event loop; a warm pool
+        # is left running for the next executor
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            if self.process_pool is None:
+                await asyncio.get_running_loop().run_in_executor(None, pool.shutdown)
+        
+        # No worker can read a segment any more
+        if self._shared_bodies is not None:
+            self._shared_bodies.close()
+        
+        # Deliver the last status changes before dropping the callback
+        if self._owns_event_bus:
+            await self.event_bus.stop()
+        if self._callback_subscription is not None:
+            self._callback_subscription.cancel()
+            self._callback_subscription = None
+        
         # Calculate total processing time
         self._stats["total_processing_time"] = time.time() - self._stats["start_time"]
         
@@ -161,21 +347,40 @@ class ParallelExecutor:
         """
         Submit a task for execution.
         
+        With max_pending set, waits until fewer than max_pending queued
+        tasks are waiting to start.
+        
         Args:
             task: The task to execute.
             
         Returns:
             A future that will resolve when the task is complete.
+        
+        Raises:
+            RuntimeError: If the executor is not running, or stops while
+                submit is waiting.
         """
         if not self._running:
             raise RuntimeError("Executor is not running")
         
+        if self.max_pending is not None and len(self._pending_ids) >= self.max_pending:
+            self._stats["submit_waits"] += 1
+            wait_start = time.perf_counter()
+            while self._running and len(self._pending_ids) >= self.max_pending:
+                self._pending_space.clear()
+                await self._pending_space.wait()
+            self._stats["submit_wait_time"] += time.perf_counter() - wait_start
+            if not self._running:
+                raise RuntimeError("Executor is not running")
+        
         # Create a future for this task
         future = asyncio.Future()
         self._task_futures[task.id] = future
         
         # Store the task in the task map
         self._task_map[task.id] = task
+        if self.profiler is not None:
+            self.profiler.record_submit(task)
         
         # Register dependencies
         if task.dependencies:
@@ -189,17 +394,21 @@ class ParallelExecutor:
         else:
             self._dependency_graph[task.id] = set()
         
-        # If all dependencies are satisfied, add to queue
-        if self._are_dependencies_satisfied(task.id):
-            await self._enqueue_task(task)
-        
-        # Signal that new tasks have been added
-        self._tasks_added_event.set()
-        self._tasks_added_event.clear()
-        
         # Update statistics
         self._stats["tasks_submitted"] += 1
         
+        # Fail the task right away if a dependency already failed,
+        # otherwise queue it once all dependencies are satisfied
+        failed_dependency = next(
+            (dep_id for dep_id in task.dependencies
+             if dep_id in self._failed_tasks or dep_id in self._cancelled),
+            None
+        )
+        if failed_dependency is not None:
+            self._fail_dependents(failed_dependency)
+        elif self._are_dependencies_satisfied(task.id):
+            await self._enqueue_task(task)
+        
         return future
     
     async def submit_all(self, tasks: List[Task]) -> List[asyncio.Future]:
@@ -236,15 +445,17 @@ class ParallelExecutor:
             logger.warning(f"Task {task_id} has already completed or failed")
             return False
         
-        # Remove task from queue (if present)
-        # Note: This is inefficient but necessary since asyncio.PriorityQueue doesn't
-        # provide a way to remove items
-        new_queue = asyncio.PriorityQueue()
-        while not self._task_queue.empty():
-            priority, tid, t = await self._task_queue.get()
-            if tid != task_id:
-                await new_queue.put((priority, tid, t))
-        self._task_queue = new_queue
+        if task_id in self._cancelled:
+            logger.warning(f"Task {task_id} has already been cancelled")
+            return False
+        
+        # Work-stealing queues and tasks still waiting on dependencies are
+        # not indexed; their entries are skipped when a worker reaches them
+        self._task_queue.remove(task_id)
+        self._cancelled.add(task_id)
+        self._release_pending(task_id)
+        self._task_map[task_id].discard_coro()
+        self._release_shared_bodies(self._task_map[task_id])
         
         # Mark as cancelled and notify callback
         self._stats["tasks_cancelled"] += 1
@@ -254,14 +465,129 @@ class ParallelExecutor:
         if future and not future.done():
             future.cancel()
         
-        # Notify callback if registered
-        if self._task_callback:
-            await asyncio.create_task(
-                self._task_callback(task_id, TaskStatus.CANCELLED)
-            )
+        self.event_bus.publish(task_id, TaskStatus.CANCELLED)
+        if self.profiler is not None:
+            self.profiler.record_finish(task_id, TaskStatus.CANCELLED)
+        
+        self._fail_dependents(task_id)
+        return True
+    
+    def forget_task(self, task_id: str) -> bool:
+        """
+        Drop a finished task and its future so its result can be freed.
+        
+        The task still counts as completed or failed for statistics and
+        for tasks depending on it, but can no longer be waited for.
+        
+        Args:
+            task_id: The ID of the task.
+            
+        Returns:
+            True if the task was finished and has been dropped, False otherwise.
+        """
+        if task_id not in self._task_map or not (
+            task_id in self._completed_tasks
+            or task_id in self._failed_tasks
+            or task_id in self._cancelled
+        ):
+            return False
+        
+        del self._task_map[task_id]
+        self._task_futures.pop(task_id, None)
+        self._forgotten_tasks += 1
+        return True
+    
+    async def reprioritize_task(self, task_id: str, priority: TaskPriority) -> bool:
+        """
+        Change the priority of a task that hasn't started executing yet.
+        
+        Args:
+            task_id: The ID of the task.
+            priority: The new priority.
+            
+        Returns:
+            True if the task is still pending and was updated, False otherwise.
+        """
+        task = self._task_map.get(task_id)
+        if (
+            task is None
+            or task_id in self._running_tasks
+            or task_id in self._completed_tasks
+            or task_id in self._failed_tasks
+            or task_id in self._cancelled
+        ):
+            return False
+        
+        # Tasks waiting on dependencies pick the priority up when enqueued
+        task.priority = priority
+        if task_id in self._task_queue:
+            self._task_queue.reprioritize(task_id, self._priority_value(task))
         
         return True
     
+    @property
+    def concurrency_limit(self) -> int:
+        """Get the maximum number of tasks allowed to run at once."""
+        return self._concurrency_limit
+    
+    def set_concurrency_limit(self, limit: int) -> int:
+        """
+        Change how many tasks may run at once without restarting workers.
+        
+        Lowering the limit lets running tasks finish; idle workers simply
+        stop taking new tasks until the number of running tasks drops below
+        the new limit.
+        
+        Args:
+            limit: New limit, clamped to between 1 and max_workers.
+            
+        Returns:
+            The limit that was applied.
+        """
+        limit = max(1, min(int(limit), self.max_workers))
+        if limit > self._concurrency_limit:
+            self._slot_available.set()
+        self._concurrency_limit = limit
+        return limit
+    
+    def share_body(self, body: Body, refs: int = 1) -> SharedBody:
+        """
+        Place a page body in shared memory for PROCESS workers.
+        
+        Pass the handle instead of the body to every task for the page and
+        take one reference per task; each task releases its reference when
+        it finishes (or is cancelled), and the segment is freed after the
+        last one. Workers get the body back via SharedBody.load, which
+        happens automatically for handles passed as task arguments.
+        
+        Args:
+            body: Page body as str or bytes.
+            refs: Number of tasks that will receive the handle.
+            
+        Returns:
+            Handle to use as a task argument.
+            
+        Raises:
+            RuntimeError: If the executor does not use PROCESS workers.
+        """
+        if self._shared_bodies is None:
+            raise RuntimeError("Shared page bodies require PROCESS workers")
+        return self._shared_bodies.share(body, refs)
+    
+    def peek_task(self) -> Optional[Task]:
+        """
+        Get the task that will run next from the global queue.
+        
+        Returns:
+            The next queued task, or None if the queue is empty or the
+            executor uses work stealing.
+        """
+        try:
+            return self._task_queue.peek()[1]
+        except IndexError:
+            # Empty, or every FAIR group with queued tasks is at its limit
+            return None
+    
     @property
     def workers(self) -> List[asyncio.Task]:
         """Get the list of worker tasks."""
@@ -276,9 +602,13 @@ class ParallelExecutor:
         """
         stats = {
             "start_time": self._stats["start_time"],
-            "pending_tasks": len(self._task_map) - len(self._completed_tasks) - len(self._failed_tasks) - len(self._running_tasks),
+            "pending_tasks": (
+                len(self._task_map) + self._forgotten_tasks
+                - len(self._completed_tasks) - len(self._failed_tasks)
+                - len(self._running_tasks) - len(self._cancelled)
+            ),
             "current_running": len(self._running_tasks),
-            "current_queue_size": self._task_queue.qsize(),
+            "current_queue_size": self._queue_size(),
             "tasks_submitted": self._stats["tasks_submitted"],
             "submitted": self._stats["tasks_submitted"],  # Alias for compatibility
             "tasks_completed": self._stats["tasks_completed"],
@@ -289,13 +619,36 @@ class ParallelExecutor:
             "cancelled": self._stats["tasks_cancelled"],  # Alias for compatibility
             "tasks_timed_out": self._stats["tasks_timed_out"],
             "max_concurrent_tasks": self._stats["max_concurrent_tasks"],
+            "concurrency_limit": self._concurrency_limit,
             "total_processing_time": self._stats["total_processing_time"],
             "avg_processing_time": (
-                self._stats["total_processing_time"] / max(1, self._stats["tasks_completed"])
+                self._stats["total_task_time"] / self._stats["tasks_completed"]
                 if self._stats["tasks_completed"] > 0 else 0.0
             ),
             "work_stealing_transfers": self._stats["work_stealing_transfers"],
+            "worker_type": self.worker_type.name,
+            "pool_tasks": self._stats["pool_tasks"],
+            "pool_restarts": self._stats["pool_restarts"],
         }
+        if self.max_pending is not None:
+            stats.update({
+                "max_pending": self.max_pending,
+                "submit_waits": self._stats["submit_waits"],
+                "submit_wait_time": self._stats["submit_wait_time"],
+            })
+        if self.memory_limiter is not None:
+            stats.update({
+                "tasks_deferred": self._stats["tasks_deferred"],
+                "tasks_shed": self._stats["tasks_shed"],
+                "deferred_time": self._stats["deferred_time"],
+                "currently_deferred": self._deferred_workers,
+                "memory_reserved": self._memory_reserved,
+            })
+        if self._shared_bodies is not None:
+            stats["shared_memory"] = self._shared_bodies.get_statistics()
+        if self._fair:
+            stats["fair_groups"] = self._task_queue.get_statistics()
+        stats["events"] = self.event_bus.get_statistics()
         return stats
     
     async def wait_for_tasks(self, task_ids: List[str], timeout: Optional[float] = None) -> Dict[str, Any]:
@@ -356,199 +709,478 @@ class ParallelExecutor:
         """
         Main worker loop that processes tasks from the queue.
         
+        The worker sleeps on the ready semaphore and is woken once per
+        queued task (or once when the executor stops).
+        
         Args:
             worker_id: ID of this worker.
         """
         logger.debug(f"Worker {worker_id} started")
         
         try:
-            while self._running and not self._stop_event.is_set():
-                # Try to get a task
-                task = await self._get_task(worker_id)
+            while True:
+                await self._ready.acquire()
+                if not self._running:
+                    break
                 
+                # Hold the token while the concurrency limit is reached, or
+                # while every FAIR group with queued tasks is at its limit.
+                # Other workers may take slots while this one waits for
+                # memory, so the slots are checked again afterwards.
+                while True:
+                    while self._running and self._slots_full():
+                        self._slot_available.clear()
+                        await self._slot_available.wait()
+                    if not self._running or self.memory_limiter is None:
+                        break
+                    await self._wait_for_memory(worker_id)
+                    if not self._running or not self._slots_full():
+                        break
+                if not self._running:
+                    break
+                
+                try:
+                    task = self._get_task(worker_id)
+                except IndexError:
+                    # No group can take a task after all; keep the token
+                    self._ready.release()
+                    continue
                 if task is None:
-                    # No task available, wait for new tasks or stop event
-                    done, pending = await asyncio.wait(
-                        [
-                            asyncio.create_task(self._stop_event.wait()),
-                            asyncio.create_task(self._tasks_added_event.wait()),
-                        ],
-                        return_when=asyncio.FIRST_COMPLETED,
-                    )
-                    for fut in done:
-                        fut.result()  # Check for exceptions
-                    for fut in pending:
-                        fut.cancel()
+                    # The token belonged to a cancelled or shed task
                     continue
                 
                 # Mark worker as busy
                 self._idle_workers.discard(worker_id)
-                
-                # Mark task as running
-                task_id = task.id
-                self._running_tasks.add(task_id)
-                
-                # Update max concurrent tasks statistic
-                current_concurrent = len(self._running_tasks)
-                if current_concurrent > self._stats["max_concurrent_tasks"]:
-                    self._stats["max_concurrent_tasks"] = current_concurrent
-                
-                # Notify task started
-                if self._task_callback:
-                    await asyncio.create_task(
-                        self._task_callback(task_id, TaskStatus.RUNNING)
-                    )
-                
-                # Execute the task with timeout if specified
-                task_timeout = task.timeout if task.timeout is not None else self.task_timeout
+                self._memory_reserved += task.memory_cost
                 try:
-                    if task_timeout is not None:
-                        result = await asyncio.wait_for(task.coro, timeout=task_timeout)
-                    else:
-                        result = await task.coro
-                    
-                    # Mark task as completed
-                    self._running_tasks.discard(task_id)
-                    self._completed_tasks.add(task_id)
-                    
-                    # Set result in future
-                    future = self._task_futures.get(task_id)
-                    if future and not future.done():
-                        future.set_result(result)
-                    
-                    # Notify task completed
-                    if self._task_callback:
-                        await asyncio.create_task(
-                            self._task_callback(task_id, TaskStatus.COMPLETED, result=result)
-                        )
-                    
-                    # Update statistics
-                    self._stats["tasks_completed"] += 1
-                    
-                    # Check if this task was a dependency for other tasks
-                    await self._process_completed_dependency(task_id)
-                    
-                except asyncio.TimeoutError:
-                    # Task timed out
-                    logger.warning(f"Task {task_id} timed out after {task_timeout}s")
-                    
-                    # Mark task as failed
-                    self._running_tasks.discard(task_id)
-                    self._failed_tasks.add(task_id)
-                    
-                    # Set exception in future
-                    error = TimeoutError(f"Task {task_id} timed out after {task_timeout}s")
-                    future = self._task_futures.get(task_id)
-                    if future and not future.done():
-                        future.set_exception(error)
-                    
-                    # Notify task failed
-                    if self._task_callback:
-                        await asyncio.create_task(
-                            self._task_callback(task_id, TaskStatus.FAILED, error=error)
-                        )
-                    
-                    # Update statistics
-                    self._stats["tasks_failed"] += 1
-                    self._stats["tasks_timed_out"] += 1
-                    
-                except Exception as e:
-                    # Task failed with exception
-                    logger.exception(f"Task {task_id} failed with exception: {e}")
-                    
-                    # Mark task as failed
-                    self._running_tasks.discard(task_id)
-                    self._failed_tasks.add(task_id)
-                    
-                    # Set exception in future
-                    future = self._task_futures.get(task_id)
-                    if future and not future.done():
-                        future.set_exception(e)
-                    
-                    # Notify task failed
-                    if self._task_callback:
-                        await asyncio.create_task(
-                            self._task_callback(task_id, TaskStatus.FAILED, error=e)
-                        )
-                    
-                    # Update statistics
-                    self._stats["tasks_failed"] += 1
+                    await self._execute_task(task, worker_id)
+                finally:
+                    self._memory_reserved -= task.memory_cost
+                    if self._fair:
+                        self._task_queue.task_done(task.id)
                 
                 # Mark worker as idle
                 self._idle_workers.add(worker_id)
+                if self._fair or self._concurrency_limit < self.max_workers:
+                    self._slot_available.set()
         
         except Exception as e:
             logger.exception(f"Worker {worker_id} exited with exception: {e}")
         
         logger.debug(f"Worker {worker_id} stopped")
     
-    async def _get_task(self, worker_id: int) -> Optional[Task]:
+    async def _execute_task(self, task: Task, worker_id: Optional[int] = None):
         """
-        Get the next task to execute based on the execution strategy.
+        Run a task and record its outcome.
         
         Args:
-            worker_id: ID of the worker requesting a task.
+            task: The task to run.
+            worker_id: ID of the worker running it.
+        """
+        # Mark task as running
+        task_id = task.id
+        self._running_tasks.add(task_id)
+        self._release_pending(task_id)
+        if self.profiler is not None:
+            self.profiler.record_start(task_id, worker_id)
+        
+        # Update max concurrent tasks statistic
+        current_concurrent = len(self._running_tasks)
+        if current_concurrent > self._stats["max_concurrent_tasks"]:
+            self._stats["max_concurrent_tasks"] = current_concurrent
+        
+        self.event_bus.publish(task_id, TaskStatus.RUNNING)
+        
+        # Execute the task with timeout if specified
+        task_timeout = task.timeout if task.timeout is not None else self.task_timeout
+        start_time = time.perf_counter()
+        try:
+            awaitable = (
+                self._run_in_pool(task) if self._pool is not None and task.func is not None
+                else task.ensure_coro()
+            )
+            if task_timeout is not None:
+                result = await asyncio.wait_for(awaitable, timeout=task_timeout)
+            else:
+                result = await awaitable
+            
+            # Mark task as completed and update statistics before the
+            # future resolves, so waiters see consistent statistics
+            self._running_tasks.discard(task_id)
+            self._completed_tasks.add(task_id)
+            self._stats["tasks_completed"] += 1
+            self._stats["total_task_time"] += time.perf_counter() - start_time
+            
+            # Set result in future
+            future = self._task_futures.get(task_id)
+            if future and not future.done():
+                future.set_result(result)
+            
+            self.event_bus.publish(task_id, TaskStatus.COMPLETED, result=result)
+            if self.profiler is not None:
+                self.profiler.record_finish(task_id, TaskStatus.COMPLETED)
+            
+            # Check if this task was a dependency for other tasks
+            await self._process_completed_dependency(task_id)
+            
+        except asyncio.TimeoutError:
+            # Task timed out
+            logger.warning(f"Task {task_id} timed out after {task_timeout}s")
+            
+            # Mark task as failed
+            self._running_tasks.discard(task_id)
+            self._failed_tasks.add(task_id)
+            self._stats["tasks_failed"] += 1
+            self._stats["tasks_timed_out"] += 1
+            
+            # Set exception in future
+            error = TimeoutError(f"Task {task_id} timed out after {task_timeout}s")
+            future = self._task_futures.get(task_id)
+            if future and not future.done():
+                future.set_exception(error)
+            
+            self.event_bus.publish(task_id, TaskStatus.FAILED, error=error)
+            if self.profiler is not None:
+                self.profiler.record_finish(task_id, TaskStatus.TIMEOUT)
+            self._fail_dependents(task_id)
+            
+        except Exception as e:
+            # Task failed with exception
+            logger.exception(f"Task {task_id} failed with exception: {e}")
+            
+            # Mark task as failed
+            self._running_tasks.discard(task_id)
+            self._failed_tasks.add(task_id)
+            self._stats["tasks_failed"] += 1
+            
+            # Set exception in future
+            future = self._task_futures.get(task_id)
+            if future and not future.done():
+                future.set_exception(e)
+            
+            self.event_bus.publish(task_id, TaskStatus.FAILED, error=e)
+            if self.profiler is not None:
+                self.profiler.record_finish(task_id, TaskStatus.FAILED)
+            self._fail_dependents(task_id)
+    
+    def _create_pool(self) -> Optional[Executor]:
+        """
+        Create the thread or process pool for the configured worker type.
+        
+        Returns:
+            The pool, or None for ASYNCIO workers.
+        """
+        if self.worker_type == WorkerType.PROCESS:
+            return ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context(self.mp_start_method),
+                initializer=self.worker_initializer,
+                initargs=self.worker_initargs
+            )
+        if self.worker_type == WorkerType.THREAD:
+            return ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="summit_seo_worker",
+                initializer=self.worker_initializer,
+                initargs=self.worker_initargs
+            )
+        return None
+    
+    async def _run_in_pool(self, task: Task) -> Any:
+        """
+        Run a callable task in the thread or process pool.
+        
+        Args:
+            task: The task to run; its coroutine wrapper is discarded.
             
         Returns:
-            The next task to execute, or None if no tasks are available.
+            The result of the call.
         """
-        # Handle different task acquisition strategies
-        if self.execution_strategy == ExecutionStrategy.WORK_STEALING:
-            # First try the worker's own queue
+        task.discard_coro()
+        self._stats["pool_tasks"] += 1
+        
+        pool = self._pool
+        loop = asyncio.get_running_loop()
+        if self._share_task_bodies(task):
+            call = partial(call_with_shared_bodies, task.func, task.args, task.kwargs)
+        else:
+            call = partial(task.func, *task.args, **task.kwargs)
+        
+        try:
             try:
-                return await asyncio.wait_for(self._worker_queues[worker_id].get(), timeout=0.01)
-            except (asyncio.TimeoutError, asyncio.QueueEmpty):
-                pass
-            
-            # If no task in own queue, try to steal from other workers
-            idle_attempts = 0
-            while idle_attempts < 3:  # Try a few times before giving up
-                # Try to steal from the worker with the most tasks
-                most_tasks = -1
-                steal_from = -1
+                future = pool.submit(call)
+            except BaseException:
+                self._release_shared_bodies(task)
+                raise
+            
+            # Release shared bodies when the worker is done with them, which
+            # may be after the task has already timed out
+            if self._shared_bodies is not None:
+                future.add_done_callback(partial(self._on_pool_call_done, loop, task))
+            return await asyncio.wrap_future(future, loop=loop)
+        except BrokenProcessPool:
+            # A worker process died; replace the pool so later tasks can run
+            if self._pool is pool and self._running:
+                logger.warning("Process pool is broken, starting a new one")
+                self._stats["pool_restarts"] += 1
+                if self.process_pool is not None:
+                    self._pool = await loop.run_in_executor(None, self.process_pool.restart, pool)
+                else:
+                    self._pool = self._create_pool()
+                    pool.shutdown(wait=False)
+            raise
+    
+    def _share_task_bodies(self, task: Task) -> List[SharedBody]:
+        """
+        Move large str and bytes arguments of a process task to shared memory.
+        
+        Args:
+            task: The task; its args and kwargs are rewritten to use handles.
+            
+        Returns:
+            Handles among the task's arguments, including ones passed by the
+            caller. Each holds one reference for this task.
+        """
+        if self._shared_bodies is None:
+            return []
+        
+        threshold = self.shared_memory_threshold
+        
+        def share(value: Any) -> Any:
+            if (
+                threshold is not None
+                and isinstance(value, (str, bytes))
+                and len(value) >= threshold
+            ):
+                try:
+                    return self._shared_bodies.share(value)
+                except OSError as e:
+                    logger.warning(f"Could not place body in shared memory, pickling it instead: {e}")
+            return value
+        
+        task.args = tuple(share(arg) for arg in task.args)
+        task.kwargs = {key: share(value) for key, value in task.kwargs.items()}
+        
+        return [
+            value for value in (*task.args, *task.kwargs.values())
+            if isinstance(value, SharedBody)
+        ]
+    
+    def _on_pool_call_done(self, loop: asyncio.AbstractEventLoop, task: Task, _future: Any) -> None:
+        """
+        Hand a finished pool call back to the event loop to release its bodies.
+        
+        Args:
+            loop: The executor's event loop.
+            task: The task whose call finished.
+            _future: The finished concurrent future.
+        """
+        try:
+            loop.call_soon_threadsafe(self._release_shared_bodies, task)
+        except RuntimeError:
+            # The loop is closed; stop() has already freed every segment
+            pass
+    
+    def _release_shared_bodies(self, task: Task) -> None:
+        """
+        Release the shared memory references held by a task's arguments.
+        
+        Args:
+            task: The finished or cancelled task.
+        """
+        if self._shared_bodies is None:
+            return
+        for value in (*task.args, *task.kwargs.values()):
+            if isinstance(value, SharedBody):
+                self._shared_bodies.release(value)
+    
+    def _slots_full(self) -> bool:
+        """
+        Check whether a worker must wait before taking a task.
+        
+        Returns:
+            True if the concurrency limit is reached, or if every FAIR
+            group with queued tasks is at its limit.
+        """
+        return (
+            len(self._running_tasks) >= self._concurrency_limit
+            or bool(self._fair and self._task_queue and not self._task_queue.has_eligible())
+        )
+    
+    def _get_task(self, worker_id: int) -> Optional[Task]:
+        """
+        Take the next task to execute based on the execution strategy.
+        
+        Must only be called after acquiring a ready token, which guarantees
+        that at least one task entry is queued.
+        
+        Args:
+            worker_id: ID of the worker requesting a task.
+            
+        Returns:
+            The next task to execute, or None if the token belonged to a
+            cancelled task.
+        """
+        if self._work_stealing_enabled:
+            # Take the oldest task from the worker's own queue
+            own_queue = self._worker_queues[worker_id]
+            if own_queue:
+                task = own_queue.popleft()
+            else:
+                # Steal the newest task from the most loaded worker
+                victim = max(self._worker_queues, key=len)
+                task = victim.pop()
+                self._stats["work_stealing_transfers"] += 1
+        else:
+            if not self._task_queue:
+                # The token belonged to a task removed by cancel_task
+                return None
+            _, task = self._task_queue.pop()
+        
+        if task.id in self._cancelled or task.id in self._failed_tasks:
+            if self._fair:
+                self._task_queue.task_done(task.id)
+            return None
+        return task
+    
+    def _peek_next_task(self, worker_id: int) -> Optional[Task]:
+        """
+        Get the task _get_task would most likely return, without taking it.
+        
+        Args:
+            worker_id: ID of the worker.
+            
+        Returns:
+            The task, or None if no task is queued.
+        """
+        if self._work_stealing_enabled:
+            own_queue = self._worker_queues[worker_id]
+            if own_queue:
+                return own_queue[0]
+            victim = max(self._worker_queues, key=len)
+            return victim[-1] if victim else None
+        
+        try:
+            return self._task_queue.peek()[1]
+        except IndexError:
+            return None
+    
+    async def _wait_for_memory(self, worker_id: int):
+        """
+        Wait until the memory budget admits the worker's next task.
+        
+        Args:
+            worker_id: ID of the worker.
+        """
+        from summit_seo.memory.limiter import AdmissionDecision
+        
+        deferred_since = None
+        try:
+            while self._running:
+                # Always admit when nothing runs, so the queue keeps draining
+                if not self._running_tasks:
+                    return
                 
-                for i in range(self.max_workers):
-                    if i != worker_id:
-                        queue_size = self._worker_queues[i].qsize()
-                        if queue_size > most_tasks:
-                            most_tasks = queue_size
-                            steal_from = i
+                task = self._peek_next_task(worker_id)
+                if task is None:
+                    return
                 
-                if most_tasks > 0:
-                    try:
-                        task = await asyncio.wait_for(self._worker_queues[steal_from].get(), timeout=0.01)
-                        self._stats["work_stealing_transfers"] += 1
-                        return task
-                    except (asyncio.TimeoutError, asyncio.QueueEmpty):
-                        pass
+                decision = self.memory_limiter.check_admission(task.memory_cost, self._memory_reserved)
+                if decision == AdmissionDecision.ADMIT:
+                    return
+                if decision == AdmissionDecision.SHED:
+                    await self._shed_tasks()
                 
-                # Wait a bit before trying again
-                await asyncio.sleep(0.05)
-                idle_attempts += 1
+                if deferred_since is None:
+                    deferred_since = time.perf_counter()
+                    self._deferred_workers += 1
+                    self._stats["tasks_deferred"] += 1
+                await asyncio.sleep(self.admission_poll_interval)
+        finally:
+            if deferred_since is not None:
+                self._deferred_workers -= 1
+                self._stats["deferred_time"] += time.perf_counter() - deferred_since
+    
+    async def _shed_tasks(self):
+        """
+        Fail the lowest-priority queued tasks while memory is above the hard limit.
+        
+        At most one round of shedding runs per admission poll interval. A
+        round sheds enough tasks to cover the excess by estimated cost, and
+        at least one task. A task without an estimate (memory_cost 0) ends
+        the round, since what shedding it frees is unknown.
+        """
+        from summit_seo.memory.monitor import MemoryLimitExceededError
+        
+        now = time.monotonic()
+        if now - self._last_shed < self.admission_poll_interval:
+            return
+        self._last_shed = now
+        
+        limit = self.memory_limiter.memory_limit.hard_limit_bytes
+        usage = self.memory_limiter.get_memory_usage()
+        excess = usage - limit
+        
+        # Newest, lowest-priority tasks are shed first
+        queued = [task for _, task in self._task_queue]
+        for queue in self._worker_queues:
+            queued.extend(
+                task for task in queue
+                if task.id not in self._cancelled and task.id not in self._failed_tasks
+            )
+        queued.sort(key=lambda t: (self._priority_value(t), t.created_at), reverse=True)
+        
+        shed_cost = 0
+        for task in queued:
+            shed_cost += task.memory_cost
             
-            # Finally, try the global queue
-            try:
-                priority, task_id, task = await asyncio.wait_for(self._task_queue.get(), timeout=0.01)
-                return task
-            except (asyncio.TimeoutError, asyncio.QueueEmpty):
-                return None
+            # Work-stealing entries are skipped when a worker reaches them
+            self._task_queue.remove(task.id)
+            task.discard_coro()
+            self._release_shared_bodies(task)
+            self._release_pending(task.id)
+            self._failed_tasks.add(task.id)
+            self._stats["tasks_failed"] += 1
+            self._stats["tasks_shed"] += 1
+            
+            error = MemoryLimitExceededError(usage, limit)
+            logger.warning(f"Shedding task {task.id}: {error}")
+            future = self._task_futures.get(task.id)
+            if future and not future.done():
+                future.set_exception(error)
+            self.event_bus.publish(task.id, TaskStatus.FAILED, error=error)
+            if self.profiler is not None:
+                self.profiler.record_finish(task.id, TaskStatus.FAILED)
+            self._fail_dependents(task.id)
+            
+            if task.memory_cost == 0 or shed_cost >= excess:
+                break
+    
+    def _release_pending(self, task_id: str) -> None:
+        """
+        Stop counting a task against max_pending and wake a blocked submit.
         
-        else:
-            # For other strategies, use the global queue
-            try:
-                priority, task_id, task = await asyncio.wait_for(self._task_queue.get(), timeout=0.01)
-                return task
-            except (asyncio.TimeoutError, asyncio.QueueEmpty):
-                return None
+        Args:
+            task_id: The ID of the task that started or was dropped.
+        """
+        if task_id in self._pending_ids:
+            self._pending_ids.discard(task_id)
+            self._pending_space.set()
     
-    async def _enqueue_task(self, task: Task):
+    def _queue_size(self) -> int:
+        """Get the number of queued task entries."""
+        return len(self._task_queue) + sum(len(queue) for queue in self._worker_queues)
+    
+    def _priority_value(self, task: Task) -> int:
         """
-        Add a task to the appropriate queue based on execution strategy.
+        Calculate the queue priority of a task (lower runs first).
         
         Args:
-            task: The task to add to the queue.
+            task: The task to calculate the priority for.
+            
+        Returns:
+            The priority value.
         """
-        # Calculate priority value (lower is higher priority)
         priority_value = task.priority.value
         
         # For dependency-based execution, adjust priority based on dependency depth
@@ -557,23 +1189,29 @@ class ParallelExecutor:
             dependents = self._reverse_dependency_graph.get(task.id, set())
             priority_value -= len(dependents) * 10
         
-        if self.execution_strategy == ExecutionStrategy.WORK_STEALING:
-            # Choose a worker with the least tasks
-            least_tasks = float('inf')
-            target_worker = 0
-            
-            for i in range(self.max_workers):
-                queue_size = self._worker_queues[i].qsize()
-                if queue_size < least_tasks:
-                    least_tasks = queue_size
-                    target_worker = i
-            
-            # Add to the chosen worker's queue
-            await self._worker_queues[target_worker].put(task)
+        return priority_value
+    
+    async def _enqueue_task(self, task: Task):
+        """
+        Add a task to the appropriate queue and wake one worker.
+        
+        Args:
+            task: The task to add to the queue.
+        """
+        self._pending_ids.add(task.id)
+        if self._work_stealing_enabled:
+            # Add to the queue of the worker with the least tasks
+            min(self._worker_queues, key=len).append(task)
         else:
-            # Add to global queue with priority
-            await self._task_queue.put((priority_value, task.id, task))
+            # Add to global queue with priority; tasks of equal priority
+            # keep submission order
+            self._task_queue.push(task.id, task, self._priority_value(task))
+        
+        if self.profiler is not None:
+            self.profiler.record_ready(task.id)
+        self._ready.release()
     
+
     def _are_dependencies_satisfied(self, task_id: str) -> bool:
         """
         Check if all dependencies for a task are satisfied.
@@ -598,12 +1236,54 @@ class ParallelExecutor:
         dependent_tasks = self._reverse_dependency_graph.get(task_id, set())
         
         for dependent_id in dependent_tasks:
+            if dependent_id in self._cancelled:
+                continue
+            
             # If all dependencies are now satisfied, add to queue
             if self._are_dependencies_satisfied(dependent_id):
                 dependent_task = self._task_map.get(dependent_id)
                 if dependent_task:
                     await self._enqueue_task(dependent_task)
     
+    def _fail_dependents(self, task_id: str) -> None:
+        """
+        Fail the tasks waiting, directly or transitively, on a task that
+        failed or was cancelled, since they can never start.
+        
+        Args:
+            task_id: The ID of the failed or cancelled task.
+        """
+        blocked = [(dependent_id, task_id) for dependent_id in self._reverse_dependency_graph.get(task_id, ())]
+        while blocked:
+            dependent_id, dependency_id = blocked.pop()
+            dependent_task = self._task_map.get(dependent_id)
+            if (
+                dependent_task is None
+                or dependent_id in self._failed_tasks
+                or dependent_id in self._cancelled
+                or dependent_id in self._completed_tasks
+                or dependent_id in self._running_tasks
+            ):
+                continue
+            
+            dependent_task.discard_coro()
+            self._release_shared_bodies(dependent_task)
+            self._release_pending(dependent_id)
+            self._failed_tasks.add(dependent_id)
+            self._stats["tasks_failed"] += 1
+            
+            error = DependencyFailedError(dependent_id, dependency_id)
+            future = self._task_futures.get(dependent_id)
+            if future and not future.done():
+                future.set_exception(error)
+            self.event_bus.publish(dependent_id, TaskStatus.FAILED, error=error)
+            if self.profiler is not None:
+                self.profiler.record_finish(dependent_id, TaskStatus.FAILED)
+            
+            blocked.extend(
+                (next_id, dependent_id) for next_id in self._reverse_dependency_graph.get(dependent_id, ())
+            )
+    
     async def get_pending_task_ids(self) -> List[str]:
         """Get IDs of tasks that are pending execution."""
         return [
@@ -611,6 +1291,7 @@ class ParallelExecutor:
             if task_id not in self._completed_tasks
             and task_id not in self._failed_tasks
             and task_id not in self._running_tasks
+            and task_id not in self._cancelled
         ]
     
     async def get_running_task_ids(self) -> List[str]:
@@ -623,4 +1304,20 @@ class ParallelExecutor:
     
     async def get_failed_task_ids(self) -> List[str]:
         """Get IDs of tasks that have failed."""
-        return list(self._failed_tasks) 
\ No newline at end of file
+        return list(self._failed_tasks)
+
+
+def _callback_adapter(task_callback: Callable) -> Callable[[List[TaskEvent]], Coroutine]:
+    """
+    Wrap a per-event task callback as an event bus subscriber.
+    
+    Args:
+        task_callback: Async callback(task_id, status, result=None, error=None).
+        
+    Returns:
+        Subscriber calling task_callback once per event, in order.
+    """
+    async def deliver(events: List[TaskEvent]):
+        for event in events:
+            await task_callback(event.task_id, event.status, result=event.result, error=event.error)
+    return deliver
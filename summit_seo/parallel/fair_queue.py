@@ -0,0 +1,346 @@
+"""
+Fair Queue Module for Summit SEO
+
+This module provides a queue that shares workers fairly between groups of
+tasks, such as the host a URL belongs to or the tenant that submitted it.
+Groups are served by deficit round robin, so a group with 10,000 queued
+tasks gets the same share of dispatches as a group with 10, and each group
+can be capped to a number of concurrently running tasks.
+"""
+
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, Iterator, Optional, Tuple, TypeVar
+from urllib.parse import urlparse
+
+from summit_seo.parallel.priority_queue import IndexedPriorityQueue
+
+T = TypeVar('T')
+
+
+def default_group_key(task: Any) -> Hashable:
+    """
+    Get the fairness group of a task from its metadata.
+
+    The group is the first of ``metadata['group']``, ``metadata['tenant']``
+    and the host of ``metadata['url']`` that is set. Tasks without any of
+    them share one group.
+
+    Args:
+        task: The task.
+
+    Returns:
+        The group key, or None for the shared group.
+    """
+    metadata = getattr(task, 'metadata', None) or {}
+    for field in ('group', 'tenant'):
+        if metadata.get(field) is not None:
+            return metadata[field]
+
+    url = metadata.get('url')
+    if url:
+        return urlparse(url).hostname
+    return None
+
+
+class _Group:
+    """Queued tasks and scheduling state of one group."""
+
+    __slots__ = ('queue', 'deficit', 'running')
+
+    def __init__(self):
+        self.queue: IndexedPriorityQueue = IndexedPriorityQueue()
+        self.deficit = 0.0
+        self.running = 0
+
+
+class FairQueue:
+    """
+    Deficit round robin queue over groups of items.
+
+    Each group keeps its items in priority order. Groups with queued items
+    are visited in turn; on each visit a group's deficit grows by its
+    weight (1 by default) and it is served one item per unit of deficit,
+    so over time every group gets dispatches in proportion to its weight,
+    regardless of how many items it has queued.
+
+    A group with as many running items as its concurrency cap is skipped
+    until ``task_done`` reports one of them finished. Popped items count
+    as running until then.
+
+    The interface matches IndexedPriorityQueue, so it can replace the
+    executor's global queue.
+    """
+
+    def __init__(
+        self,
+        group_key: Callable[[Any], Hashable] = default_group_key,
+        group_concurrency: Optional[int] = None,
+        group_limits: Optional[Dict[Hashable, int]] = None,
+        group_weights: Optional[Dict[Hashable, float]] = None
+    ):
+        """
+        Initialize an empty queue.
+
+        Args:
+            group_key: Function returning the group of an item.
+            group_concurrency: Maximum running items per group (None for
+                no limit).
+            group_limits: Per-group overrides of group_concurrency.
+            group_weights: Per-group share of dispatches relative to other
+                groups (default 1).
+
+        Raises:
+            ValueError: If a concurrency limit is below 1 or a weight is not
+                positive.
+        """
+        limits = list((group_limits or {}).values())
+        if group_concurrency is not None:
+            limits.append(group_concurrency)
+        if any(limit < 1 for limit in limits):
+            raise ValueError("Group concurrency limits must be at least 1")
+        if any(weight <= 0 for weight in (group_weights or {}).values()):
+            raise ValueError("Group weights must be positive")
+
+        self.group_key = group_key
+        self.group_concurrency = group_concurrency
+        self.group_limits = dict(group_limits or {})
+        self.group_weights = dict(group_weights or {})
+
+        self._groups: Dict[Hashable, _Group] = {}
+        self._active: Deque[Hashable] = deque()  # Groups with queued items, in visiting order
+        self._item_groups: Dict[Hashable, Hashable] = {}  # Queued or running key -> group
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Get the number of queued items."""
+        return self._size
+
+    def __bool__(self) -> bool:
+        """Check whether any items are queued."""
+        return self._size > 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check whether an item with this key is queued."""
+        group = self._item_groups.get(key, _MISSING)
+        return group is not _MISSING and key in self._groups[group].queue
+
+    def __iter__(self) -> Iterator[Tuple[Hashable, T]]:
+        """Iterate over queued (key, item) pairs in no particular order."""
+        for group in list(self._groups.values()):
+            yield from group.queue
+
+    def push(self, key: Hashable, item: T, priority: float) -> None:
+        """
+        Add an item to its group's queue.
+
+        Args:
+            key: Unique key of the item.
+            item: The item to queue.
+            priority: Priority value within the group (lower is popped first).
+
+        Raises:
+            KeyError: If an item with this key is already queued.
+        """
+        if key in self:
+            raise KeyError(f"Key {key!r} is already queued")
+
+        group_id = self.group_key(item)
+        group = self._groups.get(group_id)
+        if group is None:
+            group = self._groups[group_id] = _Group()
+
+        group.queue.push(key, item, priority)
+        if len(group.queue) == 1:
+            self._active.append(group_id)
+        self._item_groups[key] = group_id
+        self._size += 1
+
+    def pop(self) -> Tuple[Hashable, T]:
+        """
+        Remove and return the next item by deficit round robin.
+
+        Returns:
+            Tuple of (key, item).
+
+        Raises:
+            IndexError: If no group with queued items is below its cap.
+        """
+        if not self._size:
+            raise IndexError("pop from an empty queue")
+        if not self.has_eligible():
+            raise IndexError("every group with queued items is at its concurrency limit")
+
+        # Terminates because every visit to an eligible group adds to its deficit
+        active = self._active
+        while True:
+            group_id = active[0]
+            group = self._groups[group_id]
+
+            if self._is_capped(group_id, group):
+                active.rotate(-1)
+                continue
+
+            if group.deficit < 1:
+                group.deficit += self.group_weights.get(group_id, 1)
+            if group.deficit < 1:
+                # Fractional weights need several visits per dispatch
+                active.rotate(-1)
+                continue
+
+            group.deficit -= 1
+            key, item = group.queue.pop()
+            group.running += 1
+            self._size -= 1
+
+            if not group.queue:
+                active.popleft()
+                group.deficit = 0.0
+            elif group.deficit < 1:
+                active.rotate(-1)
+            return key, item
+
+    def peek(self) -> Tuple[Hashable, T]:
+        """
+        Return the item pop would most likely return, without removing it.
+
+        Returns:
+            Tuple of (key, item).
+
+        Raises:
+            IndexError: If no group with queued items is below its cap.
+        """
+        for group_id in self._active:
+            group = self._groups[group_id]
+            if not self._is_capped(group_id, group):
+                return group.queue.peek()
+        raise IndexError("peek at a queue without eligible items")
+
+    def has_eligible(self) -> bool:
+        """
+        Check whether pop would return an item.
+
+        Returns:
+            True if a group with queued items is below its concurrency cap.
+        """
+        return any(not self._is_capped(g, self._groups[g]) for g in self._active)
+
+    def task_done(self, key: Hashable) -> None:
+        """
+        Report that a popped item finished, freeing a slot of its group.
+
+        Args:
+            key: Key of the item.
+        """
+        group_id = self._item_groups.get(key, _MISSING)
+        if group_id is _MISSING or key in self._groups[group_id].queue:
+            return
+
+        del self._item_groups[key]
+        group = self._groups[group_id]
+        group.running -= 1
+        if not group.running and not group.queue:
+            del self._groups[group_id]
+
+    def get(self, key: Hashable) -> Optional[T]:
+        """
+        Get a queued item by key.
+
+        Args:
+            key: Key of the item.
+
+        Returns:
+            The item, or None if no item with this key is queued.
+        """
+        group_id = self._item_groups.get(key, _MISSING)
+        if group_id is _MISSING:
+            return None
+        return self._groups[group_id].queue.get(key)
+
+    def priority(self, key: Hashable) -> Optional[float]:
+        """
+        Get the priority of a queued item.
+
+        Args:
+            key: Key of the item.
+
+        Returns:
+            The priority value, or None if no item with this key is queued.
+        """
+        group_id = self._item_groups.get(key, _MISSING)
+        if group_id is _MISSING:
+            return None
+        return self._groups[group_id].queue.priority(key)
+
+    def remove(self, key: Hashable) -> Optional[T]:
+        """
+        Remove a queued item.
+
+        Args:
+            key: Key of the item to remove.
+
+        Returns:
+            The removed item, or None if no item with this key is queued.
+        """
+        if key not in self:
+            return None
+
+        group_id = self._item_groups.pop(key)
+        group = self._groups[group_id]
+        item = group.queue.remove(key)
+        self._size -= 1
+
+        if not group.queue:
+            self._active.remove(group_id)
+            group.deficit = 0.0
+            if not group.running:
+                del self._groups[group_id]
+        return item
+
+    def reprioritize(self, key: Hashable, priority: float) -> bool:
+        """
+        Change the priority of a queued item within its group.
+
+        Args:
+            key: Key of the item.
+            priority: New priority value.
+
+        Returns:
+            True if the item was found, False otherwise.
+        """
+        if key not in self:
+            return False
+        return self._groups[self._item_groups[key]].queue.reprioritize(key, priority)
+
+    def clear(self) -> None:
+        """Remove all queued items; running items still need task_done."""
+        for group_id in list(self._active):
+            group = self._groups[group_id]
+            for key, _ in list(group.queue):
+                del self._item_groups[key]
+            group.queue.clear()
+            group.deficit = 0.0
+            if not group.running:
+                del self._groups[group_id]
+        self._active.clear()
+        self._size = 0
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get queued and running counts per group.
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            "groups": len(self._groups),
+            "queued": {g: len(group.queue) for g, group in self._groups.items() if group.queue},
+            "running": {g: group.running for g, group in self._groups.items() if group.running},
+        }
+
+    def _is_capped(self, group_id: Hashable, group: _Group) -> bool:
+        """Check whether a group is at its concurrency limit."""
+        limit = self.group_limits.get(group_id, self.group_concurrency)
+        return limit is not None and group.running >= limit
+
+
+_MISSING = object()
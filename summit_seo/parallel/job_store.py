@@ -0,0 +1,550 @@
+"""
+Job Store Module for Summit SEO
+
+This module records batch jobs on disk so a batch that dies part way
+through can be resumed instead of started over. ``JobStore`` keeps every
+task of a job in a SQLite database with its status, number of attempts,
+last error and the location of its result, and ``run_job`` runs the
+unfinished tasks of a job through a ParallelManager, updating the store as
+tasks start and finish:
+
+    store = JobStore("jobs.db")
+    job_id = store.create_job(urls)
+    summary = await run_job(manager, store, job_id, analyze_url)
+
+    # After a crash, the same call picks up where the job stopped
+    summary = await run_job(manager, store, job_id, analyze_url)
+
+Tasks are identified by a key (the URL by default), so submitting the same
+items to a job again only adds the ones it does not already have.
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+import sqlite3
+import time
+import uuid
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from summit_seo.parallel.task import TaskPriority, TaskStatus, create_task
+
+if TYPE_CHECKING:
+    from summit_seo.parallel.manager import ParallelManager
+
+logger = logging.getLogger(__name__)
+
+# An item is either a JSON-serializable payload used as its own key (e.g. a
+# URL), or a (key, payload) tuple
+JobItem = Union[str, Tuple[str, Any]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    max_attempts INTEGER NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_tasks (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL REFERENCES jobs(job_id) ON DELETE CASCADE,
+    task_key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    result_location TEXT,
+    updated_at REAL NOT NULL,
+    UNIQUE (job_id, task_key)
+);
+CREATE INDEX IF NOT EXISTS job_tasks_status ON job_tasks (job_id, status);
+"""
+
+
+class JobStoreError(Exception):
+    """Exception raised for job store errors."""
+    pass
+
+
+@dataclass
+class JobTask:
+    """A task of a stored job."""
+    job_id: str
+    key: str
+    payload: Any
+    status: TaskStatus
+    attempts: int = 0
+    error: Optional[str] = None
+    result_location: Optional[str] = None
+
+
+class JobStore:
+    """
+    SQLite-backed record of batch jobs and their tasks.
+
+    Every status change is committed immediately, so the store reflects the
+    last task that started or finished when the process dies. The store is
+    not thread-safe and is meant to be used from one event loop.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open or create a job store.
+
+        Args:
+            path: Path of the SQLite database file (":memory:" for a
+                temporary store).
+
+        Raises:
+            JobStoreError: If the database cannot be opened.
+        """
+        self.path = path
+        try:
+            directory = os.path.dirname(path) if path != ":memory:" else ""
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            self._conn = sqlite3.connect(path)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA foreign_keys = ON")
+            if path != ":memory:":
+                # WAL keeps per-task commits cheap enough for large batches
+                self._conn.execute("PRAGMA journal_mode = WAL")
+                self._conn.execute("PRAGMA synchronous = NORMAL")
+            self._conn.executescript(_SCHEMA)
+        except (OSError, sqlite3.Error) as e:
+            raise JobStoreError(f"Error opening job store {path}: {str(e)}")
+
+    def close(self) -> None:
+        """Close the database."""
+        self._conn.close()
+
+    def create_job(
+        self,
+        items: Iterable[JobItem] = (),
+        job_id: Optional[str] = None,
+        max_attempts: int = 3,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Create a job, or add items to it if it already exists.
+
+        Args:
+            items: Items of the job.
+            job_id: Job identifier (generated if not given).
+            max_attempts: How many times a task is tried before it is given up.
+            metadata: JSON-serializable information about the job.
+
+        Returns:
+            The job identifier.
+
+        Raises:
+            ValueError: If max_attempts is less than 1.
+            JobStoreError: If the job cannot be stored.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        job_id = job_id or uuid.uuid4().hex[:12]
+        now = time.time()
+        try:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO jobs (job_id, created_at, updated_at, max_attempts, metadata) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (job_id, now, now, max_attempts, json.dumps(metadata or {}))
+                )
+        except sqlite3.Error as e:
+            raise JobStoreError(f"Error creating job {job_id}: {str(e)}")
+
+        self.add_tasks(job_id, items)
+        return job_id
+
+    def add_tasks(self, job_id: str, items: Iterable[JobItem]) -> int:
+        """
+        Add items to a job, skipping keys the job already has.
+
+        Args:
+            job_id: Job identifier.
+            items: Items to add.
+
+        Returns:
+            Number of tasks added.
+
+        Raises:
+            JobStoreError: If the job does not exist or the items cannot be stored.
+        """
+        self._require_job(job_id)
+        now = time.time()
+        rows = []
+        for item in items:
+            key, payload = item if isinstance(item, tuple) else (item, item)
+            rows.append((job_id, str(key), json.dumps(payload), TaskStatus.PENDING.name, now))
+
+        try:
+            with self._conn:
+                before = self._conn.total_changes
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO job_tasks (job_id, task_key, payload, status, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+                added = self._conn.total_changes - before
+                self._touch(job_id)
+        except sqlite3.Error as e:
+            raise JobStoreError(f"Error adding tasks to job {job_id}: {str(e)}")
+
+        return added
+
+    def set_max_attempts(self, job_id: str, max_attempts: int) -> None:
+        """
+        Change the attempt limit of a job, e.g. to retry failed tasks again.
+
+        Args:
+            job_id: Job identifier.
+            max_attempts: New attempt limit.
+
+        Raises:
+            ValueError: If max_attempts is less than 1.
+            JobStoreError: If the job does not exist.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self._require_job(job_id)
+        with self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET max_attempts = ?, updated_at = ? WHERE job_id = ?",
+                (max_attempts, time.time(), job_id)
+            )
+
+    def get_job(self, job_id: str) -> Dict[str, Any]:
+        """
+        Get a job and its task counts.
+
+        Args:
+            job_id: Job identifier.
+
+        Returns:
+            Dictionary with the job's settings, task counts per status and
+            the number of failed tasks that will be retried.
+
+        Raises:
+            JobStoreError: If the job does not exist.
+        """
+        job = self._require_job(job_id)
+        counts = {
+            row["status"]: row["count"]
+            for row in self._conn.execute(
+                "SELECT status, COUNT(*) AS count FROM job_tasks WHERE job_id = ? GROUP BY status",
+                (job_id,)
+            )
+        }
+        retryable = self._conn.execute(
+            "SELECT COUNT(*) FROM job_tasks WHERE job_id = ? AND status = ? AND attempts < ?",
+            (job_id, TaskStatus.FAILED.name, job["max_attempts"])
+        ).fetchone()[0]
+
+        return {
+            "job_id": job_id,
+            "created_at": job["created_at"],
+            "updated_at": job["updated_at"],
+            "max_attempts": job["max_attempts"],
+            "metadata": json.loads(job["metadata"]),
+            "total": sum(counts.values()),
+            "pending": counts.get(TaskStatus.PENDING.name, 0),
+            "running": counts.get(TaskStatus.RUNNING.name, 0),
+            "completed": counts.get(TaskStatus.COMPLETED.name, 0),
+            "failed": counts.get(TaskStatus.FAILED.name, 0),
+            "retryable": retryable,
+        }
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        """
+        Get every job, most recently updated first.
+
+        Returns:
+            List of job dictionaries (see get_job).
+        """
+        job_ids = [
+            row["job_id"]
+            for row in self._conn.execute("SELECT job_id FROM jobs ORDER BY updated_at DESC")
+        ]
+        return [self.get_job(job_id) for job_id in job_ids]
+
+    def delete_job(self, job_id: str) -> bool:
+        """
+        Delete a job and its tasks.
+
+        Args:
+            job_id: Job identifier.
+
+        Returns:
+            True if the job existed.
+        """
+        with self._conn:
+            self._conn.execute("DELETE FROM job_tasks WHERE job_id = ?", (job_id,))
+            deleted = self._conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,)).rowcount
+        return deleted > 0
+
+    def get_tasks(self, job_id: str, status: Optional[TaskStatus] = None) -> List[JobTask]:
+        """
+        Get the tasks of a job in the order they were added.
+
+        Args:
+            job_id: Job identifier.
+            status: Only return tasks with this status.
+
+        Returns:
+            List of tasks.
+        """
+        query = "SELECT * FROM job_tasks WHERE job_id = ?"
+        params: Tuple = (job_id,)
+        if status is not None:
+            query += " AND status = ?"
+            params += (status.name,)
+        return [self._to_task(row) for row in self._conn.execute(query + " ORDER BY seq", params)]
+
+    def runnable_tasks(self, job_id: str) -> List[JobTask]:
+        """
+        Get the tasks that still need to run.
+
+        These are pending tasks and failed tasks with attempts left.
+
+        Args:
+            job_id: Job identifier.
+
+        Returns:
+            List of tasks in the order they were added.
+
+        Raises:
+            JobStoreError: If the job does not exist.
+        """
+        job = self._require_job(job_id)
+        rows = self._conn.execute(
+            "SELECT * FROM job_tasks WHERE job_id = ? AND "
+            "(status = ? OR (status = ? AND attempts < ?)) ORDER BY seq",
+            (job_id, TaskStatus.PENDING.name, TaskStatus.FAILED.name, job["max_attempts"])
+        )
+        return [self._to_task(row) for row in rows]
+
+    def reset_running(self, job_id: str) -> int:
+        """
+        Return tasks left running by a run that died to pending.
+
+        The interrupted attempt still counts towards the attempt limit.
+
+        Args:
+            job_id: Job identifier.
+
+        Returns:
+            Number of tasks reset.
+        """
+        with self._conn:
+            return self._conn.execute(
+                "UPDATE job_tasks SET status = ?, updated_at = ? WHERE job_id = ? AND status = ?",
+                (TaskStatus.PENDING.name, time.time(), job_id, TaskStatus.RUNNING.name)
+            ).rowcount
+
+    def mark_running(self, job_id: str, key: str) -> None:
+        """
+        Record that a task started, counting an attempt.
+
+        Args:
+            job_id: Job identifier.
+            key: Task key.
+        """
+        self._update(job_id, key, "status = ?, attempts = attempts + 1", (TaskStatus.RUNNING.name,))
+
+    def mark_completed(self, job_id: str, key: str, result_location: Optional[str] = None) -> None:
+        """
+        Record that a task completed.
+
+        Args:
+            job_id: Job identifier.
+            key: Task key.
+            result_location: Where the task's result was stored.
+        """
+        self._update(
+            job_id, key, "status = ?, error = NULL, result_location = ?",
+            (TaskStatus.COMPLETED.name, result_location)
+        )
+
+    def mark_failed(self, job_id: str, key: str, error: str) -> None:
+        """
+        Record that a task failed.
+
+        Args:
+            job_id: Job identifier.
+            key: Task key.
+            error: Description of the error.
+        """
+        self._update(job_id, key, "status = ?, error = ?", (TaskStatus.FAILED.name, error))
+
+    def _update(self, job_id: str, key: str, assignments: str, params: Tuple) -> None:
+        """Update one task and the job's modification time."""
+        now = time.time()
+        try:
+            with self._conn:
+                self._conn.execute(
+                    f"UPDATE job_tasks SET {assignments}, updated_at = ? WHERE job_id = ? AND task_key = ?",
+                    params + (now, job_id, key)
+                )
+                self._touch(job_id, now)
+        except sqlite3.Error as e:
+            raise JobStoreError(f"Error updating task {key} of job {job_id}: {str(e)}")
+
+    def _touch(self, job_id: str, now: Optional[float] = None) -> None:
+        """Set the job's modification time."""
+        self._conn.execute(
+            "UPDATE jobs SET updated_at = ? WHERE job_id = ?", (now or time.time(), job_id)
+        )
+
+    def _require_job(self, job_id: str) -> sqlite3.Row:
+        """Get a job row, raising JobStoreError if it does not exist."""
+        row = self._conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            raise JobStoreError(f"Unknown job: {job_id}")
+        return row
+
+    @staticmethod
+    def _to_task(row: sqlite3.Row) -> JobTask:
+        """Convert a job_tasks row to a JobTask."""
+        return JobTask(
+            job_id=row["job_id"],
+            key=row["task_key"],
+            payload=json.loads(row["payload"]),
+            status=TaskStatus[row["status"]],
+            attempts=row["attempts"],
+            error=row["error"],
+            result_location=row["result_location"],
+        )
+
+
+async def run_job(
+    manager: "ParallelManager",
+    store: JobStore,
+    job_id: str,
+    func: Callable[[Any], Any],
+    max_in_flight: Optional[int] = None,
+    retry_delay: float = 0.0,
+    priority: TaskPriority = TaskPriority.NORMAL,
+    progress_callback: Optional[Callable[[JobTask], Any]] = None
+) -> Dict[str, Any]:
+    """
+    Run the unfinished tasks of a job.
+
+    Completed tasks are skipped. Tasks a previous run left running are
+    retried, and failed tasks are retried until they reach the job's
+    max_attempts. ``func`` is called with each task's payload and should
+    store its result itself; its return value, if not None, is recorded
+    as the task's result location.
+
+    Args:
+        manager: Running ParallelManager to submit tasks to.
+        store: Job store holding the job.
+        job_id: Job identifier.
+        func: Function (sync or async) called with a task payload.
+        max_in_flight: Maximum number of submitted tasks at a time
+            (defaults to the manager's worker count).
+        retry_delay: Seconds to wait before retrying failed tasks.
+        priority: Priority of the submitted tasks.
+        progress_callback: Optional callback (sync or async) called with
+            each task after it finishes.
+
+    Returns:
+        The job dictionary (see JobStore.get_job) with ``attempted`` (tasks
+        run by this call), ``skipped`` (tasks already completed) and
+        ``duration`` added.
+
+    Raises:
+        JobStoreError: If the job does not exist.
+    """
+    start_time = time.time()
+    max_in_flight = max_in_flight or manager.max_workers
+
+    interrupted = store.reset_running(job_id)
+    if interrupted:
+        logger.info(f"Job {job_id}: retrying {interrupted} tasks interrupted by a previous run")
+    skipped = store.get_job(job_id)["completed"]
+
+    attempted = 0
+    in_flight: Dict[asyncio.Future, JobTask] = {}
+    tasks = store.runnable_tasks(job_id)
+    while tasks:
+        for job_task in tasks:
+            if len(in_flight) >= max_in_flight:
+                await _wait_for_one(store, in_flight, progress_callback)
+
+            store.mark_running(job_id, job_task.key)
+            task = create_task(
+                func, job_task.payload,
+                name=f"job:{job_id}:{job_task.key}",
+                priority=priority,
+                metadata={"job_id": job_id, "key": job_task.key}
+            )
+            in_flight[await manager.submit(task)] = job_task
+            attempted += 1
+
+        while in_flight:
+            await _wait_for_one(store, in_flight, progress_callback)
+
+        tasks = store.runnable_tasks(job_id)
+        if tasks and retry_delay > 0:
+            await asyncio.sleep(retry_delay)
+
+    summary = store.get_job(job_id)
+    summary.update({
+        "attempted": attempted,
+        "skipped": skipped,
+        "duration": time.time() - start_time,
+    })
+    logger.info(
+        f"Job {job_id}: {summary['completed']} of {summary['total']} tasks completed, "
+        f"{summary['failed']} failed, {skipped} skipped"
+    )
+    return summary
+
+
+async def _wait_for_one(
+    store: JobStore,
+    in_flight: Dict[asyncio.Future, JobTask],
+    progress_callback: Optional[Callable[[JobTask], Any]]
+) -> None:
+    """
+    Wait until at least one in-flight task finishes and record it.
+
+    Args:
+        store: Job store to update.
+        in_flight: Futures of submitted tasks, mapped to their job task.
+        progress_callback: Optional callback called with each finished task.
+    """
+    done, _ = await asyncio.wait(list(in_flight), return_when=asyncio.FIRST_COMPLETED)
+
+    for future in done:
+        job_task = in_flight.pop(future)
+        job_task.attempts += 1
+
+        error = None if future.cancelled() else future.exception()
+        if future.cancelled() or error is not None:
+            job_task.status = TaskStatus.FAILED
+            job_task.error = (str(error) or type(error).__name__) if error is not None else "cancelled"
+            store.mark_failed(job_task.job_id, job_task.key, job_task.error)
+            logger.debug(f"Job {job_task.job_id}: task {job_task.key} failed: {job_task.error}")
+        else:
+            result = future.result()
+            job_task.status = TaskStatus.COMPLETED
+            job_task.error = None
+            job_task.result_location = str(result) if result is not None else None
+            store.mark_completed(job_task.job_id, job_task.key, job_task.result_location)
+
+        if progress_callback is not None:
+            try:
+                outcome = progress_callback(job_task)
+                if inspect.isawaitable(outcome):
+                    await outcome
+            except Exception as e:
+                logger.warning(f"Error in job progress callback: {str(e)}")
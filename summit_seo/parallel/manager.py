@@ -11,10 +11,17 @@ import time
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum, auto
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from typing import (
+    Any, AsyncIterator, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple, Union
+)
 
+from summit_seo.parallel.adaptive import AdaptiveConcurrencyController
+from summit_seo.parallel.events import EventBus, Subscription, TaskEvent
 from summit_seo.parallel.executor import ExecutionStrategy, ParallelExecutor, WorkerType
-from summit_seo.parallel.task import Task, TaskPriority, TaskStatus
+from summit_seo.parallel.fair_queue import default_group_key
+from summit_seo.parallel.profiler import ExecutionProfiler
+from summit_seo.parallel.shared_body import SharedBody
+from summit_seo.parallel.task import Task, TaskPriority, TaskStatus, create_task
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +39,7 @@ class ProcessingStrategy(Enum):
     GRAPH = auto()     # Dependency graph-based processing
     PRIORITY_GRAPH = auto()  # Priority + dependency graph
     WORK_STEALING = auto()  # Work-stealing queue
+    FAIR = auto()  # Deficit round robin across hosts or tenants
 
 
 @dataclass
@@ -51,6 +59,10 @@ class ProcessingStatistics:
     max_concurrent: int = 0
     total_duration: float = 0.0
     work_stealing_transfers: int = 0
+    current_concurrency: int = 0  # Tasks running now
+    target_concurrency: int = 0  # Tasks allowed to run at once
+    deferred: int = 0  # Tasks held back by memory admission
+    shed: int = 0  # Queued tasks dropped above the hard memory limit
 
 
 class ParallelManager:
@@ -60,6 +72,13 @@ class ParallelManager:
     This class provides a high-level interface for parallel processing
     in the Summit SEO framework. It manages task submission, execution,
     and result collection.
+    
+    With the BATCHED strategy, submitted tasks are collected into batches
+    that are flushed to the executor by whichever comes first: the batch
+    reaching batch_size, its oldest task waiting batch_linger seconds, or
+    an explicit flush(). Items submitted with submit_item are batched the
+    same way, and each batch of items runs as one call of batch_func (one
+    pool submission, one bulk insert) instead of one task per item.
     """
     
     def __init__(
@@ -69,7 +88,23 @@ class ParallelManager:
         worker_type: WorkerType = WorkerType.ASYNCIO,
         task_timeout: Optional[float] = None,
         batch_size: int = 10,
-        task_callback: Optional[Callable] = None
+        batch_linger: Optional[float] = 0.1,
+        batch_func: Optional[Callable[[List[Any]], Any]] = None,
+        task_callback: Optional[Callable] = None,
+        worker_initializer: Optional[Callable] = None,
+        worker_initargs: Tuple = (),
+        shared_memory_threshold: Optional[int] = 64 * 1024,
+        adaptive_concurrency: bool = False,
+        concurrency_controller: Optional[AdaptiveConcurrencyController] = None,
+        memory_limiter: Optional[Any] = None,
+        group_key: Callable[[Task], Hashable] = default_group_key,
+        group_concurrency: Optional[int] = None,
+        group_limits: Optional[Dict[Hashable, int]] = None,
+        group_weights: Optional[Dict[Hashable, float]] = None,
+        max_pending: Optional[int] = None,
+        event_bus: Optional[EventBus] = None,
+        process_pool: Optional[Any] = None,
+        profiler: Optional[ExecutionProfiler] = None
     ):
         """
         Initialize the parallel manager.
@@ -79,16 +114,63 @@ class ParallelManager:
             strategy: Strategy to use for task processing.
             worker_type: Type of workers to use.
             task_timeout: Default timeout for tasks in seconds.
-            batch_size: Batch size for BATCHED strategy.
+            batch_size: Batch size for BATCHED strategy and submit_item.
+            batch_linger: Maximum seconds a task or item waits in a partly
+                filled batch before the batch is flushed. None waits for a
+                full batch or an explicit flush().
+            batch_func: Function called once per batch of items submitted
+                with submit_item, with the list of items, returning one
+                result per item in the same order. Regular functions run in
+                the THREAD or PROCESS pool as a single call.
             task_callback: Callback function for task status changes.
                 The callback signature should be:
                 callback(task_id, status, result=None, error=None)
+                It is called from the event bus dispatcher, shortly after
+                the change; see event_bus for batched subscribers.
+            worker_initializer: Function run once in each THREAD or PROCESS
+                worker when it starts, e.g. summit_seo.parallel.warm_up_worker.
+            worker_initargs: Arguments for worker_initializer.
+            shared_memory_threshold: Minimum length of a str or bytes task
+                argument that PROCESS workers receive through shared memory.
+                None disables shared memory transfer.
+            adaptive_concurrency: Adjust the number of concurrently running
+                tasks between 1 and max_workers with an AIMD controller,
+                based on task latency, error and timeout rates and memory
+                pressure. max_workers then acts as the ceiling.
+            concurrency_controller: Custom controller; implies
+                adaptive_concurrency. Its max_concurrency is capped at
+                max_workers.
+            memory_limiter: MemoryLimiter that admits tasks against its
+                memory budget (see Task.memory_cost); the default adaptive
+                controller also follows its throttle factor.
+            group_key: FAIR strategy: function returning the group of a
+                task. The default uses the task's 'group' or 'tenant'
+                metadata, or the host of its 'url' metadata.
+            group_concurrency: FAIR strategy: maximum running tasks per group.
+            group_limits: FAIR strategy: per-group overrides of
+                group_concurrency.
+            group_weights: FAIR strategy: per-group share of dispatches
+                relative to other groups (default 1).
+            max_pending: Maximum number of queued tasks waiting to start;
+                submit waits for room once it is reached. None means
+                unbounded. Pass lazy=True to create_task so waiting tasks
+                hold no coroutine objects.
+            event_bus: Bus the executor publishes task status changes to
+                (a private bus is created if not given).
+            process_pool: WarmWorkerPool to run callable tasks in; implies
+                PROCESS workers and survives stop(), so consecutive runs
+                reuse its warm workers (see get_warm_pool).
+            profiler: ExecutionProfiler recording per-task queue wait, run
+                time, worker and dependencies; see ExecutionProfiler.report
+                and ExecutionProfiler.write_chrome_trace.
         """
         self.max_workers = max_workers
         self.strategy = strategy
-        self.worker_type = worker_type
+        self.worker_type = WorkerType.PROCESS if process_pool is not None else worker_type
         self.task_timeout = task_timeout
         self.batch_size = batch_size
+        self.batch_linger = batch_linger
+        self.batch_func = batch_func
         self.task_callback = task_callback
         
         # Map strategy to executor strategy
@@ -99,6 +181,7 @@ class ParallelManager:
             ProcessingStrategy.GRAPH: ExecutionStrategy.DEPENDENCY,
             ProcessingStrategy.PRIORITY_GRAPH: ExecutionStrategy.DEPENDENCY,  # We'll handle priority in submit
             ProcessingStrategy.WORK_STEALING: ExecutionStrategy.WORK_STEALING,
+            ProcessingStrategy.FAIR: ExecutionStrategy.FAIR,
         }
         
         # Create the executor
@@ -106,14 +189,47 @@ class ParallelManager:
             max_workers=max_workers,
             execution_strategy=strategy_map[strategy],
             worker_type=worker_type,
-            task_timeout=task_timeout
+            task_timeout=task_timeout,
+            worker_initializer=worker_initializer,
+            worker_initargs=worker_initargs,
+            shared_memory_threshold=shared_memory_threshold,
+            memory_limiter=memory_limiter,
+            group_key=group_key,
+            group_concurrency=group_concurrency,
+            group_limits=group_limits,
+            group_weights=group_weights,
+            max_pending=max_pending,
+            event_bus=event_bus,
+            process_pool=process_pool,
+            profiler=profiler
         )
         
+        # Adaptive concurrency
+        if concurrency_controller is None and adaptive_concurrency:
+            concurrency_controller = AdaptiveConcurrencyController(
+                max_concurrency=self._executor.max_workers,
+                memory_limiter=memory_limiter
+            )
+        if concurrency_controller is not None:
+            concurrency_controller.set_max_concurrency(
+                min(concurrency_controller.max_concurrency, self._executor.max_workers)
+            )
+        self._concurrency_controller = concurrency_controller
+        self._adapt_task: Optional[asyncio.Task] = None
+        
         # Task management
-        self._batches: List[List[Task]] = []
-        self._current_batch: List[Task] = []
-        self._batch_results: List[List[Any]] = []
-        self._task_start_times: Dict[str, float] = {}
+        self._current_batch: List[Tuple[Task, asyncio.Future]] = []
+        self._current_items: List[Tuple[Any, asyncio.Future]] = []
+        self._linger_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_tasks: Set[asyncio.Task] = set()
+        self._batch_stats = {
+            "batches": 0,
+            "batched_entries": 0,
+            "flushed_by_size": 0,
+            "flushed_by_linger": 0,
+            "flushed_explicitly": 0,
+        }
+        self._callback_subscription: Optional[Subscription] = None
         
         # Control flags
         self._running = False
@@ -131,7 +247,13 @@ class ParallelManager:
         self._session_start_time = time.time()
         
         # Start the executor
-        await self._executor.start(task_callback=self._handle_task_callback)
+        if self.task_callback is not None and self._callback_subscription is None:
+            self._callback_subscription = self.event_bus.subscribe(self._handle_task_events)
+        await self._executor.start()
+        
+        if self._concurrency_controller is not None:
+            self._executor.set_concurrency_limit(self._concurrency_controller.target)
+            self._adapt_task = asyncio.create_task(self._adapt_concurrency())
         
         logger.info(f"Parallel manager started with strategy: {self.strategy.name}")
     
@@ -143,8 +265,20 @@ class ParallelManager:
         
         logger.info("Stopping parallel manager...")
         
+        if self._adapt_task is not None:
+            self._adapt_task.cancel()
+            await asyncio.gather(self._adapt_task, return_exceptions=True)
+            self._adapt_task = None
+        
+        # Queued tasks never start once the executor stops, so batches
+        # that were not flushed yet are dropped
+        self._cancel_batches()
+        
         # Stop the executor
         await self._executor.stop()
+        if self._callback_subscription is not None:
+            self._callback_subscription.cancel()
+            self._callback_subscription = None
         
         self._running = False
         logger.info("Parallel manager stopped")
@@ -191,35 +325,12 @@ class ParallelManager:
         if self._paused:
             logger.warning("Parallel manager is paused, task will be queued but not executed")
         
-        # Record task start time for statistics
-        self._task_start_times[task.id] = time.time()
-        
         # Handle batched strategy
         if self.strategy == ProcessingStrategy.BATCHED:
-            self._current_batch.append(task)
-            
-            # If batch is full, submit it
-            if len(self._current_batch) >= self.batch_size:
-                batch = self._current_batch
-                self._current_batch = []
-                self._batches.append(batch)
-                
-                # Create and return a future for this task
-                future = asyncio.Future()
-                
-                # Submit the batch
-                batch_future = asyncio.create_task(self._process_batch(batch))
-                
-                # When batch is done, set result in individual futures
-                batch_future.add_done_callback(
-                    lambda f: self._handle_batch_completion(f, batch, [future])
-                )
-                
-                return future
-            else:
-                # Batch not full yet, return a pending future
-                future = asyncio.Future()
-                return future
+            future = asyncio.get_running_loop().create_future()
+            self._current_batch.append((task, future))
+            await self._batch_added(len(self._current_batch))
+            return future
         else:
             # For PRIORITY_GRAPH strategy, handle priorities more carefully
             if self.strategy == ProcessingStrategy.PRIORITY_GRAPH:
@@ -230,6 +341,43 @@ class ParallelManager:
             # Submit directly to executor
             return await self._executor.submit(task)
     
+    async def submit_item(self, item: Any) -> asyncio.Future:
+        """
+        Submit an item for batch_func.
+        
+        Items are collected into batches flushed like BATCHED tasks (see
+        batch_size and batch_linger), and each batch is run as one call of
+        batch_func.
+        
+        Args:
+            item: The item to process.
+            
+        Returns:
+            A future that resolves to the item's entry in the result of
+            batch_func, or fails with its exception.
+        """
+        if not self._running:
+            raise RuntimeError("Parallel manager is not running")
+        if self.batch_func is None:
+            raise RuntimeError("submit_item requires a batch_func")
+        
+        future = asyncio.get_running_loop().create_future()
+        self._current_items.append((item, future))
+        await self._batch_added(len(self._current_items))
+        return future
+    
+    async def flush(self) -> int:
+        """
+        Flush partly filled batches to the executor now.
+        
+        Returns:
+            The number of tasks and items flushed.
+        """
+        if not self._running:
+            raise RuntimeError("Parallel manager is not running")
+        
+        return await self._flush_batches("flushed_explicitly")
+    
     async def submit_many(self, tasks: List[Task]) -> List[asyncio.Future]:
         """
         Submit multiple tasks for execution.
@@ -277,6 +425,90 @@ class ParallelManager:
             for result in results
         ]
     
+    async def as_completed(
+        self,
+        tasks: Iterable[Task],
+        ordered: bool = False,
+        buffer_size: Optional[int] = None,
+        return_exceptions: bool = True
+    ) -> AsyncIterator[Tuple[Task, Any]]:
+        """
+        Run tasks and yield their results as they become available.
+        
+        At most ``buffer_size`` tasks are submitted but not yet consumed at
+        any time; the next task is taken from ``tasks`` (which may be a
+        generator) only after a result has been yielded, and yielded tasks
+        are dropped from the executor. Memory use therefore grows with the
+        buffer size, not with the number of tasks.
+        
+        Example:
+            async for task, result in manager.as_completed(tasks):
+                await writer.write(task.metadata['url'], result)
+        
+        Args:
+            tasks: The tasks to execute.
+            ordered: Yield results in task order. A slow task then holds
+                back the results after it, up to the buffer size.
+            buffer_size: Maximum number of submitted tasks whose results
+                have not been consumed (defaults to twice the worker count).
+            return_exceptions: Yield exceptions of failed tasks as results
+                instead of raising them.
+            
+        Yields:
+            Tuples of (task, result), where result is the exception for
+            failed tasks if return_exceptions is set.
+            
+        Raises:
+            ValueError: If buffer_size is less than 1.
+        """
+        if buffer_size is None:
+            buffer_size = 2 * self._executor.max_workers
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1")
+        
+        task_iter = iter(tasks)
+        pending: Dict[asyncio.Future, Task] = {}  # In submission order
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < buffer_size:
+                    task = next(task_iter, None)
+                    if task is None:
+                        exhausted = True
+                    else:
+                        pending[await self.submit(task)] = task
+                
+                if not pending:
+                    return
+                
+                # Results of a partly filled batch would wait for its linger
+                if self._current_batch:
+                    await self.flush()
+                
+                if ordered:
+                    head = next(iter(pending))
+                    await asyncio.wait([head])
+                    done = [head]
+                else:
+                    done, _ = await asyncio.wait(list(pending), return_when=asyncio.FIRST_COMPLETED)
+                
+                for future in done:
+                    task = pending.pop(future)
+                    self._executor.forget_task(task.id)
+                    
+                    error = asyncio.CancelledError() if future.cancelled() else future.exception()
+                    if error is None:
+                        yield task, future.result()
+                    elif return_exceptions:
+                        yield task, error
+                    else:
+                        raise error
+        finally:
+            # The consumer stopped early; tasks that have not started are dropped
+            for future, task in pending.items():
+                if not future.done():
+                    await self.cancel_task(task.id)
+    
     async def cancel_task(self, task_id: str) -> bool:
         """
         Cancel a task if it hasn't started executing yet.
@@ -290,8 +522,55 @@ class ParallelManager:
         if not self._running:
             raise RuntimeError("Parallel manager is not running")
         
+        for i, (task, future) in enumerate(self._current_batch):
+            if task.id == task_id:
+                del self._current_batch[i]
+                task.discard_coro()
+                future.cancel()
+                return True
+        
         return await self._executor.cancel_task(task_id)
     
+    async def reprioritize_task(self, task_id: str, priority: TaskPriority) -> bool:
+        """
+        Change the priority of a task that hasn't started executing yet.
+        
+        Args:
+            task_id: The ID of the task.
+            priority: The new priority.
+            
+        Returns:
+            True if the task was updated, False otherwise.
+        """
+        if not self._running:
+            raise RuntimeError("Parallel manager is not running")
+        
+        return await self._executor.reprioritize_task(task_id, priority)
+    
+    @property
+    def event_bus(self) -> EventBus:
+        """Get the bus task status changes are published to."""
+        return self._executor.event_bus
+    
+    @property
+    def profiler(self) -> Optional[ExecutionProfiler]:
+        """Get the profiler recording task timings, if any."""
+        return self._executor.profiler
+    
+    def share_body(self, body: Union[str, bytes], refs: int = 1) -> SharedBody:
+        """
+        Place a page body in shared memory for PROCESS workers.
+        
+        Args:
+            body: Page body as str or bytes.
+            refs: Number of tasks that will receive the handle; the segment
+                is freed once all of them have finished.
+            
+        Returns:
+            Handle to use as a task argument in place of the body.
+        """
+        return self._executor.share_body(body, refs)
+    
     def get_statistics(self) -> ProcessingStatistics:
         """
         Get statistics about parallel processing.
@@ -315,7 +594,11 @@ class ParallelManager:
             timed_out=executor_stats["tasks_timed_out"],
             max_concurrent=executor_stats["max_concurrent_tasks"],
             total_duration=time.time() - self._session_start_time,
-            work_stealing_transfers=executor_stats.get("work_stealing_transfers", 0)
+            work_stealing_transfers=executor_stats.get("work_stealing_transfers", 0),
+            current_concurrency=executor_stats["current_running"],
+            target_concurrency=executor_stats["concurrency_limit"],
+            deferred=executor_stats.get("tasks_deferred", 0),
+            shed=executor_stats.get("tasks_shed", 0)
         )
         
         # Calculate average duration if any tasks completed
@@ -324,6 +607,46 @@ class ParallelManager:
         
         return stats
     
+    def get_concurrency_statistics(self) -> Optional[Dict[str, Any]]:
+        """
+        Get statistics about the adaptive concurrency controller.
+        
+        Returns:
+            Dictionary with statistics, or None if adaptive concurrency is off.
+        """
+        if self._concurrency_controller is None:
+            return None
+        return self._concurrency_controller.get_statistics()
+    
+    def get_batch_statistics(self) -> Dict[str, Any]:
+        """
+        Get statistics about batch flushing.
+        
+        Returns:
+            Dictionary with the number of flushed batches, the entries they
+            held, what triggered the flushes and the entries still waiting.
+        """
+        batches = self._batch_stats["batches"]
+        return {
+            **self._batch_stats,
+            "avg_batch_size": self._batch_stats["batched_entries"] / batches if batches else 0.0,
+            "waiting": len(self._current_batch) + len(self._current_items),
+        }
+    
+    async def _adapt_concurrency(self):
+        """Periodically apply the controller's target to the executor."""
+        controller = self._concurrency_controller
+        while True:
+            await asyncio.sleep(controller.interval)
+            if self._paused:
+                continue
+            
+            queued = self._executor.get_statistics()["current_queue_size"]
+            target = controller.update(self.get_statistics(), queued=queued)
+            if target != self._executor.concurrency_limit:
+                logger.debug(f"Adjusting concurrency to {target} ({controller.get_statistics()['last_reason']})")
+                self._executor.set_concurrency_limit(target)
+    
     async def wait_for_tasks(self, task_ids: List[str], timeout: Optional[float] = None) -> Dict[str, Any]:
         """
         Wait for specific tasks to complete.
@@ -353,12 +676,10 @@ class ParallelManager:
         if not self._running:
             raise RuntimeError("Parallel manager is not running")
         
-        # For batched strategy, flush any pending batch
-        if self.strategy == ProcessingStrategy.BATCHED and self._current_batch:
-            batch = self._current_batch
-            self._current_batch = []
-            self._batches.append(batch)
-            await self._process_batch(batch)
+        # Flush partly filled batches and wait for flushes in progress
+        await self._flush_batches("flushed_explicitly")
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
         
         return await self._executor.wait_all(timeout)
     
@@ -376,78 +697,170 @@ class ParallelManager:
         
         return await self._executor.get_running_task_ids()
     
-    async def _process_batch(self, batch: List[Task]) -> List[Any]:
+    async def _batch_added(self, size: int):
         """
-        Process a batch of tasks.
+        Flush batches once one is full, or start the linger timer.
         
         Args:
-            batch: The batch of tasks to process.
+            size: Size of the batch an entry was just added to.
+        """
+        if size >= self.batch_size:
+            await self._flush_batches("flushed_by_size")
+        elif self._linger_handle is None and self.batch_linger is not None:
+            self._linger_handle = asyncio.get_running_loop().call_later(
+                self.batch_linger, self._linger_expired
+            )
+    
+    def _linger_expired(self):
+        """Flush batches whose oldest entry has waited batch_linger seconds."""
+        self._linger_handle = None
+        flush = asyncio.create_task(self._flush_batches("flushed_by_linger"))
+        self._flush_tasks.add(flush)
+        flush.add_done_callback(self._flush_tasks.discard)
+    
+    async def _flush_batches(self, trigger: str) -> int:
+        """
+        Submit the waiting tasks and items to the executor.
+        
+        Args:
+            trigger: Statistics key of what caused the flush.
             
         Returns:
-            A list of results from the tasks.
+            The number of tasks and items flushed.
         """
-        # Submit all tasks in the batch
-        futures = []
-        for task in batch:
-            future = await self._executor.submit(task)
-            futures.append(future)
+        if self._linger_handle is not None:
+            self._linger_handle.cancel()
+            self._linger_handle = None
         
-        # Wait for all tasks to complete
-        results = await asyncio.gather(*futures, return_exceptions=True)
+        batch, self._current_batch = self._current_batch, []
+        items, self._current_items = self._current_items, []
+        flushed = len(batch) + len(items)
+        if not flushed:
+            return 0
         
-        # Store batch results
-        self._batch_results.append(results)
+        self._batch_stats[trigger] += 1
+        self._batch_stats["batches"] += 1
+        self._batch_stats["batched_entries"] += flushed
         
-        return results
+        if batch:
+            await self._process_batch(batch)
+        if items:
+            await self._process_item_batch(items)
+        return flushed
     
-    def _handle_batch_completion(
-        self, batch_future, batch: List[Task], task_futures: List[asyncio.Future]
-    ):
+    async def _process_batch(self, batch: List[Tuple[Task, asyncio.Future]]):
+        """
+        Submit a batch of tasks to the executor.
+        
+        Args:
+            batch: The tasks with the futures returned by submit.
+        """
+        for i, (task, future) in enumerate(batch):
+            if future.done():
+                # Cancelled by the caller before the flush
+                task.discard_coro()
+                continue
+            try:
+                executor_future = await self._executor.submit(task)
+            except Exception as e:
+                # The executor stopped during the flush
+                for task, future in batch[i:]:
+                    task.discard_coro()
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            executor_future.add_done_callback(
+                lambda f, future=future: _copy_future_state(f, future)
+            )
+    
+    async def _process_item_batch(self, items: List[Tuple[Any, asyncio.Future]]):
         """
-        Handle completion of a batch of tasks.
+        Submit a batch of items to the executor as one call of batch_func.
         
         Args:
-            batch_future: The future for the batch processing.
-            batch: The batch of tasks.
-            task_futures: The futures for individual tasks.
+            items: The items with the futures returned by submit_item.
         """
+        items = [(item, future) for item, future in items if not future.done()]
+        if not items:
+            return
+        
+        futures = [future for _, future in items]
+        task = create_task(
+            self.batch_func, [item for item, _ in items],
+            name=f"Batch-{self._batch_stats['batches']}"
+        )
         try:
-            # Get batch results
-            batch_results = batch_future.result()
-            
-            # Set results in individual futures
-            for task_future, result in zip(task_futures, batch_results):
-                if isinstance(result, Exception):
-                    task_future.set_exception(result)
-                else:
-                    task_future.set_result(result)
+            batch_future = await self._executor.submit(task)
         except Exception as e:
-            # Set exception in all futures
-            for task_future in task_futures:
-                if not task_future.done():
-                    task_future.set_exception(e)
+            task.discard_coro()
+            batch_future = asyncio.get_running_loop().create_future()
+            batch_future.set_exception(e)
+        batch_future.add_done_callback(
+            lambda f: self._handle_batch_completion(f, futures)
+        )
     
-    async def _handle_task_callback(
-        self, task_id: str, status: TaskStatus, result=None, error=None
-    ):
+    def _handle_batch_completion(self, batch_future: asyncio.Future, futures: List[asyncio.Future]):
         """
-        Handle task status changes.
+        Distribute the result of a batch_func call to the item futures.
         
         Args:
-            task_id: The ID of the task.
-            status: The new status of the task.
-            result: The result of the task, if completed.
-            error: The error that occurred, if failed.
-        """
-        # Update task timing statistics
-        if status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]:
-            if task_id in self._task_start_times:
-                start_time = self._task_start_times.pop(task_id)
-                duration = time.time() - start_time
-                logger.debug(f"Task {task_id} completed in {duration:.2f}s with status {status.name}")
-        
-        # Call user-provided callback if available
-        if self.task_callback:
-            await asyncio.create_task(
-                self.task_callback(task_id, status, result, error)
-            ) 
\ No newline at end of file
+            batch_future: The future of the batch_func call.
+            futures: The futures of the batch's items, in item order.
+        """
+        if batch_future.cancelled():
+            for future in futures:
+                future.cancel()
+            return
+        
+        error = batch_future.exception()
+        results: List[Any] = []
+        if error is None:
+            results = list(batch_future.result())
+            if len(results) != len(futures):
+                error = ValueError(
+                    f"batch_func returned {len(results)} results for {len(futures)} items"
+                )
+        
+        for i, future in enumerate(futures):
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(results[i])
+    
+    def _cancel_batches(self):
+        """Cancel the tasks and items of batches that were not flushed."""
+        if self._linger_handle is not None:
+            self._linger_handle.cancel()
+            self._linger_handle = None
+        
+        for task, future in self._current_batch:
+            task.discard_coro()
+            future.cancel()
+        for _, future in self._current_items:
+            future.cancel()
+        self._current_batch = []
+        self._current_items = []
+    
+    async def _handle_task_events(self, events: List[TaskEvent]):
+        """
+        Pass a batch of task status changes to the user-provided callback.
+        
+        Args:
+            events: The events, in the order they happened.
+        """
+        for event in events:
+            await self.task_callback(event.task_id, event.status, event.result, event.error)
+
+
+def _copy_future_state(source: asyncio.Future, target: asyncio.Future):
+    """Resolve target with the outcome of source unless it is already done."""
+    if target.done():
+        return
+    if source.cancelled():
+        target.cancel()
+    elif source.exception() is not None:
+        target.set_exception(source.exception())
+    else:
+        target.set_result(source.result())
@@ -0,0 +1,357 @@
+"""
+Pipeline Module for Summit SEO
+
+This module provides a staged pipeline on top of ParallelManager. Each
+stage (for example collect -> process -> analyze -> report) has its own
+bounded input queue and its own worker pool, so different items are in
+different stages at the same time: URL N+1 is being fetched while URL N is
+analyzed, and network time overlaps with CPU time instead of adding up.
+
+    pipeline = Pipeline([
+        PipelineStage("collect", fetch_page, workers=8),
+        PipelineStage("analyze", analyze_page, workers=4, worker_type=WorkerType.PROCESS),
+        PipelineStage("report", write_report, workers=1, worker_type=WorkerType.THREAD),
+    ])
+    async with pipeline:
+        results = await pipeline.run(urls)
+
+ASYNCIO stages run coroutine functions on the event loop; THREAD and
+PROCESS stages run regular functions in their pool (picklable for
+PROCESS). A full queue makes the stage before it wait, so memory use is
+bounded no matter how many items are submitted.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from summit_seo.parallel.executor import WorkerType
+from summit_seo.parallel.manager import ParallelManager
+from summit_seo.parallel.task import create_task
+
+logger = logging.getLogger(__name__)
+
+
+class PipelineStageError(Exception):
+    """Exception raised when an item fails in a pipeline stage."""
+
+    def __init__(self, stage: str, error: BaseException):
+        """
+        Initialize the error.
+
+        Args:
+            stage: Name of the stage that failed.
+            error: The exception raised by the stage.
+        """
+        self.stage = stage
+        self.error = error
+        super().__init__(f"Stage '{stage}' failed: {error}")
+
+
+class PipelineStage:
+    """Configuration of one pipeline stage."""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable,
+        workers: int = 1,
+        worker_type: WorkerType = WorkerType.ASYNCIO,
+        queue_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        worker_initializer: Optional[Callable] = None,
+        worker_initargs: Tuple = ()
+    ):
+        """
+        Initialize the stage.
+
+        Args:
+            name: Unique name of the stage.
+            func: Function called with the output of the previous stage (or
+                the submitted item for the first stage). A coroutine function
+                for ASYNCIO stages, a regular function otherwise.
+            workers: Number of items the stage works on at once.
+            worker_type: Where the stage runs its function.
+            queue_size: Capacity of the stage's input queue (defaults to
+                twice the number of workers).
+            timeout: Timeout per item in seconds.
+            worker_initializer: Function run once in each THREAD or PROCESS
+                worker of the stage.
+            worker_initargs: Arguments for worker_initializer.
+
+        Raises:
+            ValueError: If workers or queue_size is less than 1.
+        """
+        if workers < 1:
+            raise ValueError("A stage needs at least one worker")
+        if queue_size is not None and queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+
+        self.name = name
+        self.func = func
+        self.workers = workers
+        self.worker_type = worker_type
+        self.queue_size = queue_size or 2 * workers
+        self.timeout = timeout
+        self.worker_initializer = worker_initializer
+        self.worker_initargs = tuple(worker_initargs)
+
+
+class _StageState:
+    """Runtime state of a started stage."""
+
+    def __init__(self, stage: PipelineStage):
+        self.stage = stage
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=stage.queue_size)
+        self.manager = ParallelManager(
+            max_workers=stage.workers,
+            worker_type=stage.worker_type,
+            task_timeout=stage.timeout,
+            worker_initializer=stage.worker_initializer,
+            worker_initargs=stage.worker_initargs
+        )
+        self.workers: List[asyncio.Task] = []
+        self.processed = 0
+        self.failed = 0
+        self.in_flight = 0
+        self.busy_time = 0.0
+        self.blocked_time = 0.0  # Time spent waiting for the next stage's queue
+
+
+class Pipeline:
+    """
+    Runs items through a chain of stages, each with its own worker pool.
+
+    Every submitted item gets a future that resolves to the output of the
+    last stage, or fails with PipelineStageError naming the stage where the
+    item failed. Items may finish out of submission order.
+    """
+
+    def __init__(self, stages: Sequence[PipelineStage]):
+        """
+        Initialize the pipeline.
+
+        Args:
+            stages: Stages in execution order.
+
+        Raises:
+            ValueError: If there are no stages or stage names repeat.
+        """
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        names = [stage.name for stage in stages]
+        if len(set(names)) != len(names):
+            raise ValueError("Stage names must be unique")
+
+        self.stages = list(stages)
+        self._states: List[_StageState] = []
+        self._pending = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._running = False
+        self._start_time = 0.0
+
+    @property
+    def running(self) -> bool:
+        """Check if the pipeline is running."""
+        return self._running
+
+    async def __aenter__(self) -> "Pipeline":
+        """Start the pipeline."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Stop the pipeline."""
+        await self.stop()
+
+    async def start(self):
+        """Start every stage's worker pool."""
+        if self._running:
+            logger.warning("Pipeline is already running")
+            return
+
+        self._states = [_StageState(stage) for stage in self.stages]
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._pending = 0
+
+        for index, state in enumerate(self._states):
+            await state.manager.start()
+            state.workers = [
+                asyncio.create_task(self._stage_worker(index))
+                for _ in range(state.stage.workers)
+            ]
+
+        self._running = True
+        self._start_time = time.perf_counter()
+        logger.info(f"Pipeline started with stages: {' -> '.join(s.name for s in self.stages)}")
+
+    async def stop(self):
+        """
+        Stop the pipeline.
+
+        Items still in the pipeline are cancelled; call join() first to let
+        them finish. Calls already running in a stage's pool still run to
+        completion before the pool shuts down.
+        """
+        if not self._running:
+            logger.warning("Pipeline is not running")
+            return
+
+        self._running = False
+        for state in self._states:
+            for worker in state.workers:
+                worker.cancel()
+            await asyncio.gather(*state.workers, return_exceptions=True)
+            state.workers.clear()
+
+            # Cancel items that were still waiting in the queue
+            while not state.queue.empty():
+                _, future = state.queue.get_nowait()
+                if not future.done():
+                    future.cancel()
+
+            await state.manager.stop()
+
+        self._pending = 0
+        self._idle.set()
+        logger.info("Pipeline stopped")
+
+    async def submit(self, item: Any) -> asyncio.Future:
+        """
+        Submit an item to the first stage.
+
+        Waits while the first stage's queue is full.
+
+        Args:
+            item: The item, e.g. a URL.
+
+        Returns:
+            A future that resolves to the output of the last stage.
+        """
+        if not self._running:
+            raise RuntimeError("Pipeline is not running")
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending += 1
+        self._idle.clear()
+        future.add_done_callback(self._item_done)
+
+        await self._states[0].queue.put((item, future))
+        return future
+
+    async def run(self, items: Iterable[Any]) -> List[Any]:
+        """
+        Run items through the pipeline and wait for all of them.
+
+        Args:
+            items: The items to process.
+
+        Returns:
+            Outputs of the last stage in submission order; items that failed
+            are represented by their PipelineStageError.
+        """
+        futures = [await self.submit(item) for item in items]
+        return list(await asyncio.gather(*futures, return_exceptions=True))
+
+    async def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every submitted item has finished.
+
+        Args:
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            True if the pipeline is idle, False if the timeout expired.
+        """
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def get_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get throughput and backlog statistics per stage.
+
+        Returns:
+            Dictionary mapping stage names to their statistics
+        """
+        elapsed = time.perf_counter() - self._start_time if self._start_time else 0.0
+        stats = {}
+        for state in self._states:
+            finished = state.processed + state.failed
+            stats[state.stage.name] = {
+                "worker_type": state.stage.worker_type.name,
+                "workers": state.stage.workers,
+                "processed": state.processed,
+                "failed": state.failed,
+                "in_flight": state.in_flight,
+                "backlog": state.queue.qsize(),
+                "queue_size": state.stage.queue_size,
+                "throughput": state.processed / elapsed if elapsed > 0 else 0.0,
+                "avg_time": state.busy_time / finished if finished else 0.0,
+                "utilization": (
+                    state.busy_time / (elapsed * state.stage.workers) if elapsed > 0 else 0.0
+                ),
+                "blocked_time": state.blocked_time,
+            }
+        return stats
+
+    def _item_done(self, future: asyncio.Future) -> None:
+        """Track finished items for join()."""
+        self._pending -= 1
+        if self._pending <= 0:
+            self._pending = 0
+            self._idle.set()
+
+    async def _stage_worker(self, index: int):
+        """
+        Take items from a stage's queue, run the stage and pass results on.
+
+        Args:
+            index: Index of the stage.
+        """
+        state = self._states[index]
+        stage = state.stage
+        next_state = self._states[index + 1] if index + 1 < len(self._states) else None
+
+        while True:
+            item, future = await state.queue.get()
+            try:
+                if future.done():
+                    # Cancelled by the caller
+                    continue
+
+                state.in_flight += 1
+                start_time = time.perf_counter()
+                try:
+                    result = await state.manager.submit_and_await(
+                        create_task(stage.func, item, name=stage.name)
+                    )
+                except Exception as e:
+                    state.failed += 1
+                    if not future.done():
+                        future.set_exception(PipelineStageError(stage.name, e))
+                    continue
+                finally:
+                    state.in_flight -= 1
+                    state.busy_time += time.perf_counter() - start_time
+
+                state.processed += 1
+                if next_state is None:
+                    if not future.done():
+                        future.set_result(result)
+                else:
+                    wait_start = time.perf_counter()
+                    await next_state.queue.put((result, future))
+                    state.blocked_time += time.perf_counter() - wait_start
+            except asyncio.CancelledError:
+                # The pipeline is stopping; the item will not finish
+                if not future.done():
+                    future.cancel()
+                raise
+            finally:
+                state.queue.task_done()
@@ -0,0 +1,203 @@
+"""
+Indexed Priority Queue Module for Summit SEO
+
+This module provides a binary heap keyed by task ID, so queued tasks can be
+removed or reprioritized without rebuilding the queue.
+"""
+
+import heapq
+import itertools
+from typing import Dict, Generic, Hashable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+# Entry layout: [priority, order, unique id, key, item, removed]. The unique
+# id keeps comparisons from reaching key and item when a reprioritized entry
+# and its tombstone share priority and order.
+_PRIORITY, _ORDER, _UID, _KEY, _ITEM, _REMOVED = range(6)
+
+
+class IndexedPriorityQueue(Generic[T]):
+    """
+    Min-heap of items addressable by key.
+
+    Lower priority values are popped first; items with equal priority are
+    popped in insertion order. Removing or reprioritizing an item marks its
+    heap entry as a tombstone instead of searching the heap, and tombstones
+    are discarded when they reach the top. The heap is rebuilt once
+    tombstones outnumber live entries, so memory stays proportional to the
+    number of queued items.
+
+    push, pop, remove, reprioritize and peek are all O(log n) amortized.
+    """
+
+    def __init__(self):
+        """Initialize an empty queue."""
+        self._heap: List[list] = []
+        self._entries: Dict[Hashable, list] = {}
+        self._sequence = itertools.count()
+        self._tombstones = 0
+
+    def __len__(self) -> int:
+        """Get the number of queued items."""
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        """Check whether any items are queued."""
+        return bool(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check whether an item with this key is queued."""
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[Tuple[Hashable, T]]:
+        """Iterate over queued (key, item) pairs in no particular order."""
+        return ((entry[_KEY], entry[_ITEM]) for entry in self._entries.values())
+
+    def push(self, key: Hashable, item: T, priority: float) -> None:
+        """
+        Add an item to the queue.
+
+        Args:
+            key: Unique key of the item.
+            item: The item to queue.
+            priority: Priority value (lower is popped first).
+
+        Raises:
+            KeyError: If an item with this key is already queued.
+        """
+        if key in self._entries:
+            raise KeyError(f"Key {key!r} is already queued")
+
+        sequence = next(self._sequence)
+        entry = [priority, sequence, sequence, key, item, False]
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+
+    def pop(self) -> Tuple[Hashable, T]:
+        """
+        Remove and return the item with the lowest priority value.
+
+        Returns:
+            Tuple of (key, item).
+
+        Raises:
+            IndexError: If the queue is empty.
+        """
+        self._discard_tombstones()
+        if not self._heap:
+            raise IndexError("pop from an empty queue")
+
+        entry = heapq.heappop(self._heap)
+        del self._entries[entry[_KEY]]
+        return entry[_KEY], entry[_ITEM]
+
+    def peek(self) -> Tuple[Hashable, T]:
+        """
+        Return the item with the lowest priority value without removing it.
+
+        Returns:
+            Tuple of (key, item).
+
+        Raises:
+            IndexError: If the queue is empty.
+        """
+        self._discard_tombstones()
+        if not self._heap:
+            raise IndexError("peek at an empty queue")
+
+        entry = self._heap[0]
+        return entry[_KEY], entry[_ITEM]
+
+    def get(self, key: Hashable) -> Optional[T]:
+        """
+        Get a queued item by key.
+
+        Args:
+            key: Key of the item.
+
+        Returns:
+            The item, or None if no item with this key is queued.
+        """
+        entry = self._entries.get(key)
+        return entry[_ITEM] if entry is not None else None
+
+    def priority(self, key: Hashable) -> Optional[float]:
+        """
+        Get the priority of a queued item.
+
+        Args:
+            key: Key of the item.
+
+        Returns:
+            The priority value, or None if no item with this key is queued.
+        """
+        entry = self._entries.get(key)
+        return entry[_PRIORITY] if entry is not None else None
+
+    def remove(self, key: Hashable) -> Optional[T]:
+        """
+        Remove an item from the queue.
+
+        Args:
+            key: Key of the item to remove.
+
+        Returns:
+            The removed item, or None if no item with this key is queued.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+
+        item = entry[_ITEM]
+        self._bury(entry)
+        return item
+
+    def reprioritize(self, key: Hashable, priority: float) -> bool:
+        """
+        Change the priority of a queued item.
+
+        The item keeps its original insertion order among items of the
+        new priority.
+
+        Args:
+            key: Key of the item.
+            priority: New priority value.
+
+        Returns:
+            True if the item was found, False otherwise.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+
+        if entry[_PRIORITY] != priority:
+            new_entry = [priority, entry[_ORDER], next(self._sequence), key, entry[_ITEM], False]
+            self._bury(entry)
+            self._entries[key] = new_entry
+            heapq.heappush(self._heap, new_entry)
+        return True
+
+    def clear(self) -> None:
+        """Remove all items."""
+        self._heap.clear()
+        self._entries.clear()
+        self._tombstones = 0
+
+    def _bury(self, entry: list) -> None:
+        """Mark a heap entry as removed, compacting the heap if needed."""
+        entry[_REMOVED] = True
+        entry[_ITEM] = None
+        self._tombstones += 1
+
+        if self._tombstones > len(self._entries) and self._tombstones > 64:
+            self._heap = [e for e in self._heap if not e[_REMOVED]]
+            heapq.heapify(self._heap)
+            self._tombstones = 0
+
+    def _discard_tombstones(self) -> None:
+        """Pop removed entries off the top of the heap."""
+        heap = self._heap
+        while heap and heap[0][_REMOVED]:
+            heapq.heappop(heap)
+            self._tombstones -= 1
@@ -0,0 +1,97 @@
+"""
+Process Worker Helpers for Summit SEO
+
+This module provides functions that run inside PROCESS workers. Use
+``warm_up_worker`` as the pool initializer so every worker process imports
+the analyzers and builds its analyzer instances (compiling their regular
+expressions) once, and ``run_analyzer`` as the task callable so each task
+reuses those instances:
+
+    manager = ParallelManager(
+        worker_type=WorkerType.PROCESS,
+        worker_initializer=warm_up_worker,
+        worker_initargs=(['title', 'meta'],)
+    )
+    task = create_task(run_analyzer, 'title', html)
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Per-process state, populated by warm_up_worker
+_worker_analyzers: Dict[str, Any] = {}
+_worker_config: Dict[str, Any] = {}
+_worker_local = threading.local()
+
+
+def warm_up_worker(
+    analyzers: Optional[Sequence[str]] = None,
+    config: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    Prepare a worker process: import analyzers and create their instances.
+
+    Analyzer caching is disabled by default in worker processes, because a
+    process-local cache is not shared with the parent or other workers.
+
+    Args:
+        analyzers: Names of the analyzers to create (defaults to all registered).
+        config: Configuration passed to every analyzer.
+    """
+    from summit_seo.analyzer import AnalyzerFactory
+
+    _worker_config.clear()
+    _worker_config.update({'enable_caching': False, **(config or {})})
+
+    # An exception here would break the whole pool, so failures are only logged
+    for name in analyzers or AnalyzerFactory.list_analyzers():
+        try:
+            _worker_analyzers[name] = AnalyzerFactory.create(name, dict(_worker_config))
+        except Exception as e:
+            logger.warning(f"Could not warm up analyzer '{name}': {str(e)}")
+
+    logger.debug(f"Worker process {os.getpid()} warmed up analyzers: {', '.join(_worker_analyzers)}")
+
+
+def get_worker_analyzers() -> List[str]:
+    """
+    Get the names of the analyzers created in this process.
+
+    Returns:
+        List of analyzer names.
+    """
+    return list(_worker_analyzers)
+
+
+def run_analyzer(name: str, data: Any) -> Any:
+    """
+    Run an analyzer in this process, reusing its warm instance.
+
+    Analyzers not created by warm_up_worker are created on first use.
+
+    Args:
+        name: Name of the analyzer.
+        data: Input data for the analyzer.
+
+    Returns:
+        The AnalysisResult.
+    """
+    analyzer = _worker_analyzers.get(name)
+    if analyzer is None:
+        from summit_seo.analyzer import AnalyzerFactory
+
+        config = _worker_config or {'enable_caching': False}
+        analyzer = AnalyzerFactory.create(name, dict(config))
+        _worker_analyzers[name] = analyzer
+
+    # One event loop per worker thread, reused across tasks
+    loop = getattr(_worker_local, 'loop', None)
+    if loop is None or loop.is_closed():
+        loop = _worker_local.loop = asyncio.new_event_loop()
+
+    return loop.run_until_complete(analyzer.analyze(data))
@@ -0,0 +1,338 @@
+"""
+Execution Profiler Module for Summit SEO
+
+This module records when each task of a ParallelExecutor was submitted,
+became ready (its dependencies finished), started and finished, and on
+which worker. From those records it builds:
+
+* a utilization timeline in Chrome trace-event format, which can be
+  opened in chrome://tracing or https://ui.perfetto.dev;
+* a critical-path analysis that follows the chain of waits behind the
+  last task to finish, showing whether a slow run is limited by the
+  number of workers, by one straggler task or by dependency chains.
+
+    profiler = ExecutionProfiler()
+    manager = ParallelManager(strategy=ProcessingStrategy.GRAPH, profiler=profiler)
+    ...
+    profiler.write_chrome_trace("run.trace.json")
+    print(profiler.report()["limited_by"])
+"""
+
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from summit_seo.parallel.task import Task, TaskStatus
+
+# Share of the run's span above which a component is considered the limit
+BOTTLENECK_SHARE = 0.5
+
+
+@dataclass
+class TaskProfile:
+    """Timing of one task, in seconds since the profiler started."""
+    task_id: str
+    name: str
+    dependencies: List[str] = field(default_factory=list)
+    submitted: float = 0.0
+    ready: Optional[float] = None  # Dependencies satisfied, task queued
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    worker_id: Optional[int] = None
+    status: Optional[TaskStatus] = None
+
+    @property
+    def dependency_wait(self) -> float:
+        """Seconds between submission and the dependencies finishing."""
+        if self.ready is None:
+            return 0.0
+        return self.ready - self.submitted
+
+    @property
+    def queue_wait(self) -> float:
+        """Seconds the task waited for a worker after becoming ready."""
+        if self.ready is None or self.started is None:
+            return 0.0
+        return self.started - self.ready
+
+    @property
+    def run_time(self) -> float:
+        """Seconds the task ran."""
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+
+class ExecutionProfiler:
+    """
+    Records task timings from a ParallelExecutor and analyzes them.
+
+    Recording costs one dictionary lookup and a clock read per lifecycle
+    step. A profiler can be attached to one executor at a time; call
+    reset() to reuse it for another run.
+    """
+
+    def __init__(self):
+        """Initialize the profiler."""
+        self.profiles: Dict[str, TaskProfile] = {}
+        self._origin = time.perf_counter()
+
+    def reset(self) -> None:
+        """Drop all recorded tasks and restart the clock."""
+        self.profiles.clear()
+        self._origin = time.perf_counter()
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._origin
+
+    def record_submit(self, task: Task) -> None:
+        """Record that a task was submitted."""
+        self.profiles[task.id] = TaskProfile(
+            task_id=task.id,
+            name=task.name,
+            dependencies=list(task.dependencies),
+            submitted=self._now()
+        )
+
+    def record_ready(self, task_id: str) -> None:
+        """Record that a task's dependencies are satisfied and it is queued."""
+        profile = self.profiles.get(task_id)
+        if profile is not None:
+            profile.ready = self._now()
+
+    def record_start(self, task_id: str, worker_id: Optional[int]) -> None:
+        """Record that a worker started a task."""
+        profile = self.profiles.get(task_id)
+        if profile is not None:
+            profile.started = self._now()
+            profile.worker_id = worker_id
+
+    def record_finish(self, task_id: str, status: TaskStatus) -> None:
+        """Record that a task completed, failed or was dropped."""
+        profile = self.profiles.get(task_id)
+        if profile is not None:
+            profile.finished = self._now()
+            profile.status = status
+
+    def _ran(self) -> List[TaskProfile]:
+        """Profiles of tasks that started and finished, by start time."""
+        return sorted(
+            (p for p in self.profiles.values() if p.started is not None and p.finished is not None),
+            key=lambda p: p.started
+        )
+
+    def utilization(self) -> Dict[str, Any]:
+        """
+        Summarize how busy the workers were.
+
+        Returns:
+            Dictionary with the run's span, the number of workers that ran
+            tasks, total and per-worker busy time, utilization (busy time
+            over workers x span), queue and dependency waits, and the
+            highest number of tasks running at once.
+        """
+        ran = self._ran()
+        if not ran:
+            return {
+                "tasks": 0, "span": 0.0, "workers": 0, "busy_time": 0.0, "utilization": 0.0,
+                "per_worker": {}, "avg_queue_wait": 0.0, "max_queue_wait": 0.0,
+                "avg_dependency_wait": 0.0, "max_concurrency": 0,
+            }
+
+        span_start = min(p.submitted for p in ran)
+        span = max(p.finished for p in ran) - span_start
+        per_worker: Dict[Any, float] = {}
+        for profile in ran:
+            per_worker[profile.worker_id] = per_worker.get(profile.worker_id, 0.0) + profile.run_time
+        busy = sum(per_worker.values())
+
+        return {
+            "tasks": len(ran),
+            "span": span,
+            "workers": len(per_worker),
+            "busy_time": busy,
+            "utilization": busy / (len(per_worker) * span) if span > 0 else 0.0,
+            "per_worker": per_worker,
+            "avg_queue_wait": sum(p.queue_wait for p in ran) / len(ran),
+            "max_queue_wait": max(p.queue_wait for p in ran),
+            "avg_dependency_wait": sum(p.dependency_wait for p in ran) / len(ran),
+            "max_concurrency": max(count for _, count in self._concurrency_steps(ran)),
+        }
+
+    def critical_path(self) -> List[TaskProfile]:
+        """
+        Find the chain of tasks that determined when the run finished.
+
+        Starting from the last task to finish, each step goes to the
+        dependency that finished last, i.e. the one the task was waiting
+        for. The chain ends at a task without dependencies.
+
+        Returns:
+            Profiles along the path, first task first.
+        """
+        ran = {p.task_id: p for p in self._ran()}
+        if not ran:
+            return []
+
+        current = max(ran.values(), key=lambda p: p.finished)
+        path = [current]
+        seen = {current.task_id}
+        while True:
+            dependencies = [ran[d] for d in current.dependencies if d in ran and d not in seen]
+            if not dependencies:
+                break
+            current = max(dependencies, key=lambda p: p.finished)
+            path.append(current)
+            seen.add(current.task_id)
+
+        path.reverse()
+        return path
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Analyze the run and name what limited it.
+
+        ``limited_by`` is one of:
+
+        * ``workers``: tasks on the critical path spent most of the run
+          waiting for a free worker;
+        * ``straggler``: a single task ran for most of the run;
+        * ``dependencies``: a chain of dependent tasks ran back to back for
+          most of the run;
+        * ``none``: no single cause covers most of the run (e.g. tasks
+          were submitted slowly).
+
+        Returns:
+            Dictionary with the utilization summary, the critical path and
+            its run and queue times, the slowest task and limited_by.
+        """
+        summary = self.utilization()
+        path = self.critical_path()
+        span = summary["span"]
+        path_run = sum(p.run_time for p in path)
+        path_queue = sum(p.queue_wait for p in path)
+        slowest = max(self._ran(), key=lambda p: p.run_time, default=None)
+
+        limited_by = "none"
+        if span > 0:
+            if path_queue >= BOTTLENECK_SHARE * span:
+                limited_by = "workers"
+            elif slowest is not None and slowest in path and slowest.run_time >= BOTTLENECK_SHARE * span:
+                limited_by = "straggler"
+            elif len(path) > 1 and path_run >= BOTTLENECK_SHARE * span:
+                limited_by = "dependencies"
+
+        return {
+            **summary,
+            "critical_path": [
+                {
+                    "task_id": p.task_id,
+                    "name": p.name,
+                    "worker_id": p.worker_id,
+                    "run_time": p.run_time,
+                    "queue_wait": p.queue_wait,
+                }
+                for p in path
+            ],
+            "critical_path_run_time": path_run,
+            "critical_path_queue_wait": path_queue,
+            "slowest_task": slowest.task_id if slowest is not None else None,
+            "limited_by": limited_by,
+        }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Build a Chrome trace-event document of the run.
+
+        Each worker is a thread whose slices are the tasks it ran; queue
+        waits are shown on a separate "queue" thread, and counters track
+        running tasks over time. Dependency edges are drawn as flow arrows.
+
+        Returns:
+            Trace document, ready for json.dump.
+        """
+        ran = self._ran()
+        events: List[Dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": 1, "args": {"name": "summit_seo executor"}},
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": "queue", "args": {"name": "queue wait"}},
+        ]
+        for worker_id in sorted({p.worker_id for p in ran}, key=str):
+            events.append({
+                "name": "thread_name", "ph": "M", "pid": 1, "tid": worker_id,
+                "args": {"name": f"worker {worker_id}"},
+            })
+
+        by_id = {p.task_id: p for p in ran}
+        for profile in ran:
+            events.append({
+                "name": profile.name,
+                "cat": profile.status.name.lower() if profile.status else "task",
+                "ph": "X",
+                "pid": 1,
+                "tid": profile.worker_id,
+                "ts": _micros(profile.started),
+                "dur": _micros(profile.run_time),
+                "args": {
+                    "task_id": profile.task_id,
+                    "queue_wait_ms": profile.queue_wait * 1000,
+                    "dependency_wait_ms": profile.dependency_wait * 1000,
+                    "dependencies": profile.dependencies,
+                },
+            })
+            if profile.queue_wait > 0:
+                events.append({
+                    "name": profile.name, "cat": "queue", "ph": "X", "pid": 1, "tid": "queue",
+                    "ts": _micros(profile.ready), "dur": _micros(profile.queue_wait),
+                    "args": {"task_id": profile.task_id},
+                })
+            for dependency in profile.dependencies:
+                source = by_id.get(dependency)
+                if source is None:
+                    continue
+                flow_id = f"{dependency}->{profile.task_id}"
+                events.append({
+                    "name": "dependency", "cat": "dependency", "ph": "s", "id": flow_id,
+                    "pid": 1, "tid": source.worker_id, "ts": _micros(source.finished) - 1,
+                })
+                events.append({
+                    "name": "dependency", "cat": "dependency", "ph": "f", "bp": "e", "id": flow_id,
+                    "pid": 1, "tid": profile.worker_id, "ts": _micros(profile.started),
+                })
+
+        for timestamp, running in self._concurrency_steps(ran):
+            events.append({
+                "name": "running tasks", "ph": "C", "pid": 1,
+                "ts": _micros(timestamp), "args": {"running": running},
+            })
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: str) -> None:
+        """
+        Write the Chrome trace-event document to a file.
+
+        Args:
+            path: Output path, conventionally ending in .json.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+    @staticmethod
+    def _concurrency_steps(ran: List[TaskProfile]) -> List[Tuple[float, int]]:
+        """Get (time, running tasks) at every start and finish."""
+        changes = sorted(
+            [(p.started, 1) for p in ran] + [(p.finished, -1) for p in ran],
+            key=lambda change: (change[0], change[1])
+        )
+        steps = []
+        running = 0
+        for timestamp, delta in changes:
+            running += delta
+            steps.append((timestamp, running))
+        return steps
+
+
+def _micros(seconds: float) -> int:
+    """Convert seconds to whole microseconds for trace events."""
+    return int(seconds * 1_000_000)
@@ -0,0 +1,213 @@
+"""
+Shared-Memory Page Bodies for Summit SEO
+
+This module moves page bodies to PROCESS workers through shared memory
+instead of pickling them into every task. The parent process copies a body
+into a ``multiprocessing.shared_memory`` segment once and sends workers a
+small ``SharedBody`` handle; workers read the body straight from the
+segment. Segments are reference counted and unlinked when the last task
+using them finishes, so IPC cost per task stays flat regardless of page size.
+"""
+
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Dict, NamedTuple, Tuple, Union
+
+Body = Union[str, bytes]
+
+
+class SharedBody(NamedTuple):
+    """Picklable handle to a page body stored in a shared memory segment."""
+    name: str  # Segment name
+    size: int  # Body size in bytes
+    text: bool = True  # Whether the body is decoded to str when loaded
+
+    def load(self) -> Body:
+        """
+        Read the body from its segment.
+
+        Returns:
+            The body as str (text handles) or bytes.
+
+        Raises:
+            FileNotFoundError: If the segment has already been freed.
+        """
+        segment = SharedMemory(name=self.name)
+        view = segment.buf[:self.size]
+        try:
+            return str(view, 'utf-8', 'surrogatepass') if self.text else bytes(view)
+        finally:
+            view.release()
+            segment.close()
+
+
+def resolve_shared_bodies(args: tuple, kwargs: Dict[str, Any]) -> Tuple[tuple, Dict[str, Any]]:
+    """
+    Replace SharedBody handles in call arguments with the bodies they refer to.
+
+    Args:
+        args: Positional arguments.
+        kwargs: Keyword arguments.
+
+    Returns:
+        Tuple of (args, kwargs) with handles loaded.
+    """
+    args = tuple(arg.load() if isinstance(arg, SharedBody) else arg for arg in args)
+    kwargs = {
+        key: value.load() if isinstance(value, SharedBody) else value
+        for key, value in kwargs.items()
+    }
+    return args, kwargs
+
+
+def call_with_shared_bodies(func: Callable, args: tuple, kwargs: Dict[str, Any]) -> Any:
+    """
+    Call a function in a worker after loading its shared body arguments.
+
+    Args:
+        func: The function to call.
+        args: Positional arguments, possibly containing SharedBody handles.
+        kwargs: Keyword arguments, possibly containing SharedBody handles.
+
+    Returns:
+        The result of the call.
+    """
+    args, kwargs = resolve_shared_bodies(args, kwargs)
+    return func(*args, **kwargs)
+
+
+class SharedBodyStore:
+    """
+    Reference-counted shared memory segments for page bodies.
+
+    Sharing the same body object again while its segment is alive reuses
+    the segment and adds references, so every analyzer task for a page
+    reads one copy. The segment is unlinked when its last reference is
+    released. The store is not thread-safe and is meant to be used from
+    the event loop that owns the executor.
+    """
+
+    def __init__(self):
+        """Initialize an empty store."""
+        # Segment name -> [segment, references, body, size in bytes]
+        self._segments: Dict[str, list] = {}
+        self._by_body: Dict[int, str] = {}  # id(body) -> segment name
+        self._stats = {
+            "segments_created": 0,
+            "segments_freed": 0,
+            "bytes_shared": 0,
+            "handles_issued": 0,
+        }
+
+    def __len__(self) -> int:
+        """Get the number of live segments."""
+        return len(self._segments)
+
+    def share(self, body: Body, refs: int = 1) -> SharedBody:
+        """
+        Place a body in shared memory.
+
+        Args:
+            body: Page body as str or bytes.
+            refs: Number of references to take, e.g. one per analyzer
+                task that will receive the handle.
+
+        Returns:
+            Handle to pass to worker processes.
+
+        Raises:
+            ValueError: If refs is less than 1.
+            TypeError: If body is not str or bytes.
+            OSError: If the segment cannot be created.
+        """
+        if refs < 1:
+            raise ValueError("refs must be at least 1")
+        if not isinstance(body, (str, bytes)):
+            raise TypeError(f"Cannot share body of type {type(body).__name__}")
+
+        self._stats["handles_issued"] += refs
+
+        # The store keeps the body alive, so its id cannot be reused meanwhile
+        name = self._by_body.get(id(body))
+        if name is not None:
+            record = self._segments[name]
+            record[1] += refs
+            return SharedBody(name, record[3], isinstance(body, str))
+
+        data = body.encode('utf-8', 'surrogatepass') if isinstance(body, str) else body
+        segment = SharedMemory(create=True, size=max(len(data), 1))
+        segment.buf[:len(data)] = data
+
+        self._segments[segment.name] = [segment, refs, body, len(data)]
+        self._by_body[id(body)] = segment.name
+        self._stats["segments_created"] += 1
+        self._stats["bytes_shared"] += len(data)
+
+        return SharedBody(segment.name, len(data), isinstance(body, str))
+
+    def acquire(self, handle: SharedBody, refs: int = 1) -> bool:
+        """
+        Add references to a live segment.
+
+        Args:
+            handle: Handle of the segment.
+            refs: Number of references to add.
+
+        Returns:
+            True if the segment is live, False if it was already freed.
+        """
+        record = self._segments.get(handle.name)
+        if record is None:
+            return False
+        record[1] += refs
+        self._stats["handles_issued"] += refs
+        return True
+
+    def release(self, handle: SharedBody) -> bool:
+        """
+        Drop one reference, freeing the segment when none are left.
+
+        Args:
+            handle: Handle of the segment.
+
+        Returns:
+            True if the segment was freed by this call.
+        """
+        record = self._segments.get(handle.name)
+        if record is None:
+            return False
+
+        record[1] -= 1
+        if record[1] > 0:
+            return False
+
+        self._free(handle.name)
+        return True
+
+    def close(self) -> None:
+        """Free every segment regardless of outstanding references."""
+        for name in list(self._segments):
+            self._free(name)
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        Get statistics about shared segments.
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            **self._stats,
+            "segments_live": len(self._segments),
+            "bytes_live": sum(record[3] for record in self._segments.values()),
+        }
+
+    def _free(self, name: str) -> None:
+        """Close and unlink a segment."""
+        segment, _, body, _ = self._segments.pop(name)
+        self._by_body.pop(id(body), None)
+        segment.close()
+        try:
+            segment.unlink()
+        except FileNotFoundError:
+            pass
+        self._stats["segments_freed"] += 1
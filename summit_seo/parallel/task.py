@@ -6,6 +6,7 @@ processing system in Summit SEO.
 """
 
 import asyncio
+import functools
 import inspect
 import time
 import uuid
@@ -14,6 +15,11 @@ from datetime import datetime
 from enum import Enum, auto
 from typing import Any, Callable, Coroutine, Dict, List, Optional, Set, Union
 
+from summit_seo.parallel.shared_body import SharedBody
+
+# Shorter str and bytes arguments (names, URLs) are not page bodies
+PAGE_BODY_MIN_SIZE = 1024
+
 
 class TaskStatus(Enum):
     """Status of a parallel task."""
@@ -111,41 +117,66 @@ class Task:
     
     A task encapsulates a coroutine or function to be executed, along with
     metadata such as ID, name, priority, dependencies, and timeout.
+    
+    Instead of a coroutine, a task can be given a factory that returns one.
+    The coroutine is then only created when the task starts, so large
+    numbers of queued tasks do not hold coroutine objects (and the frames
+    and arguments they reference) while they wait.
     """
     
     def __init__(
         self,
-        coro: Coroutine,
+        coro: Optional[Coroutine] = None,
         id: Optional[str] = None,
         name: Optional[str] = None,
         priority: TaskPriority = TaskPriority.NORMAL,
         dependencies: Optional[List[str]] = None,
         timeout: Optional[float] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        memory_cost: int = 0,
+        factory: Optional[Callable[[], Coroutine]] = None
     ):
         """
         Initialize a task.
         
         Args:
-            coro: Coroutine to execute
+            coro: Coroutine to execute (required unless factory is given)
             id: Task ID (generated if not provided)
             name: Human-readable name for the task
             priority: Task priority
             dependencies: List of task IDs that must complete before this task
             timeout: Timeout for task execution in seconds
             metadata: Additional metadata for the task
+            memory_cost: Estimated peak memory the task needs in bytes, used
+                for memory-aware admission (see estimate_memory_cost); 0
+                means unknown
+            factory: Callable returning the coroutine to execute, called
+                when the task starts
         """
-        # Ensure we have a coroutine
-        if not inspect.iscoroutine(coro):
+        # Ensure we have a coroutine or a way to create one
+        if coro is None:
+            if factory is None:
+                raise TypeError("Task requires a coroutine object or a factory")
+            if not callable(factory):
+                raise TypeError("Task factory must be callable")
+        elif not inspect.iscoroutine(coro):
             raise TypeError("Task requires a coroutine object")
         
         self.coro = coro
+        self.factory = factory
         self.id = id or str(uuid.uuid4())
         self.name = name or f"Task-{self.id[:8]}"
         self.priority = priority
         self.dependencies = dependencies or []
         self.timeout = timeout
         self.metadata = metadata or {}
+        self.memory_cost = max(0, int(memory_cost))
+        
+        # Callable form of the task (set by create_task for regular
+        # functions); thread and process workers run this instead of coro
+        self.func: Optional[Callable] = None
+        self.args: tuple = ()
+        self.kwargs: Dict[str, Any] = {}
         
         # Status tracking
         self._status = TaskStatus.PENDING
@@ -155,6 +186,28 @@ class Task:
         self._end_time = None
         self.created_at = datetime.now()
     
+    def ensure_coro(self) -> Coroutine:
+        """
+        Get the task's coroutine, creating it from the factory if needed.
+        
+        Returns:
+            The coroutine to execute
+        
+        Raises:
+            TypeError: If the factory does not return a coroutine
+        """
+        if self.coro is None:
+            coro = self.factory()
+            if not inspect.iscoroutine(coro):
+                raise TypeError("Task factory must return a coroutine object")
+            self.coro = coro
+        return self.coro
+    
+    def discard_coro(self) -> None:
+        """Close the task's coroutine without running it, if one was created."""
+        if self.coro is not None:
+            self.coro.close()
+    
     @property
     def status(self) -> TaskStatus:
         """Get the current status of the task."""
@@ -241,10 +294,10 @@ class Task:
         try:
             if self.timeout:
                 # Run with timeout
-                result = await asyncio.wait_for(self.coro, timeout=self.timeout)
+                result = await asyncio.wait_for(self.ensure_coro(), timeout=self.timeout)
             else:
                 # Run normally
-                result = await self.coro
+                result = await self.ensure_coro()
                 
             # Update task state
             self._result = result
@@ -503,6 +556,16 @@ def create_task(
     
     This is a helper function to create Task instances from either
     coroutines or regular functions (which will be converted to coroutines).
+    Tasks created from regular functions also keep the function and its
+    arguments, so executors with THREAD or PROCESS workers run them in their
+    pool; for PROCESS workers the function and arguments must be picklable.
+    
+    Pass ``lazy=True`` to defer calling a coroutine function until the task
+    starts, so queued tasks hold only the function and its arguments.
+    
+    Without an explicit ``memory_cost``, tasks whose arguments carry page
+    bodies (str or bytes of at least PAGE_BODY_MIN_SIZE, or SharedBody
+    handles) get one from estimate_memory_cost.
     
     Args:
         func: Function or coroutine to execute
@@ -523,22 +586,30 @@ def create_task(
     """
     # Extract task-specific kwargs
     task_kwargs = {}
-    for key in ['id', 'name', 'priority', 'dependencies', 'timeout', 'metadata']:
+    for key in ['id', 'name', 'priority', 'dependencies', 'timeout', 'metadata', 'memory_cost']:
         if key in kwargs:
             task_kwargs[key] = kwargs.pop(key)
+    lazy = kwargs.pop('lazy', False)
+    if 'memory_cost' not in task_kwargs:
+        task_kwargs['memory_cost'] = _estimate_body_cost(args, kwargs)
     
     # Handle different types of callables
+    coro = None
+    factory = None
     if asyncio.iscoroutine(func):
         # Already a coroutine object
         coro = func
     elif inspect.iscoroutinefunction(func):
-        # Coroutine function, call it with args
-        coro = func(*args, **kwargs)
+        # Coroutine function, call it with args (on start if lazy)
+        factory = functools.partial(func, *args, **kwargs)
     else:
         # Regular function, wrap in coroutine
         async def wrapper():
             return func(*args, **kwargs)
-        coro = wrapper()
+        factory = wrapper
+    if factory is not None and not lazy:
+        coro = factory()
+        factory = None
     
     # Create the task
     task = Task(
@@ -548,7 +619,37 @@ def create_task(
         priority=task_kwargs.get('priority', TaskPriority.NORMAL),
         dependencies=task_kwargs.get('dependencies'),
         timeout=task_kwargs.get('timeout'),
-        metadata=task_kwargs.get('metadata')
+        metadata=task_kwargs.get('metadata'),
+        memory_cost=task_kwargs.get('memory_cost', 0),
+        factory=factory
     )
     
-    return task 
\ No newline at end of file
+    # Keep the call itself so thread and process workers can run it
+    if not asyncio.iscoroutine(func) and not inspect.iscoroutinefunction(func):
+        task.func = func
+        task.args = args
+        task.kwargs = kwargs
+    
+    return task 
+
+
+def _estimate_body_cost(args: tuple, kwargs: Dict[str, Any]) -> int:
+    """
+    Estimate the memory cost of a call from the page bodies among its arguments.
+    
+    Args:
+        args: Positional arguments of the call
+        kwargs: Keyword arguments of the call
+        
+    Returns:
+        Estimated cost in bytes, or 0 if no argument is a page body
+    """
+    from summit_seo.memory.limiter import estimate_memory_cost
+    
+    page_size = 0
+    for value in (*args, *kwargs.values()):
+        if isinstance(value, SharedBody):
+            page_size += value.size
+        elif isinstance(value, (str, bytes)) and len(value) >= PAGE_BODY_MIN_SIZE:
+            page_size += len(value)
+    return estimate_memory_cost(page_size) if page_size else 0
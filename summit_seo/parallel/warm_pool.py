@@ -0,0 +1,288 @@
+"""
+Warm Worker Pool Module for Summit SEO
+
+This module provides a persistent, pre-forked process pool for running
+analyzers. With the ``forkserver`` start method, a server process imports
+the preload modules (bs4, the analyzer modules and their class-level
+tables such as ``ContentAnalyzer.STOP_WORDS``) once, and every worker is
+forked from it, inheriting those imports instead of repeating them. Each
+worker then builds its analyzer instances once (see warm_up_worker) and
+keeps them for as long as the pool lives.
+
+Create one pool per process and reuse it for every run, for example in
+an API process or ``summit-seo worker``:
+
+    pool = get_warm_pool(max_workers=4, analyzers=['security', 'content'])
+    result = await pool.run(run_analyzer, 'security', html)
+
+    manager = ParallelManager(process_pool=pool)
+"""
+
+import asyncio
+import atexit
+import importlib
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from summit_seo.parallel.process import warm_up_worker
+
+logger = logging.getLogger(__name__)
+
+# Modules imported by the fork server before it forks any worker
+DEFAULT_PRELOAD = (
+    "bs4",
+    "summit_seo.analyzer",
+    "summit_seo.parallel.process",
+)
+
+
+def default_start_method() -> str:
+    """
+    Get the preferred start method for warm pools on this platform.
+
+    Returns:
+        'forkserver' where available, otherwise 'spawn'.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return "forkserver"
+    return "spawn"
+
+
+def _init_worker(
+    preload: Sequence[str],
+    analyzers: Optional[Sequence[str]],
+    config: Optional[Dict[str, Any]]
+) -> None:
+    """Import the preload modules (a no-op when inherited) and warm up analyzers."""
+    for module in preload:
+        try:
+            importlib.import_module(module)
+        except ImportError as e:
+            logger.warning(f"Could not preload module '{module}': {str(e)}")
+    warm_up_worker(analyzers, config)
+
+
+class WarmWorkerPool:
+    """
+    Persistent process pool whose workers are started ahead of the first task.
+
+    The pool starts its workers when start() is called (or on first use)
+    and keeps them until shutdown(). If a worker dies, the pool is replaced
+    on the next restart() so later tasks can run. start() and restart()
+    block until every worker is warm; run() calls them in a thread so the
+    event loop keeps running meanwhile.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 0,
+        preload: Sequence[str] = DEFAULT_PRELOAD,
+        analyzers: Optional[Sequence[str]] = None,
+        analyzer_config: Optional[Dict[str, Any]] = None,
+        start_method: Optional[str] = None
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            max_workers: Number of worker processes. If 0, use CPU count.
+            preload: Modules to import before forking workers. Only the
+                first forkserver pool of a process can set the fork
+                server's preload list; workers import modules missing
+                from it themselves.
+            analyzers: Names of the analyzers every worker creates on start
+                (defaults to all registered).
+            analyzer_config: Configuration passed to every analyzer.
+            start_method: multiprocessing start method (defaults to
+                default_start_method()).
+        """
+        self.max_workers = max_workers if max_workers > 0 else multiprocessing.cpu_count()
+        self.preload = list(preload)
+        self.analyzers = list(analyzers) if analyzers is not None else None
+        self.analyzer_config = analyzer_config
+        self.start_method = start_method or default_start_method()
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._stats = {
+            "tasks": 0,
+            "restarts": 0,
+            "startup_time": 0.0,
+        }
+
+    @property
+    def running(self) -> bool:
+        """Check if the pool's workers are started."""
+        return self._executor is not None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Get the underlying process pool, starting it if needed."""
+        return self.start()
+
+    def start(self) -> ProcessPoolExecutor:
+        """
+        Start the worker processes and wait until all of them are warm.
+
+        Returns:
+            The underlying process pool.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._create_executor()
+            return self._executor
+
+    def restart(self, broken: Optional[ProcessPoolExecutor] = None) -> ProcessPoolExecutor:
+        """
+        Replace the process pool, e.g. after a worker died.
+
+        Args:
+            broken: The pool that failed. If another caller already
+                replaced it, the current pool is returned unchanged.
+
+        Returns:
+            The new process pool.
+        """
+        with self._lock:
+            if self._executor is not None and (broken is None or broken is self._executor):
+                logger.warning("Restarting warm worker pool")
+                self._executor.shutdown(wait=False)
+                self._executor = None
+                self._stats["restarts"] += 1
+            if self._executor is None:
+                self._executor = self._create_executor()
+            return self._executor
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the worker processes.
+
+        Args:
+            wait: Wait for running tasks to finish.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """
+        Run a picklable function in a worker process.
+
+        Args:
+            func: Function to call.
+            *args: Positional arguments for func.
+            **kwargs: Keyword arguments for func.
+
+        Returns:
+            A concurrent.futures.Future for the result.
+        """
+        self._stats["tasks"] += 1
+        return self.executor.submit(func, *args, **kwargs)
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a picklable function in a worker process and wait for the result.
+
+        The pool is started first if needed. If a worker died, the pool is
+        restarted before the error is raised.
+
+        Args:
+            func: Function to call.
+            *args: Positional arguments for func.
+            **kwargs: Keyword arguments for func.
+
+        Returns:
+            The result of the call.
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._executor
+        if executor is None:
+            executor = await loop.run_in_executor(None, self.start)
+        self._stats["tasks"] += 1
+        try:
+            return await asyncio.wrap_future(executor.submit(func, *args, **kwargs))
+        except BrokenProcessPool:
+            await loop.run_in_executor(None, self.restart, executor)
+            raise
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get statistics about the pool.
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            **self._stats,
+            "max_workers": self.max_workers,
+            "start_method": self.start_method,
+            "running": self.running,
+        }
+
+    def __enter__(self) -> "WarmWorkerPool":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown()
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        """Create the process pool and start every worker."""
+        start_time = time.perf_counter()
+
+        context = multiprocessing.get_context(self.start_method)
+        if self.start_method == "forkserver":
+            context.set_forkserver_preload(self.preload)
+
+        executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self.preload, self.analyzers, self.analyzer_config)
+        )
+
+        # Workers are otherwise started on demand by the first tasks
+        for future in [executor.submit(os.getpid) for _ in range(self.max_workers)]:
+            future.result()
+
+        elapsed = time.perf_counter() - start_time
+        self._stats["startup_time"] += elapsed
+        logger.info(f"Started {self.max_workers} warm workers ({self.start_method}) in {elapsed:.2f}s")
+        return executor
+
+
+# Pool shared by everything in this process
+_shared_pool: Optional[WarmWorkerPool] = None
+
+
+def get_warm_pool(**kwargs) -> WarmWorkerPool:
+    """
+    Get the process-wide warm pool, creating and starting it on first use.
+
+    Args:
+        **kwargs: WarmWorkerPool arguments, used only on first call.
+
+    Returns:
+        The shared WarmWorkerPool.
+    """
+    global _shared_pool
+    if _shared_pool is None:
+        _shared_pool = WarmWorkerPool(**kwargs)
+        _shared_pool.start()
+        atexit.register(shutdown_warm_pool)
+    return _shared_pool
+
+
+def shutdown_warm_pool() -> None:
+    """Stop the process-wide warm pool, if it was started."""
+    global _shared_pool
+    pool, _shared_pool = _shared_pool, None
+    if pool is not None:
+        pool.shutdown()
@@ -349,11 +349,9 @@ class BaseProcessor(ABC):
         # Hash the URL
         url_hash = hashlib.md5(url.encode('utf-8')).hexdigest()[:8]
         
-        # Hash the input data's keys and structure
-        # Note: We avoid hashing the entire data which could be large
-        data_keys = sorted(data.keys())
-        data_structure = f"{len(data)}:{','.join(data_keys)}"
-        data_hash = hashlib.md5(data_structure.encode('utf-8')).hexdigest()[:8]
+        # Hash the input data so different content never shares an entry
+        data_str = json.dumps(data, sort_keys=True, default=str)
+        data_hash = hashlib.md5(data_str.encode('utf-8')).hexdigest()[:8]
         
         # Include relevant configuration in cache key
         config_hash = ""
@@ -6,6 +6,13 @@ from typing import Dict, Any, List, Optional, Set
 from datetime import datetime
 from .base import BaseProcessor, TransformationError
 
+# Prefixes of the Google sitemap extensions looked up in <url> entries
+_EXTENSION_NAMESPACES = {
+    'image': 'http://www.google.com/schemas/sitemap-image/1.1',
+    'mobile': 'http://www.google.com/schemas/sitemap-mobile/1.0',
+    'xhtml': 'http://www.w3.org/1999/xhtml'
+}
+
 class SitemapProcessor(BaseProcessor):
     """Processor for analyzing sitemap.xml content."""
     
@@ -206,18 +213,18 @@ class SitemapProcessor(BaseProcessor):
                     pass
             
             # Check for images (Google extension)
-            for image in url.findall(".//image:image") or url.findall(".//image"):
+            for image in url.findall(".//image:image", _EXTENSION_NAMESPACES) or url.findall(".//image"):
                 image_data = {}
                 
-                loc_elem = image.find('loc') or image.find('image:loc')
+                loc_elem = image.find('loc') or image.find('image:loc', _EXTENSION_NAMESPACES)
                 if loc_elem is not None and loc_elem.text:
                     image_data['loc'] = loc_elem.text.strip()
                 
-                caption_elem = image.find('caption') or image.find('image:caption')
+                caption_elem = image.find('caption') or image.find('image:caption', _EXTENSION_NAMESPACES)
                 if caption_elem is not None and caption_elem.text:
                     image_data['caption'] = caption_elem.text.strip()
                 
-                title_elem = image.find('title') or image.find('image:title')
+                title_elem = image.find('title') or image.find('image:title', _EXTENSION_NAMESPACES)
                 if title_elem is not None and title_elem.text:
                     image_data['title'] = title_elem.text.strip()
                 
@@ -225,11 +232,11 @@ class SitemapProcessor(BaseProcessor):
                     url_data['images'].append(image_data)
             
             # Check for mobile (Google extension)
-            if url.find(".//mobile:mobile") is not None or url.find(".//mobile") is not None:
+            if url.find(".//mobile:mobile", _EXTENSION_NAMESPACES) is not None or url.find(".//mobile") is not None:
                 url_data['mobile'] = True
             
             # Check for hreflang entries (Google extension)
-            for link in url.findall(".//xhtml:link") or url.findall(".//link"):
+            for link in url.findall(".//xhtml:link", _EXTENSION_NAMESPACES) or url.findall(".//link"):
                 if link.get('rel') == 'alternate' and link.get('hreflang') and link.get('href'):
                     url_data['hreflang'].append({
                         'hreflang': link.get('hreflang'),
@@ -4,6 +4,7 @@ import pytest
 from typing import Dict, Any
 from bs4 import BeautifulSoup
 from summit_seo.analyzer.base import BaseAnalyzer, AnalyzerError, AnalysisResult
+from summit_seo.collector.base import CollectionResult
 
 class ConcreteAnalyzer(BaseAnalyzer):
     """Concrete implementation of BaseAnalyzer for testing."""
@@ -122,4 +123,97 @@ class TestBaseAnalyzer:
         
         # Verify analyzer config hasn't changed
         assert 'new_key' not in analyzer.config
-        assert analyzer.config == original_config 
\ No newline at end of file
+        assert analyzer.config == original_config 
+
+class BodyAnalyzer(BaseAnalyzer):
+    """Minimal analyzer for cache key tests."""
+    
+    async def _analyze(self, data):
+        return AnalysisResult(
+            data={},
+            metadata=self.create_metadata('body'),
+            score=1.0,
+            issues=[],
+            warnings=[],
+            recommendations=[]
+        )
+
+
+def make_collection_result(url: str, content: str) -> CollectionResult:
+    """Build a collection result for cache key tests."""
+    return CollectionResult(
+        url=url,
+        content=content,
+        status_code=200,
+        headers={},
+        collection_time=0.1
+    )
+
+
+def test_cache_key_shared_by_identical_bodies():
+    """Test identical bodies from different URLs share a cache key."""
+    analyzer = BodyAnalyzer()
+    page_a = make_collection_result('https://example.com/a?page=1', '<p>Not found</p>')
+    page_b = make_collection_result('https://example.com/b', '<p>Not found</p>\r\n')
+    
+    assert analyzer.generate_cache_key(page_a) == analyzer.generate_cache_key(page_b)
+    assert analyzer.generate_cache_key('<p>Not found</p>') == analyzer.generate_cache_key(page_a)
+
+
+def test_cache_key_fields_and_version():
+    """Test declared input fields and the analyzer version affect the key."""
+    class UrlAwareAnalyzer(BodyAnalyzer):
+        cache_key_fields = ('url',)
+    
+    class BumpedAnalyzer(BodyAnalyzer):
+        cache_version = '2'
+    
+    page_a = make_collection_result('https://example.com/a', '<p>Same</p>')
+    page_b = make_collection_result('https://example.com/b', '<p>Same</p>')
+    
+    url_aware = UrlAwareAnalyzer()
+    assert url_aware.generate_cache_key(page_a) != url_aware.generate_cache_key(page_b)
+    
+    key = BodyAnalyzer().generate_cache_key(page_a)
+    assert BumpedAnalyzer().generate_cache_key(page_a).split(':')[1:] == key.split(':')[1:]
+    assert BumpedAnalyzer().generate_cache_key(page_a) != key
+
+
+@pytest.mark.asyncio
+async def test_cache_key_generated_once_per_analysis(monkeypatch):
+    """Test analyze() computes the cache key a single time."""
+    analyzer = BodyAnalyzer({'threshold': 3})
+    calls = []
+    original = analyzer.generate_cache_key
+    
+    def counting_key(data):
+        calls.append(data)
+        return original(data)
+    
+    monkeypatch.setattr(analyzer, 'generate_cache_key', counting_key)
+    
+    result = await analyzer.analyze('<p>Body</p>')
+    
+    assert len(calls) == 1
+    assert result.metadata.cache_key == original('<p>Body</p>')
+    assert result.metadata.cache_key.endswith(analyzer._config_fingerprint)
+
+
+def test_collection_result_hashed_once_across_analyzers(monkeypatch):
+    """Test several analyzers share one content hash computation."""
+    import summit_seo.collector.base as collector_base
+    
+    hashes = []
+    original = collector_base.content_hash
+    
+    def counting_hash(content):
+        hashes.append(content)
+        return original(content)
+    
+    monkeypatch.setattr(collector_base, 'content_hash', counting_hash)
+    
+    page = make_collection_result('https://example.com/', '<p>Shared</p>')
+    for ttl in (60, 600, 6000):
+        BodyAnalyzer({'cache_ttl': ttl}).generate_cache_key(page)
+    
+    assert len(hashes) == 1
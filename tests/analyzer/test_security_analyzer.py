@@ -163,6 +163,36 @@ class TestSecurityAnalyzer:
         sensitive_warnings = [w for w in result_secure.warnings if "email" in w.lower()]
         assert len(sensitive_warnings) == 0
     
+    def test_sensitive_data_locations(self):
+        """Test that sensitive data matches are assigned to where they appear."""
+        analyzer = SecurityAnalyzer()
+        html = """
+        <html><head>
+            <script>const api_key = "abcdef1234567890abcdef";</script>
+        </head><body>
+            <p>Mail test@example.com &amp; call 555-123-4567</p>
+            <!-- password: super_secret_123 -->
+            <a href="mailto:hidden@example.com">Contact</a>
+            <br/><div>info@example.com</div>
+        </body></html>
+        """
+        result = analyzer._analyze_sensitive_data(BeautifulSoup(html, 'html.parser'), html)
+        
+        # The mailto address is an attribute value, not visible text
+        assert result['sensitive_data'] == {'email': 2, 'phone': 1, 'api_key': 1, 'password': 1}
+        assert "Found API key exposed in script tag" in result['issues']
+        assert "Found password exposed in HTML comment" in result['issues']
+    
+    def test_sensitive_data_many_matches(self):
+        """Test scanning a page with many emails and phone numbers."""
+        analyzer = SecurityAnalyzer()
+        html = '<html><body>' + ''.join(
+            f'<p>user{i}@example.com or 555-123-{i:04d}</p>' for i in range(2000)
+        ) + '</body></html>'
+        result = analyzer._analyze_sensitive_data(BeautifulSoup(html, 'html.parser'), html)
+        
+        assert result['sensitive_data'] == {'email': 2000, 'phone': 2000}
+    
     def test_outdated_libraries(self):
         """Test outdated libraries detection."""
         analyzer = SecurityAnalyzer()
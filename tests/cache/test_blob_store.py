@@ -0,0 +1,68 @@
+"""Tests for the content-addressed blob store."""
+
+import sys
+
+import pytest
+
+from summit_seo.cache.base import CacheConfigError
+from summit_seo.cache.blob_store import BlobStore, content_hash, normalize_body
+
+def test_content_hash_ignores_transport_formatting():
+    """Test bodies differing only in line endings or padding hash the same."""
+    assert content_hash("<p>a</p>\r\n<p>b</p>\n") == content_hash("<p>a</p>\n<p>b</p>")
+    assert content_hash("<p>a</p>") != content_hash("<p>b</p>")
+    assert normalize_body("  <p>a</p>\r\n") == "<p>a</p>"
+
+def test_blob_store_shares_identical_bodies():
+    """Test identical bodies resolve to the same stored string."""
+    store = BlobStore()
+    body = "<html>" + "soft 404" * 100 + "</html>"
+    copy = "".join(list(body))
+    
+    digest1, stored1 = store.put(body)
+    digest2, stored2 = store.put(copy)
+    
+    assert digest1 == digest2
+    assert stored2 is stored1
+    assert len(store) == 1
+    assert store.get(digest1) is stored1
+    
+    stats = store.get_stats()
+    assert stats["dedup_hits"] == 1
+    assert stats["bytes_saved"] == sys.getsizeof(body)
+
+def test_blob_store_keeps_formatting_variants():
+    """Test a whitespace variant keeps its own text but shares the hash."""
+    store = BlobStore()
+    
+    digest1, _ = store.put("<p>a</p>")
+    digest2, stored = store.put("<p>a</p>\n")
+    
+    assert digest1 == digest2
+    assert stored == "<p>a</p>\n"
+
+def test_blob_store_evicts_least_recently_used():
+    """Test the store stays within its size budget."""
+    store = BlobStore(max_bytes=10)
+    
+    first, _ = store.put("aaaaaa")
+    store.put("bbbbbb")
+    
+    assert first not in store
+    assert len(store) == 1
+    assert store.get_stats()["evictions"] == 1
+
+def test_blob_store_counts_memory_not_characters():
+    """Test non-ASCII bodies count their full in-memory size."""
+    store = BlobStore()
+    body = "\U0001F600" * 1000
+    
+    store.put(body)
+    
+    assert store.get_stats()["size"] == sys.getsizeof(body)
+    assert store.get_stats()["size"] > 3 * len(body)
+
+def test_blob_store_invalid_size():
+    """Test invalid size limits are rejected."""
+    with pytest.raises(CacheConfigError):
+        BlobStore(max_bytes=0)
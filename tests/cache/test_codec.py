@@ -0,0 +1,110 @@
+"""Tests for the cache value codecs."""
+
+import pytest
+import pickle
+
+from summit_seo.cache.base import CacheConfig, CacheConfigError
+from summit_seo.cache.codec import (
+    CacheCodec, CodecError, CompressedText, get_codec, get_available_compressors
+)
+from summit_seo.cache.memory_cache import MemoryCache
+from summit_seo.collector.base import CollectionResult
+
+SAMPLE_HTML = "<html><body>" + "<p>Repeated paragraph text.</p>" * 2000 + "</body></html>"
+
+@pytest.mark.parametrize("compressor", get_available_compressors())
+def test_codec_round_trip(compressor):
+    """Test values survive encode/decode with every available compressor."""
+    codec = CacheCodec(compressor)
+    value = {"html": SAMPLE_HTML, "status": 200, "tags": ["a", "b"]}
+    
+    assert codec.decode(codec.encode(value)) == value
+
+def test_codec_compresses_large_values():
+    """Test compressed codecs shrink large text."""
+    plain = get_codec("pickle").encode(SAMPLE_HTML)
+    compressed = get_codec("pickle+zlib").encode(SAMPLE_HTML)
+    
+    assert len(compressed) * 5 < len(plain)
+
+def test_codec_rejects_corrupt_data():
+    """Test decoding garbage raises CodecError."""
+    with pytest.raises(CodecError):
+        get_codec("pickle").decode(b"not a codec frame")
+
+def test_codec_rejects_truncated_frames():
+    """Test truncated or missing frames raise CodecError."""
+    codec = get_codec("pickle")
+    data = codec.encode({"status": 200})
+    
+    with pytest.raises(CodecError):
+        codec.decode(data[:CacheCodec._HEADER.size + 2])
+    with pytest.raises(CodecError):
+        codec.decode(data[:-3])
+    with pytest.raises(CodecError):
+        codec.decode(CacheCodec._HEADER.pack(CacheCodec._MAGIC, 0, 0, 0))
+
+def test_codec_rejects_corrupt_compressed_payload():
+    """Test a damaged compressed stream raises CodecError."""
+    codec = get_codec("pickle+zlib")
+    data = bytearray(codec.encode(SAMPLE_HTML))
+    middle = len(data) // 2
+    data[middle:middle + 8] = b"\xff" * 8
+    
+    with pytest.raises(CodecError):
+        codec.decode(bytes(data))
+
+def test_get_codec_invalid_spec():
+    """Test unknown serializers and compressors are rejected."""
+    assert get_codec(None) is None
+    
+    with pytest.raises(CacheConfigError):
+        get_codec("json+zlib")
+    
+    with pytest.raises(CacheConfigError):
+        get_codec("pickle+unknown")
+
+def test_compressed_text():
+    """Test CompressedText keeps the body compressed until read."""
+    text = CompressedText.compress(SAMPLE_HTML)
+    
+    assert len(text) == len(SAMPLE_HTML)
+    assert text.compressed_size < len(SAMPLE_HTML) // 5
+    assert text.text() == SAMPLE_HTML
+    assert pickle.loads(pickle.dumps(text, protocol=5)).text() == SAMPLE_HTML
+
+def test_collection_result_lazy_content():
+    """Test pickled collection results decompress their body on first access."""
+    result = CollectionResult(
+        url="https://example.com",
+        content=SAMPLE_HTML,
+        status_code=200,
+        headers={},
+        collection_time=0.1
+    )
+    
+    restored = get_codec("pickle").decode(get_codec("pickle").encode(result))
+    
+    assert "content" not in restored.__dict__
+    assert restored.content == SAMPLE_HTML
+    assert "content" in restored.__dict__
+    
+    # Replacing the body drops the stale compressed copy
+    restored.content = "<html></html>"
+    assert pickle.loads(pickle.dumps(restored)).content == "<html></html>"
+
+@pytest.mark.asyncio
+async def test_memory_cache_with_codec():
+    """Test the memory cache stores encoded values and decodes on read."""
+    cache = MemoryCache(CacheConfig(namespace="codec", codec="pickle+zlib"))
+    value = {"html": SAMPLE_HTML}
+    
+    await cache.set("page", value)
+    
+    stored = cache._cache["codec"]["page"].value
+    assert isinstance(stored, bytes)
+    assert len(stored) < len(SAMPLE_HTML) // 5
+    
+    result = await cache.get("page")
+    assert result.hit is True
+    assert result.value == value
@@ -0,0 +1,159 @@
+"""Tests for the file cache and its LRU/expiry index."""
+
+import asyncio
+import os
+
+import pytest
+
+from summit_seo.cache.base import CacheConfig
+from summit_seo.cache.file_cache import FileCache
+from summit_seo.cache.file_index import FileCacheIndex
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """Create a temporary cache directory."""
+    return str(tmp_path / "cache")
+
+def make_cache(cache_dir, **kwargs):
+    """Create a file cache in the given directory."""
+    return FileCache(CacheConfig(cache_dir=cache_dir, **kwargs))
+
+@pytest.mark.asyncio
+async def test_set_and_get(cache_dir):
+    """Test basic round trip through the file cache."""
+    cache = make_cache(cache_dir)
+    
+    await cache.set("key", {"value": 1})
+    result = await cache.get("key")
+    
+    assert result.hit
+    assert result.value == {"value": 1}
+    assert await cache.get_size() == 1
+
+@pytest.mark.asyncio
+async def test_eviction_is_lru_without_directory_scan(cache_dir, monkeypatch):
+    """Test eviction removes the least recently used entry via the index."""
+    cache = make_cache(cache_dir, max_size=3)
+    for key in ("a", "b", "c"):
+        await cache.set(key, key)
+    
+    # Access "a" so "b" becomes least recently used
+    await cache.get("a")
+    
+    def fail_listdir(path):
+        raise AssertionError("eviction must not list the cache directory")
+    
+    monkeypatch.setattr(os, "listdir", fail_listdir)
+    await cache.set("d", "d")
+    monkeypatch.undo()
+    
+    assert await cache.get_size() == 3
+    assert sorted(await cache.get_keys()) == ["a", "c", "d"]
+    assert not (await cache.get("b")).hit
+    assert cache.get_stats()["evictions"] == 1
+
+@pytest.mark.asyncio
+async def test_replacing_key_does_not_evict(cache_dir):
+    """Test overwriting an existing key keeps other entries."""
+    cache = make_cache(cache_dir, max_size=2)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    await cache.set("a", 3)
+    
+    assert sorted(await cache.get_keys()) == ["a", "b"]
+    assert (await cache.get("a")).value == 3
+
+@pytest.mark.asyncio
+async def test_get_keys_pattern(cache_dir):
+    """Test pattern queries match original keys."""
+    cache = make_cache(cache_dir)
+    await cache.set("page:1", 1)
+    await cache.set("page:2", 2)
+    await cache.set("other", 3)
+    
+    assert sorted(await cache.get_keys("page:*")) == ["page:1", "page:2"]
+
+@pytest.mark.asyncio
+async def test_cleanup_expired_uses_expiry_index(cache_dir):
+    """Test expired entries are swept and unexpired ones kept."""
+    cache = make_cache(cache_dir)
+    await cache.set("short", 1, ttl=1)
+    await cache.set("stale", 2, ttl=1, stale_ttl=60)
+    await cache.set("long", 3, ttl=3600)
+    
+    await asyncio.sleep(1.1)
+    
+    assert await cache.cleanup_expired() == 1
+    assert sorted(await cache.get_keys()) == ["long", "stale"]
+
+@pytest.mark.asyncio
+async def test_cleanup_expired_leaves_other_namespaces(cache_dir):
+    """Test caches sharing a directory only sweep their own namespaces."""
+    short_term = make_cache(cache_dir, namespace="short_term")
+    long_term = make_cache(cache_dir, namespace="long_term")
+    await short_term.set("a", 1, ttl=1)
+    await long_term.set("b", 2, ttl=1)
+    
+    await asyncio.sleep(1.1)
+    
+    assert await short_term.cleanup_expired() == 1
+    assert list(short_term.get_index_stats()) == ["short_term"]
+    assert await long_term.cleanup_expired() == 1
+
+@pytest.mark.asyncio
+async def test_index_rebuilt_on_startup(cache_dir):
+    """Test a new instance restores keys and LRU order from the journal."""
+    cache = make_cache(cache_dir, max_size=3)
+    for key in ("a", "b", "c"):
+        await cache.set(key, key)
+    await cache.get("a")
+    await cache.invalidate("c")
+    
+    reopened = make_cache(cache_dir, max_size=2)
+    assert await reopened.get_size() == 2
+    
+    await reopened.set("d", "d")
+    assert sorted(await reopened.get_keys()) == ["a", "d"]
+
+@pytest.mark.asyncio
+async def test_index_adopts_files_missing_from_journal(cache_dir):
+    """Test files without journal records are indexed and corrupt ones removed."""
+    cache = make_cache(cache_dir)
+    await cache.set(("tuple", "key"), 1)
+    await cache.set("plain", 2)
+    
+    ns_dir = os.path.join(cache_dir, "default")
+    os.remove(os.path.join(ns_dir, FileCacheIndex.JOURNAL_NAME))
+    with open(os.path.join(ns_dir, "corrupt.cache"), "wb") as f:
+        f.write(b"not a pickle")
+    
+    reopened = make_cache(cache_dir)
+    
+    assert sorted(await reopened.get_keys(), key=str) == [("tuple", "key"), "plain"]
+    assert not os.path.exists(os.path.join(ns_dir, "corrupt.cache"))
+
+@pytest.mark.asyncio
+async def test_journal_is_compacted(cache_dir, monkeypatch):
+    """Test the journal stays proportional to the number of entries."""
+    monkeypatch.setattr(FileCacheIndex, "MIN_COMPACT_RECORDS", 8)
+    cache = make_cache(cache_dir)
+    
+    for _ in range(20):
+        await cache.set("key", 1)
+        await cache.get("key")
+    
+    journal = os.path.join(cache_dir, "default", FileCacheIndex.JOURNAL_NAME)
+    with open(journal) as f:
+        assert len(f.readlines()) < 8
+    
+    assert await make_cache(cache_dir).get_keys() == ["key"]
+
+@pytest.mark.asyncio
+async def test_clear_resets_index(cache_dir):
+    """Test clearing the cache empties the index."""
+    cache = make_cache(cache_dir)
+    await cache.set("a", 1)
+    
+    assert await cache.clear() == 1
+    assert await cache.get_keys() == []
+    assert await cache.get_size() == 0
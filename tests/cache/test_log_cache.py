@@ -0,0 +1,235 @@
+"""Tests for the segmented log store and log cache."""
+
+import asyncio
+import os
+
+import pytest
+
+from summit_seo.cache.base import CacheConfig, CacheConfigError, CacheValueError
+from summit_seo.cache.log_cache import LogCache
+from summit_seo.cache.log_store import LogStore
+
+SEGMENT_SIZE = 4096
+
+@pytest.fixture
+def store_dir(tmp_path):
+    """Create a temporary store directory."""
+    return str(tmp_path / "store")
+
+def test_put_get_delete(store_dir):
+    """Test basic store operations."""
+    store = LogStore(store_dir, SEGMENT_SIZE)
+    
+    store.put(b"robots:example.com", b"User-agent: *")
+    assert store.get(b"robots:example.com") == (b"User-agent: *", 0.0)
+    assert store.get(b"missing") is None
+    
+    assert store.delete(b"robots:example.com")
+    assert not store.delete(b"robots:example.com")
+    assert store.get(b"robots:example.com") is None
+    store.close()
+
+def test_overwrites_roll_segments_and_compact(store_dir):
+    """Test overwritten records are reclaimed by compaction."""
+    store = LogStore(store_dir, SEGMENT_SIZE)
+    
+    for i in range(200):
+        store.put(b"key%d" % (i % 5), b"value-%d" % i)
+    
+    stats = store.get_stats()
+    assert stats["segments"] > 1
+    assert stats["keys"] == 5
+    assert store.compaction_candidates()
+    
+    assert store.compact() > 0
+    assert store.get_stats()["segments"] < stats["segments"]
+    assert [store.get(b"key%d" % i)[0] for i in range(5)] == [b"value-%d" % (195 + i) for i in range(5)]
+    store.close()
+
+def test_reopen_replays_log(store_dir):
+    """Test a reopened store sees all writes and deletions."""
+    store = LogStore(store_dir, SEGMENT_SIZE)
+    for i in range(100):
+        store.put(b"key%d" % i, b"x" * 50)
+    store.delete(b"key3")
+    store.close()
+    
+    reopened = LogStore(store_dir, SEGMENT_SIZE)
+    assert len(reopened) == 99
+    assert reopened.get(b"key3") is None
+    assert reopened.get(b"key99") == (b"x" * 50, 0.0)
+    reopened.close()
+
+def test_missing_index_is_rebuilt(store_dir):
+    """Test the index is rebuilt from segments when it is lost."""
+    store = LogStore(store_dir, SEGMENT_SIZE)
+    for i in range(100):
+        store.put(b"key%d" % i, b"value")
+    store.delete(b"key0")
+    store.put(b"key1", b"updated")
+    store.close()
+    
+    os.remove(os.path.join(store_dir, "index.bin"))
+    
+    rebuilt = LogStore(store_dir, SEGMENT_SIZE)
+    assert len(rebuilt) == 99
+    assert rebuilt.get(b"key0") is None
+    assert rebuilt.get(b"key1") == (b"updated", 0.0)
+    assert rebuilt.get_stats()["live_bytes"] > 0
+    rebuilt.close()
+
+def test_compaction_keeps_tombstones_over_older_segments(store_dir):
+    """Test deleted keys stay deleted after compaction and an index rebuild."""
+    store = LogStore(store_dir, SEGMENT_SIZE)
+    store.put(b"deleted", b"old value")
+    for i in range(60):
+        store.put(b"filler%d" % i, b"y" * 40)
+    store.delete(b"deleted")
+    for i in range(120):
+        store.put(b"churn", b"z" * 40)
+    
+    store.compact()
+    store.close()
+    os.remove(os.path.join(store_dir, "index.bin"))
+    
+    rebuilt = LogStore(store_dir, SEGMENT_SIZE)
+    assert rebuilt.get(b"deleted") is None
+    rebuilt.close()
+
+def test_eviction_during_compaction_skips_segment(store_dir, monkeypatch):
+    """Test evicting while a segment is compacted leaves that segment alone."""
+    store = LogStore(store_dir, SEGMENT_SIZE)
+    store.put(b"keep", b"live value")
+    for i in range(200):
+        store.put(b"key%d" % (i % 5), b"value-%d" % i)
+    
+    compacting = store.compaction_candidates()[0]
+    append = store._append
+    evicted = []
+    
+    def append_and_evict(record):
+        # Runs between records of the compaction, like LogCache.set would
+        if not evicted:
+            evicted.append(store.evict_oldest())
+        return append(record)
+    
+    monkeypatch.setattr(store, "_append", append_and_evict)
+    assert store.compact() > 0
+    
+    assert evicted
+    assert compacting not in store._segments
+    assert store.get(b"keep") == (b"live value", 0.0)
+    store.close()
+
+def test_index_grows(store_dir, monkeypatch):
+    """Test the memory-mapped index resizes as keys are added."""
+    from summit_seo.cache import log_store
+    monkeypatch.setattr(log_store._HashIndex, "MIN_CAPACITY", 16)
+    
+    store = LogStore(store_dir, 1 << 20)
+    for i in range(1000):
+        store.put(b"key%d" % i, b"v")
+    
+    assert store.get_stats()["index_capacity"] >= 1024
+    assert all(store.get(b"key%d" % i) for i in range(1000))
+    store.close()
+
+def test_invalid_store_config(store_dir):
+    """Test invalid store settings are rejected."""
+    with pytest.raises(CacheConfigError):
+        LogStore(store_dir, segment_size=100)
+    with pytest.raises(CacheConfigError):
+        LogStore(store_dir, compact_threshold=0)
+
+@pytest.fixture
+async def cache(tmp_path):
+    """Create a log cache with small segments."""
+    cache = LogCache(CacheConfig(cache_dir=str(tmp_path / "log")), segment_size=SEGMENT_SIZE)
+    yield cache
+    await cache.close()
+
+@pytest.mark.asyncio
+async def test_cache_round_trip(cache):
+    """Test values and tuple keys round trip through the cache."""
+    await cache.set(("headers", "https://example.com/"), {"content-type": "text/html"})
+    result = await cache.get(("headers", "https://example.com/"))
+    
+    assert result.hit
+    assert result.value == {"content-type": "text/html"}
+    assert await cache.get_keys("headers:*") == ["headers:https://example.com/"]
+    assert await cache.has_key(("headers", "https://example.com/"))
+
+@pytest.mark.asyncio
+async def test_cache_stale_and_expired(cache):
+    """Test the stale window and expiry of log cache entries."""
+    await cache.set("stale", 1, ttl=1, stale_ttl=60)
+    await cache.set("expired", 2, ttl=1)
+    
+    await asyncio.sleep(1.1)
+    
+    stale = await cache.get("stale")
+    assert stale.hit and stale.metadata["stale"]
+    assert not (await cache.get("expired")).hit
+    assert await cache.cleanup_expired() == 1
+    assert await cache.get_size() == 1
+
+@pytest.mark.asyncio
+async def test_cache_background_compaction(cache):
+    """Test churn triggers background compaction."""
+    for i in range(300):
+        await cache.set("churn", "x" * 50)
+    await cache._compaction
+    
+    store_stats = cache.get_stats()["stores"]["default"]
+    assert store_stats["compactions"] > 0
+    assert store_stats["segments"] <= 3
+    assert (await cache.get("churn")).value == "x" * 50
+
+@pytest.mark.asyncio
+async def test_cache_max_size_evicts_oldest_segment(tmp_path):
+    """Test exceeding max_size drops the oldest segment."""
+    cache = LogCache(CacheConfig(cache_dir=str(tmp_path / "log"), max_size=50), segment_size=SEGMENT_SIZE)
+    for i in range(200):
+        await cache.set(f"key{i}", "v" * 20)
+    
+    assert await cache.get_size() <= 50
+    assert (await cache.get("key199")).hit
+    assert not (await cache.get("key0")).hit
+    assert cache.get_stats()["evictions"] > 0
+    await cache.close()
+
+@pytest.mark.asyncio
+async def test_cache_value_too_large(cache):
+    """Test values larger than a segment are rejected."""
+    with pytest.raises(CacheValueError):
+        await cache.set("big", "x" * SEGMENT_SIZE * 2)
+
+@pytest.mark.asyncio
+async def test_cache_persists_across_instances(tmp_path):
+    """Test entries survive reopening the cache."""
+    config = CacheConfig(cache_dir=str(tmp_path / "log"))
+    cache = LogCache(config, segment_size=SEGMENT_SIZE)
+    await cache.set("robots", "User-agent: *")
+    await cache.close()
+    
+    reopened = LogCache(config, segment_size=SEGMENT_SIZE)
+    assert (await reopened.get("robots")).value == "User-agent: *"
+    assert await reopened.clear() == 1
+    assert await reopened.get_size() == 0
+    await reopened.close()
+
+@pytest.mark.asyncio
+async def test_cache_manager_log_cache(tmp_path):
+    """Test the cache manager exposes the log cache when configured."""
+    from summit_seo.cache import cache_manager
+    
+    cache_manager.initialize({"log": {"cache_dir": str(tmp_path / "log")}})
+    
+    await cache_manager.set("robots", "User-agent: *", cache_type="log", name="long")
+    result = await cache_manager.get("robots", cache_type="log", name="long")
+    
+    assert result.value == "User-agent: *"
+    assert cache_manager.get_cache("log", "long").config.namespace == "long_term"
+    
+    for name in (None, "short", "medium", "long"):
+        await cache_manager.get_cache("log", name).close()
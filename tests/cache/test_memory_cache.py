@@ -211,4 +211,40 @@ async def test_memory_cache_stats(memory_cache):
     # Verify basic stats
     assert stats["hits"] == 1
     assert stats["misses"] == 1
-    assert stats["sets"] == 1 
\ No newline at end of file
+    assert stats["sets"] == 1 
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_stale_while_revalidate():
+    """Test expired entries are served stale within the stale window."""
+    cache = MemoryCache(CacheConfig(ttl=0.1, stale_ttl=10, namespace="stale"))
+    
+    await cache.set("stale_key", "stale_value")
+    
+    # Wait for the entry to expire
+    await asyncio.sleep(0.15)
+    
+    # Entry is still returned, but marked stale
+    result = await cache.get("stale_key")
+    assert result.hit is True
+    assert result.expired is True
+    assert result.value == "stale_value"
+    assert result.metadata.get("stale") is True
+    
+    # Stale entries survive cleanup but are not reported as present
+    assert await cache.cleanup_expired() == 0
+    assert await cache.has_key("stale_key") is False
+    assert cache.get_stats()["stale_hits"] == 1
+
+@pytest.mark.asyncio
+async def test_memory_cache_stale_window_elapsed(memory_cache):
+    """Test entries are dropped once the stale window has passed."""
+    await memory_cache.set("short_stale", "value", ttl=0.1, stale_ttl=0.1)
+    
+    # Wait past both the TTL and the stale window
+    await asyncio.sleep(0.25)
+    
+    result = await memory_cache.get("short_stale")
+    assert result.hit is False
+    assert result.value is None
+    assert result.expired is True
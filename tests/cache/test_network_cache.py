@@ -0,0 +1,171 @@
+"""Tests for the shared network cache backend."""
+
+import asyncio
+
+import pytest
+
+from summit_seo.cache import cache_manager
+from summit_seo.cache.base import CacheConfig, CacheConfigError, CacheKeyError
+from summit_seo.cache.network_cache import NetworkCache, NetworkCacheError
+from summit_seo.cache.resp import RespConnection
+from summit_seo.cache.resp_server import RespServer
+
+@pytest.fixture
+async def server():
+    """Run an in-process cache server."""
+    async with RespServer() as server:
+        yield server
+
+@pytest.fixture
+async def cache(server):
+    """Create a network cache connected to the in-process server."""
+    cache = NetworkCache(CacheConfig(server_url=server.url, namespace="test"))
+    yield cache
+    await cache.close()
+
+@pytest.mark.asyncio
+async def test_requires_server_url():
+    """Test the backend refuses to start without a server."""
+    with pytest.raises(CacheConfigError):
+        NetworkCache(CacheConfig())
+
+@pytest.mark.asyncio
+async def test_set_and_get(cache):
+    """Test basic round trip through the server."""
+    await cache.set("key", {"value": [1, 2, 3]})
+    result = await cache.get("key")
+    
+    assert result.hit
+    assert result.value == {"value": [1, 2, 3]}
+    assert not (await cache.get("missing")).hit
+    
+    with pytest.raises(CacheKeyError):
+        await cache.get(None)
+
+@pytest.mark.asyncio
+async def test_workers_share_entries(server):
+    """Test separate cache instances see each other's writes."""
+    worker1 = NetworkCache(CacheConfig(server_url=server.url))
+    worker2 = NetworkCache(CacheConfig(server_url=server.url))
+    
+    await worker1.set("page", "<html></html>")
+    result = await worker2.get("page")
+    
+    assert result.hit
+    assert result.value == "<html></html>"
+    
+    await worker1.close()
+    await worker2.close()
+
+@pytest.mark.asyncio
+async def test_get_many_and_set_many_are_pipelined(cache, server):
+    """Test batched operations use one command per entry and one MGET."""
+    before = server.get_stats()["commands_processed"]
+    
+    await cache.set_many({f"k{i}": i for i in range(10)})
+    results = await cache.get_many([f"k{i}" for i in range(10)] + ["missing"])
+    
+    assert server.get_stats()["commands_processed"] - before == 11
+    assert [results[f"k{i}"].value for i in range(10)] == list(range(10))
+    assert not results["missing"].hit
+
+@pytest.mark.asyncio
+async def test_server_side_ttl_and_stale_window(cache, server):
+    """Test entries are served stale, then dropped by the server."""
+    await cache.set("stale", "value", ttl=1, stale_ttl=1)
+    await cache.set("gone", "value", ttl=1)
+    
+    await asyncio.sleep(1.1)
+    
+    stale = await cache.get("stale")
+    assert stale.hit and stale.expired
+    assert stale.metadata["stale"] is True
+    assert not await cache.has_key("stale")
+    assert not (await cache.get("gone")).hit
+    
+    await asyncio.sleep(1.0)
+    assert not (await cache.get("stale")).hit
+
+@pytest.mark.asyncio
+async def test_namespace_scanning(server):
+    """Test key queries and invalidation are scoped by namespace prefix."""
+    pages = NetworkCache(CacheConfig(server_url=server.url, namespace="pages"))
+    other = NetworkCache(CacheConfig(server_url=server.url, namespace="other"))
+    
+    await pages.set_many({"page:1": 1, "page:2": 2, "site": 3})
+    await other.set("page:1", 4)
+    
+    assert sorted(await pages.get_keys()) == ["page:1", "page:2", "site"]
+    assert sorted(await pages.get_keys("page:*")) == ["page:1", "page:2"]
+    assert await pages.get_size() == 3
+    
+    assert await pages.invalidate_namespace() == 3
+    assert await pages.get_size() == 0
+    assert (await other.get("page:1")).value == 4
+    
+    assert await other.clear() == 1
+    
+    await pages.close()
+    await other.close()
+
+@pytest.mark.asyncio
+async def test_invalidate(cache):
+    """Test single-key invalidation."""
+    await cache.set("key", 1)
+    
+    assert await cache.invalidate("key")
+    assert not await cache.invalidate("key")
+
+@pytest.mark.asyncio
+async def test_unreachable_server_raises_cache_error(tmp_path):
+    """Test connection failures surface as NetworkCacheError."""
+    cache = NetworkCache(CacheConfig(server_url=f"unix://{tmp_path}/missing.sock"))
+    
+    with pytest.raises(NetworkCacheError):
+        await cache.get("key")
+    assert cache.get_stats()["errors"] == 1
+
+@pytest.mark.asyncio
+async def test_local_socket_server(tmp_path):
+    """Test the local-socket stand-in serves pipelined clients."""
+    async with RespServer(unix_path=str(tmp_path / "cache.sock")) as server:
+        connection = RespConnection(server.url)
+        
+        replies = await asyncio.gather(*(
+            connection.execute("SET", f"key{i}", i) for i in range(50)
+        ))
+        assert replies == [b"OK"] * 50
+        assert await connection.execute("DBSIZE") == 50
+        
+        await connection.close()
+
+@pytest.mark.asyncio
+async def test_connection_selects_database(server):
+    """Test connecting to a non-zero database does not wait on itself."""
+    connection = RespConnection(server.url[:-1] + "1")
+    
+    assert await asyncio.wait_for(connection.execute("SET", "key", 1), 2) == b"OK"
+    assert await connection.execute("GET", "key") == b"1"
+    
+    await connection.close()
+
+@pytest.mark.asyncio
+async def test_cache_manager_network_cache(server):
+    """Test the cache manager exposes the network cache when configured."""
+    cache_manager.initialize({"network": {"server_url": server.url}})
+    
+    await cache_manager.set("key", "value", cache_type="network", name="short")
+    result = await cache_manager.get("key", cache_type="network", name="short")
+    
+    assert result.value == "value"
+    assert cache_manager.get_cache("network", "short").config.namespace == "short_term"
+    
+    for name in (None, "short", "medium", "long"):
+        await cache_manager.get_cache("network", name).close()
+
+def test_cache_manager_without_network_cache():
+    """Test requesting the network cache without a server fails clearly."""
+    cache_manager.initialize()
+    
+    with pytest.raises(ValueError):
+        cache_manager.get_cache("network")
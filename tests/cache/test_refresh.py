@@ -0,0 +1,67 @@
+"""Tests for the background refresh scheduler."""
+
+import pytest
+import asyncio
+
+from summit_seo.cache.base import CacheConfigError
+from summit_seo.cache.refresh import RefreshScheduler
+
+@pytest.mark.asyncio
+async def test_refresh_scheduler_deduplicates_keys():
+    """Test only one refresh per key is in flight."""
+    scheduler = RefreshScheduler(max_concurrent=2)
+    calls = []
+    
+    async def refresh():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+    
+    assert scheduler.schedule("key", refresh) is True
+    assert scheduler.schedule("key", refresh) is False
+    assert scheduler.is_refreshing("key") is True
+    
+    assert await scheduler.wait(timeout=1) is True
+    assert len(calls) == 1
+    assert scheduler.is_refreshing("key") is False
+    
+    stats = scheduler.get_stats()
+    assert stats["completed"] == 1
+    assert stats["deduplicated"] == 1
+
+@pytest.mark.asyncio
+async def test_refresh_scheduler_concurrency_limit():
+    """Test refreshes never exceed the concurrency limit."""
+    scheduler = RefreshScheduler(max_concurrent=2)
+    running = 0
+    peak = 0
+    
+    async def refresh():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+    
+    for i in range(6):
+        scheduler.schedule(f"key{i}", refresh)
+    
+    await scheduler.wait(timeout=1)
+    assert peak == 2
+
+@pytest.mark.asyncio
+async def test_refresh_scheduler_failure_is_contained():
+    """Test a failing refresh is counted and does not propagate."""
+    scheduler = RefreshScheduler()
+    
+    async def refresh():
+        raise ValueError("upstream down")
+    
+    scheduler.schedule("key", refresh)
+    await scheduler.wait(timeout=1)
+    
+    assert scheduler.get_stats()["failed"] == 1
+
+def test_refresh_scheduler_invalid_limit():
+    """Test invalid concurrency limits are rejected."""
+    with pytest.raises(CacheConfigError):
+        RefreshScheduler(max_concurrent=0)
@@ -0,0 +1,223 @@
+"""Tests for cache warming."""
+
+import json
+
+import pytest
+
+from summit_seo.analyzer import AnalyzerFactory, BaseAnalyzer
+from summit_seo.analyzer.base import AnalysisResult
+from summit_seo.cache import CacheWarmer, CacheWarmerError, load_run_urls, save_run_urls
+from summit_seo.collector import BaseCollector, CollectorFactory
+from summit_seo.parallel import ParallelManager, ProcessingStrategy
+
+SITEMAP = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">
+  <url><loc>https://example.com/</loc></url>
+  <url>
+    <loc>https://example.com/about</loc>
+    <image:image><image:loc>https://example.com/logo.png</image:loc></image:image>
+  </url>
+  <url><loc>https://example.com/</loc></url>
+</urlset>
+"""
+
+SITEMAP_INDEX = """<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>{child}</loc></sitemap>
+</sitemapindex>
+"""
+
+
+class WarmCollector(BaseCollector):
+    """Collector returning a fixed page and counting fetches."""
+
+    fetches = []
+
+    async def _collect_data(self, url):
+        if url.endswith('/broken'):
+            raise RuntimeError("connection refused")
+        WarmCollector.fetches.append(url)
+        return {
+            'content': f'<html><body>{url}</body></html>',
+            'status_code': 200,
+            'headers': {}
+        }
+
+
+class WarmAnalyzer(BaseAnalyzer):
+    """Analyzer counting analyses that were not served from the cache."""
+
+    analyses = []
+
+    async def _analyze(self, data):
+        WarmAnalyzer.analyses.append(data)
+        return AnalysisResult(
+            data={},
+            metadata=self.create_metadata('warm'),
+            score=1.0,
+            issues=[],
+            warnings=[],
+            recommendations=[]
+        )
+
+
+@pytest.fixture
+def warm_components():
+    """Register the counting collector and analyzer."""
+    WarmCollector.fetches = []
+    WarmAnalyzer.analyses = []
+    CollectorFactory.register('warm_test', WarmCollector)
+    AnalyzerFactory.register('warm_test', WarmAnalyzer)
+    yield
+    CollectorFactory.deregister('warm_test')
+    AnalyzerFactory._registry.pop('warm_test', None)
+
+
+def make_warmer(**kwargs):
+    """Create a warmer using the counting components."""
+    return CacheWarmer(
+        analyzers=['warm_test'],
+        collector='warm_test',
+        collector_config={'max_retries': 1, 'retry_delay': 0, 'rate_limit': 1000},
+        **kwargs
+    )
+
+
+def test_run_urls_round_trip(tmp_path):
+    path = str(tmp_path / 'runs' / 'last_run.json')
+    save_run_urls(['https://example.com/', 'https://example.com/a'], path)
+
+    assert load_run_urls(path) == ['https://example.com/', 'https://example.com/a']
+    with open(path) as f:
+        assert 'timestamp' in json.load(f)
+
+
+def test_load_run_urls_errors(tmp_path):
+    with pytest.raises(CacheWarmerError):
+        load_run_urls(str(tmp_path / 'missing.json'))
+
+    invalid = tmp_path / 'invalid.json'
+    invalid.write_text('{"urls": "https://example.com/"}')
+    with pytest.raises(CacheWarmerError):
+        load_run_urls(str(invalid))
+
+
+def test_invalid_concurrency():
+    with pytest.raises(CacheWarmerError):
+        CacheWarmer(concurrency=0)
+
+
+async def test_urls_from_sitemap_follows_index(tmp_path):
+    child = tmp_path / 'pages.xml'
+    child.write_text(SITEMAP)
+    index = tmp_path / 'sitemap.xml'
+    index.write_text(SITEMAP_INDEX.format(child=child))
+
+    warmer = CacheWarmer()
+    urls = await warmer.urls_from_sitemap(str(index))
+
+    assert urls == ['https://example.com/', 'https://example.com/about']
+    assert await warmer.urls_from_sitemap(str(index), max_urls=1) == ['https://example.com/']
+
+
+async def test_warm_populates_caches(warm_components):
+    urls = [f'https://example.com/page{i}' for i in range(6)]
+    updates = []
+
+    warmer = make_warmer(concurrency=2, progress_callback=updates.append)
+    stats = await warmer.warm(urls + urls[:2])
+
+    assert stats['total'] == 6
+    assert stats['completed'] == 6
+    assert stats['failed'] == 0
+    assert stats['analyses'] == 6
+    assert sorted(WarmCollector.fetches) == sorted(urls)
+    assert len(WarmAnalyzer.analyses) == 6
+    assert len(updates) == 6
+    assert updates[-1]['percentage'] == 100.0
+    assert warmer.get_stats()['progress'] == 100.0
+
+    # A second run is served entirely from the warmed caches
+    stats = await make_warmer().warm(urls)
+    assert stats['collected_from_cache'] == 6
+    assert len(WarmCollector.fetches) == 6
+    assert len(WarmAnalyzer.analyses) == 6
+
+
+async def test_warm_skips_analyzers_that_cannot_be_created(warm_components):
+    warmer = make_warmer()
+    warmer.analyzer_names = ['warm_test', 'not_registered']
+
+    stats = await warmer.warm(['https://example.com/'])
+
+    assert stats['completed'] == 1
+    assert stats['analyses'] == 1
+
+
+async def test_warm_reports_failures(warm_components):
+    warmer = make_warmer()
+    stats = await warmer.warm(['https://example.com/ok', 'https://example.com/broken'])
+
+    assert stats['completed'] == 1
+    assert stats['failed'] == 1
+    assert 'connection refused' in stats['errors']['https://example.com/broken']
+
+
+async def test_warm_from_last_run_with_shared_manager(warm_components, tmp_path):
+    path = str(tmp_path / 'last_run.json')
+    save_run_urls(['https://example.com/a', 'https://example.com/b'], path)
+
+    manager = ParallelManager(max_workers=4, strategy=ProcessingStrategy.PRIORITY)
+    await manager.start()
+    try:
+        stats = await make_warmer(manager=manager).warm_from_last_run(path)
+    finally:
+        await manager.stop()
+
+    assert stats['completed'] == 2
+    assert sorted(WarmCollector.fetches) == ['https://example.com/a', 'https://example.com/b']
+
+
+async def test_cli_warm_persists_for_new_cache_instances(warm_components, tmp_path, monkeypatch):
+    import argparse
+
+    import summit_seo.cache as cache_package
+    from summit_seo.cache import cache_manager
+    from summit_seo.cli.main import run_cache_warm
+
+    class TestWarmer(CacheWarmer):
+        def __init__(self, **kwargs):
+            kwargs['collector_config'] = dict(kwargs['collector_config'], max_retries=1, retry_delay=0)
+            super().__init__(collector='warm_test', **dict(kwargs, analyzers=['warm_test']))
+
+    monkeypatch.setattr(cache_package, 'CacheWarmer', TestWarmer)
+    run_file = str(tmp_path / 'last_run.json')
+    cache_dir = str(tmp_path / 'cache')
+    save_run_urls(['https://example.com/a', 'https://example.com/b'], run_file)
+
+    args = argparse.Namespace(
+        analyzers=None, concurrency=2, timeout=None, quiet=True, sitemap=None,
+        run_file=run_file, cache_type='file', cache_dir=cache_dir, cache_server=None
+    )
+    stats = await run_cache_warm(args)
+    assert stats['completed'] == 2
+
+    # New cache instances over the same directory, as in another process
+    cache_manager.reset()
+    cache_manager.initialize({'file': {'cache_dir': cache_dir}})
+    warmer = CacheWarmer(
+        analyzers=['warm_test'],
+        collector='warm_test',
+        collector_config={'cache_type': 'file'},
+        analyzer_config={'cache_type': 'file'}
+    )
+    stats = await warmer.warm_from_last_run(run_file)
+
+    assert stats['collected_from_cache'] == 2
+    assert len(WarmCollector.fetches) == 2
+    assert len(WarmAnalyzer.analyses) == 2
+
+    args.cache_type = 'network'
+    with pytest.raises(CacheWarmerError):
+        await run_cache_warm(args)
@@ -0,0 +1,106 @@
+"""Tests for resumable batch analysis in the CLI."""
+
+import json
+
+import pytest
+
+from summit_seo.analyzer import AnalyzerFactory, BaseAnalyzer
+from summit_seo.analyzer.base import AnalysisResult
+from summit_seo.cli.batch_runner import BatchRunner, read_url_file
+from summit_seo.collector import BaseCollector, CollectorFactory
+from summit_seo.parallel import JobStore, JobStoreError
+
+
+class BatchCollector(BaseCollector):
+    """Collector returning a fixed page; fails for URLs listed in ``broken``."""
+
+    fetches = []
+    broken = set()
+
+    async def _collect_data(self, url):
+        if url in BatchCollector.broken:
+            raise RuntimeError("connection refused")
+        BatchCollector.fetches.append(url)
+        return {
+            'content': f'<html><body>{url}</body></html>',
+            'status_code': 200,
+            'headers': {}
+        }
+
+
+class BatchAnalyzer(BaseAnalyzer):
+    """Analyzer returning a fixed score."""
+
+    async def _analyze(self, data):
+        return AnalysisResult(
+            data={'length': len(data)},
+            metadata=self.create_metadata('batch'),
+            score=1.0,
+            issues=[],
+            warnings=[],
+            recommendations=[]
+        )
+
+
+@pytest.fixture
+def batch_components():
+    """Register the batch collector and analyzer."""
+    BatchCollector.fetches = []
+    BatchCollector.broken = set()
+    CollectorFactory.register('batch_test', BatchCollector)
+    AnalyzerFactory.register('batch_test', BatchAnalyzer)
+    yield
+    CollectorFactory.deregister('batch_test')
+    AnalyzerFactory._registry.pop('batch_test', None)
+
+
+def make_runner(tmp_path, **kwargs):
+    """Create a batch runner using the test components."""
+    return BatchRunner(
+        store_path=str(tmp_path / 'jobs.db'),
+        analyzers=['batch_test'],
+        output_dir=str(tmp_path / 'results'),
+        collector='batch_test',
+        collector_config={'max_retries': 1, 'retry_delay': 0, 'rate_limit': 1000},
+        **kwargs
+    )
+
+
+def test_read_url_file(tmp_path):
+    path = tmp_path / 'urls.txt'
+    path.write_text('# pages\nhttps://example.com/a\n\n  https://example.com/b  \n')
+
+    assert read_url_file(str(path)) == ['https://example.com/a', 'https://example.com/b']
+    with pytest.raises(JobStoreError):
+        read_url_file(str(tmp_path / 'missing.txt'))
+
+
+async def test_batch_resume_skips_completed_urls(batch_components, tmp_path):
+    urls = [f'https://example.com/{i}' for i in range(4)]
+    BatchCollector.broken = {urls[2]}
+
+    summary = await make_runner(tmp_path, max_attempts=1).run(urls, job_id='crawl')
+
+    assert (summary['completed'], summary['failed']) == (3, 1)
+    store = JobStore(str(tmp_path / 'jobs.db'))
+    try:
+        task = store.get_tasks('crawl')[0]
+        with open(task.result_location) as f:
+            assert json.load(f)['results']['batch_test']['score'] == 1.0
+    finally:
+        store.close()
+
+    # The site recovers; resuming with another attempt only fetches the failed URL
+    BatchCollector.broken = set()
+    BatchCollector.fetches = []
+    summary = await make_runner(tmp_path, max_attempts=2).run(job_id='crawl', resume=True)
+
+    assert BatchCollector.fetches == [urls[2]]
+    assert (summary['completed'], summary['failed'], summary['skipped']) == (4, 0, 3)
+
+
+async def test_batch_errors(batch_components, tmp_path):
+    with pytest.raises(JobStoreError):
+        await make_runner(tmp_path).run(job_id='missing', resume=True)
+    with pytest.raises(JobStoreError):
+        await make_runner(tmp_path).run([])
@@ -204,4 +204,51 @@ class MockCollector(BaseCollector):
             'status_code': 200,
             'headers': {'Content-Type': 'text/html'},
             'metadata': {'test': 'data'}
-        } 
\ No newline at end of file
+        } 
+
+
+class CountingCollector(BaseCollector):
+    """Collector that counts fetches, for cache behaviour tests."""
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.fetch_count = 0
+    
+    async def _collect_data(self, url: str) -> Dict[str, Any]:
+        self.fetch_count += 1
+        return {
+            'content': f'<html><body>Fetch {self.fetch_count}</body></html>',
+            'status_code': 200,
+            'headers': {'Content-Type': 'text/html'}
+        }
+
+# Stale-While-Revalidate Tests
+@pytest.mark.asyncio
+async def test_stale_result_served_and_refreshed():
+    """Test expired results within the stale window are served and refreshed."""
+    from summit_seo.cache import cache_manager
+    
+    collector = CountingCollector({
+        'cache_ttl': 0.1,
+        'cache_stale_ttl': 60,
+        'requests_per_second': 100
+    })
+    url = 'https://example.com/stale'
+    
+    first = await collector.collect(url)
+    assert first.stale is False
+    assert collector.fetch_count == 1
+    
+    # Let the entry expire
+    await asyncio.sleep(0.15)
+    
+    stale = await collector.collect(url)
+    assert stale.stale is True
+    assert 'Fetch 1' in stale.content
+    
+    # The background refresh stores a fresh result
+    await cache_manager.wait_for_refreshes(timeout=5)
+    assert collector.fetch_count == 2
+    
+    fresh = await collector.collect(url)
+    assert fresh.stale is False
+    assert 'Fetch 2' in fresh.content
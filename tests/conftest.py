@@ -4,6 +4,13 @@ import pytest
 from typing import Dict, Any
 from bs4 import BeautifulSoup
 
+@pytest.fixture(autouse=True)
+def reset_cache_manager():
+    """Reset the shared cache manager so cached results don't leak between tests."""
+    yield
+    from summit_seo.cache import cache_manager
+    cache_manager.reset()
+
 @pytest.fixture
 def sample_html() -> str:
     """Sample HTML content for testing."""
@@ -6,7 +6,8 @@ import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from summit_seo.memory.limiter import (
-    LimitAction, LimitScope, MemoryLimit, MemoryLimiter, MemoryThreshold
+    AdmissionDecision, LimitAction, LimitScope, MemoryLimit, MemoryLimiter, MemoryThreshold,
+    estimate_memory_cost
 )
 from summit_seo.memory.monitor import MemoryLimitExceededError, MemoryMonitor, MemoryUnit
 
@@ -352,6 +353,34 @@ class TestMemoryLimiter:
         assert memory_limiter.get_throttle_factor() == 1.0
         assert not memory_limiter.should_throttle()
         
+    def test_check_admission(self, memory_limiter, memory_monitor):
+        """Test admission decisions against the memory budget."""
+        memory_monitor.process = MagicMock()
+        memory_monitor.process.memory_info.return_value = MagicMock(rss=100 * 1024 * 1024)
+        mb = 1024 * 1024
+        
+        # Without a memory limit, admission follows the throttle factor
+        assert memory_limiter.check_admission(cost=10 * mb) == AdmissionDecision.ADMIT
+        memory_limiter.apply_throttling(0.5)
+        assert memory_limiter.check_admission() == AdmissionDecision.DEFER
+        memory_limiter.reset_throttling()
+        
+        memory_limiter.memory_limit = MemoryLimit(soft_limit=150, hard_limit=200, critical_limit=250)
+        assert memory_limiter.check_admission(cost=20 * mb, reserved=20 * mb) == AdmissionDecision.ADMIT
+        assert memory_limiter.check_admission(cost=20 * mb, reserved=40 * mb) == AdmissionDecision.DEFER
+        
+        # Samples are reused briefly, so admission checks stay cheap
+        memory_monitor.process.memory_info.return_value = MagicMock(rss=210 * mb)
+        assert memory_limiter.get_memory_usage() == 100 * mb
+        assert memory_limiter.get_memory_usage(max_age=0) == 210 * mb
+        assert memory_limiter.check_admission() == AdmissionDecision.SHED
+        
+    def test_estimate_memory_cost(self):
+        """Test the page cost estimate."""
+        assert estimate_memory_cost(1000, analyzer_count=3, expansion=2.0) == 6000
+        assert estimate_memory_cost(1000, analyzer_count=0, expansion=1.0) == 1000
+        assert estimate_memory_cost(-5) == 0
+        
     @patch('gc.collect')
     def test_handle_exceeded_threshold(self, mock_collect, memory_limiter):
         """Test handling exceeded thresholds."""
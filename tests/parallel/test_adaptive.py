@@ -0,0 +1,129 @@
+"""Tests for the adaptive concurrency controller."""
+
+import pytest
+
+from summit_seo.parallel import AdaptiveConcurrencyController, ProcessingStatistics
+
+
+class FakeLimiter:
+    """Memory limiter stand-in with a settable throttle factor."""
+
+    def __init__(self):
+        self.factor = 1.0
+
+    def get_throttle_factor(self):
+        return self.factor
+
+
+class Workload:
+    """Builds cumulative statistics interval by interval."""
+
+    def __init__(self):
+        self.stats = ProcessingStatistics()
+        self.busy_time = 0.0
+
+    def interval(self, completed=10, failed=0, timed_out=0, latency=0.1):
+        self.stats.completed += completed
+        self.stats.failed += failed
+        self.stats.timed_out += timed_out
+        self.busy_time += completed * latency
+        if self.stats.completed:
+            self.stats.avg_duration = self.busy_time / self.stats.completed
+        return self.stats
+
+
+class TestAdaptiveConcurrencyController:
+    """Tests for the AdaptiveConcurrencyController class."""
+
+    def test_additive_increase_while_tasks_wait(self):
+        """Test that the target grows by one per healthy, saturated interval."""
+        controller = AdaptiveConcurrencyController(max_concurrency=6, initial_concurrency=2)
+        workload = Workload()
+
+        targets = [controller.update(workload.interval(), queued=5) for _ in range(6)]
+
+        assert targets == [3, 4, 5, 6, 6, 6]
+        assert controller.get_statistics()["increases"] == 4
+
+    def test_holds_without_demand(self):
+        """Test that an idle or unsaturated executor does not grow."""
+        controller = AdaptiveConcurrencyController(initial_concurrency=4)
+        workload = Workload()
+
+        assert controller.update(workload.interval(), queued=0) == 4
+        assert controller.update(workload.interval(completed=0), queued=10) == 4
+        assert controller.get_statistics()["last_reason"] == "steady"
+
+    def test_multiplicative_decrease_on_errors_and_timeouts(self):
+        """Test that failures halve the target."""
+        controller = AdaptiveConcurrencyController(max_concurrency=32, initial_concurrency=16)
+        workload = Workload()
+
+        assert controller.update(workload.interval(completed=8, failed=2), queued=5) == 8
+        assert controller.get_statistics()["last_reason"] == "errors"
+
+        # One timeout is enough, and a low error rate is tolerated
+        assert controller.update(workload.interval(completed=50, failed=1, timed_out=1)) == 4
+        assert controller.get_statistics()["last_reason"] == "timeouts"
+        assert controller.update(workload.interval(completed=50, failed=1), queued=5) == 5
+
+    def test_decrease_on_latency(self):
+        """Test that latency well above the best seen reduces the target."""
+        controller = AdaptiveConcurrencyController(max_concurrency=32, initial_concurrency=10)
+        workload = Workload()
+
+        assert controller.update(workload.interval(latency=0.1), queued=5) == 11
+        assert controller.update(workload.interval(latency=0.15), queued=5) == 12
+        assert controller.update(workload.interval(latency=0.5), queued=5) == 6
+        assert controller.get_statistics()["last_reason"] == "latency"
+        assert controller.get_statistics()["last_latency"] == pytest.approx(0.5)
+
+    def test_memory_pressure(self):
+        """Test that the memory limiter's throttle factor scales the target."""
+        limiter = FakeLimiter()
+        controller = AdaptiveConcurrencyController(
+            min_concurrency=2,
+            max_concurrency=32,
+            initial_concurrency=20,
+            memory_limiter=limiter
+        )
+        workload = Workload()
+
+        limiter.factor = 0.25
+        assert controller.update(workload.interval(), queued=5) == 8
+        assert controller.update(workload.interval(), queued=5) == 8
+        assert controller.get_statistics()["throttle_factor"] == 0.25
+        assert controller.get_statistics()["decreases"] == 1
+
+        limiter.factor = 1.0
+        assert controller.update(workload.interval(), queued=5) == 9
+
+    def test_constant_memory_pressure_settles_at_cap(self):
+        """Test that a lasting throttle factor caps the target instead of shrinking it."""
+        limiter = FakeLimiter()
+        controller = AdaptiveConcurrencyController(
+            max_concurrency=8,
+            initial_concurrency=8,
+            memory_limiter=limiter
+        )
+        workload = Workload()
+
+        limiter.factor = 0.9
+        targets = [controller.update(workload.interval(), queued=5) for _ in range(6)]
+
+        assert targets == [7] * 6
+        assert controller.get_statistics()["last_reason"] == "steady"
+
+        # Below the cap the controller still grows, but only up to it
+        controller.target = 5
+        targets = [controller.update(workload.interval(), queued=5) for _ in range(4)]
+        assert targets == [6, 7, 7, 7]
+
+    def test_invalid_configuration(self):
+        """Test that invalid limits are rejected."""
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyController(min_concurrency=0)
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyController(min_concurrency=4, max_concurrency=2)
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyController(decrease_factor=1.0)
@@ -0,0 +1,171 @@
+"""Tests for the task broker and broker workers."""
+
+import asyncio
+
+import pytest
+
+from summit_seo.parallel import BrokerWorker, SQLiteBroker, TaskStatus
+
+
+@pytest.fixture
+async def broker(tmp_path):
+    """Create a broker in a temporary directory."""
+    broker = SQLiteBroker(str(tmp_path / "broker.db"))
+    yield broker
+    await broker.close()
+
+
+class TestSQLiteBroker:
+    """Tests for the SQLiteBroker class."""
+
+    @pytest.mark.asyncio
+    async def test_lease_and_complete(self, broker):
+        """Test the lifecycle of a task."""
+        low = await broker.enqueue("analyze", "https://example.com/low", priority=5)
+        high = await broker.enqueue("analyze", {"url": "https://example.com/high"}, priority=1)
+
+        task = await broker.lease("analyze", "worker-1", visibility_timeout=30)
+        assert task.id == high
+        assert task.payload == {"url": "https://example.com/high"}
+        assert (task.status, task.attempts, task.lease_owner) == (TaskStatus.RUNNING, 1, "worker-1")
+
+        assert await broker.heartbeat(task, visibility_timeout=30)
+        assert await broker.complete(task, {"score": 0.9})
+
+        stored = await broker.get_task(high)
+        assert stored.done
+        assert stored.result == {"score": 0.9}
+        assert (await broker.lease("analyze", "worker-1", 30)).id == low
+        assert await broker.lease("analyze", "worker-1", 30) is None
+        assert await broker.lease("other", "worker-1", 30) is None
+
+        stats = await broker.get_statistics("analyze")
+        assert (stats["completed"], stats["running"], stats["total"]) == (1, 1, 2)
+
+    @pytest.mark.asyncio
+    async def test_keys_deduplicate(self, broker):
+        """Test that enqueueing a known key returns the existing task."""
+        first = await broker.enqueue("analyze", "a", key="a")
+        ids = await broker.enqueue_many("analyze", ["a", "b", "b"], key=lambda url: url)
+
+        assert ids[0] == first
+        assert ids[1] == ids[2]
+        assert (await broker.get_statistics())["total"] == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_handed_out_again(self, broker):
+        """Test the visibility timeout and stale lease tokens."""
+        task_id = await broker.enqueue("analyze", "a", max_attempts=2)
+
+        stale = await broker.lease("analyze", "worker-1", visibility_timeout=0.05)
+        assert await broker.lease("analyze", "worker-2", 30) is None
+        await asyncio.sleep(0.1)
+
+        fresh = await broker.lease("analyze", "worker-2", visibility_timeout=0.05)
+        assert fresh.id == task_id
+        assert fresh.attempts == 2
+
+        # The first worker lost its lease and cannot report
+        assert not await broker.heartbeat(stale, 30)
+        assert not await broker.complete(stale, "late")
+
+        # Out of attempts, the next expiry fails the task for good
+        await asyncio.sleep(0.1)
+        assert await broker.lease("analyze", "worker-3", 30) is None
+        task = await broker.get_task(task_id)
+        assert (task.status, task.error) == (TaskStatus.FAILED, "lease expired")
+
+    @pytest.mark.asyncio
+    async def test_fail_retries_until_max_attempts(self, broker):
+        """Test that failed tasks are retried while they have attempts left."""
+        task_id = await broker.enqueue("analyze", "a", max_attempts=2)
+
+        task = await broker.lease("analyze", "worker-1", 30)
+        assert await broker.fail(task, "timeout")
+        assert (await broker.get_task(task_id)).status == TaskStatus.PENDING
+
+        task = await broker.lease("analyze", "worker-1", 30)
+        assert await broker.fail(task, "timeout")
+        task = await broker.wait_for(task_id, timeout=1)
+        assert (task.status, task.attempts, task.error) == (TaskStatus.FAILED, 2, "timeout")
+
+
+@pytest.mark.asyncio
+async def test_workers_share_a_queue(tmp_path):
+    """Test that workers with separate connections split a queue."""
+    path = str(tmp_path / "broker.db")
+    submitter = SQLiteBroker(path)
+    brokers = [SQLiteBroker(path) for _ in range(2)]
+    seen = []
+
+    async def analyze(url):
+        await asyncio.sleep(0.01)
+        if url.endswith("/broken"):
+            raise ConnectionError("connection refused")
+        seen.append(url)
+        return {"url": url}
+
+    try:
+        urls = [f"https://example.com/{i}" for i in range(10)] + ["https://example.com/broken"]
+        ids = await submitter.enqueue_many("analyze", urls, key=lambda url: url, max_attempts=2)
+
+        workers = [
+            BrokerWorker(broker, {"analyze": analyze}, concurrency=2, poll_interval=0.01,
+                         worker_id=f"worker-{i}")
+            for i, broker in enumerate(brokers)
+        ]
+        stats = await asyncio.gather(*(worker.run(exit_when_idle=True) for worker in workers))
+
+        assert sorted(seen) == sorted(urls[:-1])
+        assert sum(s["completed"] for s in stats) == 10
+        assert sum(s["failed"] for s in stats) == 2
+
+        done = await submitter.get_task(ids[0])
+        assert done.result == {"url": urls[0]}
+        failed = await submitter.get_task(ids[-1])
+        assert (failed.status, failed.attempts) == (TaskStatus.FAILED, 2)
+        assert failed.error == "connection refused"
+    finally:
+        for broker in [submitter, *brokers]:
+            await broker.close()
+
+
+@pytest.mark.asyncio
+async def test_worker_renews_leases(broker):
+    """Test that heartbeats keep a long task leased past its visibility timeout."""
+    release = asyncio.Event()
+
+    async def slow(payload):
+        await release.wait()
+        return payload
+
+    task_id = await broker.enqueue("slow", "a")
+    worker = BrokerWorker(broker, {"slow": slow}, visibility_timeout=0.2, poll_interval=0.01)
+    run = asyncio.create_task(worker.run(max_tasks=1))
+
+    await asyncio.sleep(0.5)
+    assert await broker.lease("slow", "thief", 30) is None
+
+    release.set()
+    stats = await run
+    assert stats["completed"] == 1
+    assert stats["leases_lost"] == 0
+    assert (await broker.get_task(task_id)).result == "a"
+
+
+@pytest.mark.asyncio
+async def test_shared_filesystem_keeps_rollback_journal(tmp_path):
+    """Test that a broker shared across hosts does not use WAL mode."""
+    path = str(tmp_path / "broker.db")
+    local = SQLiteBroker(path)
+    assert local._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    await local.close()
+
+    # WAL mode persists in the file, so a shared broker switches it back
+    shared = SQLiteBroker(path, shared_filesystem=True)
+    try:
+        assert shared._conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        task_id = await shared.enqueue("analyze", "https://example.com")
+        assert (await shared.lease("analyze", "worker-1", visibility_timeout=30)).id == task_id
+    finally:
+        await shared.close()
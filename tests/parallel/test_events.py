@@ -0,0 +1,93 @@
+"""Tests for the task lifecycle event bus."""
+
+import asyncio
+import time
+
+import pytest
+
+from summit_seo.parallel import EventBus, ParallelExecutor, Task, TaskStatus
+
+
+@pytest.mark.asyncio
+async def test_events_are_delivered_in_batches():
+    """Test batching, status filters and subscriber errors."""
+    bus = EventBus(batch_size=3)
+    bus.publish("ignored", TaskStatus.RUNNING)  # No subscribers yet
+
+    batches = []
+    failures = []
+
+    async def record_failures(events):
+        failures.extend(event.task_id for event in events)
+
+    def broken(events):
+        raise RuntimeError("subscriber bug")
+
+    bus.subscribe(batches.append)
+    bus.subscribe(record_failures, statuses=[TaskStatus.FAILED])
+    broken_subscription = bus.subscribe(broken)
+    await bus.start()
+
+    for i in range(4):
+        bus.publish(f"task-{i}", TaskStatus.COMPLETED, result=i)
+    bus.publish("task-4", TaskStatus.FAILED, error=ValueError("boom"))
+    await asyncio.sleep(0)
+    broken_subscription.cancel()
+    await bus.stop()
+
+    assert [len(batch) for batch in batches] == [3, 2]
+    assert [event.result for event in batches[0]] == [0, 1, 2]
+    assert failures == ["task-4"]
+
+    stats = bus.get_statistics()
+    assert (stats["published"], stats["delivered"], stats["batches"]) == (5, 5, 2)
+    assert stats["subscriber_errors"] == 2
+    assert stats["subscribers"] == 2
+
+
+@pytest.mark.asyncio
+async def test_full_buffer_drops_oldest_events():
+    """Test that publishing never blocks on slow subscribers."""
+    bus = EventBus(capacity=2)
+    seen = []
+    bus.subscribe(lambda events: seen.extend(event.task_id for event in events))
+
+    # Not started yet, so nothing is delivered while the buffer wraps around
+    for i in range(5):
+        bus.publish(f"task-{i}", TaskStatus.COMPLETED)
+    await bus.start()
+    await bus.stop()
+
+    assert seen == ["task-3", "task-4"]
+    assert bus.get_statistics()["dropped"] == 3
+
+    with pytest.raises(ValueError):
+        EventBus(capacity=0)
+
+
+@pytest.mark.asyncio
+async def test_slow_callbacks_do_not_delay_tasks():
+    """Test that the executor's callbacks run off the task's critical path."""
+    executor = ParallelExecutor(max_workers=2)
+    calls = []
+
+    async def slow_callback(task_id, status, result=None, error=None):
+        await asyncio.sleep(0.05)
+        calls.append((task_id, status))
+
+    async def job(i):
+        return i
+
+    await executor.start(task_callback=slow_callback)
+    try:
+        start = time.perf_counter()
+        futures = await executor.submit_all([Task(id=f"t{i}", coro=job(i)) for i in range(5)])
+        assert await asyncio.gather(*futures) == list(range(5))
+        assert time.perf_counter() - start < 0.05
+    finally:
+        await executor.stop()
+
+    # Stopping delivers the remaining events in order
+    assert len(calls) == 10
+    assert calls.index(("t0", TaskStatus.RUNNING)) < calls.index(("t0", TaskStatus.COMPLETED))
+    assert executor.get_statistics()["events"]["backlog"] == 0
@@ -1,14 +1,38 @@
 """Tests for the ParallelExecutor class."""
 
 import asyncio
+import os
 import pytest
+import threading
 import time
 from unittest.mock import MagicMock, patch
 
 from summit_seo.parallel.executor import (
-    ExecutionStrategy, ParallelExecutor, WorkerType
+    DependencyFailedError, ExecutionStrategy, ParallelExecutor, WorkerType
 )
-from summit_seo.parallel.task import Task, TaskPriority, TaskStatus
+from summit_seo.memory.limiter import AdmissionDecision
+from summit_seo.memory.monitor import MemoryLimitExceededError
+from summit_seo.parallel.process import get_worker_analyzers, warm_up_worker
+from summit_seo.parallel.task import Task, TaskPriority, TaskStatus, create_task
+
+
+class FakeMemoryLimiter:
+    """Memory limiter stand-in returning a fixed admission decision."""
+    
+    def __init__(self, decision, usage=0, hard_limit=0):
+        self.decision = decision
+        self.usage = usage
+        self.memory_limit = MagicMock(hard_limit_bytes=hard_limit)
+        self.costs = []
+    
+    def check_admission(self, cost=0, reserved=0):
+        self.costs.append(cost)
+        return self.decision
+    
+    def get_memory_usage(self):
+        # Memory is back under the limit once tasks have been shed
+        self.decision = AdmissionDecision.ADMIT
+        return self.usage
 
 
 @pytest.fixture
@@ -398,4 +422,540 @@ class TestParallelExecutor:
         # Check all tasks are completed
         completed_tasks = await parallel_executor.get_completed_task_ids()
         assert "fast_task" in completed_tasks
-        assert "slow_task" in completed_tasks 
\ No newline at end of file
+        assert "slow_task" in completed_tasks     
+    @pytest.mark.asyncio
+    async def test_equal_priority_runs_in_submission_order(self):
+        """Test that tasks of equal priority run in submission order."""
+        executor = ParallelExecutor(max_workers=1, execution_strategy=ExecutionStrategy.PRIORITY)
+        await executor.start()
+        order = []
+        
+        async def record(value):
+            order.append(value)
+        
+        try:
+            futures = await executor.submit_all([Task(coro=record(i)) for i in range(20)])
+            await asyncio.gather(*futures)
+        finally:
+            await executor.stop()
+        
+        assert order == list(range(20))
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_task_is_skipped(self):
+        """Test that a cancelled queued task never runs."""
+        executor = ParallelExecutor(max_workers=1)
+        await executor.start()
+        ran = []
+        
+        async def record(value):
+            ran.append(value)
+            await asyncio.sleep(0.01)
+        
+        try:
+            futures = await executor.submit_all([
+                Task(id=f"task_{i}", coro=record(i)) for i in range(3)
+            ])
+            assert await executor.cancel_task("task_1")
+            assert not await executor.cancel_task("task_1")
+            
+            await asyncio.gather(futures[0], futures[2])
+        finally:
+            await executor.stop()
+        
+        assert ran == [0, 2]
+        assert futures[1].cancelled()
+        assert executor.get_statistics()["current_queue_size"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_idle_workers_do_not_poll(self):
+        """Test that idle workers schedule no timers and wake on submit."""
+        executor = ParallelExecutor(max_workers=4)
+        await executor.start()
+        loop = asyncio.get_running_loop()
+        
+        try:
+            await asyncio.sleep(0)
+            assert not [handle for handle in loop._scheduled if not handle.cancelled()]
+            
+            start = time.perf_counter()
+            future = await executor.submit(Task(coro=sample_task(0, "done")))
+            assert await future == "done"
+            assert time.perf_counter() - start < 0.01
+        finally:
+            await executor.stop()
+        
+        assert all(worker.done() for worker in executor.workers) or not executor.workers
+    
+    @pytest.mark.asyncio
+    async def test_work_stealing_drains_all_queues(self):
+        """Test that idle workers steal queued tasks from busy workers."""
+        executor = ParallelExecutor(max_workers=4, execution_strategy=ExecutionStrategy.WORK_STEALING)
+        await executor.start()
+        
+        try:
+            futures = await executor.submit_all([
+                Task(coro=sample_task(0.001 * (i % 3), i)) for i in range(50)
+            ])
+            results = await asyncio.gather(*futures)
+        finally:
+            await executor.stop()
+        
+        assert sorted(results) == list(range(50))
+        assert executor.get_statistics()["current_queue_size"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_reprioritize_and_peek(self):
+        """Test reprioritizing queued tasks changes the execution order."""
+        executor = ParallelExecutor(max_workers=1, execution_strategy=ExecutionStrategy.PRIORITY)
+        await executor.start()
+        order = []
+        
+        async def record(value):
+            order.append(value)
+        
+        try:
+            blocker = await executor.submit(Task(coro=sample_task(0.05)))
+            await asyncio.sleep(0.01)
+            
+            futures = await executor.submit_all([
+                Task(id=f"task_{i}", coro=record(i), priority=TaskPriority.NORMAL) for i in range(3)
+            ])
+            assert executor.peek_task().id == "task_0"
+            
+            assert await executor.reprioritize_task("task_2", TaskPriority.CRITICAL)
+            assert not await executor.reprioritize_task("missing", TaskPriority.CRITICAL)
+            assert executor.peek_task().id == "task_2"
+            
+            await asyncio.gather(blocker, *futures)
+        finally:
+            await executor.stop()
+        
+        assert order == [2, 0, 1]
+        assert executor.peek_task() is None
+    
+    @pytest.mark.asyncio
+    async def test_cancel_many_queued_tasks(self):
+        """Test cancelling thousands of queued tasks."""
+        executor = ParallelExecutor(max_workers=2, execution_strategy=ExecutionStrategy.PRIORITY)
+        await executor.start()
+        
+        try:
+            blocker = await executor.submit(Task(coro=sample_task(0.05)))
+            await asyncio.sleep(0.01)
+            
+            futures = await executor.submit_all([
+                Task(id=f"task_{i}", coro=sample_task(0, i)) for i in range(5000)
+            ])
+            
+            start = time.perf_counter()
+            for i in range(0, 5000, 2):
+                assert await executor.cancel_task(f"task_{i}")
+            assert time.perf_counter() - start < 1.0
+            
+            assert executor.get_statistics()["current_queue_size"] == 2500
+            results = await asyncio.gather(*futures[1::2])
+            await blocker
+        finally:
+            await executor.stop()
+        
+        assert results == list(range(1, 5000, 2))
+        assert all(future.cancelled() for future in futures[::2])
+    
+    @pytest.mark.asyncio
+    async def test_process_workers(self):
+        """Test that callable tasks run in warmed-up worker processes."""
+        executor = ParallelExecutor(
+            max_workers=1,
+            worker_type=WorkerType.PROCESS,
+            worker_initializer=warm_up_worker,
+            worker_initargs=(["security"],)
+        )
+        await executor.start()
+        
+        try:
+            pid = await (await executor.submit(create_task(os.getpid)))
+            analyzers = await (await executor.submit(create_task(get_worker_analyzers)))
+            power = await (await executor.submit(create_task(pow, 2, 10)))
+            
+            # Coroutine tasks still run on the event loop
+            coroutine_result = await (await executor.submit(Task(coro=sample_task(0, "loop"))))
+            
+            with pytest.raises(TypeError):
+                await (await executor.submit(create_task(pow, "a", 2)))
+            
+            stats = executor.get_statistics()
+        finally:
+            await executor.stop()
+        
+        assert pid != os.getpid()
+        assert analyzers == ["security"]
+        assert power == 1024
+        assert coroutine_result == "loop"
+        assert stats["worker_type"] == "PROCESS"
+        assert stats["pool_tasks"] == 4
+        assert stats["tasks_failed"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_process_workers_share_page_bodies(self):
+        """Test that large bodies reach worker processes through shared memory."""
+        executor = ParallelExecutor(
+            max_workers=2,
+            worker_type=WorkerType.PROCESS,
+            shared_memory_threshold=1024
+        )
+        await executor.start()
+        
+        body = "<html>" + "\u00e9" * 100_000 + "</html>"
+        try:
+            # One segment serves every task the handle is passed to
+            handle = executor.share_body(body, refs=3)
+            futures = await executor.submit_all([create_task(len, handle) for _ in range(3)])
+            lengths = await asyncio.gather(*futures)
+            
+            # Large arguments are moved automatically, small ones are pickled
+            auto_length = await (await executor.submit(create_task(len, body)))
+            small = await (await executor.submit(create_task(len, "small")))
+            
+            # Releasing happens on the event loop after the call returns
+            await asyncio.sleep(0.1)
+            shared = executor.get_statistics()["shared_memory"]
+        finally:
+            await executor.stop()
+        
+        assert lengths == [len(body)] * 3
+        assert auto_length == len(body)
+        assert small == 5
+        assert shared["segments_created"] == 2
+        assert shared["segments_freed"] == 2
+        assert shared["segments_live"] == 0
+        
+        with pytest.raises(FileNotFoundError):
+            handle.load()
+    
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        """Test that the concurrency limit can change while tasks run."""
+        executor = ParallelExecutor(max_workers=4)
+        await executor.start()
+        
+        running = 0
+        peak = []
+        
+        async def tracked():
+            nonlocal running
+            running += 1
+            peak.append(running)
+            await asyncio.sleep(0.01)
+            running -= 1
+        
+        try:
+            assert executor.set_concurrency_limit(0) == 1
+            await asyncio.gather(*await executor.submit_all([Task(coro=tracked()) for _ in range(5)]))
+            assert max(peak) == 1
+            
+            peak.clear()
+            assert executor.set_concurrency_limit(10) == 4
+            await asyncio.gather(*await executor.submit_all([Task(coro=tracked()) for _ in range(8)]))
+            assert max(peak) == 4
+            
+            # Raising the limit wakes workers held back by the old limit
+            peak.clear()
+            executor.set_concurrency_limit(1)
+            futures = await executor.submit_all([Task(coro=tracked()) for _ in range(8)])
+            await asyncio.sleep(0.015)
+            executor.set_concurrency_limit(3)
+            await asyncio.gather(*futures)
+            assert max(peak) == 3
+            assert executor.get_statistics()["concurrency_limit"] == 3
+        finally:
+            await executor.stop()
+    
+    @pytest.mark.asyncio
+    async def test_memory_admission_defers_tasks(self):
+        """Test that tasks wait while the memory budget is exhausted."""
+        limiter = FakeMemoryLimiter(AdmissionDecision.DEFER)
+        executor = ParallelExecutor(max_workers=4, memory_limiter=limiter, admission_poll_interval=0.01)
+        await executor.start()
+        
+        running = 0
+        peak = []
+        
+        async def tracked():
+            nonlocal running
+            running += 1
+            peak.append(running)
+            await asyncio.sleep(0.02)
+            running -= 1
+        
+        try:
+            futures = await executor.submit_all([
+                Task(coro=tracked(), memory_cost=1000) for _ in range(4)
+            ])
+            await asyncio.sleep(0.01)
+            stats = executor.get_statistics()
+            assert stats["memory_reserved"] == 1000
+            assert stats["currently_deferred"] == 3
+            
+            # Nothing running always admits one task, so work still drains
+            await asyncio.gather(*futures)
+            assert max(peak) == 1
+            assert limiter.costs[0] == 1000
+            
+            limiter.decision = AdmissionDecision.ADMIT
+            peak.clear()
+            await asyncio.gather(*await executor.submit_all([Task(coro=tracked()) for _ in range(4)]))
+            assert max(peak) == 4
+            
+            stats = executor.get_statistics()
+        finally:
+            await executor.stop()
+        
+        assert stats["tasks_deferred"] >= 3
+        assert stats["deferred_time"] > 0
+        assert stats["currently_deferred"] == 0
+        assert stats["memory_reserved"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_memory_admission_sheds_queued_tasks(self):
+        """Test that queued low-priority tasks are shed above the hard limit."""
+        limiter = FakeMemoryLimiter(AdmissionDecision.SHED, usage=110, hard_limit=100)
+        executor = ParallelExecutor(
+            max_workers=2,
+            execution_strategy=ExecutionStrategy.PRIORITY,
+            memory_limiter=limiter,
+            admission_poll_interval=0.01
+        )
+        await executor.start()
+        
+        try:
+            first = await executor.submit(Task(coro=sample_task(0.05, "first")))
+            await asyncio.sleep(0)
+            
+            # Each shed round covers the excess by estimated cost
+            low = [
+                await executor.submit(Task(coro=sample_task(0, i), priority=TaskPriority.LOW, memory_cost=6))
+                for i in range(2)
+            ]
+            high = await executor.submit(
+                Task(coro=sample_task(0, "high"), priority=TaskPriority.HIGH, memory_cost=6)
+            )
+            
+            assert await first == "first"
+            assert await high == "high"
+            for future in low:
+                with pytest.raises(MemoryLimitExceededError):
+                    await future
+            stats = executor.get_statistics()
+        finally:
+            await executor.stop()
+        
+        assert stats["tasks_shed"] == 2
+        assert stats["tasks_failed"] == 2
+        assert stats["tasks_completed"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_memory_admission_sheds_one_task_of_unknown_cost(self):
+        """Test that a shed round stops after one task without a cost estimate."""
+        limiter = FakeMemoryLimiter(AdmissionDecision.SHED, usage=110, hard_limit=100)
+        executor = ParallelExecutor(
+            max_workers=2,
+            execution_strategy=ExecutionStrategy.PRIORITY,
+            memory_limiter=limiter,
+            admission_poll_interval=0.01
+        )
+        await executor.start()
+        
+        try:
+            first = await executor.submit(Task(coro=sample_task(0.05, "first")))
+            await asyncio.sleep(0)
+            
+            low = await executor.submit(Task(coro=sample_task(0, "low"), priority=TaskPriority.LOW))
+            normal = [await executor.submit(Task(coro=sample_task(0, i))) for i in range(2)]
+            
+            assert await first == "first"
+            assert await asyncio.gather(*normal) == [0, 1]
+            with pytest.raises(MemoryLimitExceededError):
+                await low
+            stats = executor.get_statistics()
+        finally:
+            await executor.stop()
+        
+        assert stats["tasks_shed"] == 1
+        assert stats["tasks_completed"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_fair_groups_rechecked_after_memory_wait(self):
+        """Test that a group filling up during a memory wait does not stop a worker."""
+        limiter = FakeMemoryLimiter(AdmissionDecision.DEFER)
+        executor = ParallelExecutor(
+            max_workers=3,
+            execution_strategy=ExecutionStrategy.FAIR,
+            group_concurrency=1,
+            memory_limiter=limiter,
+            admission_poll_interval=0.01
+        )
+        await executor.start()
+        
+        try:
+            slow = await executor.submit(Task(coro=sample_task(0.4, "b"), metadata={"group": "b"}))
+            await asyncio.sleep(0.01)
+            fast = await executor.submit_all([
+                Task(coro=sample_task(0.05, name), metadata={"group": "a"}) for name in ("a1", "a2")
+            ])
+            
+            # Both idle workers wait for memory, then only one may run group a
+            await asyncio.sleep(0.2)
+            limiter.decision = AdmissionDecision.ADMIT
+            
+            results = await asyncio.wait_for(asyncio.gather(slow, *fast), timeout=2)
+            assert results == ["b", "a1", "a2"]
+            assert all(not worker.done() for worker in executor._workers)
+        finally:
+            await executor.stop()
+    
+    @pytest.mark.asyncio
+    async def test_thread_workers(self):
+        """Test that callable tasks run in the thread pool."""
+        executor = ParallelExecutor(max_workers=2, worker_type=WorkerType.THREAD)
+        await executor.start()
+        
+        try:
+            futures = await executor.submit_all([
+                create_task(lambda: threading.current_thread().name) for _ in range(4)
+            ])
+            names = await asyncio.gather(*futures)
+        finally:
+            await executor.stop()
+        
+        assert all(name.startswith("summit_seo_worker") for name in names)
+    
+    @pytest.mark.asyncio
+    async def test_max_pending_blocks_submit(self):
+        """Test that submit waits while max_pending tasks are waiting to start."""
+        executor = ParallelExecutor(max_workers=1, max_pending=2)
+        await executor.start()
+        
+        release = asyncio.Event()
+        created = []
+        
+        async def job(i):
+            created.append(i)
+            await release.wait()
+            return i
+        
+        async def produce():
+            return [await executor.submit(create_task(job, i, lazy=True)) for i in range(6)]
+        
+        try:
+            producer = asyncio.create_task(produce())
+            await asyncio.sleep(0.05)
+            
+            # One task running, two waiting to start, the producer blocked
+            assert not producer.done()
+            assert created == [0]
+            assert executor.get_statistics()["tasks_submitted"] == 3
+            
+            release.set()
+            futures = await asyncio.wait_for(producer, timeout=1)
+            assert await asyncio.gather(*futures) == list(range(6))
+            
+            stats = executor.get_statistics()
+            assert stats["max_pending"] == 2
+            assert stats["submit_waits"] >= 1
+        finally:
+            await executor.stop()
+        
+        with pytest.raises(ValueError):
+            ParallelExecutor(max_pending=0)
+    
+    @pytest.mark.asyncio
+    async def test_max_pending_ignores_tasks_waiting_on_dependencies(self):
+        """Test that dependents submitted before their dependencies do not block them."""
+        executor = ParallelExecutor(max_workers=1, max_pending=1)
+        await executor.start()
+        
+        try:
+            dependents = [
+                await asyncio.wait_for(
+                    executor.submit(Task(id=f"dependent-{i}", coro=sample_task(0, i), dependencies=["base"])),
+                    timeout=1
+                )
+                for i in range(2)
+            ]
+            base = await asyncio.wait_for(
+                executor.submit(Task(id="base", coro=sample_task(0.01, "base"))), timeout=1
+            )
+            
+            assert await asyncio.wait_for(base, timeout=1) == "base"
+            assert await asyncio.wait_for(asyncio.gather(*dependents), timeout=1) == [0, 1]
+        finally:
+            await executor.stop()
+    
+    @pytest.mark.asyncio
+    async def test_failed_dependency_releases_pending_slots(self):
+        """Test that dependents of a failed or cancelled task fail and free max_pending."""
+        executor = ParallelExecutor(max_workers=1, max_pending=1)
+        await executor.start()
+        
+        try:
+            a = await executor.submit(Task(id="a", coro=sample_task(0.01, raise_error=True)))
+            await asyncio.sleep(0)
+            b = await executor.submit(Task(id="b", coro=sample_task(0, "b"), dependencies=["a"]))
+            c = await asyncio.wait_for(
+                executor.submit(Task(id="c", coro=sample_task(0, "c"), dependencies=["b"])), timeout=1
+            )
+            
+            with pytest.raises(ValueError):
+                await a
+            for future, dependency in ((b, "a"), (c, "b")):
+                with pytest.raises(DependencyFailedError) as error:
+                    await future
+                assert error.value.dependency_id == dependency
+            
+            # Dependents submitted after the failure fail right away
+            d = await asyncio.wait_for(
+                executor.submit(Task(id="d", coro=sample_task(0, "d"), dependencies=["a"])), timeout=1
+            )
+            with pytest.raises(DependencyFailedError):
+                await d
+            
+            # Cancelling a dependency fails its dependents too
+            blocker = await executor.submit(Task(id="blocker", coro=sample_task(0.05, "blocker")))
+            await asyncio.sleep(0)
+            e = await executor.submit(Task(id="e", coro=sample_task(0, "e")))
+            assert await executor.cancel_task("e")
+            f = await asyncio.wait_for(
+                executor.submit(Task(id="f", coro=sample_task(0, "f"), dependencies=["e"])), timeout=1
+            )
+            with pytest.raises(DependencyFailedError):
+                await f
+            assert await asyncio.wait_for(
+                await executor.submit(Task(coro=sample_task(0, "next"))), timeout=1
+            ) == "next"
+            assert await blocker == "blocker"
+            
+            stats = executor.get_statistics()
+            assert stats["tasks_failed"] == 5
+        finally:
+            await executor.stop()
+    
+    @pytest.mark.asyncio
+    async def test_stop_releases_blocked_submit(self):
+        """Test that stopping the executor fails a blocked submit."""
+        executor = ParallelExecutor(max_workers=1, max_pending=1)
+        await executor.start()
+        
+        release = asyncio.Event()
+        await executor.submit(Task(coro=release.wait()))
+        await asyncio.sleep(0.01)
+        await executor.submit(Task(coro=release.wait()))
+        
+        blocked = asyncio.create_task(executor.submit(create_task(release.wait, lazy=True)))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        
+        release.set()
+        await executor.stop()
+        with pytest.raises(RuntimeError):
+            await blocked
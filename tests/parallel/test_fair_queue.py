@@ -0,0 +1,134 @@
+"""Tests for the FairQueue class."""
+
+import pytest
+
+from summit_seo.parallel.fair_queue import FairQueue, default_group_key
+from summit_seo.parallel.task import Task
+
+
+class Item:
+    """Queue item carrying its group."""
+
+    def __init__(self, group, name):
+        self.group = group
+        self.name = name
+
+
+def make_queue(**kwargs):
+    """Create a queue grouping items by their group attribute."""
+    return FairQueue(group_key=lambda item: item.group, **kwargs)
+
+
+def fill(queue, group, count, priority=1):
+    """Queue count items for a group."""
+    for i in range(count):
+        queue.push(f"{group}-{i}", Item(group, f"{group}-{i}"), priority)
+
+
+class TestFairQueue:
+    """Tests for the FairQueue class."""
+
+    def test_round_robin_across_groups(self):
+        """Test that a large group does not delay small ones."""
+        queue = make_queue()
+        fill(queue, "big", 1000)
+        fill(queue, "a", 2)
+        fill(queue, "b", 2)
+
+        order = [queue.pop()[1].group for _ in range(7)]
+
+        assert order == ["big", "a", "b", "big", "a", "b", "big"]
+        assert len(queue) == 997
+
+    def test_priority_within_group(self):
+        """Test that items keep priority order inside their group."""
+        queue = make_queue()
+        queue.push("low", Item("a", "low"), 5)
+        queue.push("high", Item("a", "high"), 1)
+
+        assert queue.peek()[0] == "high"
+        assert queue.pop()[0] == "high"
+        assert queue.reprioritize("low", 0)
+        assert queue.priority("low") == 0
+
+    def test_weights(self):
+        """Test that weights set each group's share of dispatches."""
+        queue = make_queue(group_weights={"heavy": 3, "light": 0.5})
+        fill(queue, "heavy", 100)
+        fill(queue, "normal", 100)
+        fill(queue, "light", 100)
+
+        groups = [queue.pop()[1].group for _ in range(45)]
+
+        assert groups.count("heavy") == 30
+        assert groups.count("normal") == 10
+        assert groups.count("light") == 5
+
+    def test_concurrency_caps(self):
+        """Test that capped groups are skipped until a task is done."""
+        queue = make_queue(group_concurrency=2, group_limits={"slow": 1})
+        fill(queue, "fast", 5)
+        fill(queue, "slow", 5)
+
+        popped = [queue.pop()[0] for _ in range(3)]
+        assert popped == ["fast-0", "slow-0", "fast-1"]
+        assert not queue.has_eligible()
+        with pytest.raises(IndexError):
+            queue.pop()
+        with pytest.raises(IndexError):
+            queue.peek()
+
+        queue.task_done("slow-0")
+        assert queue.has_eligible()
+        assert queue.pop()[0] == "slow-1"
+        assert queue.get_statistics()["running"] == {"fast": 2, "slow": 1}
+
+    def test_remove_and_clear(self):
+        """Test removing queued items and clearing the queue."""
+        queue = make_queue()
+        fill(queue, "a", 2)
+        fill(queue, "b", 1)
+
+        assert queue.remove("b-0").name == "b-0"
+        assert queue.remove("b-0") is None
+        assert "b-0" not in queue
+        assert [key for key, _ in queue] == ["a-0", "a-1"]
+
+        with pytest.raises(KeyError):
+            queue.push("a-0", Item("a", "again"), 1)
+
+        queue.clear()
+        assert not queue
+        with pytest.raises(IndexError):
+            queue.pop()
+
+    def test_invalid_configuration(self):
+        """Test that invalid caps and weights are rejected."""
+        with pytest.raises(ValueError):
+            FairQueue(group_concurrency=0)
+        with pytest.raises(ValueError):
+            FairQueue(group_limits={"a": 0})
+        with pytest.raises(ValueError):
+            FairQueue(group_weights={"a": 0})
+
+
+def test_default_group_key():
+    """Test grouping tasks by metadata."""
+    def task(**metadata):
+        return Task(coro=noop(), metadata=metadata)
+
+    tasks = [
+        task(group="g", tenant="t", url="https://example.com/"),
+        task(tenant="t", url="https://example.com/"),
+        task(url="https://Example.com:8080/page"),
+        task(),
+    ]
+
+    assert [default_group_key(t) for t in tasks] == ["g", "t", "example.com", None]
+
+    for t in tasks:
+        t.coro.close()
+
+
+async def noop():
+    """Coroutine that does nothing."""
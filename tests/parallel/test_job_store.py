@@ -0,0 +1,134 @@
+"""Tests for the job store and run_job."""
+
+import pytest
+
+from summit_seo.parallel import JobStore, JobStoreError, ParallelManager, TaskStatus, run_job
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a job store in a temporary directory."""
+    store = JobStore(str(tmp_path / "jobs" / "jobs.db"))
+    yield store
+    store.close()
+
+
+@pytest.fixture
+async def manager():
+    """Create and start a parallel manager."""
+    manager = ParallelManager(max_workers=2)
+    await manager.start()
+    yield manager
+    await manager.stop()
+
+
+class TestJobStore:
+    """Tests for the JobStore class."""
+
+    def test_resubmission_is_idempotent(self, store):
+        """Test that submitting the same items again only adds new ones."""
+        job_id = store.create_job(["a", "b"], job_id="job-1")
+        assert store.create_job(["b", "c"], job_id="job-1") == "job-1"
+        assert store.add_tasks(job_id, ["c", "d"]) == 1
+
+        job = store.get_job(job_id)
+        assert job["total"] == 4
+        assert job["pending"] == 4
+        assert [task.key for task in store.get_tasks(job_id)] == ["a", "b", "c", "d"]
+
+    def test_keyed_payloads(self, store):
+        """Test that (key, payload) items keep their payload."""
+        job_id = store.create_job([("home", {"url": "https://example.com/"})])
+
+        task = store.runnable_tasks(job_id)[0]
+        assert task.key == "home"
+        assert task.payload == {"url": "https://example.com/"}
+
+    def test_status_and_retry_limits(self, store):
+        """Test that failed tasks stay runnable until they reach max_attempts."""
+        job_id = store.create_job(["a", "b"], max_attempts=2)
+
+        store.mark_running(job_id, "a")
+        store.mark_completed(job_id, "a", "/results/a.json")
+        store.mark_running(job_id, "b")
+        store.mark_failed(job_id, "b", "timeout")
+
+        assert [task.key for task in store.runnable_tasks(job_id)] == ["b"]
+        assert store.get_job(job_id)["retryable"] == 1
+
+        store.mark_running(job_id, "b")
+        store.mark_failed(job_id, "b", "timeout")
+        assert store.runnable_tasks(job_id) == []
+
+        completed = store.get_tasks(job_id, TaskStatus.COMPLETED)[0]
+        assert completed.result_location == "/results/a.json"
+        failed = store.get_tasks(job_id, TaskStatus.FAILED)[0]
+        assert (failed.attempts, failed.error) == (2, "timeout")
+
+        store.set_max_attempts(job_id, 3)
+        assert [task.key for task in store.runnable_tasks(job_id)] == ["b"]
+
+    def test_state_survives_reopening(self, tmp_path):
+        """Test that a job can be continued from a new store instance."""
+        path = str(tmp_path / "jobs.db")
+        store = JobStore(path)
+        job_id = store.create_job(["a", "b"])
+        store.mark_running(job_id, "a")
+        store.close()
+
+        store = JobStore(path)
+        try:
+            assert store.get_job(job_id)["running"] == 1
+            assert store.reset_running(job_id) == 1
+            task = store.runnable_tasks(job_id)[0]
+            assert (task.key, task.status, task.attempts) == ("a", TaskStatus.PENDING, 1)
+            assert [job["job_id"] for job in store.list_jobs()] == [job_id]
+        finally:
+            store.close()
+
+    def test_unknown_job(self, store):
+        """Test that unknown jobs raise JobStoreError."""
+        with pytest.raises(JobStoreError):
+            store.get_job("missing")
+        with pytest.raises(JobStoreError):
+            store.add_tasks("missing", ["a"])
+        assert not store.delete_job("missing")
+
+
+@pytest.mark.asyncio
+async def test_run_job_skips_completed_and_retries(store, manager):
+    """Test that a resumed job only runs unfinished tasks."""
+    calls = []
+    failures = {"flaky": 1}
+
+    async def process(item):
+        calls.append(item)
+        if item == "broken" or failures.get(item, 0) > 0:
+            failures[item] = failures.get(item, 0) - 1
+            raise ValueError(f"cannot process {item}")
+        return f"/results/{item}.json"
+
+    job_id = store.create_job(["done", "flaky", "broken", "new"], max_attempts=3)
+    store.mark_running(job_id, "done")
+    store.mark_completed(job_id, "done", "/results/done.json")
+
+    finished = []
+    summary = await run_job(manager, store, job_id, process, progress_callback=finished.append)
+
+    assert "done" not in calls
+    assert calls.count("flaky") == 2
+    assert calls.count("broken") == 3
+    assert summary["skipped"] == 1
+    assert summary["attempted"] == 6
+    assert (summary["completed"], summary["failed"], summary["retryable"]) == (3, 1, 0)
+    assert len(finished) == 6
+
+    failed = store.get_tasks(job_id, TaskStatus.FAILED)[0]
+    assert failed.key == "broken"
+    assert failed.error == "cannot process broken"
+
+    # Nothing is left to run
+    calls.clear()
+    summary = await run_job(manager, store, job_id, process)
+    assert calls == []
+    assert summary["attempted"] == 0
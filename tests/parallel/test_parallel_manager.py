@@ -7,11 +7,13 @@ from typing import Dict, List
 import pytest
 
 from summit_seo.parallel import (
+    AdaptiveConcurrencyController,
     ParallelManager,
     ProcessingStrategy,
     Task,
     TaskPriority,
-    TaskStatus
+    TaskStatus,
+    WorkerType
 )
 
 
@@ -409,6 +411,82 @@ async def test_parallel_manager_batched_strategy():
         await batch_manager.stop()
 
 
+@pytest.mark.asyncio
+async def test_parallel_manager_batch_flush_triggers():
+    """Test that batches flush on size, linger time and explicit flush."""
+    manager = ParallelManager(
+        max_workers=2,
+        strategy=ProcessingStrategy.BATCHED,
+        batch_size=3,
+        batch_linger=0.05
+    )
+    await manager.start()
+    
+    try:
+        # A full batch is flushed right away
+        futures = [await manager.submit(Task(coro=sample_task(0, return_value=i))) for i in range(3)]
+        assert await asyncio.wait_for(asyncio.gather(*futures), timeout=0.04) == [0, 1, 2]
+        
+        # A trickle is flushed once the oldest task has waited batch_linger
+        future = await manager.submit(Task(coro=sample_task(0, return_value="late")))
+        await asyncio.sleep(0.01)
+        assert not future.done()
+        assert await asyncio.wait_for(future, timeout=1) == "late"
+        
+        manager.batch_linger = None
+        future = await manager.submit(Task(coro=sample_task(0, return_value="flushed")))
+        assert await manager.flush() == 1
+        assert await future == "flushed"
+        
+        stats = manager.get_batch_statistics()
+        assert (stats["flushed_by_size"], stats["flushed_by_linger"], stats["flushed_explicitly"]) == (1, 1, 1)
+        assert stats["batched_entries"] == 5
+        
+        # Tasks can be cancelled while their batch waits
+        task = Task(coro=sample_task(0))
+        future = await manager.submit(task)
+        assert await manager.cancel_task(task.id)
+        assert future.cancelled()
+        assert manager.get_batch_statistics()["waiting"] == 0
+    finally:
+        await manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_parallel_manager_vectorized_batches():
+    """Test that items run as one batch_func call per batch."""
+    calls = []
+    
+    def insert_rows(rows):
+        calls.append(list(rows))
+        return [row * 10 for row in rows]
+    
+    manager = ParallelManager(
+        max_workers=2,
+        worker_type=WorkerType.THREAD,
+        batch_size=4,
+        batch_linger=0.02,
+        batch_func=insert_rows
+    )
+    await manager.start()
+    
+    try:
+        futures = [await manager.submit_item(i) for i in range(6)]
+        assert await asyncio.gather(*futures) == [0, 10, 20, 30, 40, 50]
+        assert calls == [[0, 1, 2, 3], [4, 5]]
+        
+        # A result count that does not match the batch fails every item
+        manager.batch_func = lambda rows: rows[:1]
+        futures = [await manager.submit_item(i) for i in range(2)]
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+    finally:
+        await manager.stop()
+    
+    with pytest.raises(RuntimeError):
+        await ParallelManager().submit_item(1)
+
+
 @pytest.mark.asyncio
 async def test_parallel_manager_work_stealing():
     """Test work stealing strategy."""
@@ -491,4 +569,141 @@ async def test_parallel_manager_pause_resume(parallel_manager):
     
     # Verify results
     assert result1 == "result_1"
-    assert result2 == "result_2" 
\ No newline at end of file
+    assert result2 == "result_2" 
+
+
+@pytest.mark.asyncio
+async def test_parallel_manager_adaptive_concurrency():
+    """Test that adaptive concurrency ramps up while tasks are waiting."""
+    controller = AdaptiveConcurrencyController(
+        initial_concurrency=1,
+        increase_step=2,
+        interval=0.05
+    )
+    manager = ParallelManager(max_workers=6, concurrency_controller=controller)
+    await manager.start()
+    
+    try:
+        assert manager.get_statistics().target_concurrency == 1
+        
+        tasks = [Task(coro=sample_task(0.02, i)) for i in range(40)]
+        results = await manager.submit_and_await_many(tasks)
+        stats = manager.get_statistics()
+    finally:
+        await manager.stop()
+    
+    assert results == list(range(40))
+    assert controller.max_concurrency == 6
+    assert 1 < stats.target_concurrency <= 6
+    assert stats.max_concurrent <= stats.target_concurrency
+    assert manager.get_concurrency_statistics()["increases"] > 0
+
+
+@pytest.mark.asyncio
+async def test_parallel_manager_fair_strategy():
+    """Test that FAIR interleaves hosts and caps each host's concurrency."""
+    manager = ParallelManager(
+        max_workers=4,
+        strategy=ProcessingStrategy.FAIR,
+        group_concurrency=2
+    )
+    await manager.start()
+    
+    order = []
+    running: Dict[str, int] = {}
+    peak: Dict[str, int] = {}
+    
+    async def fetch(url: str):
+        host = url.split("/")[2]
+        order.append(host)
+        running[host] = running.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), running[host])
+        await asyncio.sleep(0.01)
+        running[host] -= 1
+    
+    urls = [f"https://big.example/{i}" for i in range(20)]
+    urls += [f"https://small{i}.example/" for i in range(3)]
+    
+    try:
+        tasks = [Task(coro=fetch(url), metadata={"url": url}) for url in urls]
+        await manager.submit_and_await_many(tasks)
+    finally:
+        await manager.stop()
+    
+    # The small hosts are not stuck behind the 20 queued pages of big.example
+    assert set(order[:4]) == {"big.example", "small0.example", "small1.example", "small2.example"}
+    assert peak["big.example"] == 2
+
+
+@pytest.mark.asyncio
+async def test_parallel_manager_as_completed(parallel_manager):
+    """Test streaming results in completion and in task order."""
+    delays = [0.15, 0.01, 0.1, 0.05]
+    
+    def make_tasks():
+        return [
+            Task(coro=sample_task(delay, return_value=i), metadata={"index": i})
+            for i, delay in enumerate(delays)
+        ]
+    
+    streamed = [
+        (task.metadata["index"], result)
+        async for task, result in parallel_manager.as_completed(make_tasks())
+    ]
+    assert streamed == [(1, 1), (3, 3), (2, 2), (0, 0)]
+    
+    ordered = [result async for _, result in parallel_manager.as_completed(make_tasks(), ordered=True)]
+    assert ordered == [0, 1, 2, 3]
+    
+    # Consumed tasks are released by the executor
+    assert parallel_manager._executor.get_statistics()["pending_tasks"] == 0
+    assert not parallel_manager._executor._task_futures
+
+
+@pytest.mark.asyncio
+async def test_parallel_manager_as_completed_bounds_buffer(parallel_manager):
+    """Test that tasks are created lazily, at most buffer_size ahead of the consumer."""
+    created = []
+    
+    def make_tasks():
+        for i in range(20):
+            created.append(i)
+            yield Task(coro=sample_task(0.001, return_value=i))
+    
+    seen = []
+    async for _, result in parallel_manager.as_completed(make_tasks(), buffer_size=3):
+        seen.append(result)
+        assert len(created) - len(seen) <= 2
+    
+    assert sorted(seen) == list(range(20))
+
+
+@pytest.mark.asyncio
+async def test_parallel_manager_as_completed_errors(parallel_manager):
+    """Test yielding and raising task errors, and stopping early."""
+    tasks = [
+        Task(coro=sample_task(0.01, return_value="ok")),
+        Task(coro=sample_task(0.02, raise_error=True)),
+    ]
+    results = [result async for _, result in parallel_manager.as_completed(tasks)]
+    assert results[0] == "ok"
+    assert isinstance(results[1], ValueError)
+    
+    with pytest.raises(ValueError):
+        tasks = [Task(coro=sample_task(0.01, raise_error=True))]
+        async for _ in parallel_manager.as_completed(tasks, return_exceptions=False):
+            pass
+    
+    # Leaving the loop early cancels tasks that have not started
+    manager = ParallelManager(max_workers=1)
+    await manager.start()
+    try:
+        tasks = [Task(coro=sample_task(0.01, return_value=i)) for i in range(5)]
+        stream = manager.as_completed(tasks, buffer_size=5)
+        async for _, result in stream:
+            break
+        await stream.aclose()
+        assert result == 0
+        assert manager.get_statistics().cancelled >= 3
+    finally:
+        await manager.stop()
@@ -0,0 +1,150 @@
+"""Tests for the Pipeline class."""
+
+import asyncio
+import time
+
+import pytest
+
+from summit_seo.parallel import Pipeline, PipelineStage, PipelineStageError, WorkerType
+
+
+async def fetch(url):
+    """Simulate an I/O-bound fetch."""
+    await asyncio.sleep(0.05)
+    if url.endswith("/broken"):
+        raise ConnectionError("connection refused")
+    return f"<html>{url}</html>"
+
+
+def analyze(page):
+    """Simulate a blocking analysis."""
+    time.sleep(0.05)
+    return len(page)
+
+
+def report(length):
+    """Format an analysis result."""
+    return f"length={length}"
+
+
+def make_pipeline(**kwargs):
+    """Create a collect -> analyze -> report pipeline."""
+    return Pipeline([
+        PipelineStage("collect", fetch, workers=1, **kwargs),
+        PipelineStage("analyze", analyze, workers=1, worker_type=WorkerType.THREAD),
+        PipelineStage("report", report, workers=1, worker_type=WorkerType.THREAD),
+    ])
+
+
+def test_invalid_stages():
+    """Test that invalid stage configurations are rejected."""
+    with pytest.raises(ValueError):
+        Pipeline([])
+    with pytest.raises(ValueError):
+        Pipeline([PipelineStage("a", report), PipelineStage("a", report)])
+    with pytest.raises(ValueError):
+        PipelineStage("a", report, workers=0)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_runs_items_through_all_stages():
+    """Test that results come from the last stage in submission order."""
+    urls = [f"https://example.com/{i}" for i in range(3)]
+
+    async with make_pipeline() as pipeline:
+        results = await pipeline.run(urls)
+        stats = pipeline.get_statistics()
+
+    assert results == [f"length={len(f'<html>{url}</html>')}" for url in urls]
+    assert list(stats) == ["collect", "analyze", "report"]
+    for stage_stats in stats.values():
+        assert stage_stats["processed"] == 3
+        assert stage_stats["failed"] == 0
+        assert stage_stats["backlog"] == 0
+        assert stage_stats["throughput"] > 0
+    assert stats["analyze"]["worker_type"] == "THREAD"
+
+
+@pytest.mark.asyncio
+async def test_pipeline_overlaps_stages():
+    """Test that fetching the next item overlaps with analyzing the current one."""
+    urls = [f"https://example.com/{i}" for i in range(6)]
+
+    async with make_pipeline() as pipeline:
+        start = time.perf_counter()
+        await pipeline.run(urls)
+        elapsed = time.perf_counter() - start
+
+    # Sequential: 6 * (0.05 + 0.05) = 0.6s; pipelined: about 7 * 0.05 = 0.35s
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_pipeline_reports_failing_stage():
+    """Test that a failure stops the item and names the stage."""
+    async with make_pipeline() as pipeline:
+        results = await pipeline.run(["https://example.com/ok", "https://example.com/broken"])
+        stats = pipeline.get_statistics()
+
+    assert results[0] == f"length={len('<html>https://example.com/ok</html>')}"
+    assert isinstance(results[1], PipelineStageError)
+    assert results[1].stage == "collect"
+    assert isinstance(results[1].error, ConnectionError)
+    assert stats["collect"]["failed"] == 1
+    assert stats["analyze"]["processed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pipeline_applies_backpressure():
+    """Test that a slow stage bounds the number of queued items."""
+    release = asyncio.Event()
+
+    async def slow(item):
+        await release.wait()
+        return item
+
+    pipeline = Pipeline([
+        PipelineStage("fast", fetch, workers=2),
+        PipelineStage("slow", slow, workers=1, queue_size=1),
+    ])
+    await pipeline.start()
+    try:
+        futures = []
+        submitter = asyncio.create_task(
+            _submit_all(pipeline, [f"https://example.com/{i}" for i in range(20)], futures)
+        )
+        await asyncio.sleep(0.3)
+
+        # 1 running in the slow stage, 1 queued for it, 2 held by fast
+        # workers and 4 in the fast stage's queue
+        assert not submitter.done()
+        stats = pipeline.get_statistics()
+        assert stats["slow"]["backlog"] == 1
+        assert stats["fast"]["backlog"] == stats["fast"]["queue_size"]
+
+        release.set()
+        await submitter
+        assert await pipeline.join(timeout=5)
+        assert all(future.done() for future in futures)
+    finally:
+        await pipeline.stop()
+
+
+async def _submit_all(pipeline, items, futures):
+    """Submit items one by one, collecting their futures."""
+    for item in items:
+        futures.append(await pipeline.submit(item))
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_pending_items():
+    """Test that stopping the pipeline cancels unfinished items."""
+    pipeline = Pipeline([PipelineStage("wait", asyncio.sleep, workers=1)])
+    await pipeline.start()
+    futures = [await pipeline.submit(0.2) for _ in range(2)]
+    await asyncio.sleep(0.05)
+    await pipeline.stop()
+
+    assert all(future.cancelled() for future in futures)
+    with pytest.raises(RuntimeError):
+        await pipeline.submit(1)
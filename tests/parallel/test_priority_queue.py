@@ -0,0 +1,112 @@
+"""Tests for the IndexedPriorityQueue class."""
+
+import random
+
+import pytest
+
+from summit_seo.parallel.priority_queue import IndexedPriorityQueue
+
+
+class TestIndexedPriorityQueue:
+    """Tests for the IndexedPriorityQueue class."""
+
+    def test_pop_order(self):
+        """Test that lower priorities pop first and ties keep insertion order."""
+        queue = IndexedPriorityQueue()
+        queue.push("a", "A", 2)
+        queue.push("b", "B", 1)
+        queue.push("c", "C", 2)
+        queue.push("d", "D", 1)
+
+        assert len(queue) == 4
+        assert [queue.pop() for _ in range(4)] == [("b", "B"), ("d", "D"), ("a", "A"), ("c", "C")]
+        assert not queue
+
+        with pytest.raises(IndexError):
+            queue.pop()
+
+    def test_duplicate_key(self):
+        """Test that a queued key cannot be pushed twice."""
+        queue = IndexedPriorityQueue()
+        queue.push("a", "A", 1)
+
+        with pytest.raises(KeyError):
+            queue.push("a", "A2", 1)
+
+    def test_remove(self):
+        """Test removing items by key."""
+        queue = IndexedPriorityQueue()
+        for i in range(5):
+            queue.push(i, f"item_{i}", i)
+
+        assert queue.remove(0) == "item_0"
+        assert queue.remove(3) == "item_3"
+        assert queue.remove(3) is None
+        assert 3 not in queue
+        assert len(queue) == 3
+
+        assert queue.peek() == (1, "item_1")
+        assert [queue.pop()[0] for _ in range(3)] == [1, 2, 4]
+
+    def test_reprioritize(self):
+        """Test moving items up and down the queue."""
+        queue = IndexedPriorityQueue()
+        for key in "abcd":
+            queue.push(key, key.upper(), 5)
+
+        assert queue.reprioritize("d", 1)
+        assert queue.reprioritize("a", 9)
+        assert not queue.reprioritize("missing", 1)
+        assert queue.priority("d") == 1
+        assert queue.get("d") == "D"
+
+        # Moving back keeps the original insertion order among equals
+        assert queue.reprioritize("a", 1)
+        assert queue.reprioritize("a", 9)
+        assert queue.reprioritize("a", 1)
+
+        assert [queue.pop()[0] for _ in range(4)] == ["a", "d", "b", "c"]
+
+    def test_tombstones_are_compacted(self):
+        """Test that removed entries do not accumulate in the heap."""
+        queue = IndexedPriorityQueue()
+        for i in range(10000):
+            queue.push(i, i, i)
+        for i in range(9990):
+            queue.remove(i)
+
+        assert len(queue) == 10
+        assert len(queue._heap) < 200
+        assert [queue.pop()[0] for _ in range(10)] == list(range(9990, 10000))
+
+    def test_matches_sorted_order(self):
+        """Test random operations against a reference implementation."""
+        rng = random.Random(42)
+        queue = IndexedPriorityQueue()
+        reference = {}
+        order = {}
+
+        for step in range(5000):
+            action = rng.random()
+            if action < 0.5 or not reference:
+                key = step
+                priority = rng.randint(0, 20)
+                queue.push(key, key, priority)
+                reference[key] = priority
+                order[key] = step
+            elif action < 0.7:
+                key = rng.choice(list(reference))
+                assert queue.remove(key) == key
+                del reference[key]
+            elif action < 0.85:
+                key = rng.choice(list(reference))
+                priority = rng.randint(0, 20)
+                assert queue.reprioritize(key, priority)
+                reference[key] = priority
+            else:
+                expected = min(reference, key=lambda k: (reference[k], order[k]))
+                assert queue.peek()[0] == expected
+                assert queue.pop()[0] == expected
+                del reference[expected]
+
+            assert len(queue) == len(reference)
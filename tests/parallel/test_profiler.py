@@ -0,0 +1,87 @@
+"""Tests for the parallel execution profiler."""
+
+import asyncio
+import json
+
+import pytest
+
+from summit_seo.parallel import (
+    ExecutionProfiler,
+    ParallelManager,
+    ProcessingStrategy,
+    Task,
+    TaskStatus,
+)
+
+
+async def sleep_task(seconds):
+    """Sleep and return the duration."""
+    await asyncio.sleep(seconds)
+    return seconds
+
+
+async def profile_run(tasks, **kwargs):
+    """Run tasks on a profiled manager and return the profiler."""
+    profiler = ExecutionProfiler()
+    manager = ParallelManager(profiler=profiler, **kwargs)
+    await manager.start()
+    try:
+        await manager.submit_and_await_many(tasks)
+    finally:
+        await manager.stop()
+    return profiler
+
+
+@pytest.mark.asyncio
+async def test_dependency_chain_is_the_critical_path(tmp_path):
+    """Test critical-path analysis and the Chrome trace of a GRAPH run."""
+    profiler = await profile_run(
+        [
+            Task(id="fetch", coro=sleep_task(0.05)),
+            Task(id="parse", coro=sleep_task(0.05), dependencies=["fetch"]),
+            Task(id="score", coro=sleep_task(0.05), dependencies=["parse"]),
+            Task(id="robots", coro=sleep_task(0.01)),
+        ],
+        max_workers=4,
+        strategy=ProcessingStrategy.GRAPH
+    )
+
+    report = profiler.report()
+    assert [step["task_id"] for step in report["critical_path"]] == ["fetch", "parse", "score"]
+    assert report["limited_by"] == "dependencies"
+    assert report["tasks"] == 4
+    assert report["max_concurrency"] == 2
+
+    parse = profiler.profiles["parse"]
+    assert parse.status == TaskStatus.COMPLETED
+    assert parse.dependency_wait >= 0.04
+    assert parse.run_time >= 0.04
+
+    path = tmp_path / "run.trace.json"
+    profiler.write_chrome_trace(str(path))
+    events = json.loads(path.read_text())["traceEvents"]
+    slices = {e["args"]["task_id"]: e for e in events if e["ph"] == "X" and e.get("cat") != "queue"}
+    assert set(slices) == {"fetch", "parse", "score", "robots"}
+    assert slices["parse"]["ts"] >= slices["fetch"]["ts"] + slices["fetch"]["dur"]
+    assert sum(1 for e in events if e["ph"] == "s") == 2
+    assert any(e["ph"] == "C" for e in events)
+
+
+@pytest.mark.asyncio
+async def test_detects_worker_and_straggler_limits():
+    """Test that runs limited by workers and by one slow task are told apart."""
+    profiler = await profile_run([Task(coro=sleep_task(0.02)) for _ in range(6)], max_workers=1)
+    report = profiler.report()
+    assert report["limited_by"] == "workers"
+    assert report["workers"] == 1
+    assert report["utilization"] > 0.8
+    assert report["max_queue_wait"] >= 0.08
+
+    tasks = [Task(id="slow", coro=sleep_task(0.2))] + [Task(coro=sleep_task(0.01)) for _ in range(3)]
+    profiler = await profile_run(tasks, max_workers=4)
+    report = profiler.report()
+    assert report["limited_by"] == "straggler"
+    assert report["slowest_task"] == "slow"
+
+    profiler.reset()
+    assert profiler.report()["limited_by"] == "none"
@@ -0,0 +1,93 @@
+"""Tests for shared-memory page bodies."""
+
+import pickle
+
+import pytest
+
+from summit_seo.parallel.shared_body import (
+    SharedBody,
+    SharedBodyStore,
+    call_with_shared_bodies,
+)
+
+
+class TestSharedBodyStore:
+    """Tests for the SharedBodyStore class."""
+
+    def test_share_and_load(self):
+        """Test that text and binary bodies round-trip through a segment."""
+        store = SharedBodyStore()
+        try:
+            text = store.share("<p>café</p>")
+            data = store.share(b"\x00\x01binary")
+            empty = store.share("")
+
+            # Handles are small and picklable
+            assert pickle.loads(pickle.dumps(text)) == text
+            assert text.load() == "<p>café</p>"
+            assert data.load() == b"\x00\x01binary"
+            assert empty.load() == ""
+            assert len(store) == 3
+        finally:
+            store.close()
+
+        assert len(store) == 0
+
+    def test_reference_counting(self):
+        """Test that a segment is freed when its last reference is released."""
+        store = SharedBodyStore()
+        body = "x" * 10_000
+
+        handle = store.share(body, refs=2)
+        assert store.share(body) == handle
+        assert store.get_statistics()["segments_created"] == 1
+
+        assert not store.release(handle)
+        assert not store.release(handle)
+        assert store.release(handle)
+        assert not store.release(handle)
+
+        stats = store.get_statistics()
+        assert stats["segments_freed"] == 1
+        assert stats["segments_live"] == 0
+        with pytest.raises(FileNotFoundError):
+            handle.load()
+
+        # Sharing again after the segment was freed creates a new one
+        assert store.share(body).name != handle.name
+        store.close()
+
+    def test_acquire(self):
+        """Test adding references to live and freed segments."""
+        store = SharedBodyStore()
+        handle = store.share("body")
+
+        assert store.acquire(handle)
+        assert not store.release(handle)
+        assert store.release(handle)
+        assert not store.acquire(handle)
+
+    def test_invalid_arguments(self):
+        """Test that invalid bodies and reference counts are rejected."""
+        store = SharedBodyStore()
+
+        with pytest.raises(TypeError):
+            store.share(["not", "a", "body"])
+        with pytest.raises(ValueError):
+            store.share("body", refs=0)
+
+    def test_call_with_shared_bodies(self):
+        """Test that handles in call arguments are loaded before the call."""
+        store = SharedBodyStore()
+        try:
+            handle = store.share("page body")
+            result = call_with_shared_bodies(
+                lambda body, prefix, suffix="": prefix + body + suffix,
+                (handle, ">"),
+                {"suffix": store.share("!")}
+            )
+        finally:
+            store.close()
+
+        assert result == ">page body!"
+        assert isinstance(handle, SharedBody)
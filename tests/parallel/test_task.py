@@ -5,6 +5,8 @@ import pytest
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
+from summit_seo.memory import estimate_memory_cost
+from summit_seo.parallel.shared_body import SharedBody
 from summit_seo.parallel.task import (
     Task, TaskGroup, TaskPriority, TaskResult, TaskStatus, create_task
 )
@@ -441,4 +443,37 @@ class TestTaskGroup:
         
         # Run the task
         result = await task.run()
-        assert result == "value" 
\ No newline at end of file
+        assert result == "value" 
+    @pytest.mark.asyncio
+    async def test_create_lazy_task(self):
+        """Test that a lazy task creates its coroutine when it runs."""
+        calls = []
+        
+        async def fetch(url):
+            calls.append(url)
+            return url
+        
+        task = create_task(fetch, "https://example.com", lazy=True)
+        assert task.coro is None
+        assert calls == []
+        
+        assert await task.run() == "https://example.com"
+        assert calls == ["https://example.com"]
+        
+        with pytest.raises(TypeError):
+            Task()
+        with pytest.raises(TypeError):
+            await Task(factory=lambda: "not a coroutine").run()
+    
+    def test_create_task_estimates_memory_cost(self):
+        """Test that page bodies among the arguments give the task a memory cost."""
+        html = "<p>" * 1000
+        
+        assert create_task(sample_func, "title", html).memory_cost == estimate_memory_cost(len(html))
+        assert create_task(
+            sample_func, body=SharedBody("segment", 5000)
+        ).memory_cost == estimate_memory_cost(5000)
+        assert create_task(sample_func, html, memory_cost=7).memory_cost == 7
+        
+        # Short strings such as names and URLs are not bodies
+        assert create_task(sample_func, "https://example.com").memory_cost == 0
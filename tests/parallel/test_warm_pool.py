@@ -0,0 +1,81 @@
+"""Tests for the persistent warm worker pool."""
+
+import os
+import threading
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from summit_seo.parallel import ParallelManager, WarmWorkerPool, WorkerType, create_task
+from summit_seo.parallel.process import get_worker_analyzers, run_analyzer
+
+
+@pytest.fixture(scope="module")
+def warm_pool():
+    """Start one pool for all tests in this module."""
+    pool = WarmWorkerPool(max_workers=2, analyzers=["security"])
+    pool.start()
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_workers_start_warm(warm_pool):
+    """Test that workers are started up front with their analyzers built."""
+    stats = warm_pool.get_statistics()
+    assert stats["running"]
+    assert stats["max_workers"] == 2
+    assert stats["startup_time"] > 0
+
+    assert await warm_pool.run(get_worker_analyzers) == ["security"]
+    result = await warm_pool.run(run_analyzer, "security", "<html><body>Hello</body></html>")
+    assert 0 <= result.score <= 1
+
+
+@pytest.mark.asyncio
+async def test_pool_is_reused_across_runs(warm_pool):
+    """Test that consecutive managers run their tasks in the same processes."""
+    pids = set()
+    for _ in range(2):
+        manager = ParallelManager(process_pool=warm_pool)
+        assert manager.worker_type == WorkerType.PROCESS
+        await manager.start()
+        try:
+            pids.update(await manager.submit_and_await_many([create_task(os.getpid) for _ in range(6)]))
+        finally:
+            await manager.stop()
+
+    assert warm_pool.running
+    assert len(pids) <= 2
+    assert os.getpid() not in pids
+
+
+@pytest.mark.asyncio
+async def test_first_run_starts_pool_off_the_loop(monkeypatch):
+    """Test that starting the pool on first use does not block the event loop."""
+    pool = WarmWorkerPool(max_workers=1, analyzers=["security"])
+    threads = []
+    create_executor = pool._create_executor
+    
+    def record_thread():
+        threads.append(threading.current_thread())
+        return create_executor()
+    
+    monkeypatch.setattr(pool, "_create_executor", record_thread)
+    try:
+        assert await pool.run(get_worker_analyzers) == ["security"]
+        assert threads and threads[0] is not threading.main_thread()
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_pool_restarts_after_worker_death(warm_pool):
+    """Test that a dead worker is replaced by a fresh pool."""
+    restarts = warm_pool.get_statistics()["restarts"]
+
+    with pytest.raises(BrokenProcessPool):
+        await warm_pool.run(os._exit, 1)
+
+    assert await warm_pool.run(get_worker_analyzers) == ["security"]
+    assert warm_pool.get_statistics()["restarts"] == restarts + 1